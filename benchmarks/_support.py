@@ -0,0 +1,238 @@
+"""Shared fixtures for the VAai benchmark scripts.
+
+Benchmarks run straight from a source checkout (``python benchmarks/<name>.py``)
+against local stub backends with injectable latency, so no external services
+are required.
+"""
+from __future__ import annotations
+
+import asyncio
+import math
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Union
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from vaai.intents import (  # noqa: E402
+    ActivateCardHandler,
+    AsyncActivateCardHandler,
+    AsyncExplainChargeHandler,
+    AsyncFreezeCardHandler,
+    AsyncListRecentTransactionsHandler,
+    ExplainChargeHandler,
+    FreezeCardHandler,
+    ListRecentTransactionsHandler,
+    VerifyClientHandler,
+)
+from vaai.intents.base import IntentRequest  # noqa: E402
+from vaai.integrations.card_api import (  # noqa: E402
+    AsyncCardManagementAPI,
+    CardManagementAPI,
+    CardOperationResult,
+    CardStatus,
+)
+from vaai.integrations.transaction_api import (  # noqa: E402
+    AsyncTransactionAPI,
+    Transaction,
+    TransactionAPI,
+    TransactionBatch,
+)
+from vaai.utils.audit import AuditLog  # noqa: E402
+from vaai.utils.context import ConversationContext  # noqa: E402
+from vaai.utils.security import VerificationService  # noqa: E402
+
+
+Latency = Union[float, Callable[[], float]]
+"""Fixed seconds per backend call, or a callable sampling a latency distribution."""
+
+
+def lognormal_latency(median: float, sigma: float = 0.5, seed: Optional[int] = None) -> Callable[[], float]:
+    """Sample backend latencies from a log-normal distribution around ``median``."""
+
+    if median <= 0:
+        return lambda: 0.0
+    rng = random.Random(seed)
+    mu = math.log(median)
+    return lambda: rng.lognormvariate(mu, sigma)
+
+
+class _StubBackend:
+    """Latency and failure injection shared by the stub clients."""
+
+    def __init__(
+        self,
+        latency: Latency = 0.0,
+        failure_rate: float = 0.0,
+        seed: Optional[int] = None,
+        observer: Optional[Callable[[float], None]] = None,
+    ) -> None:
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.observer = observer
+        self._rng = random.Random(seed)
+
+    def _delay(self) -> float:
+        delay = self.latency() if callable(self.latency) else self.latency
+        if self.observer is not None:
+            self.observer(delay)
+        return delay
+
+    def _should_fail(self) -> bool:
+        return self.failure_rate > 0 and self._rng.random() < self.failure_rate
+
+
+class AlwaysVerified:
+    """Authentication provider that accepts every caller."""
+
+    def verify_identity(self, context: ConversationContext) -> bool:
+        return True
+
+
+class StubCardManagementAPI(_StubBackend, CardManagementAPI):
+    """Card client that blocks for ``latency`` seconds per call.
+
+    A ``failure_rate`` fraction of calls returns a retryable ``unavailable`` failure.
+    """
+
+    def freeze_card(self, *, card_id: str, reason: Optional[str]) -> CardOperationResult:
+        time.sleep(self._delay())
+        if self._should_fail():
+            return CardOperationResult(success=False, failure_reason="unavailable")
+        return super().freeze_card(card_id=card_id, reason=reason)
+
+    def activate_card(self, *, card_id: str | None) -> CardOperationResult:
+        time.sleep(self._delay())
+        if self._should_fail():
+            return CardOperationResult(success=False, failure_reason="unavailable")
+        return super().activate_card(card_id=card_id)
+
+    def get_card_status(self, *, card_id: str) -> CardStatus:
+        time.sleep(self._delay())
+        return super().get_card_status(card_id=card_id)
+
+
+class StubTransactionAPI(_StubBackend, TransactionAPI):
+    """Transaction client that blocks for ``latency`` seconds per call.
+
+    A ``failure_rate`` fraction of calls raises ``TimeoutError``.
+    """
+
+    def list_recent(self, *, card_id: str | None, limit: int) -> TransactionBatch:
+        time.sleep(self._delay())
+        if self._should_fail():
+            raise TimeoutError("transaction service timed out")
+        return super().list_recent(card_id=card_id, limit=limit)
+
+    def get_transaction(self, *, transaction_id: str) -> Transaction:
+        time.sleep(self._delay())
+        if self._should_fail():
+            raise TimeoutError("transaction service timed out")
+        return super().get_transaction(transaction_id=transaction_id)
+
+
+class StubAsyncCardManagementAPI(_StubBackend, AsyncCardManagementAPI):
+    """Async card client that yields to the loop for ``latency`` seconds per call."""
+
+    async def freeze_card(self, *, card_id: str, reason: Optional[str]) -> CardOperationResult:
+        await asyncio.sleep(self._delay())
+        if self._should_fail():
+            return CardOperationResult(success=False, failure_reason="unavailable")
+        return await super().freeze_card(card_id=card_id, reason=reason)
+
+    async def activate_card(self, *, card_id: str | None) -> CardOperationResult:
+        await asyncio.sleep(self._delay())
+        if self._should_fail():
+            return CardOperationResult(success=False, failure_reason="unavailable")
+        return await super().activate_card(card_id=card_id)
+
+    async def get_card_status(self, *, card_id: str) -> CardStatus:
+        await asyncio.sleep(self._delay())
+        return await super().get_card_status(card_id=card_id)
+
+
+class StubAsyncTransactionAPI(_StubBackend, AsyncTransactionAPI):
+    """Async transaction client that yields to the loop for ``latency`` seconds per call."""
+
+    async def list_recent(self, *, card_id: str | None, limit: int) -> TransactionBatch:
+        await asyncio.sleep(self._delay())
+        if self._should_fail():
+            raise TimeoutError("transaction service timed out")
+        return await super().list_recent(card_id=card_id, limit=limit)
+
+    async def get_transaction(self, *, transaction_id: str) -> Transaction:
+        await asyncio.sleep(self._delay())
+        if self._should_fail():
+            raise TimeoutError("transaction service timed out")
+        return await super().get_transaction(transaction_id=transaction_id)
+
+
+def sync_handlers(
+    latency: Latency = 0.0,
+    failure_rate: float = 0.0,
+    observer: Optional[Callable[[float], None]] = None,
+    audit: Optional[AuditLog] = None,
+) -> Dict[str, object]:
+    """Stock handlers wired to blocking stub backends, recording to ``audit`` when given."""
+
+    card_api = StubCardManagementAPI(latency, failure_rate, observer=observer)
+    transaction_api = StubTransactionAPI(latency, failure_rate, observer=observer)
+    handlers = [
+        VerifyClientHandler(verification_service=VerificationService(), audit=audit),
+        FreezeCardHandler(card_api=card_api, audit=audit),
+        ActivateCardHandler(card_api=card_api, audit=audit),
+        ListRecentTransactionsHandler(transaction_api=transaction_api),
+        ExplainChargeHandler(transaction_api=transaction_api),
+    ]
+    return {handler.name: handler for handler in handlers}
+
+
+def async_handlers(
+    latency: Latency = 0.0, failure_rate: float = 0.0, observer: Optional[Callable[[float], None]] = None
+) -> Dict[str, object]:
+    """Async handlers wired to non-blocking stub backends.
+
+    ``VerifyClientHandler`` stays synchronous to exercise the executor path.
+    """
+
+    card_api = StubAsyncCardManagementAPI(latency, failure_rate, observer=observer)
+    transaction_api = StubAsyncTransactionAPI(latency, failure_rate, observer=observer)
+    handlers = [
+        VerifyClientHandler(verification_service=VerificationService()),
+        AsyncFreezeCardHandler(card_api=card_api),
+        AsyncActivateCardHandler(card_api=card_api),
+        AsyncListRecentTransactionsHandler(transaction_api=transaction_api),
+        AsyncExplainChargeHandler(transaction_api=transaction_api),
+    ]
+    return {handler.name: handler for handler in handlers}
+
+
+def call_script() -> List[IntentRequest]:
+    """A typical call: verify, list transactions, explain a charge, freeze the card."""
+
+    return [
+        IntentRequest(intent_name="verify_client", utterance="my code is 000000", parameters={"otp": "000000"}),
+        IntentRequest(intent_name="list_recent_transactions", utterance="what did I spend recently"),
+        IntentRequest(
+            intent_name="explain_charge",
+            utterance="what is this charge",
+            parameters={"transaction_id": "TXN-3"},
+        ),
+        IntentRequest(intent_name="freeze_card", utterance="freeze my card", parameters={"reason": "lost"}),
+    ]
+
+
+def new_context(index: int) -> ConversationContext:
+    return ConversationContext(client_id=f"client-{index}", channel="voice", active_card_id=f"card-{index}")
+
+
+def percentile(samples: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of ``samples`` (``fraction`` in ``[0, 1]``)."""
+
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = min(len(ordered) - 1, max(0, int(round(fraction * len(ordered))) - 1))
+    return ordered[rank]
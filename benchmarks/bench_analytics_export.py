@@ -0,0 +1,91 @@
+"""Measure turn-path cost of analytics recording with a slow background sink.
+
+Records ``--events`` events from several threads while a
+:class:`BatchExporter` ships them to a sink that sleeps ``--sink-latency``
+seconds per batch. Reports per-event record latency, how many events were
+exported versus shed by the overflow policy, and the baseline cost of the
+previous unbounded list-of-dicts collector.
+
+Usage: ``python benchmarks/bench_analytics_export.py --events 200000 --sink-latency 0.01``
+"""
+from __future__ import annotations
+
+import argparse
+import threading
+import time
+from typing import Dict, List, Sequence
+
+from _support import new_context, percentile
+
+from vaai.monitoring.analytics import AnalyticsCollector, AnalyticsEvent
+from vaai.monitoring.export import BatchExporter, InMemorySink
+
+
+class SlowSink(InMemorySink):
+    def __init__(self, latency: float) -> None:
+        super().__init__()
+        self.latency = latency
+
+    def write_batch(self, events: Sequence[AnalyticsEvent]) -> None:
+        time.sleep(self.latency)
+        super().write_batch(events)
+
+
+def legacy_record(events: List[Dict[str, object]], count: int) -> float:
+    """The pre-ring-buffer collector: one dict appended per event."""
+
+    context = new_context(0)
+    started = time.perf_counter()
+    for _ in range(count):
+        events.append(
+            {"event": "turn_complete", "client_id": context.client_id, "case_id": context.case_id, "metadata": {}}
+        )
+    return (time.perf_counter() - started) / count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=200_000)
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--capacity", type=int, default=10_000)
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--sink-latency", type=float, default=0.01)
+    args = parser.parse_args()
+
+    collector = AnalyticsCollector(capacity=args.capacity)
+    sink = SlowSink(args.sink_latency)
+    exporter = BatchExporter(collector=collector, sink=sink, batch_size=args.batch_size, flush_interval=0.05)
+    per_thread = args.events // args.threads
+    samples: List[List[float]] = [[] for _ in range(args.threads)]
+
+    def worker(index: int) -> None:
+        context = new_context(index)
+        metadata = {"intent": "list_recent_transactions"}
+        record, clock, out = collector.record_event, time.perf_counter, samples[index]
+        for _ in range(per_thread):
+            started = clock()
+            record("turn_complete", context=context, metadata=metadata)
+            out.append(clock() - started)
+
+    with exporter:
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(args.threads)]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+
+    latencies = [sample for chunk in samples for sample in chunk]
+    print(f"recorded  : {collector.recorded} events in {elapsed:.2f}s ({collector.recorded / elapsed:,.0f} events/s)")
+    print(
+        f"record    : p50 {percentile(latencies, 0.5) * 1e6:.2f}us  p99 {percentile(latencies, 0.99) * 1e6:.2f}us  "
+        f"max {max(latencies) * 1e6:.0f}us"
+    )
+    print(f"legacy    : {legacy_record([], per_thread) * 1e6:.2f}us per event (unbounded list of dicts)")
+    print(f"exported  : {exporter.exported_events} events in {exporter.exported_batches} batches")
+    print(f"dropped   : {collector.dropped} (overflow={collector.overflow}, capacity={collector.capacity})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Compare sessions/sec of the sync and asyncio turn pipelines.
+
+Each session replays :func:`call_script` against stub backends that take
+``--latency`` seconds per call. The sync path uses a thread pool (one blocked
+thread per in-flight session); the async path multiplexes every session on a
+single event loop. CPU seconds are measured with ``time.process_time`` so the
+"per core" figure is independent of wall-clock waiting.
+
+Usage: ``python benchmarks/bench_async_turns.py --sessions 2000 --latency 0.02``
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from _support import AlwaysVerified, async_handlers, call_script, new_context, sync_handlers
+
+from vaai.agent import create_agent
+from vaai.monitoring.analytics import AnalyticsCollector
+
+
+def run_sync(sessions: int, latency: float, threads: int) -> tuple[float, float]:
+    agent = create_agent(sync_handlers(latency), AnalyticsCollector(), AlwaysVerified())
+    script = call_script()
+    wall, cpu = time.perf_counter(), time.process_time()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(lambda i: agent.run_conversation(script, new_context(i)), range(sessions)))
+    return time.perf_counter() - wall, time.process_time() - cpu
+
+
+async def _run_async(sessions: int, latency: float, concurrency: int) -> None:
+    agent = create_agent(async_handlers(latency), AnalyticsCollector(), AlwaysVerified())
+    script = call_script()
+    gate = asyncio.Semaphore(concurrency)
+
+    async def session(index: int) -> None:
+        async with gate:
+            await agent.run_conversation_async(script, new_context(index))
+
+    await asyncio.gather(*(session(i) for i in range(sessions)))
+
+
+def run_async(sessions: int, latency: float, concurrency: int) -> tuple[float, float]:
+    wall, cpu = time.perf_counter(), time.process_time()
+    asyncio.run(_run_async(sessions, latency, concurrency))
+    return time.perf_counter() - wall, time.process_time() - cpu
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=2000)
+    parser.add_argument("--latency", type=float, default=0.02, help="backend latency per call, seconds")
+    parser.add_argument("--threads", type=int, default=64, help="thread pool size for the sync path")
+    parser.add_argument("--concurrency", type=int, default=2000, help="concurrent sessions on the async path")
+    args = parser.parse_args()
+
+    for label, (wall, cpu) in (
+        ("sync", run_sync(args.sessions, args.latency, args.threads)),
+        ("async", run_async(args.sessions, args.latency, args.concurrency)),
+    ):
+        print(
+            f"{label:>5}: {args.sessions / wall:10.1f} sessions/s wall  "
+            f"{args.sessions / max(cpu, 1e-9):10.1f} sessions/cpu-s  ({wall:.2f}s wall, {cpu:.2f}s cpu)"
+        )
+
+
+if __name__ == "__main__":
+    main()
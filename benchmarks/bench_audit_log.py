@@ -0,0 +1,135 @@
+"""Durable throughput, added turn latency and verification speed of :class:`AuditLog`.
+
+Part one appends ``--records`` audit records with fsync from 1, 8 and 64
+threads and reports durable records per second, records per fsync and
+append latency. Part two replays ``--sessions`` calls (verify -> list
+transactions -> explain a charge -> freeze) through ``create_agent`` on
+``--concurrency`` threads, with and without the verify and freeze handlers
+writing to an audit log, and reports turn latency. Part three builds a log
+of ``--verify-records`` records and times :func:`verify_audit_log` over it.
+
+Usage: ``python benchmarks/bench_audit_log.py --records 20000 --sessions 2000 --verify-records 500000``
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from _support import AlwaysVerified, call_script, new_context, percentile, sync_handlers
+
+from vaai.agent import create_agent
+from vaai.monitoring.analytics import AnalyticsCollector
+from vaai.utils.audit import CARD_FREEZE, AuditLog, verify_audit_log
+
+
+def run_appends(path: Path, records: int, threads: int) -> Dict[str, object]:
+    log = AuditLog(path)
+    per_thread = records // threads
+    samples: List[List[float]] = [[] for _ in range(threads)]
+
+    def writer(index: int) -> None:
+        context = new_context(index)
+        details = {"card_id": context.active_card_id, "success": True, "reference_id": "FRZ-1"}
+        for _ in range(per_thread):
+            started = time.perf_counter()
+            log.append(CARD_FREEZE, context=context, details=details)
+            samples[index].append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    workers = [threading.Thread(target=writer, args=(index,)) for index in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    seconds = time.perf_counter() - started
+    log.close()
+    latencies = [sample for thread in samples for sample in thread]
+    return {
+        "threads": threads,
+        "durableRecordsPerSecond": round(len(latencies) / seconds),
+        "recordsPerFsync": log.stats.to_json()["recordsPerCommit"],
+        "appendP50Us": round(percentile(latencies, 0.5) * 1e6, 1),
+        "appendP99Us": round(percentile(latencies, 0.99) * 1e6, 1),
+    }
+
+
+def run_turns(args: argparse.Namespace, audit: Optional[AuditLog]) -> Dict[str, object]:
+    agent = create_agent(sync_handlers(audit=audit), AnalyticsCollector(capacity=1000), AlwaysVerified())
+    script = call_script()
+    latencies: List[float] = []
+    lock = threading.Lock()
+
+    def session(index: int) -> None:
+        context = new_context(index)
+        for request in script:
+            started = time.perf_counter()
+            agent.handle_turn(replace(request), context)
+            elapsed = time.perf_counter() - started
+            with lock:
+                latencies.append(elapsed)
+
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        list(pool.map(session, range(args.sessions)))
+    report: Dict[str, object] = {
+        "turnP50Us": round(percentile(latencies, 0.5) * 1e6, 1),
+        "turnP99Us": round(percentile(latencies, 0.99) * 1e6, 1),
+    }
+    if audit is not None:
+        audit.close()
+        report["auditRecords"] = audit.stats.records
+        report["recordsPerFsync"] = audit.stats.to_json()["recordsPerCommit"]
+    return report
+
+
+def run_verify(path: Path, records: int) -> Dict[str, object]:
+    log = AuditLog(path, fsync=False)
+    context = new_context(0)
+    for index in range(records):
+        log.append(CARD_FREEZE, context=context, details={"card_id": f"card-{index}", "success": True})
+    head = log.head
+    log.close()
+    started = time.perf_counter()
+    result = verify_audit_log(path, expected_head=head)
+    seconds = time.perf_counter() - started
+    assert result.valid and result.records == records, result
+    size = path.stat().st_size
+    return {
+        "records": records,
+        "megabytes": round(size / 1e6, 1),
+        "seconds": round(seconds, 3),
+        "recordsPerSecond": round(records / seconds),
+        "megabytesPerSecond": round(size / 1e6 / seconds, 1),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=20_000)
+    parser.add_argument("--sessions", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--verify-records", type=int, default=500_000)
+    parser.add_argument("--directory", help="Log location (defaults to a temporary directory).")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(dir=args.directory) as tmp:
+        root = Path(tmp)
+        report = {
+            "appends": [run_appends(root / f"appends-{threads}.log", args.records, threads) for threads in (1, 8, 64)],
+            "turns": {
+                "noAudit": run_turns(args, None),
+                "audit": run_turns(args, AuditLog(root / "turns.log")),
+            },
+            "verify": run_verify(root / "verify.log", args.verify_records),
+        }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""Throughput of :class:`BulkCardOperations` against a local stub card backend.
+
+The stub takes ``--latency`` seconds per call and fails a ``--transient-rate``
+fraction of calls with a retryable ``unavailable`` reason. Each concurrency
+level freezes ``--cards`` cards and prints its summary as JSON.
+
+Usage: ``python benchmarks/bench_bulk_freeze.py --cards 5000 --concurrency 1 8 32 128``
+"""
+from __future__ import annotations
+
+import argparse
+import json
+
+from _support import StubCardManagementAPI
+
+from vaai.integrations.card_bulk import BulkCardOperations
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cards", type=int, default=5000)
+    parser.add_argument("--latency", type=float, default=0.005)
+    parser.add_argument("--transient-rate", type=float, default=0.02)
+    parser.add_argument("--rate-limit", type=float, default=None, help="max calls per second")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32, 128])
+    args = parser.parse_args()
+
+    for concurrency in args.concurrency:
+        bulk = BulkCardOperations(
+            card_api=StubCardManagementAPI(args.latency, args.transient_rate, seed=7),
+            max_concurrency=concurrency,
+            rate_limit=args.rate_limit,
+            backoff=0.001,
+        )
+        card_ids = (f"card-{i}" for i in range(args.cards))
+        summary = bulk.freeze_cards(card_ids, reason="merchant_breach").wait()
+        print(json.dumps({"concurrency": concurrency, **summary.to_json()}))
+
+
+if __name__ == "__main__":
+    main()
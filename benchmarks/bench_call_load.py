@@ -0,0 +1,365 @@
+"""Synthetic call-load harness with per-intent and per-stage latency percentiles.
+
+Generates call scripts (verify -> list transactions -> explain charge -> freeze,
+with a configurable intent mix and failure rates), replays them through
+``create_agent`` with the stock handlers and stub integrations across many
+concurrent sessions, and reports throughput plus p50/p95/p99 latency per intent
+and per stage against the 1.5s text SLO.
+
+Turns are consumed through ``handle_turn_stream`` so the report also covers
+time-to-first-chunk against the 400ms voice streaming budget. Stages: ``turn``
+is the end-to-end time to the final chunk, ``first_chunk`` the time to the first
+speakable chunk, ``auth`` the authentication provider, ``handler`` the intent
+handler and ``backend`` the latency injected by the stub integrations.
+
+Results are printed (or written with ``--output``) as JSON. Pass
+``--baseline previous.json`` to compare p95s against an earlier run; the
+script exits non-zero if any intent regressed by more than ``--tolerance``.
+
+Usage: ``python benchmarks/bench_call_load.py --sessions 2000 --concurrency 64 --output run.json``
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextvars
+import inspect
+import json
+import random
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Tuple
+
+from _support import async_handlers, lognormal_latency, percentile, sync_handlers
+
+from vaai.agent import EscalationRequired, VAaiAgent, create_agent
+from vaai.intents.base import (
+    IntentRequest,
+    IntentResponse,
+    ResponseChunk,
+    collect_response,
+    collect_response_async,
+    stream_response,
+)
+from vaai.monitoring.analytics import AnalyticsCollector
+from vaai.monitoring.observability import ObservabilityContext
+from vaai.utils.context import ConversationContext
+
+TEXT_SLO_SECONDS = 1.5
+VOICE_FIRST_CHUNK_SLO_SECONDS = 0.4
+
+_current_intent: contextvars.ContextVar[str] = contextvars.ContextVar("current_intent", default="unknown")
+
+
+@dataclass
+class CallMix:
+    """Probability that each optional step appears in a generated call."""
+
+    list_transactions: float = 0.9
+    explain_charge: float = 0.6
+    freeze_card: float = 0.25
+    activate_card: float = 0.05
+    verify_failure_rate: float = 0.02
+
+
+def generate_scripts(sessions: int, mix: CallMix, seed: int = 0) -> List[List[IntentRequest]]:
+    rng = random.Random(seed)
+    scripts = []
+    for _ in range(sessions):
+        otp = "123456" if rng.random() < mix.verify_failure_rate else "000000"
+        script = [IntentRequest(intent_name="verify_client", utterance="my code", parameters={"otp": otp})]
+        if rng.random() < mix.list_transactions:
+            script.append(IntentRequest(intent_name="list_recent_transactions", utterance="recent activity"))
+        if rng.random() < mix.explain_charge:
+            txn = f"TXN-{rng.randrange(10)}"
+            script.append(
+                IntentRequest(intent_name="explain_charge", utterance="what is this", parameters={"transaction_id": txn})
+            )
+        if rng.random() < mix.freeze_card:
+            script.append(IntentRequest(intent_name="freeze_card", utterance="freeze it", parameters={"reason": "lost"}))
+        if rng.random() < mix.activate_card:
+            script.append(IntentRequest(intent_name="activate_card", utterance="activate my new card"))
+        scripts.append(script)
+    return scripts
+
+
+class StageRecorder:
+    """Collects latency samples keyed by (intent, stage)."""
+
+    def __init__(self) -> None:
+        self.samples: Dict[Tuple[str, str], List[float]] = defaultdict(list)
+        self.outcomes: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def record(self, stage: str, seconds: float, intent: Optional[str] = None) -> None:
+        key = (intent or _current_intent.get(), stage)
+        with self._lock:
+            self.samples[key].append(seconds)
+
+    def outcome(self, name: str) -> None:
+        with self._lock:
+            self.outcomes[name] += 1
+
+    def by_intent(self, stage: str) -> Dict[str, List[float]]:
+        return {intent: samples for (intent, name), samples in self.samples.items() if name == stage}
+
+    def by_stage(self) -> Dict[str, List[float]]:
+        merged: Dict[str, List[float]] = defaultdict(list)
+        for (_, stage), samples in self.samples.items():
+            merged[stage].extend(samples)
+        return merged
+
+
+class TimedHandler:
+    """Proxy that times a synchronous handler and tags backend calls with its intent.
+
+    Streams through the inner handler's ``handle_stream`` when it has one, so
+    acknowledgements still reach the caller early. Any other attribute the
+    agent consults (``requires_verification``, ``fraud_sensitive``,
+    ``requires_rag``, ...) is read from the inner handler.
+    """
+
+    def __init__(self, inner: object, recorder: StageRecorder) -> None:
+        self.inner = inner
+        self.recorder = recorder
+        self.name = inner.name
+
+    def __getattr__(self, name: str) -> object:
+        return getattr(self.inner, name)
+
+    def handle(
+        self, request: IntentRequest, context: ConversationContext, observability: ObservabilityContext
+    ) -> IntentResponse:
+        return collect_response(self.handle_stream(request, context, observability))
+
+    def handle_stream(
+        self, request: IntentRequest, context: ConversationContext, observability: ObservabilityContext
+    ) -> Iterator[ResponseChunk]:
+        token = _current_intent.set(request.intent_name)
+        started = time.perf_counter()
+        try:
+            stream = getattr(self.inner, "handle_stream", None)
+            if stream is not None:
+                yield from stream(request=request, context=context, observability=observability)
+            else:
+                yield from stream_response(
+                    self.inner.handle(request=request, context=context, observability=observability)
+                )
+        finally:
+            self.recorder.record("handler", time.perf_counter() - started, intent=request.intent_name)
+            _current_intent.reset(token)
+
+
+class TimedAsyncHandler(TimedHandler):
+    async def handle(
+        self, request: IntentRequest, context: ConversationContext, observability: ObservabilityContext
+    ) -> IntentResponse:
+        return await collect_response_async(self.handle_stream(request, context, observability))
+
+    async def handle_stream(
+        self, request: IntentRequest, context: ConversationContext, observability: ObservabilityContext
+    ) -> AsyncIterator[ResponseChunk]:
+        token = _current_intent.set(request.intent_name)
+        started = time.perf_counter()
+        try:
+            stream = getattr(self.inner, "handle_stream", None)
+            if stream is not None:
+                async for chunk in stream(request=request, context=context, observability=observability):
+                    yield chunk
+            else:
+                response = await self.inner.handle(request=request, context=context, observability=observability)
+                for chunk in stream_response(response):
+                    yield chunk
+        finally:
+            self.recorder.record("handler", time.perf_counter() - started, intent=request.intent_name)
+            _current_intent.reset(token)
+
+
+class TimedAuthProvider:
+    """Accepts callers that passed ``verify_client``; everyone else is escalated."""
+
+    def __init__(self, recorder: StageRecorder) -> None:
+        self.recorder = recorder
+
+    def verify_identity(self, context: ConversationContext) -> bool:
+        started = time.perf_counter()
+        verified = context.is_verified
+        self.recorder.record("auth", time.perf_counter() - started, intent="auth")
+        return verified
+
+
+def build_agent(mode: str, recorder: StageRecorder, latency: float, failure_rate: float) -> VAaiAgent:
+    sampler = lognormal_latency(latency, seed=1)
+    factory = async_handlers if mode == "async" else sync_handlers
+    handlers = {}
+    for name, handler in factory(sampler, failure_rate, observer=lambda s: recorder.record("backend", s)).items():
+        proxy = TimedAsyncHandler if inspect.iscoroutinefunction(handler.handle) else TimedHandler
+        handlers[name] = proxy(handler, recorder)
+    return create_agent(handlers, AnalyticsCollector(capacity=1000), TimedAuthProvider(recorder))
+
+
+def _session_context(index: int) -> ConversationContext:
+    return ConversationContext(client_id=f"load-{index}", channel="chat", active_card_id=f"card-{index}")
+
+
+def replay_sync(agent: VAaiAgent, scripts: List[List[IntentRequest]], concurrency: int, recorder: StageRecorder) -> None:
+    def session(index: int) -> None:
+        context = _session_context(index)
+        for request in scripts[index]:
+            started = time.perf_counter()
+            first_chunk = None
+            try:
+                for chunk in agent.handle_turn_stream(request, context):
+                    if first_chunk is None:
+                        first_chunk = time.perf_counter() - started
+                        recorder.record("first_chunk", first_chunk, intent=request.intent_name)
+                response = chunk.response
+            except EscalationRequired:
+                recorder.outcome("escalated")
+                return
+            except Exception:  # noqa: BLE001
+                recorder.outcome("error")
+                return
+            finally:
+                recorder.record("turn", time.perf_counter() - started, intent=request.intent_name)
+            if response.terminate_session:
+                break
+        recorder.outcome("completed")
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(session, range(len(scripts))))
+
+
+async def replay_async(
+    agent: VAaiAgent, scripts: List[List[IntentRequest]], concurrency: int, recorder: StageRecorder
+) -> None:
+    gate = asyncio.Semaphore(concurrency)
+
+    async def session(index: int) -> None:
+        async with gate:
+            context = _session_context(index)
+            for request in scripts[index]:
+                started = time.perf_counter()
+                first_chunk = None
+                try:
+                    async for chunk in agent.handle_turn_stream_async(request, context):
+                        if first_chunk is None:
+                            first_chunk = time.perf_counter() - started
+                            recorder.record("first_chunk", first_chunk, intent=request.intent_name)
+                    response = chunk.response
+                except EscalationRequired:
+                    recorder.outcome("escalated")
+                    return
+                except Exception:  # noqa: BLE001
+                    recorder.outcome("error")
+                    return
+                finally:
+                    recorder.record("turn", time.perf_counter() - started, intent=request.intent_name)
+                if response.terminate_session:
+                    break
+            recorder.outcome("completed")
+
+    await asyncio.gather(*(session(i) for i in range(len(scripts))))
+
+
+def summarize(samples: List[float], slo: float) -> Dict[str, object]:
+    return {
+        "count": len(samples),
+        "p50Ms": round(percentile(samples, 0.50) * 1000, 3),
+        "p95Ms": round(percentile(samples, 0.95) * 1000, 3),
+        "p99Ms": round(percentile(samples, 0.99) * 1000, 3),
+        "maxMs": round(max(samples, default=0.0) * 1000, 3),
+        "sloViolations": sum(1 for sample in samples if sample > slo),
+    }
+
+
+def compare(report: Dict[str, object], baseline: Dict[str, object], tolerance: float) -> List[str]:
+    regressions = []
+    for intent, stats in report["intents"].items():
+        previous = baseline.get("intents", {}).get(intent)
+        if previous and previous["p95Ms"] and stats["p95Ms"] > previous["p95Ms"] * (1 + tolerance):
+            regressions.append(f"{intent}: p95 {previous['p95Ms']}ms -> {stats['p95Ms']}ms")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--mode", choices=("sync", "async"), default="sync")
+    parser.add_argument("--latency", type=float, default=0.02, help="median backend latency, seconds")
+    parser.add_argument("--backend-failure-rate", type=float, default=0.01)
+    parser.add_argument("--verify-failure-rate", type=float, default=0.02)
+    parser.add_argument("--explain-rate", type=float, default=0.6)
+    parser.add_argument("--freeze-rate", type=float, default=0.25)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, default=None)
+    parser.add_argument("--baseline", type=Path, default=None)
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed p95 regression vs. baseline")
+    args = parser.parse_args()
+
+    mix = CallMix(
+        explain_charge=args.explain_rate,
+        freeze_card=args.freeze_rate,
+        verify_failure_rate=args.verify_failure_rate,
+    )
+    scripts = generate_scripts(args.sessions, mix, seed=args.seed)
+    recorder = StageRecorder()
+    agent = build_agent(args.mode, recorder, args.latency, args.backend_failure_rate)
+
+    started = time.perf_counter()
+    if args.mode == "async":
+        asyncio.run(replay_async(agent, scripts, args.concurrency, recorder))
+    else:
+        replay_sync(agent, scripts, args.concurrency, recorder)
+    elapsed = time.perf_counter() - started
+
+    turns = recorder.by_intent("turn")
+    total_turns = sum(len(samples) for samples in turns.values())
+    report = {
+        "config": {**vars(args), "output": None, "baseline": None, "mix": asdict(mix)},
+        "elapsedSeconds": round(elapsed, 3),
+        "throughput": {
+            "sessionsPerSecond": round(args.sessions / elapsed, 1),
+            "turnsPerSecond": round(total_turns / elapsed, 1),
+        },
+        "outcomes": dict(recorder.outcomes),
+        "sloMs": TEXT_SLO_SECONDS * 1000,
+        "intents": {intent: summarize(samples, TEXT_SLO_SECONDS) for intent, samples in sorted(turns.items())},
+        "firstChunkSloMs": VOICE_FIRST_CHUNK_SLO_SECONDS * 1000,
+        "firstChunk": {
+            intent: summarize(samples, VOICE_FIRST_CHUNK_SLO_SECONDS)
+            for intent, samples in sorted(recorder.by_intent("first_chunk").items())
+        },
+        "stages": {stage: summarize(samples, TEXT_SLO_SECONDS) for stage, samples in sorted(recorder.by_stage().items())},
+        "stagesByIntent": {
+            stage: {intent: summarize(samples, TEXT_SLO_SECONDS) for intent, samples in sorted(recorder.by_intent(stage).items())}
+            for stage in ("handler", "backend")
+        },
+    }
+    report["sloMet"] = all(stats["p99Ms"] <= report["sloMs"] for stats in report["intents"].values())
+    report["firstChunkSloMet"] = all(
+        stats["p99Ms"] <= report["firstChunkSloMs"] for stats in report["firstChunk"].values()
+    )
+
+    payload = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(payload + "\n")
+    else:
+        print(payload)
+
+    if args.baseline:
+        regressions = compare(report, json.loads(args.baseline.read_text()), args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
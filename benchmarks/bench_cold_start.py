@@ -0,0 +1,100 @@
+"""Cold-start cost: import time, agent construction and first-turn latency.
+
+Each run starts a fresh interpreter that imports ``vaai``, builds an agent
+from :func:`vaai.intents.default_registry` and serves a verification turn
+followed by a card-freeze turn. ``lazy`` leaves handlers to be built on first
+route; ``eager`` first imports every handler module and the analytics
+exporters and warms the registry, as the package used to on import. Medians
+over ``--runs`` are reported in milliseconds.
+
+With ``--budget-ms`` the script exits non-zero when the lazy median from the
+first ``import vaai`` to the first response exceeds the budget, so it can gate a
+rollout or run as a test.
+
+Usage: ``python benchmarks/bench_cold_start.py --runs 15 --budget-ms 150``
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+import _support
+
+PROBE = """
+import json, sys, time
+started = time.perf_counter()
+sys.path.insert(0, {src!r})
+import vaai
+from vaai import create_agent
+from vaai.intents import default_registry
+from vaai.intents.base import IntentRequest
+from vaai.monitoring.analytics import AnalyticsCollector
+from vaai.utils.context import ConversationContext
+if {eager!r}:
+    import vaai.intents.card_management, vaai.intents.encoding, vaai.intents.faq
+    import vaai.intents.transactions, vaai.intents.verification, vaai.monitoring.export
+imported = time.perf_counter()
+
+
+class Allow:
+    def verify_identity(self, context):
+        return True
+
+
+registry = default_registry()
+if {eager!r}:
+    registry.warm()
+agent = create_agent(registry, AnalyticsCollector(), Allow())
+built = time.perf_counter()
+context = ConversationContext(client_id="client-1", channel="voice", active_card_id="card-1")
+agent.handle_turn(IntentRequest(intent_name="verify_client", utterance="code", parameters={{"otp": "000000"}}), context)
+verified = time.perf_counter()
+agent.handle_turn(IntentRequest(intent_name="freeze_card", utterance="freeze my card"), context)
+frozen = time.perf_counter()
+print(json.dumps({{
+    "importMs": (imported - started) * 1000,
+    "buildMs": (built - imported) * 1000,
+    "firstTurnMs": (verified - built) * 1000,
+    "firstFreezeMs": (frozen - verified) * 1000,
+    "startToFirstResponseMs": (verified - started) * 1000,
+    "modules": sum(1 for name in sys.modules if name.startswith("vaai")),
+}}))
+"""
+
+
+def probe(src: str, eager: bool) -> Dict[str, float]:
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE.format(src=src, eager=eager)], check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output)
+
+
+def medians(runs: List[Dict[str, float]]) -> Dict[str, float]:
+    return {key: round(statistics.median(run[key] for run in runs), 2) for key in runs[0]}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=15)
+    parser.add_argument("--budget-ms", type=float, default=None)
+    args = parser.parse_args()
+
+    src = str(Path(_support.__file__).resolve().parents[1] / "src")
+    report: Dict[str, object] = {"runs": args.runs}
+    for mode, eager in (("lazy", False), ("eager", True)):
+        report[mode] = medians([probe(src, eager) for _ in range(args.runs)])
+    if args.budget_ms is not None:
+        report["budgetMs"] = args.budget_ms
+        report["withinBudget"] = report["lazy"]["startToFirstResponseMs"] <= args.budget_ms
+    print(json.dumps(report, indent=2))
+    if report.get("withinBudget") is False:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+"""CRM calls saved and latency added per turn by :class:`BatchingCRMClient`.
+
+``--sessions`` calls arrive across ``--concurrency`` threads from customers
+drawn out of ``--callers``; a ``--repeat-rate`` fraction are repeat callers. Each session
+personalizes its context on the first turn and then runs
+``--turns-per-session`` turns in total. A stand-in CRM charges
+``--request-ms`` per request plus ``--per-id-us`` per profile. Three setups
+are compared: one ``get_profile`` request per session with no cache, the
+batching client from cold, and the batching client warmed from a file listing
+``--warm-fraction`` of the expected callers. Latencies are in milliseconds.
+
+Usage: ``python benchmarks/bench_crm_profiles.py --sessions 20000 --concurrency 256``
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+from _support import percentile
+
+from vaai.integrations.crm import BatchingCRMClient, CRMClient, CustomerProfile
+from vaai.utils.context import ConversationContext
+
+TIERS = ["standard", "silver", "gold", "platinum"]
+
+
+class StandInCRM(CRMClient):
+    """Counts requests and blocks for a fixed cost per request plus a cost per profile."""
+
+    def __init__(self, request_seconds: float, per_id_seconds: float) -> None:
+        self.request_seconds = request_seconds
+        self.per_id_seconds = per_id_seconds
+        self.requests = 0
+        self._lock = threading.Lock()
+
+    def get_profiles(self, *, client_ids: Sequence[str]) -> Dict[str, CustomerProfile]:
+        with self._lock:
+            self.requests += 1
+        time.sleep(self.request_seconds + self.per_id_seconds * len(client_ids))
+        return {
+            client_id: CustomerProfile(
+                client_id=client_id,
+                loyalty_tier=TIERS[int(client_id[-7:]) % len(TIERS)],
+                vip=client_id.endswith("7"),
+                preferences={"contact": "sms"},
+            )
+            for client_id in client_ids
+        }
+
+
+class DirectProfiles:
+    """Baseline: one CRM request per session."""
+
+    def __init__(self, backend: CRMClient) -> None:
+        self.backend = backend
+
+    def personalize(self, context: ConversationContext) -> Optional[CustomerProfile]:
+        profile = self.backend.get_profile(client_id=context.client_id)
+        if profile is not None:
+            context.loyalty_tier = profile.loyalty_tier
+        return profile
+
+
+def callers(args: argparse.Namespace) -> List[str]:
+    rng = random.Random(3)
+    seen: List[str] = []
+    sessions = []
+    for _ in range(args.sessions):
+        if seen and rng.random() < args.repeat_rate:
+            sessions.append(rng.choice(seen))
+        else:
+            sessions.append(f"client-{rng.randrange(args.callers):07d}")
+            seen.append(sessions[-1])
+    return sessions
+
+
+def run(args: argparse.Namespace, setup: str, sessions: List[str]) -> Dict[str, object]:
+    backend = StandInCRM(args.request_ms / 1000, args.per_id_us / 1e6)
+    client: object
+    warm_seconds = 0.0
+    if setup == "direct":
+        client = DirectProfiles(backend)
+    else:
+        client = BatchingCRMClient(backend, window=args.window_ms / 1000, max_batch=args.max_batch)
+        if setup == "warmed":
+            expected = list(dict.fromkeys(sessions))
+            expected = expected[: int(len(expected) * args.warm_fraction)]
+            with tempfile.TemporaryDirectory() as directory:
+                path = Path(directory) / "expected_callers.txt"
+                path.write_text("\n".join(expected) + "\n", encoding="utf-8")
+                started = time.perf_counter()
+                client.warm_from_file(path)
+                warm_seconds = time.perf_counter() - started
+        backend.requests = 0
+
+    samples: List[float] = []
+    lock = threading.Lock()
+
+    def session(client_id: str) -> None:
+        context = ConversationContext(client_id=client_id, channel="voice")
+        started = time.perf_counter()
+        client.personalize(context)
+        elapsed = time.perf_counter() - started
+        with lock:
+            samples.append(elapsed)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        list(pool.map(session, sessions))
+    wall = time.perf_counter() - started
+
+    report: Dict[str, object] = {
+        "backendRequests": backend.requests,
+        "requestsPerSession": round(backend.requests / len(sessions), 4),
+        "firstTurnAddedMs": {
+            "p50": round(percentile(samples, 0.5) * 1000, 3),
+            "p99": round(percentile(samples, 0.99) * 1000, 3),
+        },
+        "meanAddedMsPerTurn": round(sum(samples) / (len(samples) * args.turns_per_session) * 1000, 3),
+        "sessionsPerSecond": round(len(sessions) / wall),
+    }
+    if isinstance(client, BatchingCRMClient):
+        report["stats"] = client.stats.to_json()
+    if setup == "warmed":
+        report["warmSeconds"] = round(warm_seconds, 3)
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=20_000)
+    parser.add_argument("--callers", type=int, default=50_000)
+    parser.add_argument("--repeat-rate", type=float, default=0.2)
+    parser.add_argument("--concurrency", type=int, default=256)
+    parser.add_argument("--turns-per-session", type=int, default=4)
+    parser.add_argument("--request-ms", type=float, default=25.0)
+    parser.add_argument("--per-id-us", type=float, default=50.0)
+    parser.add_argument("--window-ms", type=float, default=5.0)
+    parser.add_argument("--max-batch", type=int, default=100)
+    parser.add_argument("--warm-fraction", type=float, default=0.5)
+    args = parser.parse_args()
+
+    sessions = callers(args)
+    report = {setup: run(args, setup, sessions) for setup in ("direct", "batched", "warmed")}
+    report["requestsSaved"] = report["direct"]["backendRequests"] - report["batched"]["backendRequests"]
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
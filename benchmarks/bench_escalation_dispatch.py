@@ -0,0 +1,105 @@
+"""Escalation tickets per second through the priority dispatcher.
+
+Producer threads issue ``--tickets`` escalations with collision-free case ids
+across several skills and urgencies while the dispatcher hands batches to an
+in-memory ticketing sink on its background thread. A share of tickets repeats
+a recent case, sometimes at higher urgency and sometimes after the first
+ticket was already handed off. Reports submit and end-to-end throughput,
+duplicate handling, id collisions and queue waits.
+
+Usage: ``python benchmarks/bench_escalation_dispatch.py --tickets 200000 --producers 4``
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import threading
+import time
+from datetime import datetime
+from typing import List
+
+import _support  # noqa: F401  (puts src/ on sys.path)
+
+from vaai.workflows.dispatcher import URGENCY_LEVELS, EscalationDispatcher, InMemoryTicketSink
+from vaai.workflows.escalation import EscalationTicket, new_case_id
+
+ISSUES = ["freeze_card", "activate_card", "verify_client", "freeze_all_cards", "dispute_transaction"]
+
+
+def produce(dispatcher: EscalationDispatcher, count: int, repeat_rate: float, seed: int, case_ids: List[str]) -> None:
+    rng = random.Random(seed)
+    recent: List[str] = []
+    for number in range(count):
+        if recent and rng.random() < repeat_rate:
+            case_id = rng.choice(recent)
+        else:
+            case_id = new_case_id()
+            case_ids.append(case_id)
+            recent.append(case_id)
+            if len(recent) > 256:
+                recent.pop(0)
+        dispatcher.submit(
+            EscalationTicket(
+                client_id=f"client-{seed}-{number}",
+                case_id=case_id,
+                issue_type=rng.choice(ISSUES),
+                urgency=rng.choice(URGENCY_LEVELS),
+                created_at=datetime.utcnow(),
+                metadata={"reason": "card_api_failure"},
+            )
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tickets", type=int, default=200_000)
+    parser.add_argument("--producers", type=int, default=4)
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--repeat-rate", type=float, default=0.05)
+    args = parser.parse_args()
+
+    sink = InMemoryTicketSink()
+    dispatcher = EscalationDispatcher(sink, batch_size=args.batch_size, flush_interval=0.05)
+    per_producer = args.tickets // args.producers
+    case_ids: List[List[str]] = [[] for _ in range(args.producers)]
+    threads = [
+        threading.Thread(target=produce, args=(dispatcher, per_producer, args.repeat_rate, seed, case_ids[seed]))
+        for seed in range(args.producers)
+    ]
+
+    started = time.perf_counter()
+    dispatcher.start()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    submitted_seconds = time.perf_counter() - started
+    peak_depth = dispatcher.depth()
+    dispatcher.stop()
+    total_seconds = time.perf_counter() - started
+
+    issued = [case_id for ids in case_ids for case_id in ids]
+    delivered = [ticket.case_id for ticket in sink.tickets]
+    stats = dispatcher.stats.to_json()
+    report = {
+        "tickets": per_producer * args.producers,
+        "producers": args.producers,
+        "submitPerSecond": round(per_producer * args.producers / submitted_seconds),
+        "endToEndPerSecond": round(per_producer * args.producers / total_seconds),
+        "caseIdCollisions": len(issued) - len(set(issued)),
+        "handedOff": len(delivered),
+        "casesHandedOffTwice": len(delivered) - len(set(delivered)),
+        "batches": len(sink.batches),
+        "deduplicated": stats["deduplicated"],
+        "reprioritised": stats["reprioritised"],
+        "depthAtProducerFinish": peak_depth,
+        "waitP99Ms": {
+            urgency: round(histogram["p99"] * 1000, 2) for urgency, histogram in stats["waitSeconds"].items()
+        },
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
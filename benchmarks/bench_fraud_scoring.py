@@ -0,0 +1,119 @@
+"""Fraud-scoring throughput and memory footprint of the per-card scorer.
+
+Warms ``--cards`` cards with ``--history`` transactions each of their usual
+spending, then scores and absorbs batches of ``--batch-size`` new transactions
+with a small share of injected anomalies (large amounts in unfamiliar
+categories). Reports transactions per second, mean score of normal and
+anomalous transactions, state bytes per card and snapshot/restore time.
+
+Usage: ``python benchmarks/bench_fraud_scoring.py --cards 1000000 --batch-size 10000``
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+import _support  # noqa: F401  (puts src/ on sys.path)
+
+from vaai.monitoring.fraud import FraudScorer
+
+CATEGORIES = [f"mcc-{code}" for code in range(40)]
+
+
+def synthetic_batch(rng: np.random.Generator, cards: int, size: int, now: float, anomaly_rate: float):
+    card_numbers = rng.integers(0, cards, size)
+    usual = card_numbers % 5
+    anomalous = rng.random(size) < anomaly_rate
+    categories = np.where(anomalous, 20 + rng.integers(0, 20, size), usual + rng.integers(0, 2, size))
+    amounts = np.where(anomalous, rng.lognormal(7.0, 0.5, size), rng.lognormal(3.5, 0.4, size))
+    timestamps = now + np.sort(rng.random(size)) * 60
+    return (
+        [f"card-{number}" for number in card_numbers],
+        amounts.tolist(),
+        [CATEGORIES[category] for category in categories],
+        timestamps.tolist(),
+        anomalous,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cards", type=int, default=1_000_000)
+    parser.add_argument("--history", type=int, default=8)
+    parser.add_argument("--batch-size", type=int, default=10_000)
+    parser.add_argument("--batches", type=int, default=50)
+    parser.add_argument("--anomaly-rate", type=float, default=0.01)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    now = time.time() - 30 * 86_400
+    scorer = FraudScorer(capacity=args.cards)
+
+    started = time.perf_counter()
+    for round_number in range(args.history):
+        for offset in range(0, args.cards, 100_000):
+            count = min(100_000, args.cards - offset)
+            numbers = np.arange(offset, offset + count)
+            scorer.update(
+                [f"card-{number}" for number in numbers],
+                rng.lognormal(3.5, 0.4, count).tolist(),
+                [CATEGORIES[category] for category in (numbers % 5 + rng.integers(0, 2, count))],
+                (now + round_number * 86_400 + rng.random(count) * 3_600).tolist(),
+            )
+    warmup_seconds = time.perf_counter() - started
+
+    now += (args.history + 1) * 86_400
+    scored = 0
+    normal_scores, anomaly_scores = [], []
+    elapsed = 0.0
+    for _ in range(args.batches):
+        card_ids, amounts, categories, timestamps, anomalous = synthetic_batch(
+            rng, args.cards, args.batch_size, now, args.anomaly_rate
+        )
+        started = time.perf_counter()
+        scores = scorer.update(card_ids, amounts, categories, timestamps)
+        elapsed += time.perf_counter() - started
+        scored += len(scores)
+        normal_scores.append(scores[~anomalous])
+        anomaly_scores.append(scores[anomalous])
+        now += 60
+
+    state_bytes = sum(
+        getattr(scorer, f"_{name}").nbytes
+        for name in ("count", "mean", "var", "last_seen", "velocity_hour", "velocity_day", "risk", "category_counts")
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "fraud.npz"
+        started = time.perf_counter()
+        scorer.snapshot(path)
+        snapshot_seconds = time.perf_counter() - started
+        started = time.perf_counter()
+        restored = FraudScorer.restore(path)
+        restore_seconds = time.perf_counter() - started
+
+    normal = np.concatenate(normal_scores)
+    anomalies = np.concatenate(anomaly_scores)
+    report = {
+        "cards": len(restored),
+        "warmupSeconds": round(warmup_seconds, 2),
+        "transactionsPerSecond": round(scored / elapsed),
+        "batchSize": args.batch_size,
+        "meanScoreNormal": round(float(normal.mean()), 3),
+        "meanScoreAnomalous": round(float(anomalies.mean()), 3) if len(anomalies) else None,
+        "flaggedNormalAt0.6": round(float((normal >= 0.6).mean()), 4),
+        "flaggedAnomalousAt0.6": round(float((anomalies >= 0.6).mean()), 4) if len(anomalies) else None,
+        "stateBytesPerCard": round(state_bytes / args.cards, 1),
+        "snapshotSeconds": round(snapshot_seconds, 2),
+        "restoreSeconds": round(restore_seconds, 2),
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""Latency per utterance and fallback rate of the local intent classifier.
+
+Trains :class:`NearestCentroidClassifier` on synthetic call-centre utterances
+generated from phrase templates, then routes a held-out set through
+:class:`WorkflowRouter` at each ``--thresholds`` value. Reports single and
+batched prediction latency, model size and load time, the fallback rate, and
+the accuracy of the predictions that were routed directly.
+
+Usage: ``python benchmarks/bench_intent_classifier.py --train 5000 --test 5000``
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from _support import percentile, sync_handlers
+
+from vaai.intents.base import IntentRequest
+from vaai.workflows.classifier import NearestCentroidClassifier
+from vaai.workflows.router import WorkflowRouter
+
+OPENERS = ["", "hi, ", "hello, ", "um, ", "yes ", "ok so ", "please ", "can you help, "]
+TEMPLATES: Dict[str, List[str]] = {
+    "freeze_card": [
+        "i lost my {card}",
+        "my {card} was stolen",
+        "freeze my {card}",
+        "can you block my {card}",
+        "please lock the {card} someone took my wallet",
+        "i can't find my {card} anywhere",
+        "stop my {card} right now",
+    ],
+    "activate_card": [
+        "activate my new {card}",
+        "i just received my {card} and want to turn it on",
+        "how do i activate the {card}",
+        "my replacement {card} arrived",
+        "set up the new {card} please",
+        "enable my {card}",
+    ],
+    "list_recent_transactions": [
+        "what are my recent transactions",
+        "show me what i spent {when}",
+        "list the charges on my {card}",
+        "what did i buy {when}",
+        "read me my latest purchases",
+        "recent activity on my {card}",
+    ],
+    "explain_charge": [
+        "what is this charge from {merchant}",
+        "i don't recognise a payment to {merchant}",
+        "why was i charged by {merchant}",
+        "explain the {merchant} transaction",
+        "there's a strange charge {when}",
+        "who is {merchant} on my statement",
+    ],
+    "verify_client": [
+        "my code is {digits}",
+        "the one time code is {digits}",
+        "last four digits are {digits}",
+        "here is my passcode {digits}",
+        "i want to verify my identity",
+        "the pin you sent me is {digits}",
+    ],
+}
+SLOTS = {
+    "card": ["card", "credit card", "debit card", "visa", "mastercard", "bank card"],
+    "when": ["yesterday", "last week", "this month", "over the weekend", "today"],
+    "merchant": ["amazon", "netflix", "uber", "a coffee shop", "some gas station", "paypal"],
+    "digits": ["1234", "000000", "482913", "five five six seven"],
+}
+NOISE = ["", "", "", " thanks", " please", " i think", " uh", " right away"]
+
+
+def utterance(rng: random.Random, intent: str) -> str:
+    template = rng.choice(TEMPLATES[intent])
+    filled = template.format(**{slot: rng.choice(values) for slot, values in SLOTS.items()})
+    return rng.choice(OPENERS) + filled + rng.choice(NOISE)
+
+
+def dataset(rng: random.Random, size: int) -> List[Tuple[str, str]]:
+    intents = list(TEMPLATES)
+    return [(utterance(rng, intent), intent) for intent in (rng.choice(intents) for _ in range(size))]
+
+
+def route_test_set(model: NearestCentroidClassifier, test: List[Tuple[str, str]], threshold: float) -> Dict[str, object]:
+    router = WorkflowRouter(
+        handlers=sync_handlers(),
+        classifier=model,
+        confidence_threshold=threshold,
+        fallback=lambda request: "fallback",
+    )
+    requests = [IntentRequest(intent_name="", utterance=text) for text, _ in test]
+    resolved = router.resolve_intents(requests)
+    direct = [(intent, expected) for intent, (_, expected) in zip(resolved, test) if intent != "fallback"]
+    correct = sum(intent == expected for intent, expected in direct)
+    return {
+        "threshold": threshold,
+        **router.stats.to_json(),
+        "directAccuracy": round(correct / len(direct), 4) if direct else None,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--train", type=int, default=5000)
+    parser.add_argument("--test", type=int, default=5000)
+    parser.add_argument("--batch", type=int, default=64)
+    parser.add_argument("--thresholds", type=float, nargs="+", default=[0.5, 0.7, 0.9])
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    train = dataset(rng, args.train)
+    test = dataset(rng, args.test)
+
+    started = time.perf_counter()
+    model = NearestCentroidClassifier.train([text for text, _ in train], [intent for _, intent in train])
+    train_seconds = time.perf_counter() - started
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "intents.npz"
+        model.save(path)
+        started = time.perf_counter()
+        model = NearestCentroidClassifier.load(path)
+        load_ms = (time.perf_counter() - started) * 1000
+        model_bytes = path.stat().st_size
+
+    single: List[float] = []
+    for text, _ in test:
+        started = time.perf_counter()
+        model.predict([text])
+        single.append(time.perf_counter() - started)
+
+    texts = [text for text, _ in test]
+    started = time.perf_counter()
+    for offset in range(0, len(texts), args.batch):
+        model.predict(texts[offset : offset + args.batch])
+    batched_us = (time.perf_counter() - started) / len(texts) * 1e6
+
+    report = {
+        "trainUtterances": args.train,
+        "trainSeconds": round(train_seconds, 3),
+        "modelBytes": model_bytes,
+        "loadMs": round(load_ms, 2),
+        "singleUs": {
+            "p50": round(percentile(single, 0.50) * 1e6, 1),
+            "p99": round(percentile(single, 0.99) * 1e6, 1),
+        },
+        "batchedUsPerUtterance": round(batched_us, 1),
+        "routing": [route_test_set(model, test, threshold) for threshold in args.thresholds],
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+"""Ingest rate, memory and query cost of :class:`KPIAggregator`.
+
+Generates ``--turns`` turns spread over ``--simulated-hours`` of event time
+from ``--sessions`` concurrent callers across ten intents, three channels and
+four locales. Each turn is a ``turn_start`` followed by a ``turn_complete``
+(with or without follow-up), ``escalated`` or ``error`` after a log-normal
+handle time. It reports events per second folded into the windows, the
+per-event cost of ``record_event`` with and without the aggregator subscribed,
+aggregator memory (tracemalloc) as event time advances, and the cost of
+querying a window.
+
+Usage: ``python benchmarks/bench_kpi_aggregator.py --turns 250000 --simulated-hours 2``
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import random
+import time
+import tracemalloc
+from typing import Dict, List
+
+from _support import new_context
+
+from vaai.monitoring.analytics import AnalyticsCollector, AnalyticsEvent
+from vaai.monitoring.kpi import KPIAggregator
+
+INTENTS = [
+    "verify_client",
+    "list_recent_transactions",
+    "explain_charge",
+    "freeze_card",
+    "unfreeze_card",
+    "activate_card",
+    "report_lost_card",
+    "dispute_charge",
+    "policy_question",
+    "bulk_freeze",
+]
+CHANNELS = ["voice", "chat", "sms"]
+LOCALES = ["en-US", "en-GB", "fr-FR", "es-MX"]
+
+
+def generate(args: argparse.Namespace) -> List[AnalyticsEvent]:
+    rng = random.Random(11)
+    span = args.simulated_hours * 3600
+    sessions = [
+        (f"client-{index:06d}", f"{index:032x}", rng.choice(CHANNELS), rng.choice(LOCALES))
+        for index in range(args.sessions)
+    ]
+    starts = {intent: {"intent": intent} for intent in INTENTS}
+    completes = {
+        (intent, follow_up): {"intent": intent, "response_type": "text", "requires_follow_up": follow_up}
+        for intent in INTENTS
+        for follow_up in (False, True)
+    }
+    events = []
+    for index in range(args.turns):
+        client_id, trace_id, channel, locale = sessions[index % len(sessions)]
+        intent = rng.choice(INTENTS)
+        started = index * span / args.turns
+        finished = started + rng.lognormvariate(-0.5, 0.8)
+        roll = rng.random()
+        if roll < 0.06:
+            name, metadata = "escalated", starts[intent]
+        elif roll < 0.08:
+            name, metadata = "error", starts[intent]
+        else:
+            name, metadata = "turn_complete", completes[intent, roll > 0.9]
+        for event, timestamp, payload in (("turn_start", started, starts[intent]), (name, finished, metadata)):
+            events.append(AnalyticsEvent(event, client_id, None, trace_id, timestamp, payload, None, channel, locale))
+    events.sort(key=lambda event: event.timestamp)
+    return events
+
+
+def ingest(events: List[AnalyticsEvent]) -> Dict[str, object]:
+    aggregator = KPIAggregator(clock=lambda: events[-1].timestamp)
+    observe = aggregator.observe
+    started = time.perf_counter()
+    for event in events:
+        observe(event)
+    seconds = time.perf_counter() - started
+
+    queries = 200
+    started = time.perf_counter()
+    for _ in range(queries):
+        aggregator.snapshot("1h")
+    snapshot_us = (time.perf_counter() - started) / queries * 1e6
+    started = time.perf_counter()
+    report = aggregator.to_json()
+    to_json_ms = (time.perf_counter() - started) * 1000
+    return {
+        "events": len(events),
+        "eventsPerSecond": round(len(events) / seconds),
+        "series": aggregator.series,
+        "snapshot1hUs": round(snapshot_us, 1),
+        "fullReportMs": round(to_json_ms, 2),
+        "lastHour": report["1h"]["all"],
+    }
+
+
+def memory(events: List[AnalyticsEvent], checkpoints: int = 4) -> List[Dict[str, object]]:
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    aggregator = KPIAggregator(clock=lambda: events[-1].timestamp)
+    samples = []
+    step = len(events) // checkpoints
+    for checkpoint in range(checkpoints):
+        for event in events[checkpoint * step : (checkpoint + 1) * step]:
+            aggregator.observe(event)
+        gc.collect()
+        samples.append(
+            {
+                "eventHours": round((events[(checkpoint + 1) * step - 1].timestamp - events[0].timestamp) / 3600, 2),
+                "eventsSeen": (checkpoint + 1) * step,
+                "aggregatorMB": round((tracemalloc.get_traced_memory()[0] - baseline) / 1e6, 2),
+            }
+        )
+    tracemalloc.stop()
+    return samples
+
+
+def record_cost(count: int, subscribed: bool) -> float:
+    collector = AnalyticsCollector(capacity=10_000)
+    if subscribed:
+        KPIAggregator().attach(collector)
+    contexts = [new_context(index) for index in range(64)]
+    for context in contexts:
+        context.set_metadata("trace_id", f"{context.client_id}-trace")
+    metadata = {"intent": "freeze_card"}
+    started = time.perf_counter()
+    for index in range(count):
+        context = contexts[index % len(contexts)]
+        collector.record_event("turn_complete" if index % 2 else "turn_start", context=context, metadata=metadata)
+    return (time.perf_counter() - started) / count * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--turns", type=int, default=250_000)
+    parser.add_argument("--simulated-hours", type=float, default=2.0)
+    parser.add_argument("--sessions", type=int, default=2000)
+    parser.add_argument("--record-events", type=int, default=200_000)
+    args = parser.parse_args()
+
+    events = generate(args)
+    report = {
+        "ingest": ingest(events),
+        "memory": memory(events),
+        "recordEventUs": {
+            "withoutAggregator": round(record_cost(args.record_events, subscribed=False), 2),
+            "withAggregator": round(record_cost(args.record_events, subscribed=True), 2),
+        },
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
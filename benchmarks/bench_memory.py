@@ -0,0 +1,184 @@
+"""Memory held per live session and per 10k transactions, before and after slotted models.
+
+"Before" uses replicas of the original ``@dataclass`` models (per-instance
+``__dict__``, one ``Transaction`` and ``Money`` object per row); "after" uses
+the slotted models and the columnar :class:`TransactionBatch`. A live session
+holds its context, the last request, response and observability context, and
+its ``--recent`` most recent transactions; "after" responses carry lazy
+:class:`TransactionRecords` rather than serialised dicts.
+Allocations are measured with ``tracemalloc``.
+
+Usage: ``python benchmarks/bench_memory.py --sessions 10000``
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import tracemalloc
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional
+
+import _support  # noqa: F401  (puts src/ on sys.path)
+
+from vaai.intents.base import IntentRequest, IntentResponse, ResponseType
+from vaai.integrations.transaction_api import Money, Transaction, TransactionBatch
+from vaai.monitoring.observability import ObservabilityContext
+from vaai.utils.context import ConversationContext
+
+CATEGORIES = ["groceries", "dining", "travel", "fuel", "shopping", "utilities", "health", "general"]
+
+
+@dataclass
+class LegacyMoney:
+    currency: str
+    amount: int
+
+    @property
+    def display_value(self) -> str:
+        return f"{self.currency} {self.amount / 100:.2f}"
+
+
+@dataclass
+class LegacyTransaction:
+    transaction_id: str
+    posted_at: datetime
+    merchant_name: str
+    amount: LegacyMoney
+    category: str
+
+    def model_dump(self) -> dict:
+        return {
+            "transactionId": self.transaction_id,
+            "postedAt": self.posted_at.isoformat(),
+            "merchantName": self.merchant_name,
+            "amount": self.amount.display_value,
+            "category": self.category,
+        }
+
+
+@dataclass
+class LegacyIntentRequest:
+    intent_name: str
+    utterance: str
+    parameters: Dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class LegacyIntentResponse:
+    message: str
+    response_type: ResponseType = ResponseType.TEXT
+    data: Optional[Dict[str, object]] = None
+    requires_follow_up: bool = False
+    terminate_session: bool = False
+
+
+@dataclass
+class LegacyObservabilityContext:
+    trace_id: str
+    span_id: str
+    client_id: str
+    intent: str
+    metrics: Optional[object] = None
+    sampled: bool = False
+    spans: list = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        self._stack = [self.span_id]
+
+
+def rows(offset: int, count: int, merchants: int = 500):
+    start = datetime(2026, 1, 1)
+    for number in range(offset, offset + count):
+        yield (
+            f"TXN-{number:010d}",
+            start + timedelta(seconds=37 * number),
+            f"Merchant {number % merchants}",
+            "USD",
+            100 + (number * 7919) % 50_000,
+            CATEGORIES[number % len(CATEGORIES)],
+        )
+
+
+def legacy_transactions(offset: int, count: int) -> List[LegacyTransaction]:
+    return [
+        LegacyTransaction(txn_id, posted, merchant, LegacyMoney(currency, cents), category)
+        for txn_id, posted, merchant, currency, cents, category in rows(offset, count)
+    ]
+
+
+def slotted_transactions(offset: int, count: int) -> List[Transaction]:
+    return [
+        Transaction(txn_id, posted, merchant, Money(currency, cents), category)
+        for txn_id, posted, merchant, currency, cents, category in rows(offset, count)
+    ]
+
+
+def legacy_session(index: int, recent: int) -> tuple:
+    transactions = legacy_transactions(index * recent, recent)
+    context = ConversationContext(client_id=f"client-{index}", channel="voice")
+    request = LegacyIntentRequest(intent_name="list_recent_transactions", utterance="what did I spend recently")
+    observability = LegacyObservabilityContext(
+        trace_id=f"{index:032x}", span_id=f"{index:016x}", client_id=context.client_id, intent=request.intent_name
+    )
+    response = LegacyIntentResponse(
+        message="Here are the last transactions on your card.",
+        response_type=ResponseType.TRANSACTION_LIST,
+        data={"transactions": [txn.model_dump() for txn in transactions]},
+    )
+    return context, request, observability, response, transactions
+
+
+def slotted_session(index: int, recent: int) -> tuple:
+    transactions = TransactionBatch.from_rows(rows(index * recent, recent))
+    context = ConversationContext(client_id=f"client-{index}", channel="voice")
+    request = IntentRequest(intent_name="list_recent_transactions", utterance="what did I spend recently")
+    observability = ObservabilityContext(
+        trace_id=f"{index:032x}", span_id=f"{index:016x}", client_id=context.client_id, intent=request.intent_name
+    )
+    response = IntentResponse(
+        message="Here are the last transactions on your card.",
+        response_type=ResponseType.TRANSACTION_LIST,
+        data={"transactions": transactions.records()},
+    )
+    return context, request, observability, response, transactions
+
+
+def allocated(build: Callable[[], object]) -> int:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return after - before
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=10_000)
+    parser.add_argument("--recent", type=int, default=10)
+    parser.add_argument("--transactions", type=int, default=10_000)
+    args = parser.parse_args()
+
+    per_session = {
+        "before": allocated(lambda: [legacy_session(i, args.recent) for i in range(args.sessions)]) / args.sessions,
+        "after": allocated(lambda: [slotted_session(i, args.recent) for i in range(args.sessions)]) / args.sessions,
+    }
+    scale = 10_000 / args.transactions
+    per_10k = {
+        "dataclassList": allocated(lambda: legacy_transactions(0, args.transactions)) * scale,
+        "slottedList": allocated(lambda: slotted_transactions(0, args.transactions)) * scale,
+        "transactionBatch": allocated(lambda: TransactionBatch.from_rows(rows(0, args.transactions))) * scale,
+    }
+    report = {
+        "sessions": args.sessions,
+        "recentTransactionsPerSession": args.recent,
+        "bytesPerLiveSession": {name: round(value) for name, value in per_session.items()},
+        "bytesPer10kTransactions": {name: round(value) for name, value in per_10k.items()},
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
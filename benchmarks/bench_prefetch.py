@@ -0,0 +1,101 @@
+"""Call latency with and without speculative prefetch during verification.
+
+Each session replays :func:`call_script` with a verification step taking
+``--verify-latency`` seconds and backends taking ``--latency`` seconds per call.
+A ``--fail-rate`` fraction of sessions fails verification and hangs up, so
+their prefetches show up as wasted fetches.
+
+Usage: ``python benchmarks/bench_prefetch.py --sessions 1000 --verify-latency 0.2``
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+from _support import (
+    AlwaysVerified,
+    StubCardManagementAPI,
+    StubTransactionAPI,
+    call_script,
+    new_context,
+    percentile,
+    sync_handlers,
+)
+
+from vaai.agent import create_agent
+from vaai.intents import VerifyClientHandler
+from vaai.intents.base import IntentRequest
+from vaai.monitoring.analytics import AnalyticsCollector
+from vaai.utils.context import ConversationContext
+from vaai.utils.security import VerificationResult, VerificationService
+from vaai.workflows.prefetch import Prefetcher
+
+
+class SlowVerificationService(VerificationService):
+    """Verification that takes a fixed time, like an OTP round trip."""
+
+    def __init__(self, latency: float) -> None:
+        self.latency = latency
+
+    def verify(self, context: ConversationContext, parameters: Dict[str, str]) -> VerificationResult:
+        time.sleep(self.latency)
+        return super().verify(context, parameters)
+
+
+def run(args: argparse.Namespace, prefetch: bool) -> Dict[str, object]:
+    handlers = sync_handlers(args.latency)
+    handlers["verify_client"] = VerifyClientHandler(verification_service=SlowVerificationService(args.verify_latency))
+    prefetcher: Optional[Prefetcher] = None
+    if prefetch:
+        prefetcher = Prefetcher(
+            transaction_api=StubTransactionAPI(args.latency),
+            card_api=StubCardManagementAPI(args.latency),
+            executor=ThreadPoolExecutor(max_workers=2 * args.threads),
+        )
+    agent = create_agent(handlers, AnalyticsCollector(), AlwaysVerified(), prefetcher=prefetcher)
+    script = call_script()
+    failed_script = [IntentRequest(intent_name="verify_client", utterance="my code is 123456", parameters={"otp": "1"})]
+    rng = random.Random(args.seed)
+    failing = {index for index in range(args.sessions) if rng.random() < args.fail_rate}
+
+    def session(index: int) -> float:
+        context = new_context(index)
+        started = time.perf_counter()
+        agent.run_conversation(failed_script if index in failing else script, context)
+        elapsed = time.perf_counter() - started
+        if prefetcher is not None:
+            prefetcher.close_session(context)
+        return elapsed
+
+    wall = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.threads) as pool:
+        durations: List[float] = [d for i, d in enumerate(pool.map(session, range(args.sessions))) if i not in failing]
+    result: Dict[str, object] = {
+        "seconds": round(time.perf_counter() - wall, 3),
+        "callP50Ms": round(percentile(durations, 0.50) * 1000, 1),
+        "callP95Ms": round(percentile(durations, 0.95) * 1000, 1),
+    }
+    if prefetcher is not None:
+        result["prefetch"] = prefetcher.stats.to_json()
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=1000)
+    parser.add_argument("--latency", type=float, default=0.05, help="backend latency per call, seconds")
+    parser.add_argument("--verify-latency", type=float, default=0.2, help="verification latency, seconds")
+    parser.add_argument("--fail-rate", type=float, default=0.05, help="fraction of sessions failing verification")
+    parser.add_argument("--threads", type=int, default=64)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    print(json.dumps({"baseline": run(args, prefetch=False), "prefetch": run(args, prefetch=True)}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""PCI redaction throughput (MB/s) and correctness against a labelled corpus.
+
+The corpus in ``benchmarks/data/redaction_corpus.jsonl`` is checked first:
+every record must redact to its ``expected`` text, both in one call and when
+streamed in random-sized chunks. The script exits non-zero on any mismatch.
+Throughput is then measured on synthetic call transcripts built from the
+corpus and ordinary chatter.
+
+Usage: ``python benchmarks/bench_redaction.py --megabytes 20``
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+import _support  # noqa: F401  (puts src/ on sys.path)
+
+from vaai.utils.security import PCIRedactor
+
+CORPUS = Path(__file__).resolve().parent / "data" / "redaction_corpus.jsonl"
+CHATTER = [
+    "Thanks for calling, how can I help you today?",
+    "I think I lost my card somewhere near the train station yesterday evening.",
+    "Sure, let me take a look at the recent activity on your account.",
+    "There are 3 pending charges from the weekend, the largest is 45.20.",
+    "Can you tell me more about the charge from the coffee shop?",
+    "I'd like to freeze it until I can look in the car.",
+]
+
+
+def load_corpus() -> List[Dict[str, str]]:
+    return [json.loads(line) for line in CORPUS.read_text().splitlines() if line.strip()]
+
+
+def stream_in_chunks(redactor: PCIRedactor, text: str, rng: random.Random, max_chunk: int = 24) -> str:
+    stream = redactor.stream()
+    parts = []
+    index = 0
+    while index < len(text):
+        size = rng.randint(1, max_chunk)
+        parts.append(stream.feed(text[index : index + size]))
+        index += size
+    parts.append(stream.flush())
+    return "".join(parts)
+
+
+def check_corpus(redactor: PCIRedactor, corpus: List[Dict[str, str]], rng: random.Random) -> List[str]:
+    failures = []
+    for case in corpus:
+        if redactor.redact(case["text"]) != case["expected"]:
+            failures.append(f"{case['name']}: redact")
+        for _ in range(20):
+            if stream_in_chunks(redactor, case["text"], rng, max_chunk=8) != case["expected"]:
+                failures.append(f"{case['name']}: stream")
+                break
+    batch = redactor.redact_many(case["text"] for case in corpus)
+    failures.extend(f"{case['name']}: batch" for case, out in zip(corpus, batch) if out != case["expected"])
+    return failures
+
+
+def synthetic_records(corpus: List[Dict[str, str]], megabytes: float, secret_rate: float, rng: random.Random) -> List[str]:
+    records: List[str] = []
+    size = 0
+    while size < megabytes * 1_000_000:
+        record = rng.choice(corpus)["text"] if rng.random() < secret_rate else rng.choice(CHATTER)
+        records.append(record)
+        size += len(record) + 1
+    return records
+
+
+def throughput(label: str, func: Callable[[], object], megabytes: float) -> Dict[str, object]:
+    started = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - started
+    return {"mode": label, "seconds": round(elapsed, 3), "mbPerSecond": round(megabytes / elapsed, 1)}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--megabytes", type=float, default=20.0)
+    parser.add_argument("--secret-rate", type=float, default=0.2, help="fraction of records containing secrets")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    redactor = PCIRedactor()
+    corpus = load_corpus()
+    failures = check_corpus(redactor, corpus, rng)
+
+    records = synthetic_records(corpus, args.megabytes, args.secret_rate, rng)
+    transcript = "\n".join(records)
+    megabytes = len(transcript) / 1_000_000
+    expected = redactor.redact(transcript)
+    if stream_in_chunks(redactor, transcript[:200_000], rng, max_chunk=64) != redactor.redact(transcript[:200_000]):
+        failures.append("synthetic transcript: stream")
+
+    report = {
+        "corpusCases": len(corpus),
+        "failures": failures,
+        "megabytes": round(megabytes, 2),
+        "runs": [
+            throughput("per_record", lambda: [redactor.redact(record) for record in records], megabytes),
+            throughput("batch", lambda: redactor.redact_many(records), megabytes),
+            throughput("transcript", lambda: redactor.redact(transcript), megabytes),
+            throughput("stream_4k_chunks", lambda: _stream_fixed(redactor, transcript, 4096), megabytes),
+        ],
+        "redactedBytes": len(transcript) - len(expected),
+    }
+    print(json.dumps(report, indent=2))
+    if failures:
+        sys.exit(1)
+
+
+def _stream_fixed(redactor: PCIRedactor, text: str, chunk: int) -> str:
+    stream = redactor.stream()
+    parts = [stream.feed(text[index : index + chunk]) for index in range(0, len(text), chunk)]
+    parts.append(stream.flush())
+    return "".join(parts)
+
+
+if __name__ == "__main__":
+    main()
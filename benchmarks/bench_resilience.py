@@ -0,0 +1,168 @@
+"""Turn latency against slow backend tails and outages, with and without resilient clients.
+
+Starts ``--rate`` sessions per second (list transactions -> explain a
+charge -> freeze the card) through ``create_agent`` over stub backends whose latency is log-normal
+around ``--median-ms`` with a ``--tail-rate`` fraction of calls taking
+``--tail-ms``. For ``--outage-seconds`` starting ``--outage-start`` seconds
+into each run, every call takes ``--outage-ms`` instead. The same load runs
+twice: with the stub clients called directly, and with each wrapped in
+:class:`ResilientClient` (per-call ``--timeout-ms``, hedged reads, circuit
+breakers probing again after ``--reset-seconds``, the agent's 1.5s turn
+budget). The report gives turn p50/p99, SLO
+misses, degraded or escalated turns and the resilience counters.
+
+Usage: ``python benchmarks/bench_resilience.py --sessions 300 --rate 50``
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from typing import Callable, Dict, List
+
+from _support import AlwaysVerified, StubCardManagementAPI, StubTransactionAPI, lognormal_latency, percentile
+
+from vaai.agent import AgentConfig, create_agent
+from vaai.integrations.resilience import CircuitBreaker, HedgePolicy, ResilienceStats, ResilientClient
+from vaai.intents.base import IntentRequest
+from vaai.intents.card_management import FreezeCardHandler
+from vaai.intents.transactions import ExplainChargeHandler, ListRecentTransactionsHandler
+from vaai.monitoring.analytics import AnalyticsCollector
+from vaai.utils.context import ConversationContext
+
+TEXT_SLO_SECONDS = 1.5
+
+SCRIPT = [
+    IntentRequest(intent_name="list_recent_transactions", utterance="recent activity"),
+    IntentRequest(intent_name="explain_charge", utterance="what is this", parameters={"transaction_id": "TXN-3"}),
+    IntentRequest(intent_name="freeze_card", utterance="freeze it", parameters={"reason": "lost"}),
+]
+
+
+class Backend:
+    """Latency sampler with a heavy tail and a timed outage window."""
+
+    def __init__(self, args: argparse.Namespace, seed: int) -> None:
+        self.body = lognormal_latency(args.median_ms / 1000, seed=seed)
+        self.rng = random.Random(seed)
+        self.tail_rate = args.tail_rate
+        self.tail = args.tail_ms / 1000
+        self.outage = args.outage_ms / 1000
+        self.outage_start = args.outage_start
+        self.outage_end = args.outage_start + args.outage_seconds
+        self.started = time.monotonic()
+        self._lock = threading.Lock()
+
+    def __call__(self) -> float:
+        if self.outage_start <= time.monotonic() - self.started < self.outage_end:
+            return self.outage
+        with self._lock:
+            tail = self.rng.random() < self.tail_rate
+        return self.tail if tail else self.body()
+
+
+def run(args: argparse.Namespace, resilient: bool) -> Dict[str, object]:
+    backend = Backend(args, seed=7)
+    card_api: object = StubCardManagementAPI(backend)
+    transaction_api: object = StubTransactionAPI(backend)
+    stats = ResilienceStats()
+    if resilient:
+        executor = ThreadPoolExecutor(max_workers=args.concurrency * 2)
+        options = dict(
+            timeout=args.timeout_ms / 1000,
+            hedge=HedgePolicy(),
+            breaker_factory=lambda: CircuitBreaker(reset_timeout=args.reset_seconds),
+            stats=stats,
+            executor=executor,
+        )
+        card_api = ResilientClient(card_api, "card_api", hedged=("get_card_status",), **options)
+        transaction_api = ResilientClient(
+            transaction_api, "transaction_api", hedged=("list_recent", "get_transaction"), **options
+        )
+    handlers = [
+        ListRecentTransactionsHandler(transaction_api=transaction_api),
+        ExplainChargeHandler(transaction_api=transaction_api),
+        FreezeCardHandler(card_api=card_api),
+    ]
+    agent = create_agent(
+        {handler.name: handler for handler in handlers},
+        AnalyticsCollector(capacity=1000),
+        AlwaysVerified(),
+        AgentConfig(enable_fraud_checks=False),
+    )
+
+    latencies: List[float] = []
+    outcomes = {"ok": 0, "degraded": 0, "escalated": 0, "errors": 0}
+    lock = threading.Lock()
+
+    def session(index: int) -> None:
+        time.sleep(max(0.0, index / args.rate - (time.monotonic() - backend.started)))
+        context = ConversationContext(client_id=f"client-{index}", channel="voice", active_card_id=f"card-{index}")
+        context.is_verified = True
+        for request in SCRIPT:
+            started = time.perf_counter()
+            try:
+                response = agent.handle_turn(replace(request), context)
+                outcome = "ok"
+                if "degraded" in response.data:
+                    outcome = "degraded"
+                elif "ticket" in response.data:
+                    outcome = "escalated"
+            except Exception:  # noqa: BLE001
+                outcome = "errors"
+            elapsed = time.perf_counter() - started
+            with lock:
+                latencies.append(elapsed)
+                outcomes[outcome] += 1
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        list(pool.map(session, range(args.sessions)))
+    wall = time.perf_counter() - started
+
+    report: Dict[str, object] = {
+        "turns": len(latencies),
+        "wallSeconds": round(wall, 2),
+        "turnP50Ms": round(percentile(latencies, 0.5) * 1000, 1),
+        "turnP99Ms": round(percentile(latencies, 0.99) * 1000, 1),
+        "turnMaxMs": round(max(latencies) * 1000, 1),
+        "sloMisses": sum(1 for seconds in latencies if seconds > TEXT_SLO_SECONDS),
+        "outcomes": outcomes,
+    }
+    if resilient:
+        totals: Callable[[str], int] = stats.total
+        report["hedges"] = totals("hedges")
+        report["hedgeWins"] = totals("hedge_wins")
+        report["timeouts"] = totals("timeouts")
+        report["budgetExhausted"] = totals("budget_exhausted")
+        report["breakerTrips"] = totals("breaker_trips")
+        report["shortCircuits"] = totals("short_circuits")
+        report["endpoints"] = stats.to_json()
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=300)
+    parser.add_argument("--rate", type=float, default=50.0)
+    parser.add_argument("--concurrency", type=int, default=128)
+    parser.add_argument("--median-ms", type=float, default=40.0)
+    parser.add_argument("--tail-rate", type=float, default=0.03)
+    parser.add_argument("--tail-ms", type=float, default=2500.0)
+    parser.add_argument("--outage-start", type=float, default=2.0)
+    parser.add_argument("--outage-seconds", type=float, default=1.5)
+    parser.add_argument("--outage-ms", type=float, default=3000.0)
+    parser.add_argument("--timeout-ms", type=float, default=500.0)
+    parser.add_argument("--reset-seconds", type=float, default=0.5)
+    args = parser.parse_args()
+
+    report = {"direct": run(args, resilient=False), "resilient": run(args, resilient=True)}
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
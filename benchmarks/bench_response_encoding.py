@@ -0,0 +1,150 @@
+"""Response encode throughput and memory: :class:`ResponseEncoder` against ``json.dumps``.
+
+For transaction-list responses of each ``--rows`` size and for an escalation
+response, times the current path (``model_dump``/``to_json`` dicts, then
+``json.dumps(...).encode()``), ``json.dumps`` alone on prebuilt dicts, and
+the encoder on the lazy response the handlers now return. Peak memory
+allocated during one encode comes from ``tracemalloc``. Outputs are checked to
+be byte-identical.
+
+Usage: ``python benchmarks/bench_response_encoding.py --rows 10 1000``
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from typing import Callable, Dict
+
+import _support  # noqa: F401  (puts src/ on sys.path)
+
+from vaai.intents.base import IntentResponse, ResponseType
+from vaai.intents.encoding import ResponseEncoder
+from vaai.integrations.transaction_api import TransactionBatch
+from vaai.workflows.escalation import EscalationTicket
+
+CATEGORIES = ["groceries", "dining", "travel", "fuel", "shopping", "utilities"]
+
+
+def batch(rows: int) -> TransactionBatch:
+    start = datetime(2026, 3, 1)
+    return TransactionBatch.from_rows(
+        (
+            f"TXN-{number:08d}",
+            start + timedelta(minutes=17 * number),
+            f"Merchant {number % 200}",
+            "USD",
+            150 + (number * 7919) % 90_000,
+            CATEGORIES[number % len(CATEGORIES)],
+        )
+        for number in range(rows)
+    )
+
+
+def as_dict(response: IntentResponse, data: object) -> Dict[str, object]:
+    return {
+        "message": response.message,
+        "responseType": response.response_type.value,
+        "data": data,
+        "requiresFollowUp": response.requires_follow_up,
+        "terminateSession": response.terminate_session,
+    }
+
+
+def dumps(value: object) -> bytes:
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def rate(func: Callable[[], bytes], seconds: float) -> float:
+    count, started = 0, time.perf_counter()
+    while time.perf_counter() - started < seconds:
+        func()
+        count += 1
+    return count / (time.perf_counter() - started)
+
+
+def peak_bytes(func: Callable[[], bytes]) -> int:
+    func()
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def compare(
+    name: str,
+    current: Callable[[], bytes],
+    prebuilt: Callable[[], bytes],
+    encoder: Callable[[], bytes],
+    seconds: float,
+) -> Dict[str, object]:
+    if not current() == prebuilt() == encoder():
+        raise AssertionError(f"{name}: encoder output differs from json.dumps")
+    results = {}
+    variants = (("modelDumpPlusJsonDumps", current), ("jsonDumpsOnly", prebuilt), ("responseEncoder", encoder))
+    for label, func in variants:
+        results[label] = {"encodesPerSecond": round(rate(func, seconds)), "peakBytes": peak_bytes(func)}
+    results["bytes"] = len(encoder())
+    results["speedupVsCurrent"] = round(
+        results["responseEncoder"]["encodesPerSecond"] / results["modelDumpPlusJsonDumps"]["encodesPerSecond"], 2
+    )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[10, 1000])
+    parser.add_argument("--seconds", type=float, default=1.0)
+    args = parser.parse_args()
+
+    encoder = ResponseEncoder()
+    report: Dict[str, object] = {}
+    for rows in args.rows:
+        transactions = batch(rows)
+        lazy = IntentResponse(
+            message="Here are the last transactions on your card.",
+            response_type=ResponseType.TRANSACTION_LIST,
+            data={"transactions": transactions.records()},
+            requires_follow_up=True,
+        )
+        materialised = list(transactions)
+        prebuilt = as_dict(lazy, {"transactions": [txn.model_dump() for txn in materialised]})
+        report[f"transactionList{rows}"] = compare(
+            f"{rows} rows",
+            lambda: dumps(as_dict(lazy, {"transactions": [txn.model_dump() for txn in materialised]})),
+            lambda: dumps(prebuilt),
+            lambda: encoder.encode(lazy),
+            args.seconds,
+        )
+
+    ticket = EscalationTicket(
+        client_id="client-42",
+        case_id="CASE-20260301120000-A1B2C3-000042",
+        issue_type="freeze_card",
+        urgency="high",
+        created_at=datetime(2026, 3, 1, 12, 0, 0),
+        metadata={"reason": "card_api_failure", "trace_id": "9f1c2b7e4d3a4f5e8a6b1c2d3e4f5a6b"},
+    )
+    escalation = IntentResponse(
+        message="I'll bring a specialist to assist you further.",
+        response_type=ResponseType.CASE_ESCALATION,
+        data={"ticket": ticket},
+        requires_follow_up=True,
+    )
+    prebuilt = as_dict(escalation, {"ticket": ticket.to_json()})
+    report["escalation"] = compare(
+        "escalation",
+        lambda: dumps(as_dict(escalation, {"ticket": ticket.to_json()})),
+        lambda: dumps(prebuilt),
+        lambda: encoder.encode(escalation),
+        args.seconds,
+    )
+    report["binaryFrameBytes"] = len(encoder.encode_frame(escalation))
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
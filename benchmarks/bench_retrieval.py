@@ -0,0 +1,127 @@
+"""Index build time and query latency of the policy/FAQ retrieval index.
+
+Generates a deterministic synthetic corpus of ``--chunks`` passages, each
+about one of ``--topics`` topics, ingests it into a memory-mapped
+:class:`KnowledgeBase`, and times exact and IVF queries. IVF recall@k is
+measured against the exact results. Incremental add/delete of one document is
+timed on the full index.
+
+Usage: ``python benchmarks/bench_retrieval.py --chunks 100000``
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import tempfile
+import time
+from pathlib import Path
+from typing import List, Tuple
+
+from _support import percentile
+
+from vaai.integrations.vector_index import HashingEmbedder, KnowledgeBase, VectorIndex
+
+FILLER = (
+    "the a of to and in for on with your our we you is are be can may will card account bank "
+    "customer service policy please note this that when after before within days business"
+).split()
+
+
+def topic_words(rng: random.Random, topics: int) -> List[List[str]]:
+    return [[f"t{topic}w{word}" for word in range(12)] for topic in range(topics)]
+
+
+def passage(rng: random.Random, words: List[str], length: int = 100) -> str:
+    return " ".join(rng.choice(words) if rng.random() < 0.3 else rng.choice(FILLER) for _ in range(length))
+
+
+def corpus(rng: random.Random, chunks: int, topics: int) -> Tuple[List[Tuple[str, str, str]], List[List[str]]]:
+    vocabulary = topic_words(rng, topics)
+    documents = []
+    for number in range(chunks):
+        topic = number % topics
+        documents.append((f"doc-{number}", f"topic {topic}", passage(rng, vocabulary[topic])))
+    return documents, vocabulary
+
+
+def time_queries(kb: KnowledgeBase, queries: List[str], top_k: int) -> Tuple[List[float], List[List[str]]]:
+    latencies, results = [], []
+    for query in queries:
+        started = time.perf_counter()
+        hits = kb.search(query, top_k)
+        latencies.append(time.perf_counter() - started)
+        results.append([hit.chunk_id for hit in hits])
+    return latencies, results
+
+
+def summary(latencies: List[float]) -> dict:
+    return {
+        "p50Ms": round(percentile(latencies, 0.50) * 1000, 3),
+        "p99Ms": round(percentile(latencies, 0.99) * 1000, 3),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--chunks", type=int, default=100_000)
+    parser.add_argument("--topics", type=int, default=500)
+    parser.add_argument("--dim", type=int, default=256)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--top-k", type=int, default=5)
+    parser.add_argument("--nprobe", type=int, default=16)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    documents, vocabulary = corpus(rng, args.chunks, args.topics)
+    queries = [" ".join(rng.sample(vocabulary[rng.randrange(args.topics)], 4)) for _ in range(args.queries)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        embedder = HashingEmbedder(dim=args.dim)
+        kb = KnowledgeBase(VectorIndex(args.dim, path=Path(tmp) / "policies"), embedder)
+        started = time.perf_counter()
+        kb.ingest_many(documents)
+        build_seconds = time.perf_counter() - started
+
+        exact_latencies, exact_results = time_queries(kb, queries, args.top_k)
+
+        started = time.perf_counter()
+        kb.index.build_ivf()
+        ivf_seconds = time.perf_counter() - started
+        kb.nprobe = args.nprobe
+        ivf_latencies, ivf_results = time_queries(kb, queries, args.top_k)
+        recall = sum(len(set(a) & set(b)) for a, b in zip(exact_results, ivf_results)) / sum(
+            len(result) for result in exact_results
+        )
+
+        started = time.perf_counter()
+        kb.ingest("doc-new", "topic 0", passage(rng, vocabulary[0]))
+        add_ms = (time.perf_counter() - started) * 1000
+        started = time.perf_counter()
+        kb.delete_document("doc-new")
+        delete_ms = (time.perf_counter() - started) * 1000
+
+        started = time.perf_counter()
+        reopened = VectorIndex.open(Path(tmp) / "policies")
+        open_seconds = time.perf_counter() - started
+
+    report = {
+        "chunks": len(reopened.metadata),
+        "dim": args.dim,
+        "buildSeconds": round(build_seconds, 2),
+        "reopenSeconds": round(open_seconds, 2),
+        "exact": summary(exact_latencies),
+        "ivf": {
+            **summary(ivf_latencies),
+            "buildSeconds": round(ivf_seconds, 2),
+            "nprobe": args.nprobe,
+            f"recallAt{args.top_k}": round(recall, 3),
+        },
+        "incremental": {"addDocumentMs": round(add_ms, 2), "deleteDocumentMs": round(delete_ms, 2)},
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+"""Write cost per turn and recovery time of :class:`SessionJournal`.
+
+Part one replays ``--sessions`` calls (verify -> list transactions -> explain
+a charge -> freeze) through ``create_agent`` with zero-latency stub backends
+on ``--concurrency`` threads: once without a journal, once journaling with
+fsync per group commit, and once without fsync. It reports turn latency, the
+time spent in :meth:`~SessionJournal.record`, bytes and fsyncs per turn, and
+write amplification. For comparison it also gives the bytes per turn of
+pickling the whole context, which is what ``WorkerPool(replicate_state=True)``
+ships after every turn.
+
+Part two journals ``--recovery-sessions`` sessions and times
+:func:`recover_sessions` from the log alone and from a snapshot plus a tail
+in which ``--tail-fraction`` of the sessions changed again.
+
+Usage: ``python benchmarks/bench_session_journal.py --sessions 2000 --concurrency 16 --recovery-sessions 50000``
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import pickle
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from _support import AlwaysVerified, call_script, new_context, percentile, sync_handlers
+
+from vaai.agent import create_agent
+from vaai.monitoring.analytics import AnalyticsCollector
+from vaai.utils.context import ConversationContext
+from vaai.utils.journal import SessionJournal, recover_sessions
+
+
+class TimedJournal(SessionJournal):
+    """Journal that keeps the latency of every :meth:`record` call."""
+
+    def __init__(self, *args: object, **kwargs: object) -> None:
+        super().__init__(*args, **kwargs)
+        self.samples: List[float] = []
+
+    def record(self, context: ConversationContext, session_id: Optional[str] = None) -> bool:
+        started = time.perf_counter()
+        changed = super().record(context, session_id)
+        self.samples.append(time.perf_counter() - started)
+        return changed
+
+
+def directory_bytes(directory: Path) -> int:
+    return sum(path.stat().st_size for path in directory.iterdir())
+
+
+def run_turns(args: argparse.Namespace, journal: Optional[TimedJournal]) -> Dict[str, object]:
+    agent = create_agent(sync_handlers(), AnalyticsCollector(capacity=1000), AlwaysVerified(), journal=journal)
+    script = call_script()
+    latencies: List[float] = []
+    pickled: List[int] = []
+    lock = threading.Lock()
+
+    def session(index: int) -> None:
+        context = new_context(index)
+        for request in script:
+            started = time.perf_counter()
+            agent.handle_turn(replace(request), context)
+            elapsed = time.perf_counter() - started
+            size = len(pickle.dumps(context, protocol=pickle.HIGHEST_PROTOCOL))
+            with lock:
+                latencies.append(elapsed)
+                pickled.append(size)
+
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        list(pool.map(session, range(args.sessions)))
+    turns = len(latencies)
+    report: Dict[str, object] = {
+        "turnP50Us": round(percentile(latencies, 0.5) * 1e6, 1),
+        "turnP99Us": round(percentile(latencies, 0.99) * 1e6, 1),
+        "pickledContextBytesPerTurn": round(sum(pickled) / turns),
+    }
+    if journal is not None:
+        journal.close()
+        stats = journal.stats
+        report.update(
+            {
+                "journalP50Us": round(percentile(journal.samples, 0.5) * 1e6, 1),
+                "journalP99Us": round(percentile(journal.samples, 0.99) * 1e6, 1),
+                "logBytesPerTurn": round(stats.log_bytes / turns, 1),
+                "fsyncsPerTurn": round(stats.commits / turns, 4) if journal.fsync else 0.0,
+                "stats": stats.to_json(),
+            }
+        )
+    return report
+
+
+def populate(directory: Path, sessions: int) -> List[ConversationContext]:
+    journal = SessionJournal(directory, fsync=False, segment_bytes=1 << 40)
+    contexts = []
+    for index in range(sessions):
+        context = new_context(index)
+        journal.record(context)
+        context.is_verified = True
+        context.set_metadata("trace_id", f"{index:032x}")
+        journal.record(context)
+        context.add_note(f"Card card-{index} frozen: FRZ-card-{index}")
+        journal.record(context)
+        contexts.append(context)
+    journal.close()
+    return contexts
+
+
+def timed_recovery(directory: Path, sessions: int) -> Dict[str, object]:
+    started = time.perf_counter()
+    recovered = recover_sessions(directory)
+    seconds = time.perf_counter() - started
+    assert len(recovered) == sessions, (len(recovered), sessions)
+    return {"seconds": round(seconds, 3), "bytesRead": directory_bytes(directory)}
+
+
+def run_recovery(args: argparse.Namespace, root: Path) -> Dict[str, object]:
+    directory = root / "recovery"
+    contexts = populate(directory, args.recovery_sessions)
+    log_only = timed_recovery(directory, len(contexts))
+
+    journal = SessionJournal(directory, fsync=False, segment_bytes=1 << 40)
+    journal.snapshot()
+    for context in contexts[: int(len(contexts) * args.tail_fraction)]:
+        context.add_note("Replacement card dispatched")
+        journal.record(context)
+    journal.close()
+    return {
+        "sessions": len(contexts),
+        "logOnly": log_only,
+        "snapshotPlusTail": timed_recovery(directory, len(contexts)),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--recovery-sessions", type=int, default=50_000)
+    parser.add_argument("--tail-fraction", type=float, default=0.1)
+    parser.add_argument("--directory", help="Journal location (defaults to a temporary directory).")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(dir=args.directory) as tmp:
+        root = Path(tmp)
+        report = {
+            "noJournal": run_turns(args, None),
+            "fsync": run_turns(args, TimedJournal(root / "fsync")),
+            "noFsync": run_turns(args, TimedJournal(root / "no-fsync", fsync=False)),
+            "recovery": run_recovery(args, root),
+        }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Per-turn overhead of span timing and latency histograms.
+
+Runs the same zero-latency call script through ``handle_turn`` with metrics
+disabled, with histograms only, and with histograms plus full span retention
+(``trace_sample_rate=1.0``), and prints the added microseconds per turn. The
+final histogram snapshot is printed in Prometheus text format.
+
+Usage: ``python benchmarks/bench_span_overhead.py --sessions 20000``
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Optional
+
+from _support import AlwaysVerified, call_script, new_context, sync_handlers
+
+from vaai.agent import AgentConfig, create_agent
+from vaai.monitoring.analytics import AnalyticsCollector
+from vaai.monitoring.metrics import LatencyMetrics
+
+
+def per_turn(sessions: int, metrics: Optional[LatencyMetrics], sample_rate: float) -> float:
+    agent = create_agent(
+        sync_handlers(),
+        AnalyticsCollector(capacity=1000),
+        AlwaysVerified(),
+        config=AgentConfig(trace_sample_rate=sample_rate),
+        metrics=metrics,
+    )
+    script = call_script()
+    started = time.perf_counter()
+    for index in range(sessions):
+        agent.run_conversation(script, new_context(index))
+    return (time.perf_counter() - started) / (sessions * len(script))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=20_000)
+    parser.add_argument("--prometheus", action="store_true", help="print the scraped histograms")
+    args = parser.parse_args()
+
+    baseline = per_turn(args.sessions, None, 0.0)
+    metrics = LatencyMetrics()
+    histograms = per_turn(args.sessions, metrics, 0.0)
+    sampled = per_turn(args.sessions, LatencyMetrics(), 1.0)
+    print(f"no metrics        : {baseline * 1e6:8.2f} us/turn")
+    print(f"histograms        : {histograms * 1e6:8.2f} us/turn (+{(histograms - baseline) * 1e6:.2f})")
+    print(f"histograms+spans  : {sampled * 1e6:8.2f} us/turn (+{(sampled - baseline) * 1e6:.2f})")
+    if args.prometheus:
+        print(metrics.to_prometheus())
+
+
+if __name__ == "__main__":
+    main()
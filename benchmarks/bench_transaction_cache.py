@@ -0,0 +1,89 @@
+"""Backend calls saved by :class:`CachingTransactionAPI` on "what is this charge" calls.
+
+Each session lists recent transactions for a card and then asks about one of
+them. Sessions are spread over ``--cards`` distinct cards, so concurrent
+sessions on the same card exercise single-flight coalescing.
+
+Usage: ``python benchmarks/bench_transaction_cache.py --sessions 5000 --cards 500``
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+
+from _support import StubTransactionAPI
+
+from vaai.integrations.transaction_api import Transaction, TransactionAPI, TransactionBatch
+from vaai.integrations.transaction_cache import CachingTransactionAPI
+
+
+class CountingTransactionAPI(StubTransactionAPI):
+    """Stub backend with card-scoped transaction ids and a call counter."""
+
+    def __init__(self, latency: float) -> None:
+        super().__init__(latency)
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def _count(self) -> None:
+        with self._lock:
+            self.calls += 1
+
+    def list_recent(self, *, card_id: str | None, limit: int) -> TransactionBatch:
+        self._count()
+        transactions = super().list_recent(card_id=card_id, limit=limit)
+        return TransactionBatch.from_transactions(
+            replace(transaction, transaction_id=f"{card_id}-{transaction.transaction_id}") for transaction in transactions
+        )
+
+    def get_transaction(self, *, transaction_id: str) -> Transaction:
+        self._count()
+        return super().get_transaction(transaction_id=transaction_id)
+
+
+def run(api: TransactionAPI, sessions: int, cards: int, threads: int) -> float:
+    def session(index: int) -> None:
+        card_id = f"card-{index % cards}"
+        api.list_recent(card_id=card_id, limit=10)
+        api.get_transaction(transaction_id=f"{card_id}-TXN-3")
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(session, range(sessions)))
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=5000)
+    parser.add_argument("--cards", type=int, default=500)
+    parser.add_argument("--threads", type=int, default=64)
+    parser.add_argument("--latency", type=float, default=0.005)
+    args = parser.parse_args()
+
+    uncached = CountingTransactionAPI(args.latency)
+    uncached_elapsed = run(uncached, args.sessions, args.cards, args.threads)
+
+    backend = CountingTransactionAPI(args.latency)
+    cache = CachingTransactionAPI(backend=backend)
+    cached_elapsed = run(cache, args.sessions, args.cards, args.threads)
+
+    print(
+        json.dumps(
+            {
+                "sessions": args.sessions,
+                "cards": args.cards,
+                "uncached": {"backendCalls": uncached.calls, "seconds": round(uncached_elapsed, 3)},
+                "cached": {"backendCalls": backend.calls, "seconds": round(cached_elapsed, 3), **cache.stats.to_json()},
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
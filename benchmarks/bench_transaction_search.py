@@ -0,0 +1,148 @@
+"""Query latency of :class:`TransactionStore` search on a single long card history.
+
+Bulk-loads ``--transactions`` rows (default one million, about three years
+of history) for one card, then times incremental appends and a mix of
+searches: merchant substring plus a one-month window ("the charge from Acme
+last month"), category plus amount range, amount range alone, and paging
+through an unfiltered history with cursors. The baseline is the current
+approach: fetch the full history as a :class:`TransactionBatch` and filter
+it in Python with :meth:`TransactionQuery.matches`, timed over
+``--baseline-queries`` runs. Latencies are in milliseconds.
+
+Usage: ``python benchmarks/bench_transaction_search.py --transactions 1000000 --queries 200``
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import statistics
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterator, List
+
+import _support  # noqa: F401  (puts src/ on sys.path)
+
+from vaai.integrations.transaction_api import TransactionBatch, TransactionQuery
+from vaai.integrations.transaction_store import TransactionStore
+
+CATEGORIES = ["groceries", "dining", "travel", "fuel", "shopping", "utilities", "health", "entertainment"]
+START = datetime(2023, 1, 1)
+
+
+def history(count: int, merchants: int, seed: int = 11) -> Iterator[tuple]:
+    rng = random.Random(seed)
+    names = [f"Merchant {number:04d}" for number in range(merchants - 3)]
+    names += ["Acme Hardware", "Acme Foods", "ACME Travel"]
+    step = timedelta(days=3 * 365) / count
+    for number in range(count):
+        # A few merchants take most of the volume, as on real cards.
+        popular = rng.random() < 0.7
+        merchant = min(int(rng.paretovariate(1.2)) - 1, len(names) - 1) if popular else rng.randrange(len(names))
+        yield (
+            f"TXN-{number:09d}",
+            START + step * number,
+            names[merchant],
+            "USD",
+            rng.randrange(100, 100_000),
+            rng.choice(CATEGORIES),
+        )
+
+
+def percentiles(samples: List[float]) -> Dict[str, float]:
+    ordered = sorted(samples)
+    return {
+        "p50": round(statistics.median(ordered) * 1000, 3),
+        "p99": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))] * 1000, 3),
+    }
+
+
+def timed(func: Callable[[], object], runs: int) -> List[float]:
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--transactions", type=int, default=1_000_000)
+    parser.add_argument("--merchants", type=int, default=5_000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--baseline-queries", type=int, default=3)
+    parser.add_argument("--page-size", type=int, default=10)
+    args = parser.parse_args()
+
+    rows = list(history(args.transactions, args.merchants))
+    store = TransactionStore()
+    started = time.perf_counter()
+    store.load("card-1", rows)
+    load_seconds = time.perf_counter() - started
+
+    end = rows[-1][1]
+    appended = [
+        (f"NEW-{number:06d}", end + timedelta(minutes=number + 1), "Acme Foods", "USD", 4_200, "groceries")
+        for number in range(10_000)
+    ]
+    started = time.perf_counter()
+    for offset in range(0, len(appended), 100):
+        store.append("card-1", appended[offset : offset + 100])
+    append_seconds = time.perf_counter() - started
+
+    rng = random.Random(5)
+    month = timedelta(days=30)
+
+    def window() -> tuple:
+        start = START + timedelta(days=rng.randrange(3 * 365 - 30))
+        return start, start + month
+
+    def merchant_last_month() -> TransactionQuery:
+        start, stop = window()
+        return TransactionQuery(merchant="acme", start=start, end=stop)
+
+    def category_amount() -> TransactionQuery:
+        low = rng.randrange(100, 90_000)
+        return TransactionQuery(category=rng.choice(CATEGORIES), min_amount=low, max_amount=low + 5_000)
+
+    def amount_only() -> TransactionQuery:
+        low = rng.randrange(100, 99_000)
+        return TransactionQuery(min_amount=low, max_amount=low + 1_000)
+
+    mixes = {"merchantLastMonth": merchant_last_month, "categoryAmount": category_amount, "amountOnly": amount_only}
+    searches: Dict[str, object] = {}
+    for name, make in mixes.items():
+        searches[name] = percentiles(
+            timed(lambda: store.search(card_id="card-1", query=make(), limit=args.page_size), args.queries)
+        )
+
+    def page_through() -> None:
+        pages = store.iter_pages(card_id="card-1", limit=args.page_size)
+        for _ in range(10):
+            next(pages)
+
+    searches["tenPagesUnfiltered"] = percentiles(timed(page_through, args.queries))
+
+    full = TransactionBatch.from_rows(rows)
+
+    def baseline() -> None:
+        query = merchant_last_month()
+        matches = [txn for txn in full if query.matches(txn)]
+        matches.sort(key=lambda txn: txn.posted_at, reverse=True)
+        matches[: args.page_size]
+
+    baseline_latency = percentiles(timed(baseline, args.baseline_queries))
+    report = {
+        "transactions": len(rows) + len(appended),
+        "loadSeconds": round(load_seconds, 2),
+        "appendsPerSecond": round(len(appended) / append_seconds),
+        "searchMs": searches,
+        "baselineScanMs": {"merchantLastMonth": baseline_latency},
+        "speedupMerchantLastMonth": round(baseline_latency["p50"] / searches["merchantLastMonth"]["p50"]),
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
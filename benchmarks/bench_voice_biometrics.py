@@ -0,0 +1,83 @@
+"""Voiceprint verifications per second against a large memory-mapped template store.
+
+Builds a store of ``--enrolled`` random templates in a temporary directory,
+reopens it read-only as a worker process would, then scores batches of
+genuine and impostor probes at each ``--batch-sizes`` value.
+
+Usage: ``python benchmarks/bench_voice_biometrics.py --enrolled 1000000 --dim 192``
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+import _support  # noqa: F401  (puts src/ on sys.path)
+
+from vaai.utils.biometrics import VoiceBiometricScorer, VoiceprintStore
+
+
+def build_store(path: Path, enrolled: int, dim: int, rng: np.random.Generator, chunk: int = 100_000) -> float:
+    started = time.perf_counter()
+    store = VoiceprintStore.create(path, dim=dim, capacity=enrolled)
+    for offset in range(0, enrolled, chunk):
+        count = min(chunk, enrolled - offset)
+        ids = [f"client-{i}" for i in range(offset, offset + count)]
+        store.enroll_many(ids, rng.standard_normal((count, dim), dtype=np.float32))
+    store.flush()
+    return time.perf_counter() - started
+
+
+def run_batches(scorer: VoiceBiometricScorer, enrolled: int, batch: int, total: int, rng: np.random.Generator) -> dict:
+    dim = scorer.store.dim
+    passed = 0
+    started = time.perf_counter()
+    for _ in range(max(1, total // batch)):
+        rows = rng.integers(0, enrolled, size=batch)
+        templates = scorer.store.matrix[rows].astype(np.float32)
+        # About half genuine (template plus noise), half impostors (random voices).
+        probes = templates + rng.normal(0, 0.02, size=templates.shape).astype(np.float32)
+        impostors = rng.random(batch) < 0.5
+        probes[impostors] = rng.standard_normal((int(impostors.sum()), dim), dtype=np.float32)
+        results = scorer.verify_batch([(f"client-{row}", probe) for row, probe in zip(rows, probes)])
+        passed += sum(result.passed for result in results)
+    elapsed = time.perf_counter() - started
+    scored = max(1, total // batch) * batch
+    return {
+        "batch": batch,
+        "verifications": scored,
+        "verificationsPerSecond": round(scored / elapsed),
+        "passRate": round(passed / scored, 3),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--enrolled", type=int, default=1_000_000)
+    parser.add_argument("--dim", type=int, default=192)
+    parser.add_argument("--verifications", type=int, default=20_000)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 16, 256])
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "voiceprints"
+        build_seconds = build_store(path, args.enrolled, args.dim, rng)
+        scorer = VoiceBiometricScorer(store=VoiceprintStore.open(path))
+        report = {
+            "enrolled": args.enrolled,
+            "dim": args.dim,
+            "storeBytes": path.with_suffix(".npy").stat().st_size,
+            "buildSeconds": round(build_seconds, 2),
+            "runs": [run_batches(scorer, args.enrolled, batch, args.verifications, rng) for batch in args.batch_sizes],
+        }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
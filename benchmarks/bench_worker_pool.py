@@ -0,0 +1,176 @@
+"""Turn throughput of :class:`WorkerPool` against worker count, plus failover.
+
+Every call verifies the caller and then asks for a call summary whose handler
+does CPU-bound work (PCI-redacting a ``--transcript-kb`` transcript), the kind
+of work the GIL serialises within one process. Throughput is measured for an
+in-process agent driven by threads and for pools of each ``--workers`` count.
+Finally one worker is killed mid-run to count lost turns and re-homed
+sessions. Scaling is bounded by the cores available (reported as ``cpus``).
+Before timing, ``error_check`` makes sure a handler's exception (including one
+that cannot be pickled) reaches the caller and leaves the worker serving.
+
+Usage: ``python benchmarks/bench_worker_pool.py --workers 1 2 4 --sessions 400``
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import signal
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Callable, List
+
+from _support import AlwaysVerified, new_context, sync_handlers
+
+from vaai.agent import VAaiAgent, create_agent
+from vaai.intents.base import IntentRequest, IntentResponse, ResponseType
+from vaai.integrations.resilience import DeadlineExceeded
+from vaai.monitoring.analytics import AnalyticsCollector
+from vaai.serving import WorkerLost, WorkerPool
+from vaai.utils.security import redact
+
+TRANSCRIPT_KB = 32
+
+
+def transcript(size_kb: int, seed: int = 3) -> str:
+    rng = random.Random(seed)
+    words = "caller said the card ending 4111 1111 1111 1111 was charged twice at the store today".split()
+    text = []
+    while sum(len(word) + 1 for word in text) < size_kb * 1024:
+        text.append(rng.choice(words))
+    return " ".join(text)
+
+
+@dataclass
+class SummariseCallHandler:
+    """Redacts the call transcript; stands in for any CPU-heavy turn work."""
+
+    text: str
+    name: str = "summarise_call"
+    requires_verification: bool = True
+
+    def handle(self, request, context, observability) -> IntentResponse:
+        redacted = redact(self.text)
+        return IntentResponse(message=f"Summary ready ({len(redacted)} chars).", response_type=ResponseType.TEXT)
+
+
+class UnpicklableError(Exception):
+    def __init__(self) -> None:
+        super().__init__("cannot cross the pipe")
+        self.callback = lambda: None
+
+
+@dataclass
+class FailingHandler:
+    """Raises ``parameters["error"]``: a deadline error, or one that cannot be pickled."""
+
+    name: str = "fail"
+    requires_verification: bool = False
+
+    def handle(self, request, context, observability) -> IntentResponse:
+        if request.parameters.get("error") == "unpicklable":
+            raise UnpicklableError()
+        raise DeadlineExceeded("turn budget exhausted", endpoint="card_api.freeze_card", reason="card_api_timeout")
+
+
+def build_agent() -> VAaiAgent:
+    handlers = sync_handlers()
+    handlers["summarise_call"] = SummariseCallHandler(text=transcript(TRANSCRIPT_KB))
+    handlers["fail"] = FailingHandler()
+    return create_agent(handlers, AnalyticsCollector(), AlwaysVerified())
+
+
+def script() -> List[IntentRequest]:
+    return [
+        IntentRequest(intent_name="verify_client", utterance="my code", parameters={"otp": "000000"}),
+        IntentRequest(intent_name="summarise_call", utterance="summarise"),
+        IntentRequest(intent_name="summarise_call", utterance="summarise again"),
+    ]
+
+
+def drive(handle: Callable[[IntentRequest, object], IntentResponse], sessions: int, concurrency: int) -> float:
+    def call(index: int) -> None:
+        context = new_context(index)
+        for request in script():
+            handle(request, context)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(call, range(sessions)))
+    return time.perf_counter() - started
+
+
+def fail(error: str) -> IntentRequest:
+    return IntentRequest(intent_name="fail", utterance="", parameters={"error": error})
+
+
+def error_check() -> None:
+    """A handler's exception must reach the caller, and the worker must keep answering."""
+
+    with WorkerPool(build_agent, workers=1, threads_per_worker=2) as pool:
+        context = new_context(0)
+        error = pool.submit(fail("deadline"), context).exception(timeout=5)
+        assert isinstance(error, DeadlineExceeded) and error.reason == "card_api_timeout", error
+        error = pool.submit(fail("unpicklable"), context).exception(timeout=5)
+        assert isinstance(error, RuntimeError) and "UnpicklableError" in str(error), error
+        assert pool.handle_turn(script()[0], context).message
+
+
+def failover(sessions: int, concurrency: int) -> dict:
+    with WorkerPool(build_agent, workers=2, threads_per_worker=2) as pool:
+        contexts = [new_context(index) for index in range(sessions)]
+        for context in contexts:
+            pool.handle_turn(script()[0], context)
+        victim = pool.worker_for(contexts[0].client_id)
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            futures = [executor.submit(pool.handle_turn, script()[1], context) for context in contexts]
+            time.sleep(0.05)
+            os.kill(pool.worker_pid(victim), signal.SIGKILL)
+            wait(futures)
+        lost = sum(1 for future in futures if isinstance(future.exception(), WorkerLost))
+        time.sleep(0.5)
+        retried_ok = sum(1 for context in contexts if pool.handle_turn(script()[1], context).message)
+        return {
+            "sessions": sessions,
+            "lostInFlightTurns": lost,
+            "turnsAfterFailover": retried_ok,
+            "liveWorkers": len(pool.live_workers),
+            **pool.stats.to_json(),
+        }
+
+
+def main() -> None:
+    global TRANSCRIPT_KB
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--sessions", type=int, default=400)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--transcript-kb", type=int, default=TRANSCRIPT_KB)
+    args = parser.parse_args()
+    TRANSCRIPT_KB = args.transcript_kb
+
+    error_check()
+    turns = args.sessions * len(script())
+    agent = build_agent()
+    in_process = drive(agent.handle_turn, args.sessions, args.concurrency)
+    results = {"inProcess": round(turns / in_process, 1)}
+    for workers in args.workers:
+        with WorkerPool(build_agent, workers=workers, threads_per_worker=max(1, args.concurrency // workers)) as pool:
+            seconds = drive(pool.handle_turn, args.sessions, args.concurrency)
+        results[f"workers{workers}"] = round(turns / seconds, 1)
+
+    report = {
+        "cpus": os.cpu_count(),
+        "turns": turns,
+        "transcriptKb": args.transcript_kb,
+        "turnsPerSecond": results,
+        "failover": failover(min(args.sessions, 200), args.concurrency),
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,21 @@
 """VAai — Virtual Agent for payment-card support."""
-from .agent import AgentConfig, VAaiAgent, create_agent
+from __future__ import annotations
 
-__all__ = ["AgentConfig", "VAaiAgent", "create_agent"]
+from typing import TYPE_CHECKING
+
+from .utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .agent import AgentConfig, VAaiAgent, create_agent
+    from .intents.registry import HandlerRegistry
+
+_EXPORTS = {
+    "AgentConfig": ".agent",
+    "HandlerRegistry": ".intents.registry",
+    "VAaiAgent": ".agent",
+    "create_agent": ".agent",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+__all__ = ["AgentConfig", "HandlerRegistry", "VAaiAgent", "create_agent"]
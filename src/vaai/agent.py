@@ -1,18 +1,52 @@
 """Core agent orchestration logic for VAai payment-card virtual assistant."""
 from __future__ import annotations
 
+import asyncio
+import contextvars
+import functools
+import inspect
+import time
+from concurrent.futures import Executor
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Protocol
+from typing import (
+    TYPE_CHECKING,
+    AsyncIterator,
+    Callable,
+    Iterator,
+    List,
+    MutableMapping,
+    Optional,
+    Protocol,
+    TypeVar,
+    Union,
+)
 
-from .intents.base import IntentHandler, IntentRequest, IntentResponse
+from .intents.base import (
+    AsyncIntentHandler,
+    ChunkKind,
+    IntentHandler,
+    IntentRequest,
+    IntentResponse,
+    ResponseChunk,
+    collect_response,
+    collect_response_async,
+    stream_response,
+)
 from .monitoring.analytics import AnalyticsCollector
+from .monitoring.metrics import LatencyMetrics
 from .monitoring.observability import ObservabilityContext
 from .utils.context import ConversationContext
-from .workflows.router import WorkflowRouter
+from .workflows.escalation import EscalationRequired
+from .workflows.router import IntentFallback, UtteranceClassifier, WorkflowRouter
 
+if TYPE_CHECKING:
+    # Optional subsystems; imported by whoever constructs them, not on ``import vaai.agent``.
+    from .utils.audit import AuditLog
+    from .utils.biometrics import VoiceBiometricScorer
+    from .utils.journal import SessionJournal
+    from .workflows.prefetch import Prefetcher
 
-class EscalationRequired(Exception):
-    """Raised when a request must be escalated to a human agent."""
+T = TypeVar("T")
 
 
 @dataclass
@@ -23,6 +57,11 @@ class AgentConfig:
     enable_voice_biometrics: bool = True
     enable_rag: bool = True
     enable_fraud_checks: bool = True
+    trace_sample_rate: float = 0.0
+    turn_budget: Optional[float] = 1.5
+    intent_confidence_threshold: float = 0.7
+    fraud_review_threshold: float = 0.6
+    fraud_block_threshold: float = 0.9
 
 
 class AuthenticationProvider(Protocol):
@@ -32,14 +71,42 @@ class AuthenticationProvider(Protocol):
         """Return ``True`` if the caller is authenticated."""
 
 
+class AsyncAuthenticationProvider(Protocol):
+    """Asyncio-native variant of :class:`AuthenticationProvider`."""
+
+    async def verify_identity(self, context: ConversationContext) -> bool:
+        """Return ``True`` if the caller is authenticated."""
+
+
+class FraudRiskProvider(Protocol):
+    """Supplies a card's current fraud risk in ``[0, 1]``."""
+
+    def card_risk(self, card_id: str) -> float:
+        """Return the risk of the card's recent activity."""
+
+
+class ProfileProvider(Protocol):
+    """Fills session personalization (loyalty tier, preferences) from the CRM."""
+
+    def personalize(self, context: ConversationContext) -> object:
+        """Populate ``context`` from the caller's profile; must not raise."""
+
+
 @dataclass
 class VAaiAgent:
     """High-level orchestrator for handling multi-turn conversations."""
 
     router: WorkflowRouter
     analytics: AnalyticsCollector
-    auth_provider: AuthenticationProvider
+    auth_provider: Union[AuthenticationProvider, AsyncAuthenticationProvider]
     config: AgentConfig = field(default_factory=AgentConfig)
+    executor: Optional[Executor] = None
+    metrics: Optional[LatencyMetrics] = None
+    prefetcher: Optional[Prefetcher] = None
+    fraud_scorer: Optional[FraudRiskProvider] = None
+    profiles: Optional[ProfileProvider] = None
+    journal: Optional[SessionJournal] = None
+    audit: Optional[AuditLog] = None
 
     def handle_turn(self, request: IntentRequest, context: ConversationContext) -> IntentResponse:
         """Process a single conversational turn.
@@ -48,41 +115,150 @@ class VAaiAgent:
         workflow, logs the interaction, and returns the generated response.
         """
 
-        self.analytics.record_event("turn_start", context=context, metadata={"intent": request.intent_name})
-
-        if not context.is_verified and request.intent_name != "verify_client":
-            if not self.auth_provider.verify_identity(context):
-                self.analytics.record_event("verification_failed", context=context)
-                raise EscalationRequired("Unable to verify caller identity.")
-            context.is_verified = True
+        return collect_response(self.handle_turn_stream(request, context))
 
-        observability = ObservabilityContext.from_context(context, request)
-        self.analytics.bind_trace(observability.trace_id)
+    def handle_turn_stream(self, request: IntentRequest, context: ConversationContext) -> Iterator[ResponseChunk]:
+        """Process a turn, yielding response chunks as soon as they are available.
 
-        handler = self.router.route(request.intent_name)
-        if handler.requires_verification and not context.is_verified:
-            raise EscalationRequired("Intent requires verified identity.")
+        Requests without an ``intent_name`` are first resolved from their
+        utterance by the router's classifier or fallback. Handlers exposing
+        ``handle_stream`` can acknowledge the caller before
+        their backend calls complete; other handlers produce their message as a
+        single ``TEXT`` chunk. The stream always ends with a ``FINAL`` chunk
+        carrying the full :class:`IntentResponse`, yielded after the turn has
+        been recorded. Time-to-first-chunk is recorded as the ``first_chunk``
+        stage. While streaming, the ``turn`` and ``handler`` spans include time
+        the consumer spends between chunks.
+        """
 
         try:
-            response = handler.handle(request=request, context=context, observability=observability)
+            self.router.resolve_intent(request)
         except EscalationRequired:
-            self.analytics.record_event("escalated", context=context, metadata={"intent": request.intent_name})
-            raise
-        except Exception as exc:  # noqa: BLE001
-            self.analytics.record_error(exc, context=context, metadata={"intent": request.intent_name})
+            self._journal(context, self._unresolved_turn(request, context))
             raise
+        observability = self._begin_turn(request, context)
+        started = time.perf_counter()
+        final: Optional[ResponseChunk] = None
+        with observability.span("turn"):
+            if self._needs_profile(context):
+                with observability.span("crm"):
+                    self.profiles.personalize(context)
+            if self._needs_authentication(request, context):
+                if inspect.iscoroutinefunction(self.auth_provider.verify_identity):
+                    raise TypeError("Asynchronous authentication providers require handle_turn_async.")
+                with observability.span("auth"):
+                    verified = self.auth_provider.verify_identity(context)
+                self._audit_verification(verified, context, observability)
+                self._apply_authentication(verified, context)
 
-        self.analytics.record_event(
-            "turn_complete",
-            context=context,
-            metadata={
-                "intent": request.intent_name,
-                "response_type": response.response_type,
-                "requires_follow_up": response.requires_follow_up,
-            },
-        )
+            try:
+                handler = self._route(request, context, observability)
+            except EscalationRequired:
+                self._record_escalation(request, context)
+                self._journal(context, observability)
+                raise
+            stream = getattr(handler, "handle_stream", None)
+            if inspect.iscoroutinefunction(handler.handle) or inspect.isasyncgenfunction(stream):
+                raise TypeError(f"Handler for intent {request.intent_name!r} is asynchronous; use handle_turn_async.")
+
+            try:
+                with observability.span("handler"):
+                    if stream is not None:
+                        chunks = stream(request=request, context=context, observability=observability)
+                    else:
+                        chunks = stream_response(
+                            handler.handle(request=request, context=context, observability=observability)
+                        )
+                    for chunk in chunks:
+                        if started is not None:
+                            observability.record_duration("first_chunk", time.perf_counter() - started)
+                            started = None
+                        if chunk.kind is ChunkKind.FINAL:
+                            final = chunk
+                        else:
+                            yield chunk
+            except EscalationRequired:
+                self._record_escalation(request, context)
+                self._journal(context, observability)
+                raise
+            except Exception as exc:  # noqa: BLE001
+                self.analytics.record_error(exc, context=context, metadata={"intent": request.intent_name})
+                self._journal(context, observability)
+                raise
+
+        # Journaled before the caller hears the outcome, so a failover never contradicts it.
+        self._journal(context, observability, ended=_terminates(final))
+        yield self._finish_stream(request, context, final)
+
+    async def handle_turn_async(self, request: IntentRequest, context: ConversationContext) -> IntentResponse:
+        """Asyncio-native counterpart of :meth:`handle_turn`.
+
+        Coroutine handlers and authentication providers are awaited on the
+        running loop; synchronous ones are offloaded to ``executor`` (the loop's
+        default executor when unset) so they never block other sessions.
+        """
+
+        return await collect_response_async(self.handle_turn_stream_async(request, context))
+
+    async def handle_turn_stream_async(
+        self, request: IntentRequest, context: ConversationContext
+    ) -> AsyncIterator[ResponseChunk]:
+        """Asyncio-native counterpart of :meth:`handle_turn_stream`.
+
+        Synchronous ``handle_stream`` generators are advanced in the executor
+        one chunk at a time, so an acknowledgement reaches the caller while the
+        handler is still blocked on its backend call.
+        """
+
+        if not request.intent_name:
+            # The fallback resolver may block on a remote NLU call.
+            try:
+                await self._call(self.router.resolve_intent, request)
+            except EscalationRequired:
+                await self._journal_async(context, self._unresolved_turn(request, context))
+                raise
+        observability = self._begin_turn(request, context)
+        started = time.perf_counter()
+        final: Optional[ResponseChunk] = None
+        with observability.span("turn"):
+            if self._needs_profile(context):
+                with observability.span("crm"):
+                    await self._call(self.profiles.personalize, context)
+            if self._needs_authentication(request, context):
+                with observability.span("auth"):
+                    verified = await self._call(self.auth_provider.verify_identity, context)
+                if self.audit is not None:
+                    await self._call(self._audit_verification, verified, context, observability)
+                self._apply_authentication(verified, context)
 
-        return response
+            try:
+                handler = self._route(request, context, observability)
+            except EscalationRequired:
+                self._record_escalation(request, context)
+                await self._journal_async(context, observability)
+                raise
+
+            try:
+                with observability.span("handler"):
+                    async for chunk in self._handler_chunks_async(handler, request, context, observability):
+                        if started is not None:
+                            observability.record_duration("first_chunk", time.perf_counter() - started)
+                            started = None
+                        if chunk.kind is ChunkKind.FINAL:
+                            final = chunk
+                        else:
+                            yield chunk
+            except EscalationRequired:
+                self._record_escalation(request, context)
+                await self._journal_async(context, observability)
+                raise
+            except Exception as exc:  # noqa: BLE001
+                self.analytics.record_error(exc, context=context, metadata={"intent": request.intent_name})
+                await self._journal_async(context, observability)
+                raise
+
+        await self._journal_async(context, observability, ended=_terminates(final))
+        yield self._finish_stream(request, context, final)
 
     def run_conversation(self, requests: List[IntentRequest], context: ConversationContext) -> List[IntentResponse]:
         """Execute a batch of conversational turns for testing or playback."""
@@ -98,14 +274,280 @@ class VAaiAgent:
                 break
         return responses
 
+    async def run_conversation_async(
+        self, requests: List[IntentRequest], context: ConversationContext
+    ) -> List[IntentResponse]:
+        """Asyncio-native counterpart of :meth:`run_conversation`."""
+
+        responses: List[IntentResponse] = []
+        for turn, request in enumerate(requests, start=1):
+            if turn > self.config.max_turns:
+                self.analytics.record_event("max_turns_exceeded", context=context)
+                break
+            response = await self.handle_turn_async(request=request, context=context)
+            responses.append(response)
+            if response.terminate_session:
+                break
+        return responses
+
+    def _needs_profile(self, context: ConversationContext) -> bool:
+        if self.profiles is None:
+            return False
+        from .integrations.crm import PROFILE_STATE_KEY
+
+        return PROFILE_STATE_KEY not in context.session_metadata
+
+    def _needs_authentication(self, request: IntentRequest, context: ConversationContext) -> bool:
+        return not context.is_verified and request.intent_name != "verify_client"
+
+    def _audit_verification(
+        self, verified: bool, context: ConversationContext, observability: ObservabilityContext
+    ) -> None:
+        """Durably record an ``auth_provider`` verification before its outcome takes effect."""
+
+        if self.audit is None:
+            return
+        from .utils.audit import VERIFICATION_ATTEMPT
+
+        with observability.span("audit_log.append"):
+            self.audit.append(
+                VERIFICATION_ATTEMPT,
+                context=context,
+                details={"passed": bool(verified), "source": "auth_provider"},
+                trace_id=observability.trace_id,
+            )
+
+    def _apply_authentication(self, verified: bool, context: ConversationContext) -> None:
+        if verified:
+            context.is_verified = True
+        self._settle_prefetch(context, verification_attempted=True)
+        if not verified:
+            self.analytics.record_event("verification_failed", context=context)
+            raise EscalationRequired("Unable to verify caller identity.")
+
+    def _settle_prefetch(self, context: ConversationContext, *, verification_attempted: bool) -> None:
+        if self.prefetcher is not None:
+            self.prefetcher.settle(context, verification_attempted=verification_attempted)
+
+    def _begin_turn(self, request: IntentRequest, context: ConversationContext) -> ObservabilityContext:
+        budget = self.config.turn_budget
+        deadline = None
+        if budget is not None:
+            from .integrations.resilience import Deadline
+
+            deadline = Deadline.after(budget)
+        observability = ObservabilityContext.from_context(
+            context,
+            request,
+            metrics=self.metrics,
+            sample_rate=self.config.trace_sample_rate,
+            deadline=deadline,
+        )
+        self.analytics.record_event("turn_start", context=context, metadata={"intent": request.intent_name})
+        if self.prefetcher is not None:
+            # Fetch the caller's likely next data while verification runs;
+            # nothing is visible to handlers until the session is verified.
+            self.prefetcher.start(context)
+        return observability
+
+    def _route(
+        self, request: IntentRequest, context: ConversationContext, observability: ObservabilityContext
+    ) -> Union[IntentHandler, AsyncIntentHandler]:
+        with observability.span("route"):
+            handler = self.router.route(request.intent_name)
+        if getattr(handler, "requires_rag", False) and not self.config.enable_rag:
+            raise EscalationRequired("Policy retrieval is disabled.")
+        if handler.requires_verification and not context.is_verified:
+            raise EscalationRequired("Intent requires verified identity.")
+        if getattr(handler, "fraud_sensitive", False):
+            self._check_fraud(request, context, observability)
+        return handler
+
+    def _check_fraud(
+        self, request: IntentRequest, context: ConversationContext, observability: ObservabilityContext
+    ) -> None:
+        """Escalate or tag the turn when the target card's fraud risk is elevated."""
+
+        if not self.config.enable_fraud_checks or self.fraud_scorer is None:
+            return
+        card_id = request.parameters.get("card_id") or context.active_card_id
+        if not card_id:
+            return
+        with observability.span("fraud_check"):
+            risk = self.fraud_scorer.card_risk(card_id)
+        if risk < self.config.fraud_review_threshold:
+            return
+        metadata = {"intent": request.intent_name, "card_id": card_id, "risk": round(risk, 3)}
+        if risk >= self.config.fraud_block_threshold:
+            self.analytics.record_event("fraud_blocked", context=context, metadata=metadata)
+            raise EscalationRequired("Card activity requires fraud review.")
+        context.set_metadata("fraud_risk", f"{risk:.2f}")
+        self.analytics.record_event("fraud_flagged", context=context, metadata=metadata)
+
+    async def _handler_chunks_async(
+        self,
+        handler: Union[IntentHandler, AsyncIntentHandler],
+        request: IntentRequest,
+        context: ConversationContext,
+        observability: ObservabilityContext,
+    ) -> AsyncIterator[ResponseChunk]:
+        kwargs = {"request": request, "context": context, "observability": observability}
+        stream = getattr(handler, "handle_stream", None)
+        if inspect.isasyncgenfunction(stream):
+            async for chunk in stream(**kwargs):
+                yield chunk
+        elif stream is not None:
+            chunks = stream(**kwargs)
+            # Advance the generator in one stable context even though each step
+            # may land on a different executor thread.
+            stream_context = contextvars.copy_context()
+            while True:
+                chunk = await self._call(stream_context.run, next, chunks, None)
+                if chunk is None:
+                    break
+                yield chunk
+        else:
+            for chunk in stream_response(await self._call(handler.handle, **kwargs)):
+                yield chunk
+
+    def _journal(
+        self, context: ConversationContext, observability: ObservabilityContext, *, ended: bool = False
+    ) -> None:
+        if self.journal is not None:
+            with observability.span("journal"):
+                if ended:
+                    self.journal.end(context.client_id)
+                else:
+                    self.journal.record(context)
+
+    async def _journal_async(
+        self, context: ConversationContext, observability: ObservabilityContext, *, ended: bool = False
+    ) -> None:
+        if self.journal is not None:
+            with observability.span("journal"):
+                if ended:
+                    await self._call(self.journal.end, context.client_id)
+                else:
+                    await self._call(self.journal.record, context)
+
+    def _finish_stream(
+        self, request: IntentRequest, context: ConversationContext, final: Optional[ResponseChunk]
+    ) -> ResponseChunk:
+        if final is None or final.response is None:
+            raise RuntimeError(f"Handler for intent {request.intent_name!r} did not produce a final response.")
+        if self.prefetcher is not None:
+            self.prefetcher.finish_turn(context, verification_attempted=request.intent_name == "verify_client")
+        self._record_turn_complete(request, context, final.response)
+        return final
+
+    def _unresolved_turn(self, request: IntentRequest, context: ConversationContext) -> ObservabilityContext:
+        """Record a turn whose intent could not be resolved as started and escalated."""
+
+        observability = self._begin_turn(request, context)
+        self._record_escalation(request, context)
+        return observability
+
+    def _record_escalation(self, request: IntentRequest, context: ConversationContext) -> None:
+        self.analytics.record_event("escalated", context=context, metadata={"intent": request.intent_name})
+
+    def _record_turn_complete(
+        self, request: IntentRequest, context: ConversationContext, response: IntentResponse
+    ) -> None:
+        self.analytics.record_event(
+            "turn_complete",
+            context=context,
+            metadata={
+                "intent": request.intent_name,
+                "response_type": response.response_type,
+                "requires_follow_up": response.requires_follow_up,
+            },
+        )
+
+    async def _call(self, func: Callable[..., T], *args: object, **kwargs: object) -> T:
+        """Await ``func`` if it is a coroutine function, else run it in the executor."""
+
+        if inspect.iscoroutinefunction(func):
+            return await func(*args, **kwargs)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, functools.partial(func, *args, **kwargs))
+
+
+def _terminates(final: Optional[ResponseChunk]) -> bool:
+    return final is not None and final.response is not None and final.response.terminate_session
+
+
+def _use_voice_biometrics(
+    handlers: MutableMapping[str, Union[IntentHandler, AsyncIntentHandler]],
+    scorer: VoiceBiometricScorer,
+    *,
+    enabled: bool,
+) -> None:
+    from .intents.registry import HandlerRegistry
+
+    if isinstance(handlers, HandlerRegistry):
+        handlers.provide(
+            "verification_service",
+            "vaai.utils.biometrics:BiometricVerificationService",
+            scorer=scorer,
+            enabled=enabled,
+        )
+        if "verify_client" not in handlers.loaded:
+            # Built on first route, from the client provided above.
+            return
+        service = handlers.client("verification_service")
+    else:
+        from .utils.biometrics import BiometricVerificationService
+
+        service = BiometricVerificationService(scorer, enabled=enabled)
+    handler = handlers.get("verify_client")
+    if handler is not None and hasattr(handler, "verification_service"):
+        handler.verification_service = service
+
 
 def create_agent(
-    handlers: Dict[str, IntentHandler],
+    handlers: MutableMapping[str, Union[IntentHandler, AsyncIntentHandler]],
     analytics: AnalyticsCollector,
-    auth_provider: AuthenticationProvider,
+    auth_provider: Union[AuthenticationProvider, AsyncAuthenticationProvider],
     config: Optional[AgentConfig] = None,
+    executor: Optional[Executor] = None,
+    metrics: Optional[LatencyMetrics] = None,
+    prefetcher: Optional[Prefetcher] = None,
+    classifier: Optional[UtteranceClassifier] = None,
+    intent_fallback: Optional[IntentFallback] = None,
+    fraud_scorer: Optional[FraudRiskProvider] = None,
+    profiles: Optional[ProfileProvider] = None,
+    journal: Optional[SessionJournal] = None,
+    audit: Optional[AuditLog] = None,
+    voice_scorer: Optional[VoiceBiometricScorer] = None,
 ) -> VAaiAgent:
-    """Convenience factory for assembling the virtual agent."""
+    """Convenience factory for assembling the virtual agent.
+
+    Pass a :class:`~vaai.intents.registry.HandlerRegistry` as ``handlers`` to
+    defer importing and building each handler until its first turn. With a
+    ``voice_scorer``, the ``verify_client`` handler verifies callers through a
+    :class:`~vaai.utils.biometrics.BiometricVerificationService` enabled per
+    ``AgentConfig.enable_voice_biometrics``.
+    """
 
-    router = WorkflowRouter(handlers=handlers)
-    return VAaiAgent(router=router, analytics=analytics, auth_provider=auth_provider, config=config or AgentConfig())
+    config = config or AgentConfig()
+    if voice_scorer is not None:
+        _use_voice_biometrics(handlers, voice_scorer, enabled=config.enable_voice_biometrics)
+    router = WorkflowRouter(
+        handlers=handlers,
+        classifier=classifier,
+        confidence_threshold=config.intent_confidence_threshold,
+        fallback=intent_fallback,
+    )
+    return VAaiAgent(
+        router=router,
+        analytics=analytics,
+        auth_provider=auth_provider,
+        config=config,
+        executor=executor,
+        metrics=metrics,
+        prefetcher=prefetcher,
+        fraud_scorer=fraud_scorer,
+        profiles=profiles,
+        journal=journal,
+        audit=audit,
+    )
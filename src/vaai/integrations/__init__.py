@@ -1,11 +1,115 @@
 """Integration client exports."""
-from .card_api import CardManagementAPI, CardOperationResult
-from .transaction_api import Money, Transaction, TransactionAPI
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from ..utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .card_api import AsyncCardManagementAPI, CardManagementAPI, CardOperationResult, CardStatus
+    from .card_bulk import BulkCardOperations, BulkCardResult, BulkCardRun, BulkOperationSummary, RateLimiter
+    from .crm import BatchingCRMClient, CRMClient, CRMStats, CustomerProfile
+    from .knowledge_base import KnowledgeChunk, KnowledgeRetriever, chunk_text
+    from .resilience import (
+        AsyncResilientClient,
+        CircuitBreaker,
+        CircuitOpen,
+        Deadline,
+        DeadlineExceeded,
+        HedgePolicy,
+        IntegrationUnavailable,
+        ResilienceStats,
+        ResilientClient,
+    )
+    from .transaction_api import (
+        AsyncTransactionAPI,
+        Money,
+        Transaction,
+        TransactionAPI,
+        TransactionBatch,
+        TransactionPage,
+        TransactionQuery,
+        TransactionRecords,
+    )
+    from .transaction_cache import CacheStats, CachingTransactionAPI
+    from .transaction_store import TransactionStore
+
+_EXPORTS = {
+    "AsyncCardManagementAPI": ".card_api",
+    "AsyncResilientClient": ".resilience",
+    "AsyncTransactionAPI": ".transaction_api",
+    "BatchingCRMClient": ".crm",
+    "BulkCardOperations": ".card_bulk",
+    "BulkCardResult": ".card_bulk",
+    "BulkCardRun": ".card_bulk",
+    "BulkOperationSummary": ".card_bulk",
+    "CRMClient": ".crm",
+    "CRMStats": ".crm",
+    "CacheStats": ".transaction_cache",
+    "CachingTransactionAPI": ".transaction_cache",
+    "CardManagementAPI": ".card_api",
+    "CardOperationResult": ".card_api",
+    "CardStatus": ".card_api",
+    "CircuitBreaker": ".resilience",
+    "CircuitOpen": ".resilience",
+    "CustomerProfile": ".crm",
+    "Deadline": ".resilience",
+    "DeadlineExceeded": ".resilience",
+    "HedgePolicy": ".resilience",
+    "IntegrationUnavailable": ".resilience",
+    "KnowledgeChunk": ".knowledge_base",
+    "KnowledgeRetriever": ".knowledge_base",
+    "Money": ".transaction_api",
+    "RateLimiter": ".card_bulk",
+    "ResilienceStats": ".resilience",
+    "ResilientClient": ".resilience",
+    "Transaction": ".transaction_api",
+    "TransactionAPI": ".transaction_api",
+    "TransactionBatch": ".transaction_api",
+    "TransactionPage": ".transaction_api",
+    "TransactionQuery": ".transaction_api",
+    "TransactionRecords": ".transaction_api",
+    "TransactionStore": ".transaction_store",
+    "chunk_text": ".knowledge_base",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
+    "AsyncCardManagementAPI",
+    "AsyncResilientClient",
+    "AsyncTransactionAPI",
+    "BatchingCRMClient",
+    "BulkCardOperations",
+    "BulkCardResult",
+    "BulkCardRun",
+    "BulkOperationSummary",
+    "CRMClient",
+    "CRMStats",
+    "CacheStats",
+    "CachingTransactionAPI",
     "CardManagementAPI",
     "CardOperationResult",
+    "CardStatus",
+    "CircuitBreaker",
+    "CircuitOpen",
+    "CustomerProfile",
+    "Deadline",
+    "DeadlineExceeded",
+    "HedgePolicy",
+    "IntegrationUnavailable",
+    "KnowledgeChunk",
+    "KnowledgeRetriever",
     "Money",
+    "RateLimiter",
+    "ResilienceStats",
+    "ResilientClient",
     "Transaction",
     "TransactionAPI",
+    "TransactionBatch",
+    "TransactionPage",
+    "TransactionQuery",
+    "TransactionRecords",
+    "TransactionStore",
+    "chunk_text",
 ]
@@ -14,6 +14,14 @@ class CardOperationResult:
     failure_reason: Optional[str] = None
 
 
+@dataclass
+class CardStatus:
+    """Current lifecycle state of a card."""
+
+    card_id: str
+    status: str
+
+
 class CardManagementAPI:
     """Client for interacting with card management microservices."""
 
@@ -29,3 +37,29 @@ class CardManagementAPI:
         if not card_id:
             return CardOperationResult(success=False, failure_reason="card_id_required")
         return CardOperationResult(success=True, reference_id=f"ACT-{card_id}")
+
+    def get_card_status(self, *, card_id: str) -> CardStatus:
+        return CardStatus(card_id=card_id, status="active")
+
+
+class AsyncCardManagementAPI:
+    """Asyncio-native client for the card management microservices.
+
+    Mirrors :class:`CardManagementAPI` so handlers can be migrated one at a time.
+    """
+
+    async def freeze_card(self, *, card_id: str, reason: Optional[str]) -> CardOperationResult:
+        """Freeze the card and optionally trigger replacement."""
+
+        if not card_id:
+            return CardOperationResult(success=False, failure_reason="card_id_required")
+        reference = f"FRZ-{card_id}" if reason else f"FRZ-{card_id}-AUTO"
+        return CardOperationResult(success=True, reference_id=reference)
+
+    async def activate_card(self, *, card_id: str | None) -> CardOperationResult:
+        if not card_id:
+            return CardOperationResult(success=False, failure_reason="card_id_required")
+        return CardOperationResult(success=True, reference_id=f"ACT-{card_id}")
+
+    async def get_card_status(self, *, card_id: str) -> CardStatus:
+        return CardStatus(card_id=card_id, status="active")
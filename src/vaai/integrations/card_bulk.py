@@ -0,0 +1,208 @@
+"""Bulk card operations for mass freeze/activation events."""
+from __future__ import annotations
+
+import contextvars
+import threading
+import time
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Callable, Dict, FrozenSet, Iterable, Iterator, Optional, Set
+
+from .card_api import CardManagementAPI, CardOperationResult
+from .resilience import IntegrationUnavailable
+
+DEFAULT_TRANSIENT_FAILURES: FrozenSet[str] = frozenset({"timeout", "unavailable", "rate_limited"})
+
+
+class RateLimiter:
+    """Thread-safe token bucket allowing ``rate`` acquisitions per second."""
+
+    def __init__(self, rate: float, burst: Optional[int] = None, clock: Callable[[], float] = time.monotonic) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = burst or max(1, int(rate))
+        self._clock = clock
+        self._tokens = float(self.burst)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                delay = (1 - self._tokens) / self.rate
+            time.sleep(delay)
+
+
+@dataclass
+class BulkCardResult:
+    """Outcome for one card in a bulk run."""
+
+    card_id: str
+    result: CardOperationResult
+    attempts: int
+
+
+def default_failure_reasons() -> Dict[str, int]:
+    return {}
+
+
+@dataclass
+class BulkOperationSummary:
+    """Aggregate outcome of a bulk run."""
+
+    operation: str
+    total: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    retries: int = 0
+    elapsed: float = 0.0
+    failure_reasons: Dict[str, int] = field(default_factory=default_failure_reasons)
+
+    @property
+    def throughput(self) -> float:
+        return self.total / self.elapsed if self.elapsed else 0.0
+
+    def to_json(self) -> Dict[str, object]:
+        return {
+            "operation": self.operation,
+            "total": self.total,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "retries": self.retries,
+            "elapsedSeconds": round(self.elapsed, 3),
+            "cardsPerSecond": round(self.throughput, 1),
+            "failureReasons": dict(self.failure_reasons),
+        }
+
+
+class BulkCardRun:
+    """Iterator over per-card results in completion order.
+
+    ``summary`` is updated as results are yielded and is final once the
+    iterator is exhausted; :meth:`wait` drains it and returns the summary.
+    """
+
+    def __init__(self, results: Iterator[BulkCardResult], summary: BulkOperationSummary) -> None:
+        self._results = results
+        self.summary = summary
+
+    def __iter__(self) -> Iterator[BulkCardResult]:
+        return self._results
+
+    def wait(self) -> BulkOperationSummary:
+        for _ in self._results:
+            pass
+        return self.summary
+
+
+@dataclass
+class BulkCardOperations:
+    """Runs card operations for many cards with bounded concurrency.
+
+    At most ``max_concurrency`` backend calls are in flight and, when
+    ``rate_limit`` is set, no more than that many calls start per second
+    (retries included). Results whose ``failure_reason`` is in
+    ``transient_failures``, and calls raising ``OSError``/``TimeoutError``, are
+    retried up to ``max_retries`` times with exponential backoff.
+    :class:`~vaai.integrations.resilience.DeadlineExceeded` and
+    :class:`~vaai.integrations.resilience.CircuitOpen` from a guarded client
+    are never retried; they end the run. Card ids are consumed lazily, so
+    arbitrarily large iterables run in bounded memory.
+    """
+
+    card_api: CardManagementAPI
+    max_concurrency: int = 32
+    rate_limit: Optional[float] = None
+    max_retries: int = 3
+    backoff: float = 0.05
+    transient_failures: FrozenSet[str] = DEFAULT_TRANSIENT_FAILURES
+
+    def freeze_cards(self, card_ids: Iterable[str], *, reason: Optional[str]) -> BulkCardRun:
+        return self._run(
+            "freeze", card_ids, lambda card_id: self.card_api.freeze_card(card_id=card_id, reason=reason)
+        )
+
+    def activate_cards(self, card_ids: Iterable[str]) -> BulkCardRun:
+        return self._run("activate", card_ids, lambda card_id: self.card_api.activate_card(card_id=card_id))
+
+    def _run(
+        self, operation: str, card_ids: Iterable[str], call: Callable[[str], CardOperationResult]
+    ) -> BulkCardRun:
+        summary = BulkOperationSummary(operation=operation)
+        return BulkCardRun(self._execute(card_ids, call, summary), summary)
+
+    def _execute(
+        self,
+        card_ids: Iterable[str],
+        call: Callable[[str], CardOperationResult],
+        summary: BulkOperationSummary,
+    ) -> Iterator[BulkCardResult]:
+        limiter = RateLimiter(self.rate_limit) if self.rate_limit else None
+        reasons: Counter = Counter()
+        started = time.perf_counter()
+        pending_ids = iter(card_ids)
+        in_flight: Set[Future] = set()
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="vaai-bulk-card") as pool:
+
+            def submit_next() -> bool:
+                card_id = next(pending_ids, None)
+                if card_id is None:
+                    return False
+                # Each call runs in a copy of the caller's context so it sees the turn's deadline and span.
+                context = contextvars.copy_context()
+                in_flight.add(pool.submit(context.run, self._with_retries, card_id, call, limiter))
+                return True
+
+            while len(in_flight) < self.max_concurrency and submit_next():
+                pass
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    in_flight.discard(future)
+                    outcome = future.result()
+                    summary.total += 1
+                    summary.retries += outcome.attempts - 1
+                    if outcome.result.success:
+                        summary.succeeded += 1
+                    else:
+                        summary.failed += 1
+                        reasons[outcome.result.failure_reason or "unknown"] += 1
+                        summary.failure_reasons = dict(reasons)
+                    summary.elapsed = time.perf_counter() - started
+                    submit_next()
+                    yield outcome
+        summary.elapsed = time.perf_counter() - started
+
+    def _with_retries(
+        self,
+        card_id: str,
+        call: Callable[[str], CardOperationResult],
+        limiter: Optional[RateLimiter],
+    ) -> BulkCardResult:
+        attempt = 0
+        while True:
+            attempt += 1
+            if limiter is not None:
+                limiter.acquire()
+            try:
+                result = call(card_id)
+            except IntegrationUnavailable:
+                # Out of turn budget or the breaker is open: retrying cannot help.
+                raise
+            except (OSError, TimeoutError) as exc:
+                result = CardOperationResult(success=False, failure_reason=f"error:{type(exc).__name__}")
+                transient = True
+            else:
+                transient = not result.success and result.failure_reason in self.transient_failures
+            if not transient or attempt > self.max_retries:
+                return BulkCardResult(card_id=card_id, result=result, attempts=attempt)
+            time.sleep(self.backoff * (2 ** (attempt - 1)))
@@ -0,0 +1,243 @@
+"""Customer profiles from the CRM, looked up in batches and cached for personalization."""
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from ..utils.context import ConversationContext
+
+PROFILE_STATE_KEY = "crm_profile"
+"""Session metadata key recording that the session's profile lookup was made."""
+
+
+def default_preferences() -> Dict[str, str]:
+    return {}
+
+
+@dataclass(slots=True)
+class CustomerProfile:
+    """The personalization fields of a CRM customer record."""
+
+    client_id: str
+    loyalty_tier: Optional[str] = None
+    vip: bool = False
+    locale: Optional[str] = None
+    preferences: Dict[str, str] = field(default_factory=default_preferences)
+
+
+class CRMClient:
+    """Client for the CRM profile service.
+
+    :meth:`get_profiles` is the bulk endpoint; ids the CRM does not know are
+    left out of the result.
+    """
+
+    def get_profile(self, *, client_id: str) -> Optional[CustomerProfile]:
+        return self.get_profiles(client_ids=[client_id]).get(client_id)
+
+    def get_profiles(self, *, client_ids: Sequence[str]) -> Dict[str, CustomerProfile]:
+        return {client_id: CustomerProfile(client_id=client_id, loyalty_tier="standard") for client_id in client_ids}
+
+
+@dataclass
+class CRMStats:
+    """Counters for judging batch sizes and cache sizing."""
+
+    lookups: int = 0
+    hits: int = 0
+    coalesced: int = 0
+    batches: int = 0
+    batched_ids: int = 0
+    warmed: int = 0
+    evictions: int = 0
+    failures: int = 0
+
+    def __post_init__(self) -> None:
+        self._lock = threading.Lock()
+
+    def add(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + amount)
+
+    @property
+    def mean_batch_size(self) -> float:
+        return self.batched_ids / self.batches if self.batches else 0.0
+
+    def to_json(self) -> Dict[str, object]:
+        return {
+            "lookups": self.lookups,
+            "hits": self.hits,
+            "coalesced": self.coalesced,
+            "batches": self.batches,
+            "batchedIds": self.batched_ids,
+            "meanBatchSize": round(self.mean_batch_size, 2),
+            "warmed": self.warmed,
+            "evictions": self.evictions,
+            "failures": self.failures,
+        }
+
+
+class _Batch:
+    """Ids collected during one batching window, with a future per id."""
+
+    __slots__ = ("futures", "full")
+
+    def __init__(self) -> None:
+        self.futures: Dict[str, Future] = {}
+        self.full = threading.Event()
+
+
+_Entry = Tuple[float, Optional[CustomerProfile]]
+
+
+class BatchingCRMClient:
+    """Read-through profile cache that coalesces misses into bulk CRM requests.
+
+    The first miss opens a batch and waits up to ``window`` seconds (less if
+    ``max_batch`` ids arrive sooner) for other sessions' misses to join it,
+    then fetches the whole batch with one ``get_profiles`` call. Lookups for
+    an id already in the open batch share its result. Profiles, including
+    "not in the CRM", are cached for ``ttl`` seconds in an LRU bounded by
+    ``max_profiles``.
+
+    :meth:`warm` and :meth:`warm_from_file` bulk-load expected callers ahead
+    of time, e.g. customers with scheduled call-backs. :meth:`personalize`
+    fills a :class:`ConversationContext` from the caller's profile.
+    """
+
+    def __init__(
+        self,
+        backend: Optional[CRMClient] = None,
+        *,
+        window: float = 0.005,
+        max_batch: int = 100,
+        ttl: float = 900.0,
+        max_profiles: int = 100_000,
+        clock: Callable[[], float] = time.monotonic,
+        stats: Optional[CRMStats] = None,
+    ) -> None:
+        self.backend = backend if backend is not None else CRMClient()
+        self.window = window
+        self.max_batch = max_batch
+        self.ttl = ttl
+        self.max_profiles = max_profiles
+        self.clock = clock
+        self.stats = stats if stats is not None else CRMStats()
+        self._profiles: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._batch: Optional[_Batch] = None
+        self._lock = threading.Lock()
+
+    def get_profile(self, *, client_id: str) -> Optional[CustomerProfile]:
+        """The caller's profile, or ``None`` if the CRM has no record of them."""
+
+        self.stats.add("lookups")
+        with self._lock:
+            entry = self._profiles.get(client_id)
+            if entry is not None and entry[0] > self.clock():
+                self._profiles.move_to_end(client_id)
+                self.stats.add("hits")
+                return entry[1]
+            batch = self._batch
+            leader = batch is None
+            if leader:
+                batch = self._batch = _Batch()
+            future = batch.futures.get(client_id)
+            if future is None:
+                future = batch.futures[client_id] = Future()
+                if len(batch.futures) >= self.max_batch:
+                    # Later misses start the next batch instead of waiting on this one.
+                    self._batch = None
+                    batch.full.set()
+            else:
+                self.stats.add("coalesced")
+
+        if leader:
+            batch.full.wait(self.window)
+            with self._lock:
+                if self._batch is batch:
+                    self._batch = None
+            self._fetch(batch.futures)
+        return future.result()
+
+    def warm(self, client_ids: Iterable[str]) -> int:
+        """Bulk-load profiles for ``client_ids`` in ``max_batch`` chunks; returns the number cached."""
+
+        ids = list(dict.fromkeys(client_ids))
+        warmed = 0
+        for offset in range(0, len(ids), self.max_batch):
+            chunk = ids[offset : offset + self.max_batch]
+            profiles = self.backend.get_profiles(client_ids=chunk)
+            self.stats.add("batches")
+            self.stats.add("batched_ids", len(chunk))
+            self._store(chunk, profiles)
+            warmed += len(chunk)
+        self.stats.add("warmed", warmed)
+        return warmed
+
+    def warm_from_file(self, path: Union[str, Path]) -> int:
+        """:meth:`warm` from a file with one client id per line; blank and ``#`` lines are skipped."""
+
+        with open(path, encoding="utf-8") as handle:
+            lines = (line.strip() for line in handle)
+            return self.warm(line for line in lines if line and not line.startswith("#"))
+
+    def invalidate(self, client_id: str) -> None:
+        with self._lock:
+            self._profiles.pop(client_id, None)
+
+    def personalize(self, context: ConversationContext) -> Optional[CustomerProfile]:
+        """Fill ``context`` from the caller's profile once per session.
+
+        Personalization is best effort: a failed lookup is counted and the
+        session carries on with default settings.
+        """
+
+        if context.get_metadata(PROFILE_STATE_KEY) is not None:
+            return None
+        try:
+            profile = self.get_profile(client_id=context.client_id)
+        except Exception:  # noqa: BLE001
+            self.stats.add("failures")
+            context.set_metadata(PROFILE_STATE_KEY, "unavailable")
+            return None
+        if profile is None:
+            context.set_metadata(PROFILE_STATE_KEY, "unknown")
+            return None
+        context.loyalty_tier = profile.loyalty_tier
+        if profile.locale:
+            context.locale = profile.locale
+        if profile.vip:
+            context.set_metadata("vip", "true")
+        for key, value in profile.preferences.items():
+            context.set_metadata(f"preference.{key}", value)
+        context.set_metadata(PROFILE_STATE_KEY, "loaded")
+        return profile
+
+    def _fetch(self, futures: Dict[str, Future]) -> None:
+        ids: List[str] = list(futures)
+        self.stats.add("batches")
+        self.stats.add("batched_ids", len(ids))
+        try:
+            profiles = self.backend.get_profiles(client_ids=ids)
+        except BaseException as exc:
+            for future in futures.values():
+                future.set_exception(exc)
+            return
+        self._store(ids, profiles)
+        for client_id, future in futures.items():
+            future.set_result(profiles.get(client_id))
+
+    def _store(self, ids: Sequence[str], profiles: Dict[str, CustomerProfile]) -> None:
+        with self._lock:
+            expires_at = self.clock() + self.ttl
+            for client_id in ids:
+                self._profiles[client_id] = (expires_at, profiles.get(client_id))
+                self._profiles.move_to_end(client_id)
+            while len(self._profiles) > self.max_profiles:
+                self._profiles.popitem(last=False)
+                self.stats.add("evictions")
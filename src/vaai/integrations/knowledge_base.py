@@ -0,0 +1,46 @@
+"""Policy and FAQ knowledge-base models shared by retrievers and handlers."""
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import List, Protocol
+
+_WORD = re.compile(r"\S+")
+
+
+@dataclass
+class KnowledgeChunk:
+    """A passage of a policy/FAQ document returned by a retriever."""
+
+    chunk_id: str
+    doc_id: str
+    title: str
+    text: str
+    score: float = 0.0
+
+    def to_json(self) -> dict:
+        return {
+            "chunkId": self.chunk_id,
+            "docId": self.doc_id,
+            "title": self.title,
+            "score": round(self.score, 4),
+        }
+
+
+class KnowledgeRetriever(Protocol):
+    """Top-k passage search over the policy/FAQ corpus."""
+
+    def search(self, query: str, top_k: int = 3) -> List[KnowledgeChunk]:
+        """Return up to ``top_k`` passages, best first."""
+
+
+def chunk_text(text: str, *, max_words: int = 120, overlap: int = 20) -> List[str]:
+    """Split ``text`` into windows of ``max_words`` words overlapping by ``overlap``."""
+
+    if overlap >= max_words:
+        raise ValueError("overlap must be smaller than max_words")
+    words = _WORD.findall(text)
+    if len(words) <= max_words:
+        return [" ".join(words)] if words else []
+    step = max_words - overlap
+    return [" ".join(words[start : start + max_words]) for start in range(0, len(words) - overlap, step)]
@@ -0,0 +1,500 @@
+"""Deadlines, hedged requests and circuit breakers for integration calls."""
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, Iterable, Optional, Set, Tuple, Type
+
+from ..monitoring.metrics import LatencyHistogram
+from ..monitoring.observability import current_observability
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+DEFAULT_FAILURE_TYPES: Tuple[Type[BaseException], ...] = (OSError, TimeoutError)
+"""Exceptions that count against an endpoint's breaker: transport errors and timeouts."""
+
+
+class IntegrationUnavailable(RuntimeError):
+    """An integration call was not attempted or did not finish in time.
+
+    ``reason`` is a short machine-readable code suitable for escalation
+    tickets, e.g. ``"card_api_unavailable"``.
+    """
+
+    def __init__(self, message: str, *, endpoint: str, reason: str) -> None:
+        super().__init__(message)
+        self.endpoint = endpoint
+        self.reason = reason
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # Keyword-only arguments are not in ``args``; rebuild them so the error crosses process boundaries.
+        return _rebuild_unavailable, (type(self), self.args, self.endpoint, self.reason), self.__dict__
+
+
+def _rebuild_unavailable(cls: type, args: tuple, endpoint: str, reason: str) -> IntegrationUnavailable:
+    return cls(*args, endpoint=endpoint, reason=reason)
+
+
+class DeadlineExceeded(IntegrationUnavailable, TimeoutError):
+    """The turn's deadline, or the call's own timeout, ran out."""
+
+
+class CircuitOpen(IntegrationUnavailable):
+    """The endpoint's circuit breaker is open, so the call failed fast."""
+
+
+@dataclass(slots=True)
+class Deadline:
+    """Absolute time budget for one turn, on a monotonic clock."""
+
+    expires_at: float
+    budget: float
+    clock: Callable[[], float] = time.monotonic
+
+    @classmethod
+    def after(cls, seconds: float, clock: Callable[[], float] = time.monotonic) -> "Deadline":
+        return cls(expires_at=clock() + seconds, budget=seconds, clock=clock)
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires_at - self.clock())
+
+    @property
+    def expired(self) -> bool:
+        return self.clock() >= self.expires_at
+
+
+def current_deadline() -> Optional[Deadline]:
+    """Deadline of the turn whose span is active in this context, if any."""
+
+    observability = current_observability()
+    return observability.deadline if observability is not None else None
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker.
+
+    After ``failure_threshold`` failures in a row the breaker opens and calls
+    fail fast for ``reset_timeout`` seconds. It then lets a single probe call
+    through (half-open): success closes it, failure reopens it.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self.state = CLOSED
+        self.failures = 0
+        self.trips = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+            if self.state == OPEN and self.clock() - self._opened_at >= self.reset_timeout:
+                self.state = HALF_OPEN
+                self._probing = False
+            if self.state == HALF_OPEN and not self._probing:
+                self._probing = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.state = CLOSED
+            self.failures = 0
+            self._probing = False
+
+    def record_failure(self) -> bool:
+        """Count a failure; returns ``True`` if this one tripped the breaker."""
+
+        with self._lock:
+            self.failures += 1
+            if self.state == HALF_OPEN or (self.state == CLOSED and self.failures >= self.failure_threshold):
+                self.state = OPEN
+                self._opened_at = self.clock()
+                self._probing = False
+                self.trips += 1
+                return True
+            return False
+
+
+@dataclass
+class HedgePolicy:
+    """When to send a duplicate of a slow idempotent call.
+
+    Once an endpoint has ``min_samples`` successful latencies, a second copy
+    of a call is sent if the first has not answered within the endpoint's
+    ``percentile`` latency (never sooner than ``min_delay``). The first
+    successful answer wins.
+    """
+
+    percentile: float = 0.95
+    min_samples: int = 20
+    min_delay: float = 0.005
+    refresh_every: int = 64
+
+
+_STAT_NAMES = (
+    "calls",
+    "successes",
+    "failures",
+    "errors",
+    "timeouts",
+    "budget_exhausted",
+    "short_circuits",
+    "breaker_trips",
+    "hedges",
+    "hedge_wins",
+)
+
+
+def _camel(name: str) -> str:
+    head, *rest = name.split("_")
+    return head + "".join(part.title() for part in rest)
+
+
+@dataclass
+class ResilienceStats:
+    """Per-endpoint counters for guarded integration calls."""
+
+    counts: Dict[str, Dict[str, int]] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        self._lock = threading.Lock()
+
+    def add(self, endpoint: str, name: str, amount: int = 1) -> None:
+        with self._lock:
+            counters = self.counts.get(endpoint)
+            if counters is None:
+                counters = self.counts[endpoint] = dict.fromkeys(_STAT_NAMES, 0)
+            counters[name] += amount
+
+    def total(self, name: str) -> int:
+        with self._lock:
+            return sum(counters[name] for counters in self.counts.values())
+
+    def to_json(self) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            return {
+                endpoint: {_camel(name): value for name, value in counters.items()}
+                for endpoint, counters in self.counts.items()
+            }
+
+
+class _Endpoint:
+    """Breaker, latency histogram and cached hedge delay for one client method."""
+
+    __slots__ = ("name", "breaker", "latency", "hedged", "_hedge_delay", "_refresh_at")
+
+    def __init__(self, name: str, breaker: CircuitBreaker, hedged: bool) -> None:
+        self.name = name
+        self.breaker = breaker
+        self.latency = LatencyHistogram()
+        self.hedged = hedged
+        self._hedge_delay: Optional[float] = None
+        self._refresh_at = 0
+
+    def hedge_delay(self, policy: Optional[HedgePolicy]) -> Optional[float]:
+        if policy is None or not self.hedged or self.latency.count < policy.min_samples:
+            return None
+        if self._hedge_delay is None or self.latency.count >= self._refresh_at:
+            self._hedge_delay = max(policy.min_delay, self.latency.percentile(policy.percentile))
+            self._refresh_at = self.latency.count + policy.refresh_every
+        return self._hedge_delay
+
+
+class _Guard:
+    """Admission, timeout and outcome bookkeeping shared by the sync and async clients."""
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        timeout: Optional[float],
+        hedged: Iterable[str],
+        hedge: Optional[HedgePolicy],
+        breaker_factory: Callable[[], CircuitBreaker],
+        failure_types: Tuple[Type[BaseException], ...],
+        stats: ResilienceStats,
+        clock: Callable[[], float],
+    ) -> None:
+        self.name = name
+        self.failure_types = failure_types
+        self.timeout = timeout
+        self.hedged: FrozenSet[str] = frozenset(hedged)
+        self.hedge = hedge
+        self.breaker_factory = breaker_factory
+        self.stats = stats
+        self.clock = clock
+        self._endpoints: Dict[str, _Endpoint] = {}
+        self._lock = threading.Lock()
+
+    def endpoint(self, method: str) -> _Endpoint:
+        endpoint = self._endpoints.get(method)
+        if endpoint is None:
+            with self._lock:
+                endpoint = self._endpoints.get(method)
+                if endpoint is None:
+                    endpoint = _Endpoint(f"{self.name}.{method}", self.breaker_factory(), method in self.hedged)
+                    self._endpoints[method] = endpoint
+        return endpoint
+
+    def admit(self, endpoint: _Endpoint) -> tuple:
+        """Return ``(timeout, limited_by_deadline)`` or raise without calling the backend."""
+
+        self.stats.add(endpoint.name, "calls")
+        deadline = current_deadline()
+        remaining = deadline.remaining() if deadline is not None else None
+        if remaining is not None and remaining <= 0:
+            self.stats.add(endpoint.name, "budget_exhausted")
+            raise DeadlineExceeded(
+                f"No time left in the turn for {endpoint.name}.", endpoint=endpoint.name, reason=self.reason
+            )
+        if not endpoint.breaker.allow():
+            self.stats.add(endpoint.name, "short_circuits")
+            raise CircuitOpen(
+                f"{endpoint.name} is failing; not calling it.", endpoint=endpoint.name, reason=self.reason
+            )
+        if remaining is None:
+            return self.timeout, False
+        if self.timeout is None or remaining < self.timeout:
+            return remaining, True
+        return self.timeout, False
+
+    @property
+    def reason(self) -> str:
+        return f"{self.name}_unavailable"
+
+    def succeeded(self, endpoint: _Endpoint, seconds: float) -> None:
+        endpoint.latency.record(seconds)
+        endpoint.breaker.record_success()
+        self.stats.add(endpoint.name, "successes")
+
+    def failed(self, endpoint: _Endpoint) -> None:
+        self.stats.add(endpoint.name, "failures")
+        if endpoint.breaker.record_failure():
+            self.stats.add(endpoint.name, "breaker_trips")
+
+    def raised(self, endpoint: _Endpoint, error: BaseException) -> None:
+        if isinstance(error, self.failure_types):
+            self.failed(endpoint)
+            return
+        # The backend answered; a rejected request says nothing about its health.
+        self.stats.add(endpoint.name, "errors")
+        endpoint.breaker.record_success()
+
+    def timed_out(self, endpoint: _Endpoint, by_deadline: bool) -> DeadlineExceeded:
+        self.stats.add(endpoint.name, "budget_exhausted" if by_deadline else "timeouts")
+        self.failed(endpoint)
+        limit = "turn deadline" if by_deadline else "timeout"
+        return DeadlineExceeded(f"{endpoint.name} exceeded its {limit}.", endpoint=endpoint.name, reason=self.reason)
+
+    def breakers(self) -> Dict[str, str]:
+        return {endpoint.name: endpoint.breaker.state for endpoint in self._endpoints.values()}
+
+
+def _wait_limit(elapsed: float, timeout: Optional[float], hedge_delay: Optional[float]) -> Optional[float]:
+    """Seconds until the call times out or is due a hedge, whichever is sooner."""
+
+    limits = [limit - elapsed for limit in (timeout, hedge_delay) if limit is not None]
+    return max(0.0, min(limits)) if limits else None
+
+
+def default_breaker() -> CircuitBreaker:
+    return CircuitBreaker()
+
+
+class ResilientClient:
+    """Wraps a synchronous integration client with deadlines, hedging and breakers.
+
+    Every public method of ``client`` is guarded. A call is refused with
+    :class:`DeadlineExceeded` when the current turn's deadline (see
+    :attr:`ObservabilityContext.deadline`) has run out, and with
+    :class:`CircuitOpen` while the method's breaker is open. Otherwise it
+    runs on ``executor`` and is abandoned after the smaller of ``timeout``
+    and the remaining turn budget. Timeouts and exceptions in
+    ``failure_types`` (transport errors by default) count against the
+    breaker; other exceptions are re-raised and counted as ``errors`` only. Methods named in ``hedged``, which must be
+    idempotent reads, get a duplicate request once the first exceeds the
+    ``hedge`` policy's latency percentile.
+
+    Abandoned calls keep running on the executor; size it for the expected
+    number of stragglers.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        name: str,
+        *,
+        timeout: Optional[float] = None,
+        hedged: Iterable[str] = (),
+        hedge: Optional[HedgePolicy] = None,
+        breaker_factory: Callable[[], CircuitBreaker] = default_breaker,
+        failure_types: Tuple[Type[BaseException], ...] = DEFAULT_FAILURE_TYPES,
+        stats: Optional[ResilienceStats] = None,
+        executor: Optional[Executor] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.client = client
+        self.stats = stats if stats is not None else ResilienceStats()
+        self._guard = _Guard(
+            name,
+            timeout=timeout,
+            hedged=hedged,
+            hedge=hedge if hedge is not None else HedgePolicy(),
+            breaker_factory=breaker_factory,
+            failure_types=failure_types,
+            stats=self.stats,
+            clock=clock,
+        )
+        if executor is None:
+            executor = ThreadPoolExecutor(max_workers=32, thread_name_prefix=f"vaai-{name}")
+        self._executor = executor
+
+    def __getattr__(self, method: str) -> Any:
+        target = getattr(self.client, method)
+        if method.startswith("_") or not callable(target):
+            return target
+
+        def guarded(*args: Any, **kwargs: Any) -> Any:
+            return self._call(method, target, args, kwargs)
+
+        return guarded
+
+    def breakers(self) -> Dict[str, str]:
+        return self._guard.breakers()
+
+    def _call(self, method: str, target: Callable[..., Any], args: tuple, kwargs: Dict[str, Any]) -> Any:
+        guard = self._guard
+        endpoint = guard.endpoint(method)
+        timeout, by_deadline = guard.admit(endpoint)
+        hedge_delay = endpoint.hedge_delay(guard.hedge)
+        started = guard.clock()
+        pending: Set[Future] = {self._executor.submit(target, *args, **kwargs)}
+        primary = next(iter(pending))
+        error: Optional[BaseException] = None
+        while pending:
+            elapsed = guard.clock() - started
+            if timeout is not None and elapsed >= timeout:
+                break
+            limit = _wait_limit(elapsed, timeout, hedge_delay)
+            done, pending = wait(pending, timeout=limit, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    guard.succeeded(endpoint, guard.clock() - started)
+                    if future is not primary:
+                        guard.stats.add(endpoint.name, "hedge_wins")
+                    return future.result()
+                error = future.exception()
+            # A call that already raised is not resent; hedges only cover slow requests.
+            if hedge_delay is not None and error is None and guard.clock() - started >= hedge_delay:
+                guard.stats.add(endpoint.name, "hedges")
+                pending.add(self._executor.submit(target, *args, **kwargs))
+                hedge_delay = None
+            elif done and not pending:
+                break
+        if error is not None and not pending:
+            guard.raised(endpoint, error)
+            raise error
+        raise guard.timed_out(endpoint, by_deadline)
+
+
+class AsyncResilientClient:
+    """Asyncio-native variant of :class:`ResilientClient` for ``async def`` clients.
+
+    Timeouts cancel the outstanding requests instead of abandoning them.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        name: str,
+        *,
+        timeout: Optional[float] = None,
+        hedged: Iterable[str] = (),
+        hedge: Optional[HedgePolicy] = None,
+        breaker_factory: Callable[[], CircuitBreaker] = default_breaker,
+        failure_types: Tuple[Type[BaseException], ...] = DEFAULT_FAILURE_TYPES,
+        stats: Optional[ResilienceStats] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.client = client
+        self.stats = stats if stats is not None else ResilienceStats()
+        self._guard = _Guard(
+            name,
+            timeout=timeout,
+            hedged=hedged,
+            hedge=hedge if hedge is not None else HedgePolicy(),
+            breaker_factory=breaker_factory,
+            failure_types=failure_types,
+            stats=self.stats,
+            clock=clock,
+        )
+
+    def __getattr__(self, method: str) -> Any:
+        target = getattr(self.client, method)
+        if method.startswith("_") or not callable(target):
+            return target
+
+        async def guarded(*args: Any, **kwargs: Any) -> Any:
+            return await self._call(method, target, args, kwargs)
+
+        return guarded
+
+    def breakers(self) -> Dict[str, str]:
+        return self._guard.breakers()
+
+    async def _call(
+        self, method: str, target: Callable[..., Awaitable[Any]], args: tuple, kwargs: Dict[str, Any]
+    ) -> Any:
+        guard = self._guard
+        endpoint = guard.endpoint(method)
+        timeout, by_deadline = guard.admit(endpoint)
+        hedge_delay = endpoint.hedge_delay(guard.hedge)
+        started = guard.clock()
+        primary = asyncio.ensure_future(target(*args, **kwargs))
+        pending: Set[asyncio.Future] = {primary}
+        error: Optional[BaseException] = None
+        try:
+            while pending:
+                elapsed = guard.clock() - started
+                if timeout is not None and elapsed >= timeout:
+                    break
+                done, pending = await asyncio.wait(
+                    pending, timeout=_wait_limit(elapsed, timeout, hedge_delay), return_when=asyncio.FIRST_COMPLETED
+                )
+                for future in done:
+                    if future.exception() is None:
+                        guard.succeeded(endpoint, guard.clock() - started)
+                        if future is not primary:
+                            guard.stats.add(endpoint.name, "hedge_wins")
+                        return future.result()
+                    error = future.exception()
+                if hedge_delay is not None and error is None and guard.clock() - started >= hedge_delay:
+                    guard.stats.add(endpoint.name, "hedges")
+                    pending.add(asyncio.ensure_future(target(*args, **kwargs)))
+                    hedge_delay = None
+                elif done and not pending:
+                    break
+        finally:
+            for future in pending:
+                future.cancel()
+        if error is not None and not pending:
+            guard.raised(endpoint, error)
+            raise error
+        raise guard.timed_out(endpoint, by_deadline)
+
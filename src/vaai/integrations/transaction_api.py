@@ -1,12 +1,15 @@
 """Transaction data service integration."""
 from __future__ import annotations
 
+from array import array
 from dataclasses import dataclass
-from datetime import datetime
-from typing import List
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Union, overload
 
+_EPOCH = datetime(1970, 1, 1)
 
-@dataclass
+
+@dataclass(slots=True)
 class Money:
     currency: str
     amount: int
@@ -16,7 +19,7 @@ class Money:
         return f"{self.currency} {self.amount / 100:.2f}"
 
 
-@dataclass
+@dataclass(slots=True)
 class Transaction:
     transaction_id: str
     posted_at: datetime
@@ -34,21 +37,404 @@ class Transaction:
         }
 
 
+def _to_micros(moment: datetime) -> int:
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(timezone.utc).replace(tzinfo=None)
+    return (moment - _EPOCH) // timedelta(microseconds=1)
+
+
+class _Vocabulary:
+    """Interns repeated strings (merchants, categories, currencies) as small integer codes."""
+
+    __slots__ = ("values", "_codes")
+
+    def __init__(self) -> None:
+        self.values: List[str] = []
+        self._codes: Dict[str, int] = {}
+
+    def code(self, value: str) -> int:
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def find(self, value: str) -> int:
+        """Code of ``value``, or -1 if it was never interned."""
+
+        return self._codes.get(value, -1)
+
+
+class TransactionColumns(NamedTuple):
+    """Raw column view of a :class:`TransactionBatch` for bulk consumers such as encoders."""
+
+    transaction_ids: List[str]
+    posted_us: array
+    amounts: array
+    merchant_codes: array
+    category_codes: array
+    currency_codes: array
+    merchants: List[str]
+    categories: List[str]
+    currencies: List[str]
+    tz: Optional[timezone]
+
+
+class TransactionBatch(Sequence[Transaction]):
+    """Columnar, immutable list of transactions.
+
+    Rows are held in parallel arrays: transaction ids as one string plus end
+    offsets, posting times as microseconds since the epoch, amounts in cents,
+    and merchant, category and currency as codes into per-batch vocabularies.
+    Indexing materialises a :class:`Transaction` on demand and slicing returns
+    another batch, so callers that treat the result as a list keep working.
+    :meth:`record`, :meth:`records` and :meth:`model_dump` serialise straight
+    from the columns without building row objects.
+    """
+
+    __slots__ = (
+        "_ids",
+        "_id_ends",
+        "_posted_us",
+        "_amounts",
+        "_merchant_codes",
+        "_category_codes",
+        "_currency_codes",
+        "_merchants",
+        "_categories",
+        "_currencies",
+        "_tz",
+    )
+
+    def __init__(
+        self,
+        *,
+        ids: str,
+        id_ends: array,
+        posted_us: array,
+        amounts: array,
+        merchant_codes: array,
+        category_codes: array,
+        currency_codes: array,
+        merchants: List[str],
+        categories: List[str],
+        currencies: List[str],
+        tz: Optional[timezone] = None,
+    ) -> None:
+        self._ids = ids
+        self._id_ends = id_ends
+        self._posted_us = posted_us
+        self._amounts = amounts
+        self._merchant_codes = merchant_codes
+        self._category_codes = category_codes
+        self._currency_codes = currency_codes
+        self._merchants = merchants
+        self._categories = categories
+        self._currencies = currencies
+        self._tz = tz
+
+    @classmethod
+    def from_rows(
+        cls,
+        rows: Iterable[tuple],
+        *,
+        tz: Optional[timezone] = None,
+    ) -> "TransactionBatch":
+        """Build from ``(transaction_id, posted_at, merchant_name, currency, cents, category)`` tuples."""
+
+        ids: List[str] = []
+        id_ends = array("l")
+        posted_us = array("q")
+        amounts = array("q")
+        merchant_codes = array("l")
+        category_codes = array("l")
+        currency_codes = array("l")
+        merchants, categories, currencies = _Vocabulary(), _Vocabulary(), _Vocabulary()
+        end = 0
+        for transaction_id, posted_at, merchant_name, currency, cents, category in rows:
+            ids.append(transaction_id)
+            end += len(transaction_id)
+            id_ends.append(end)
+            posted_us.append(_to_micros(posted_at))
+            amounts.append(cents)
+            merchant_codes.append(merchants.code(merchant_name))
+            category_codes.append(categories.code(category))
+            currency_codes.append(currencies.code(currency))
+        return cls(
+            ids="".join(ids),
+            id_ends=id_ends,
+            posted_us=posted_us,
+            amounts=amounts,
+            merchant_codes=merchant_codes,
+            category_codes=category_codes,
+            currency_codes=currency_codes,
+            merchants=merchants.values,
+            categories=categories.values,
+            currencies=currencies.values,
+            tz=tz,
+        )
+
+    @classmethod
+    def from_transactions(cls, transactions: Iterable[Transaction]) -> "TransactionBatch":
+        transactions = list(transactions)
+        tz = transactions[0].posted_at.tzinfo if transactions else None
+        rows = (
+            (txn.transaction_id, txn.posted_at, txn.merchant_name, txn.amount.currency, txn.amount.amount, txn.category)
+            for txn in transactions
+        )
+        return cls.from_rows(
+            rows,
+            tz=timezone.utc if tz is not None else None,
+        )
+
+    def __len__(self) -> int:
+        return len(self._amounts)
+
+    @overload
+    def __getitem__(self, index: int) -> Transaction: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "TransactionBatch": ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Transaction, "TransactionBatch"]:
+        if isinstance(index, slice):
+            return self._slice(index)
+        size = len(self._amounts)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("transaction index out of range")
+        return Transaction(
+            transaction_id=self.transaction_id(index),
+            posted_at=self.posted_at(index),
+            merchant_name=self._merchants[self._merchant_codes[index]],
+            amount=Money(currency=self._currencies[self._currency_codes[index]], amount=self._amounts[index]),
+            category=self._categories[self._category_codes[index]],
+        )
+
+    def __iter__(self) -> Iterator[Transaction]:
+        for index in range(len(self._amounts)):
+            yield self[index]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, TransactionBatch):
+            return list(self) == list(other)
+        if isinstance(other, list):
+            return list(self) == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"TransactionBatch({len(self)} transactions)"
+
+    def columns(self) -> TransactionColumns:
+        ids, start = [], 0
+        for end in self._id_ends:
+            ids.append(self._ids[start:end])
+            start = end
+        return TransactionColumns(
+            transaction_ids=ids,
+            posted_us=self._posted_us,
+            amounts=self._amounts,
+            merchant_codes=self._merchant_codes,
+            category_codes=self._category_codes,
+            currency_codes=self._currency_codes,
+            merchants=self._merchants,
+            categories=self._categories,
+            currencies=self._currencies,
+            tz=self._tz,
+        )
+
+    def transaction_id(self, index: int) -> str:
+        start = self._id_ends[index - 1] if index else 0
+        return self._ids[start : self._id_ends[index]]
+
+    def posted_at(self, index: int) -> datetime:
+        moment = _EPOCH + timedelta(microseconds=self._posted_us[index])
+        return moment.replace(tzinfo=self._tz) if self._tz is not None else moment
+
+    def index_of(self, transaction_id: str) -> Optional[int]:
+        """Row index of ``transaction_id``, without materialising any rows."""
+
+        for index in range(len(self._amounts)):
+            if self.transaction_id(index) == transaction_id:
+                return index
+        return None
+
+    def record(self, index: int) -> Dict[str, object]:
+        """Serialise one row as :meth:`Transaction.model_dump` would, straight from the columns."""
+
+        return {
+            "transactionId": self.transaction_id(index),
+            "postedAt": self.posted_at(index).isoformat(),
+            "merchantName": self._merchants[self._merchant_codes[index]],
+            "amount": f"{self._currencies[self._currency_codes[index]]} {self._amounts[index] / 100:.2f}",
+            "category": self._categories[self._category_codes[index]],
+        }
+
+    def records(self) -> "TransactionRecords":
+        """Every row's serialised form, as a list the response encoder can write from the columns."""
+
+        return TransactionRecords(self)
+
+    def model_dump(self) -> List[Dict[str, object]]:
+        return [self.record(index) for index in range(len(self._amounts))]
+
+    def nbytes(self) -> int:
+        """Approximate size of the column storage."""
+
+        columns = (
+            self._id_ends,
+            self._posted_us,
+            self._amounts,
+            self._merchant_codes,
+            self._category_codes,
+            self._currency_codes,
+        )
+        return len(self._ids) + sum(column.itemsize * len(column) for column in columns)
+
+    def _slice(self, index: slice) -> "TransactionBatch":
+        start, stop, step = index.indices(len(self._amounts))
+        if step != 1:
+            return TransactionBatch.from_transactions(self[position] for position in range(start, stop, step))
+        offset = self._id_ends[start - 1] if start else 0
+        end = self._id_ends[stop - 1] if stop > start else offset
+        return TransactionBatch(
+            ids=self._ids[offset:end],
+            id_ends=array("l", (position - offset for position in self._id_ends[start:stop])),
+            posted_us=self._posted_us[start:stop],
+            amounts=self._amounts[start:stop],
+            merchant_codes=self._merchant_codes[start:stop],
+            category_codes=self._category_codes[start:stop],
+            currency_codes=self._currency_codes[start:stop],
+            merchants=self._merchants,
+            categories=self._categories,
+            currencies=self._currencies,
+            tz=self._tz,
+        )
+
+
+class TransactionRecords(Sequence[Dict[str, object]]):
+    """Serialised rows of a :class:`TransactionBatch`, built on first use.
+
+    Responses carry this instead of a list of dicts, so a response that is
+    only written by :class:`~vaai.intents.ResponseEncoder` never builds them:
+    the encoder writes straight from the batch's columns. Reading the rows
+    (iterating, indexing or :meth:`to_json`) builds the dicts once and keeps
+    them, and from then on the encoder writes those same dicts, so its output
+    always matches what readers see. For :func:`json.dumps`, pass
+    ``default=vaai.intents.json_default``.
+    """
+
+    __slots__ = ("batch", "_rows")
+
+    def __init__(self, batch: TransactionBatch) -> None:
+        self.batch = batch
+        self._rows: Optional[List[Dict[str, object]]] = None
+
+    @property
+    def materialized(self) -> bool:
+        """Whether the row dicts have been built."""
+
+        return self._rows is not None
+
+    def __len__(self) -> int:
+        return len(self.batch) if self._rows is None else len(self._rows)
+
+    @overload
+    def __getitem__(self, index: int) -> Dict[str, object]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Dict[str, object]]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Dict[str, object], List[Dict[str, object]]]:
+        return self.to_json()[index]
+
+    def __iter__(self) -> Iterator[Dict[str, object]]:
+        return iter(self.to_json())
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (TransactionRecords, list)):
+            return self.to_json() == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"TransactionRecords({len(self)} rows)"
+
+    def to_json(self) -> List[Dict[str, object]]:
+        if self._rows is None:
+            self._rows = self.batch.model_dump()
+        return self._rows
+
+
+@dataclass
+class TransactionQuery:
+    """Filters for :meth:`TransactionAPI.search`; unset fields match everything.
+
+    ``merchant`` matches a case-insensitive substring of the merchant name,
+    ``category`` the exact category. Amounts are in minor units and inclusive;
+    ``start`` is inclusive and ``end`` exclusive.
+    """
+
+    merchant: Optional[str] = None
+    category: Optional[str] = None
+    min_amount: Optional[int] = None
+    max_amount: Optional[int] = None
+    start: Optional[datetime] = None
+    end: Optional[datetime] = None
+
+    def matches(self, transaction: Transaction) -> bool:
+        cents = transaction.amount.amount
+        posted = _to_micros(transaction.posted_at)
+        return (
+            (self.merchant is None or self.merchant.casefold() in transaction.merchant_name.casefold())
+            and (self.category is None or transaction.category == self.category)
+            and (self.min_amount is None or cents >= self.min_amount)
+            and (self.max_amount is None or cents <= self.max_amount)
+            and (self.start is None or posted >= _to_micros(self.start))
+            and (self.end is None or posted < _to_micros(self.end))
+        )
+
+
+@dataclass
+class TransactionPage:
+    """One page of search results, newest first.
+
+    Pass ``next_cursor`` back to ``search`` for the following page; it is
+    ``None`` on the last page. Cursors are opaque and carry the query.
+    """
+
+    transactions: TransactionBatch
+    next_cursor: Optional[str] = None
+
+
+def _sample_batch(limit: int) -> TransactionBatch:
+    now = datetime.utcnow()
+    return TransactionBatch.from_rows(
+        (f"TXN-{i}", now, f"Merchant {i}", "USD", 1000 * (i + 1), "general") for i in range(limit)
+    )
+
+
 class TransactionAPI:
     """Client for retrieving card transaction history."""
 
-    def list_recent(self, *, card_id: str | None, limit: int) -> List[Transaction]:
-        now = datetime.utcnow()
-        return [
-            Transaction(
-                transaction_id=f"TXN-{i}",
-                posted_at=now,
-                merchant_name=f"Merchant {i}",
-                amount=Money(currency="USD", amount=1000 * (i + 1)),
-                category="general",
-            )
-            for i in range(limit)
-        ]
+    def list_recent(self, *, card_id: str | None, limit: int) -> TransactionBatch:
+        return _sample_batch(limit)
+
+    def search(
+        self,
+        *,
+        card_id: str | None,
+        query: Optional[TransactionQuery] = None,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+    ) -> TransactionPage:
+        """Transactions on ``card_id`` matching ``query``, newest first, ``limit`` per page."""
+
+        query = query if query is not None else TransactionQuery()
+        matching = (txn for txn in _sample_batch(limit) if query.matches(txn))
+        return TransactionPage(TransactionBatch.from_transactions(matching))
 
     def get_transaction(self, *, transaction_id: str) -> Transaction:
         return Transaction(
@@ -58,3 +444,31 @@ class TransactionAPI:
             amount=Money(currency="USD", amount=3299),
             category="shopping",
         )
+
+
+class AsyncTransactionAPI:
+    """Asyncio-native client for retrieving card transaction history."""
+
+    async def list_recent(self, *, card_id: str | None, limit: int) -> TransactionBatch:
+        return _sample_batch(limit)
+
+    async def search(
+        self,
+        *,
+        card_id: str | None,
+        query: Optional[TransactionQuery] = None,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+    ) -> TransactionPage:
+        query = query if query is not None else TransactionQuery()
+        matching = (txn for txn in _sample_batch(limit) if query.matches(txn))
+        return TransactionPage(TransactionBatch.from_transactions(matching))
+
+    async def get_transaction(self, *, transaction_id: str) -> Transaction:
+        return Transaction(
+            transaction_id=transaction_id,
+            posted_at=datetime.utcnow(),
+            merchant_name="Example Merchant",
+            amount=Money(currency="USD", amount=3299),
+            category="shopping",
+        )
@@ -0,0 +1,217 @@
+"""Read-through cache with single-flight coalescing in front of ``TransactionAPI``."""
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Hashable, Optional, Set, Tuple, TypeVar, Union
+
+from .transaction_api import Transaction, TransactionAPI, TransactionBatch, TransactionPage, TransactionQuery
+
+T = TypeVar("T")
+_CachedRow = Union[Transaction, Tuple[TransactionBatch, int]]
+
+
+@dataclass
+class CacheStats:
+    """Counters exposed for sizing the cache."""
+
+    hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses + self.coalesced
+        return (self.hits + self.coalesced) / lookups if lookups else 0.0
+
+    def to_json(self) -> Dict[str, object]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "hitRate": round(self.hit_rate, 4),
+        }
+
+
+def _materialise(row: _CachedRow) -> Transaction:
+    if isinstance(row, tuple):
+        batch, index = row
+        return batch[index]
+    return row
+
+
+class _Flight:
+    """A backend call in progress that concurrent identical requests wait on."""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: object = None
+        self.error: Optional[BaseException] = None
+
+
+@dataclass
+class _CardEntry:
+    fetched_limit: int
+    expires_at: float
+    transactions: TransactionBatch
+
+
+@dataclass
+class CachingTransactionAPI(TransactionAPI):
+    """Drop-in :class:`TransactionAPI` that caches ``backend`` responses.
+
+    ``list_recent`` results are cached per card for ``card_ttl`` seconds; a
+    cached list fetched with a larger ``limit`` also serves smaller ones. Every
+    row of a list result populates the per-transaction cache, so the usual
+    "list, then explain one charge" call needs a single backend hit. Both
+    caches are LRU-bounded. Identical requests that arrive while a backend call
+    is in flight wait for that call instead of issuing their own.
+
+    Call :meth:`invalidate_card` whenever card state changes (for example after
+    a freeze) so the next lookup goes to the backend.
+    """
+
+    backend: TransactionAPI
+    card_ttl: float = 30.0
+    transaction_ttl: float = 300.0
+    max_cards: int = 10_000
+    max_transactions: int = 100_000
+    clock: Callable[[], float] = time.monotonic
+    stats: CacheStats = field(default_factory=CacheStats)
+
+    def __post_init__(self) -> None:
+        self._lock = threading.Lock()
+        self._cards: "OrderedDict[Optional[str], _CardEntry]" = OrderedDict()
+        # Rows from list results are kept as (batch, index) and materialised on lookup.
+        self._transactions: "OrderedDict[str, Tuple[float, _CachedRow, Optional[str]]]" = OrderedDict()
+        self._card_transactions: Dict[Optional[str], Set[str]] = {}
+        self._flights: Dict[Hashable, _Flight] = {}
+        # Bumped by every invalidation; a fetch that straddles one is not cached.
+        self._epoch = 0
+
+    def list_recent(self, *, card_id: str | None, limit: int) -> TransactionBatch:
+        with self._lock:
+            entry = self._cards.get(card_id)
+            if entry is not None and entry.fetched_limit >= limit and entry.expires_at > self.clock():
+                self._cards.move_to_end(card_id)
+                self.stats.hits += 1
+                return entry.transactions[:limit]
+            epoch = self._epoch
+
+        transactions = self._single_flight(
+            ("list", card_id, limit), lambda: self.backend.list_recent(card_id=card_id, limit=limit)
+        )
+        if not isinstance(transactions, TransactionBatch):
+            transactions = TransactionBatch.from_transactions(transactions)
+        self._store_list(card_id, limit, transactions, epoch)
+        return transactions
+
+    def get_transaction(self, *, transaction_id: str) -> Transaction:
+        with self._lock:
+            cached = self._transactions.get(transaction_id)
+            if cached is not None and cached[0] > self.clock():
+                self._transactions.move_to_end(transaction_id)
+                self.stats.hits += 1
+                return _materialise(cached[1])
+            epoch = self._epoch
+
+        transaction = self._single_flight(
+            ("get", transaction_id), lambda: self.backend.get_transaction(transaction_id=transaction_id)
+        )
+        with self._lock:
+            if epoch == self._epoch:
+                self._store_transaction(transaction.transaction_id, transaction, card_id=None, now=self.clock())
+        return transaction
+
+    def search(
+        self,
+        *,
+        card_id: str | None,
+        query: Optional[TransactionQuery] = None,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+    ) -> TransactionPage:
+        # Filtered searches rarely repeat, so they are not cached.
+        return self.backend.search(card_id=card_id, query=query, limit=limit, cursor=cursor)
+
+    def invalidate_card(self, card_id: str | None) -> None:
+        """Drop the cached list for ``card_id`` and every transaction it populated."""
+
+        with self._lock:
+            self._epoch += 1
+            self._cards.pop(card_id, None)
+            for txn_id in self._card_transactions.pop(card_id, ()):
+                self._transactions.pop(txn_id, None)
+            self.stats.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._epoch += 1
+            self._cards.clear()
+            self._transactions.clear()
+            self._card_transactions.clear()
+
+    def _single_flight(self, key: Hashable, fetch: Callable[[], T]) -> T:
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+                self.stats.misses += 1
+            else:
+                self.stats.coalesced += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result  # type: ignore[return-value]
+
+        try:
+            flight.result = fetch()
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+        return flight.result  # type: ignore[return-value]
+
+    def _store_list(self, card_id: str | None, limit: int, transactions: TransactionBatch, epoch: int) -> None:
+        with self._lock:
+            if epoch != self._epoch:
+                return
+            now = self.clock()
+            self._cards[card_id] = _CardEntry(fetched_limit=limit, expires_at=now + self.card_ttl, transactions=transactions)
+            self._cards.move_to_end(card_id)
+            while len(self._cards) > self.max_cards:
+                evicted_card, _ = self._cards.popitem(last=False)
+                for txn_id in self._card_transactions.pop(evicted_card, ()):
+                    self._transactions.pop(txn_id, None)
+                self.stats.evictions += 1
+            for index in range(len(transactions)):
+                self._store_transaction(
+                    transactions.transaction_id(index), (transactions, index), card_id=card_id, now=now
+                )
+
+    def _store_transaction(self, txn_id: str, row: _CachedRow, *, card_id: str | None, now: float) -> None:
+        previous = self._transactions.get(txn_id)
+        owner = card_id if card_id is not None or previous is None else previous[2]
+        self._transactions[txn_id] = (now + self.transaction_ttl, row, owner)
+        self._transactions.move_to_end(txn_id)
+        if owner is not None:
+            self._card_transactions.setdefault(owner, set()).add(txn_id)
+        while len(self._transactions) > self.max_transactions:
+            evicted_id, (_, _, evicted_owner) = self._transactions.popitem(last=False)
+            if evicted_owner is not None:
+                self._card_transactions.get(evicted_owner, set()).discard(evicted_id)
+            self.stats.evictions += 1
@@ -0,0 +1,359 @@
+"""Local indexed transaction history with filtered, cursor-paginated search."""
+from __future__ import annotations
+
+import base64
+import heapq
+import json
+import threading
+from array import array
+from bisect import bisect_left
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .transaction_api import (
+    _EPOCH,
+    Transaction,
+    TransactionAPI,
+    TransactionBatch,
+    TransactionPage,
+    TransactionQuery,
+    _to_micros,
+    _Vocabulary,
+)
+
+_CURSOR_VERSION = 1
+
+Row = Tuple[str, datetime, str, str, int, str]
+"""``(transaction_id, posted_at, merchant_name, currency, cents, category)``, as for ``from_rows``."""
+
+
+def _from_micros(micros: Optional[int]) -> Optional[datetime]:
+    return _EPOCH + timedelta(microseconds=micros) if micros is not None else None
+
+
+def encode_cursor(card_id: Optional[str], query: TransactionQuery, posted_us: int, transaction_id: str) -> str:
+    """Opaque cursor resuming ``query`` after the row ``(posted_us, transaction_id)``."""
+
+    payload = [
+        _CURSOR_VERSION,
+        card_id,
+        query.merchant,
+        query.category,
+        query.min_amount,
+        query.max_amount,
+        _to_micros(query.start) if query.start is not None else None,
+        _to_micros(query.end) if query.end is not None else None,
+        posted_us,
+        transaction_id,
+    ]
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Tuple[Optional[str], TransactionQuery, Tuple[int, str]]:
+    """Inverse of :func:`encode_cursor`: ``(card_id, query, (posted_us, transaction_id))``."""
+
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        version, card_id, merchant, category, low, high, start, end, posted_us, transaction_id = json.loads(raw)
+    except (ValueError, TypeError) as exc:
+        raise ValueError("Invalid transaction search cursor.") from exc
+    if version != _CURSOR_VERSION:
+        raise ValueError("Invalid transaction search cursor.")
+    query = TransactionQuery(merchant, category, low, high, _from_micros(start), _from_micros(end))
+    return card_id, query, (posted_us, transaction_id)
+
+
+class _History:
+    """One card's rows in ``(posted_at, transaction_id)`` order, with posting lists."""
+
+    __slots__ = (
+        "ids",
+        "posted_us",
+        "amounts",
+        "merchant_codes",
+        "category_codes",
+        "currency_codes",
+        "merchant_postings",
+        "category_postings",
+    )
+
+    def __init__(self) -> None:
+        self.ids: List[str] = []
+        self.posted_us = array("q")
+        self.amounts = array("q")
+        self.merchant_codes = array("l")
+        self.category_codes = array("l")
+        self.currency_codes = array("l")
+        self.merchant_postings: Dict[int, array] = {}
+        self.category_postings: Dict[int, array] = {}
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def last_key(self) -> Optional[Tuple[int, str]]:
+        return (self.posted_us[-1], self.ids[-1]) if self.ids else None
+
+    def add(
+        self, transaction_id: str, posted_us: int, merchant: int, currency: int, cents: int, category: int
+    ) -> None:
+        position = len(self.ids)
+        self.ids.append(transaction_id)
+        self.posted_us.append(posted_us)
+        self.amounts.append(cents)
+        self.merchant_codes.append(merchant)
+        self.category_codes.append(category)
+        self.currency_codes.append(currency)
+        self.merchant_postings.setdefault(merchant, array("l")).append(position)
+        self.category_postings.setdefault(category, array("l")).append(position)
+
+    def position_after(self, posted_us: int) -> int:
+        return bisect_left(self.posted_us, posted_us)
+
+    def position_of(self, key: Tuple[int, str]) -> int:
+        """Number of rows ordered strictly before ``key``."""
+
+        posted_us, transaction_id = key
+        position, size = bisect_left(self.posted_us, posted_us), len(self.ids)
+        while position < size and self.posted_us[position] == posted_us and self.ids[position] < transaction_id:
+            position += 1
+        return position
+
+
+def _descending(postings: array, low: int, high: int) -> Iterator[int]:
+    """Entries of sorted ``postings`` within ``[low, high)``, largest first."""
+
+    first, last = bisect_left(postings, low), bisect_left(postings, high)
+    return (postings[index] for index in range(last - 1, first - 1, -1))
+
+
+def _count(postings: array, low: int, high: int) -> int:
+    return bisect_left(postings, high) - bisect_left(postings, low)
+
+
+class TransactionStore(TransactionAPI):
+    """In-process transaction history indexed for :meth:`search`.
+
+    Each card's rows are kept in columns sorted by posting time (the date
+    index), with one posting list of row positions per merchant and per
+    category (the inverted indexes). A query narrows to its date range by
+    binary search, then walks whichever candidate set is smallest: the date
+    range itself, the category's postings, or the merged postings of every
+    merchant whose name contains the ``merchant`` substring. The remaining
+    filters (including amounts) are checked per candidate, and scanning stops
+    once a page is full.
+
+    Load history with :meth:`load` and add new rows with :meth:`append`.
+    Appends that are newer than everything stored are O(rows); older rows
+    force a rebuild of that card. Results are newest first. Cursors carry the
+    query and the last row returned, so pages stay consistent while newer
+    rows are appended.
+
+    Cards that were never loaded go to ``backend`` when one is given.
+    Timestamps are kept as UTC microseconds; once aware rows are stored,
+    results come back aware in UTC, as with
+    :meth:`TransactionBatch.from_transactions`. :meth:`get_transaction`
+    looks rows up by id in constant time.
+    """
+
+    def __init__(self, backend: Optional[TransactionAPI] = None) -> None:
+        self.backend = backend
+        self._cards: Dict[Optional[str], _History] = {}
+        self._merchants = _Vocabulary()
+        self._folded: List[str] = []
+        self._categories = _Vocabulary()
+        self._currencies = _Vocabulary()
+        self._locations: Dict[str, Tuple[Optional[str], int]] = {}
+        self._tz: Optional[timezone] = None
+        self._lock = threading.Lock()
+
+    def load(self, card_id: Optional[str], rows: Iterable[Row]) -> int:
+        """Replace the card's history with ``rows`` (any order); returns the row count."""
+
+        history = _History()
+        with self._lock:
+            for row in sorted(self._encode(rows)):
+                history.add(row[1], row[0], *row[2:])
+            previous = self._cards.get(card_id)
+            if previous is not None:
+                for transaction_id in previous.ids:
+                    if self._locations.get(transaction_id, (None, -1))[0] == card_id:
+                        del self._locations[transaction_id]
+            self._cards[card_id] = history
+            self._locate(card_id, history, 0)
+        return len(history)
+
+    def append(self, card_id: Optional[str], rows: Iterable[Row]) -> int:
+        """Add ``rows`` to the card's history; returns the number added."""
+
+        with self._lock:
+            encoded = sorted(self._encode(rows))
+            if not encoded:
+                return 0
+            history = self._cards.setdefault(card_id, _History())
+            last = history.last_key()
+            if last is None or (encoded[0][0], encoded[0][1]) >= last:
+                start = len(history)
+                for row in encoded:
+                    history.add(row[1], row[0], *row[2:])
+                self._locate(card_id, history, start)
+                return len(encoded)
+            merged = sorted(
+                [
+                    (
+                        history.posted_us[index],
+                        history.ids[index],
+                        history.merchant_codes[index],
+                        history.currency_codes[index],
+                        history.amounts[index],
+                        history.category_codes[index],
+                    )
+                    for index in range(len(history))
+                ]
+                + encoded
+            )
+            rebuilt = _History()
+            for row in merged:
+                rebuilt.add(row[1], row[0], *row[2:])
+            self._cards[card_id] = rebuilt
+            self._locate(card_id, rebuilt, 0)
+        return len(encoded)
+
+    def search(
+        self,
+        *,
+        card_id: str | None,
+        query: Optional[TransactionQuery] = None,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+    ) -> TransactionPage:
+        after = None
+        if cursor is not None:
+            cursor_card, query, after = decode_cursor(cursor)
+            if cursor_card != card_id:
+                raise ValueError("Transaction search cursor belongs to another card.")
+        query = query if query is not None else TransactionQuery()
+        with self._lock:
+            history = self._cards.get(card_id)
+            if history is None:
+                if self.backend is not None:
+                    return self.backend.search(card_id=card_id, query=query, limit=limit, cursor=cursor)
+                return TransactionPage(TransactionBatch.from_rows(()))
+            positions = self._select(history, query, after, limit + 1)
+            page = self._page(history, positions[:limit])
+        next_cursor = None
+        if len(positions) > limit:
+            last = positions[limit - 1]
+            next_cursor = encode_cursor(card_id, query, history.posted_us[last], history.ids[last])
+        return TransactionPage(page, next_cursor)
+
+    def iter_pages(
+        self, *, card_id: str | None, query: Optional[TransactionQuery] = None, limit: int = 20
+    ) -> Iterator[TransactionPage]:
+        """Yield successive pages of :meth:`search` until the last one."""
+
+        page = self.search(card_id=card_id, query=query, limit=limit)
+        yield page
+        while page.next_cursor is not None:
+            page = self.search(card_id=card_id, limit=limit, cursor=page.next_cursor)
+            yield page
+
+    def list_recent(self, *, card_id: str | None, limit: int) -> TransactionBatch:
+        if card_id not in self._cards and self.backend is not None:
+            return self.backend.list_recent(card_id=card_id, limit=limit)
+        return self.search(card_id=card_id, limit=limit).transactions
+
+    def get_transaction(self, *, transaction_id: str) -> Transaction:
+        with self._lock:
+            location = self._locations.get(transaction_id)
+            if location is not None:
+                card_id, position = location
+                return self._page(self._cards[card_id], [position])[0]
+        if self.backend is not None:
+            return self.backend.get_transaction(transaction_id=transaction_id)
+        raise KeyError(transaction_id)
+
+    def _locate(self, card_id: Optional[str], history: _History, start: int) -> None:
+        """Index rows ``start`` onwards of the card's history by id. Caller holds the lock."""
+
+        ids, locations = history.ids, self._locations
+        for position in range(start, len(ids)):
+            locations[ids[position]] = (card_id, position)
+
+    def _encode(self, rows: Iterable[Row]) -> Iterator[Tuple[int, str, int, int, int, int]]:
+        # Sort key first so ``sorted`` yields (posted_us, transaction_id) order.
+        for transaction_id, posted_at, merchant_name, currency, cents, category in rows:
+            if self._tz is None and posted_at.tzinfo is not None:
+                self._tz = timezone.utc
+            merchant = self._merchants.code(merchant_name)
+            if merchant == len(self._folded):
+                self._folded.append(merchant_name.casefold())
+            yield (
+                _to_micros(posted_at),
+                transaction_id,
+                merchant,
+                self._currencies.code(currency),
+                cents,
+                self._categories.code(category),
+            )
+
+    def _select(
+        self, history: _History, query: TransactionQuery, after: Optional[Tuple[int, str]], wanted: int
+    ) -> List[int]:
+        low = history.position_after(_to_micros(query.start)) if query.start is not None else 0
+        high = history.position_after(_to_micros(query.end)) if query.end is not None else len(history)
+        if after is not None:
+            high = min(high, history.position_of(after))
+        if low >= high:
+            return []
+
+        merchants: Optional[set] = None
+        candidates: Iterable[int] = range(high - 1, low - 1, -1)
+        size = high - low
+        if query.merchant is not None:
+            needle = query.merchant.casefold()
+            merchants = {code for code in history.merchant_postings if needle in self._folded[code]}
+            postings = [history.merchant_postings[code] for code in merchants]
+            count = sum(_count(posting, low, high) for posting in postings)
+            if count < size:
+                size = count
+                candidates = heapq.merge(*(_descending(posting, low, high) for posting in postings), reverse=True)
+        category: Optional[int] = None
+        if query.category is not None:
+            category = self._categories.find(query.category)
+            posting = history.category_postings.get(category, array("l"))
+            if _count(posting, low, high) < size:
+                candidates = _descending(posting, low, high)
+
+        low_amount, high_amount = query.min_amount, query.max_amount
+        amounts, merchant_codes, category_codes = history.amounts, history.merchant_codes, history.category_codes
+        selected: List[int] = []
+        for position in candidates:
+            if merchants is not None and merchant_codes[position] not in merchants:
+                continue
+            if category is not None and category_codes[position] != category:
+                continue
+            cents = amounts[position]
+            if (low_amount is not None and cents < low_amount) or (high_amount is not None and cents > high_amount):
+                continue
+            selected.append(position)
+            if len(selected) == wanted:
+                break
+        return selected
+
+    def _page(self, history: _History, positions: List[int]) -> TransactionBatch:
+        merchants, categories, currencies = self._merchants.values, self._categories.values, self._currencies.values
+        return TransactionBatch.from_rows(
+            (
+                (
+                    history.ids[position],
+                    _EPOCH + timedelta(microseconds=history.posted_us[position]),
+                    merchants[history.merchant_codes[position]],
+                    currencies[history.currency_codes[position]],
+                    history.amounts[position],
+                    categories[history.category_codes[position]],
+                )
+                for position in positions
+            ),
+            tz=self._tz,
+        )
@@ -0,0 +1,339 @@
+"""Memory-mapped embedding index for the policy/FAQ retrieval path.
+
+Requires NumPy, which the rest of the package does not; import this module
+only where ``AgentConfig.enable_rag`` is used.
+"""
+from __future__ import annotations
+
+import json
+import os
+import re
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .knowledge_base import KnowledgeChunk, chunk_text
+
+_TOKEN = re.compile(r"[a-z0-9']+")
+_SEARCH_BLOCK = 65_536
+_TOKEN_CACHE_SIZE = 1 << 20
+_BIGRAM_MULTIPLIER = np.uint32(0x9E3779B1)
+
+
+@dataclass
+class HashingEmbedder:
+    """Deterministic, offline text embedding by signed feature hashing.
+
+    Unigrams and bigrams are hashed into ``dim`` buckets with a hash-derived
+    sign and the result is L2-normalised. It needs no model download, so the
+    retrieval path and its benchmark run anywhere; swap in a neural embedder
+    with the same ``embed`` signature for production quality. Token hashes
+    are cached, and bigram hashes are combined from them with array
+    arithmetic, so a batch costs one dictionary lookup per token.
+    """
+
+    dim: int = 256
+
+    def __post_init__(self) -> None:
+        self._token_hashes: Dict[str, int] = {}
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        cache = self._token_hashes
+        hashes: List[int] = []
+        rows: List[int] = []
+        for row, text in enumerate(texts):
+            tokens = _TOKEN.findall(text.lower())
+            for token in tokens:
+                value = cache.get(token)
+                if value is None:
+                    if len(cache) >= _TOKEN_CACHE_SIZE:
+                        cache.clear()
+                    value = cache[token] = zlib.crc32(token.encode())
+                hashes.append(value)
+            rows.extend([row] * len(tokens))
+        unigrams = np.asarray(hashes, dtype=np.uint32)
+        row_ids = np.asarray(rows, dtype=np.int64)
+        same_text = row_ids[1:] == row_ids[:-1]
+        bigrams = (unigrams[:-1] * _BIGRAM_MULTIPLIER ^ unigrams[1:])[same_text]
+        features = np.concatenate([unigrams, bigrams])
+        feature_rows = np.concatenate([row_ids, row_ids[:-1][same_text]])
+        signs = np.where(features & np.uint32(0x8000_0000), 1.0, -1.0).astype(np.float32)
+        flat = feature_rows * self.dim + (features % np.uint32(self.dim)).astype(np.int64)
+        vectors = np.bincount(flat, weights=signs, minlength=len(texts) * self.dim).astype(np.float32)
+        vectors = vectors.reshape(len(texts), self.dim)
+        vectors /= np.maximum(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-12)
+        return vectors
+
+
+class VectorIndex:
+    """Append-only embedding matrix with tombstone deletes and optional IVF search.
+
+    With a ``path`` the vectors live in a memory-mapped ``<path>.npy`` and
+    each row's metadata in an append-only ``<path>.meta.jsonl`` sidecar, so
+    adds and deletes are persisted incrementally and many processes can map
+    the same index. Capacity doubles when full. Exact search is a blocked
+    matrix-vector product over live rows; after :meth:`build_ivf` searches can
+    instead probe the ``nprobe`` nearest of ``nlist`` k-means clusters. Rows
+    added after the IVF build are searched exhaustively until the next build.
+    Constructing an index with a ``path`` starts it empty, overwriting any
+    index already there; use :meth:`open` to continue one.
+    """
+
+    def __init__(
+        self,
+        dim: int,
+        *,
+        path: Union[str, Path, None] = None,
+        capacity: int = 1024,
+        dtype: Union[str, np.dtype] = np.float32,
+    ) -> None:
+        self.dim = dim
+        self.path = Path(path) if path is not None else None
+        self.dtype = np.dtype(dtype)
+        self.size = 0
+        self.metadata: List[Optional[Dict[str, str]]] = []
+        self._alive = np.zeros(capacity, dtype=bool)
+        self._matrix = self._allocate(capacity)
+        self._ivf: Optional[_IVF] = None
+
+    @classmethod
+    def open(cls, path: Union[str, Path]) -> "VectorIndex":
+        """Reopen an index written with ``path``, replaying its metadata sidecar."""
+
+        path = Path(path)
+        matrix = np.load(path.with_suffix(".npy"), mmap_mode="r+")
+        index = cls.__new__(cls)
+        index.dim = matrix.shape[1]
+        index.path = path
+        index.dtype = matrix.dtype
+        index._matrix = matrix
+        index._alive = np.zeros(matrix.shape[0], dtype=bool)
+        index.metadata = []
+        index._ivf = None
+        with path.with_suffix(".meta.jsonl").open() as handle:
+            for line in handle:
+                record = json.loads(line)
+                if "delete" in record:
+                    index._alive[record["delete"]] = False
+                    index.metadata[record["delete"]] = None
+                else:
+                    index._alive[len(index.metadata)] = True
+                    index.metadata.append(record)
+        index.size = len(index.metadata)
+        return index
+
+    def __len__(self) -> int:
+        return int(self._alive[: self.size].sum())
+
+    @property
+    def vectors(self) -> np.ndarray:
+        return self._matrix[: self.size]
+
+    def add(self, vectors: np.ndarray, metadata: Sequence[Dict[str, str]]) -> np.ndarray:
+        """Append ``vectors`` (one row per metadata record); returns their row ids."""
+
+        vectors = np.asarray(vectors, dtype=np.float32)
+        if vectors.shape != (len(metadata), self.dim):
+            raise ValueError(f"expected vectors of shape ({len(metadata)}, {self.dim})")
+        start, stop = self.size, self.size + len(metadata)
+        if stop > self._matrix.shape[0]:
+            self._grow(stop)
+        self._matrix[start:stop] = vectors
+        self._alive[start:stop] = True
+        self.metadata.extend(dict(record) for record in metadata)
+        self.size = stop
+        self._append_sidecar(metadata)
+        return np.arange(start, stop)
+
+    def delete(self, rows: Iterable[int]) -> int:
+        """Tombstone ``rows``; returns how many were live."""
+
+        removed = [row for row in rows if 0 <= row < self.size and self._alive[row]]
+        for row in removed:
+            self._alive[row] = False
+            self.metadata[row] = None
+        self._append_sidecar([{"delete": row} for row in removed])
+        return len(removed)
+
+    def search(
+        self, queries: np.ndarray, top_k: int = 5, *, nprobe: Optional[int] = None
+    ) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """``(rows, scores)`` of the ``top_k`` most similar live rows per query, best first.
+
+        ``nprobe`` selects IVF search (requires :meth:`build_ivf`); otherwise
+        the search is exact.
+        """
+
+        queries = np.atleast_2d(np.asarray(queries, dtype=np.float32))
+        if nprobe is not None and self._ivf is not None:
+            return [self._search_ivf(query, top_k, nprobe) for query in queries]
+        scores = np.empty((len(queries), self.size), dtype=np.float32)
+        for start in range(0, self.size, _SEARCH_BLOCK):
+            block = self._matrix[start : min(start + _SEARCH_BLOCK, self.size)].astype(np.float32, copy=False)
+            scores[:, start : start + len(block)] = queries @ block.T
+        scores[:, ~self._alive[: self.size]] = -np.inf
+        return [_top_k(np.arange(self.size), row_scores, top_k) for row_scores in scores]
+
+    def build_ivf(self, nlist: Optional[int] = None, *, iterations: int = 8, seed: int = 0) -> None:
+        """Cluster live rows with spherical k-means for approximate search."""
+
+        live = np.flatnonzero(self._alive[: self.size])
+        if not len(live):
+            self._ivf = None
+            return
+        nlist = min(nlist or max(1, int(np.sqrt(len(live)))), len(live))
+        rng = np.random.default_rng(seed)
+        sample = live if len(live) <= 64 * nlist else rng.choice(live, 64 * nlist, replace=False)
+        data = self._matrix[np.sort(sample)].astype(np.float32)
+        centroids = data[rng.choice(len(data), nlist, replace=False)]
+        for _ in range(iterations):
+            assignment = (data @ centroids.T).argmax(axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assignment, data)
+            empty = np.bincount(assignment, minlength=nlist) == 0
+            sums[empty] = centroids[empty]
+            centroids = sums / np.maximum(np.linalg.norm(sums, axis=1, keepdims=True), 1e-12)
+        assignment = np.concatenate(
+            [
+                (self._matrix[live[start : start + _SEARCH_BLOCK]].astype(np.float32) @ centroids.T).argmax(axis=1)
+                for start in range(0, len(live), _SEARCH_BLOCK)
+            ]
+        )
+        order = np.argsort(assignment, kind="stable")
+        offsets = np.searchsorted(assignment[order], np.arange(nlist + 1))
+        self._ivf = _IVF(centroids=centroids, rows=live[order], offsets=offsets, indexed_until=self.size)
+
+    def _search_ivf(self, query: np.ndarray, top_k: int, nprobe: int) -> Tuple[np.ndarray, np.ndarray]:
+        ivf = self._ivf
+        assert ivf is not None
+        lists = np.argsort(-(ivf.centroids @ query))[:nprobe]
+        candidates = np.concatenate(
+            [ivf.rows[ivf.offsets[cluster] : ivf.offsets[cluster + 1]] for cluster in lists]
+            + [np.arange(ivf.indexed_until, self.size)]
+        )
+        candidates = candidates[self._alive[candidates]]
+        scores = self._matrix[candidates].astype(np.float32) @ query
+        return _top_k(candidates, scores, top_k)
+
+    def _allocate(self, capacity: int) -> np.ndarray:
+        if self.path is None:
+            return np.zeros((capacity, self.dim), dtype=self.dtype)
+        # A new index replaces any previous one at ``path``, sidecar included;
+        # reopen an existing index with :meth:`open` instead.
+        self.path.with_suffix(".meta.jsonl").write_text("")
+        return np.lib.format.open_memmap(
+            self.path.with_suffix(".npy"), mode="w+", dtype=self.dtype, shape=(capacity, self.dim)
+        )
+
+    def _grow(self, needed: int) -> None:
+        capacity = max(needed, 2 * self._matrix.shape[0])
+        if self.path is None:
+            matrix = np.zeros((capacity, self.dim), dtype=self.dtype)
+        else:
+            # Write the larger matrix beside the old one, then swap it in atomically.
+            scratch = self.path.with_suffix(".grow.npy")
+            matrix = np.lib.format.open_memmap(scratch, mode="w+", dtype=self.dtype, shape=(capacity, self.dim))
+        matrix[: self.size] = self._matrix[: self.size]
+        if self.path is not None:
+            matrix.flush()
+            os.replace(scratch, self.path.with_suffix(".npy"))
+        self._matrix = matrix
+        self._alive = np.concatenate([self._alive, np.zeros(capacity - len(self._alive), dtype=bool)])
+
+    def _append_sidecar(self, records: Sequence[Dict[str, object]]) -> None:
+        if self.path is None or not records:
+            return
+        with self.path.with_suffix(".meta.jsonl").open("a") as handle:
+            handle.writelines(json.dumps(record) + "\n" for record in records)
+
+
+@dataclass
+class _IVF:
+    centroids: np.ndarray
+    rows: np.ndarray
+    offsets: np.ndarray
+    indexed_until: int
+
+
+def _top_k(rows: np.ndarray, scores: np.ndarray, top_k: int) -> Tuple[np.ndarray, np.ndarray]:
+    if len(scores) > top_k:
+        keep = np.argpartition(-scores, top_k)[:top_k]
+        rows, scores = rows[keep], scores[keep]
+    order = np.argsort(-scores, kind="stable")
+    rows, scores = rows[order], scores[order]
+    finite = np.isfinite(scores)
+    return rows[finite], scores[finite]
+
+
+class KnowledgeBase:
+    """Chunks, embeds and indexes policy/FAQ documents; a :class:`KnowledgeRetriever`.
+
+    Re-ingesting a ``doc_id`` replaces its chunks. ``nprobe`` switches
+    :meth:`search` to the approximate IVF index once :meth:`VectorIndex.build_ivf`
+    has been called.
+    """
+
+    def __init__(
+        self,
+        index: Optional[VectorIndex] = None,
+        embedder: Optional[HashingEmbedder] = None,
+        *,
+        max_words: int = 120,
+        overlap: int = 20,
+        nprobe: Optional[int] = None,
+    ) -> None:
+        self.embedder = embedder if embedder is not None else HashingEmbedder()
+        self.index = index if index is not None else VectorIndex(self.embedder.dim)
+        self.max_words = max_words
+        self.overlap = overlap
+        self.nprobe = nprobe
+        self._doc_rows: Dict[str, List[int]] = {}
+        for row, record in enumerate(self.index.metadata):
+            if record is not None:
+                self._doc_rows.setdefault(record["doc_id"], []).append(row)
+
+    def ingest(self, doc_id: str, title: str, text: str) -> int:
+        """Index ``text`` as ``doc_id``; returns the number of chunks added."""
+
+        return self.ingest_many([(doc_id, title, text)])
+
+    def ingest_many(self, documents: Iterable[Tuple[str, str, str]]) -> int:
+        texts: List[str] = []
+        records: List[Dict[str, str]] = []
+        for doc_id, title, text in documents:
+            self.delete_document(doc_id)
+            for number, chunk in enumerate(chunk_text(text, max_words=self.max_words, overlap=self.overlap)):
+                texts.append(f"{title}. {chunk}")
+                records.append({"doc_id": doc_id, "chunk_id": f"{doc_id}#{number}", "title": title, "text": chunk})
+        if not records:
+            return 0
+        rows = self.index.add(self.embedder.embed(texts), records)
+        for row, record in zip(rows.tolist(), records):
+            self._doc_rows.setdefault(record["doc_id"], []).append(row)
+        return len(records)
+
+    def delete_document(self, doc_id: str) -> int:
+        return self.index.delete(self._doc_rows.pop(doc_id, []))
+
+    def search(self, query: str, top_k: int = 3) -> List[KnowledgeChunk]:
+        return self.search_many([query], top_k)[0]
+
+    def search_many(self, queries: Sequence[str], top_k: int = 3) -> List[List[KnowledgeChunk]]:
+        results = self.index.search(self.embedder.embed(queries), top_k, nprobe=self.nprobe)
+        return [
+            [self._chunk(row, score) for row, score in zip(rows.tolist(), scores.tolist())]
+            for rows, scores in results
+        ]
+
+    def _chunk(self, row: int, score: float) -> KnowledgeChunk:
+        record = self.index.metadata[row]
+        return KnowledgeChunk(
+            chunk_id=record["chunk_id"],
+            doc_id=record["doc_id"],
+            title=record["title"],
+            text=record["text"],
+            score=score,
+        )
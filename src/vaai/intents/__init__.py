@@ -1,12 +1,73 @@
 """Intent handlers available in VAai."""
-from .card_management import ActivateCardHandler, FreezeCardHandler
-from .transactions import ExplainChargeHandler, ListRecentTransactionsHandler
-from .verification import VerifyClientHandler
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from ..utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .card_management import (
+        ActivateCardHandler,
+        AsyncActivateCardHandler,
+        AsyncFreezeCardHandler,
+        FreezeAllCardsHandler,
+        FreezeCardHandler,
+    )
+    from .encoding import ResponseEncoder, decode_frame, json_default
+    from .faq import AnswerPolicyQuestionHandler
+    from .registry import HandlerRegistry, Provided, default_registry
+    from .transactions import (
+        AsyncExplainChargeHandler,
+        AsyncListRecentTransactionsHandler,
+        AsyncSearchTransactionsHandler,
+        ExplainChargeHandler,
+        ListRecentTransactionsHandler,
+        SearchTransactionsHandler,
+    )
+    from .verification import VerifyClientHandler
+
+_EXPORTS = {
+    "ActivateCardHandler": ".card_management",
+    "AnswerPolicyQuestionHandler": ".faq",
+    "AsyncActivateCardHandler": ".card_management",
+    "AsyncExplainChargeHandler": ".transactions",
+    "AsyncFreezeCardHandler": ".card_management",
+    "AsyncListRecentTransactionsHandler": ".transactions",
+    "AsyncSearchTransactionsHandler": ".transactions",
+    "ExplainChargeHandler": ".transactions",
+    "FreezeAllCardsHandler": ".card_management",
+    "FreezeCardHandler": ".card_management",
+    "HandlerRegistry": ".registry",
+    "ListRecentTransactionsHandler": ".transactions",
+    "Provided": ".registry",
+    "ResponseEncoder": ".encoding",
+    "SearchTransactionsHandler": ".transactions",
+    "VerifyClientHandler": ".verification",
+    "decode_frame": ".encoding",
+    "json_default": ".encoding",
+    "default_registry": ".registry",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     "ActivateCardHandler",
-    "FreezeCardHandler",
+    "AnswerPolicyQuestionHandler",
+    "AsyncActivateCardHandler",
+    "AsyncExplainChargeHandler",
+    "AsyncFreezeCardHandler",
+    "AsyncListRecentTransactionsHandler",
+    "AsyncSearchTransactionsHandler",
     "ExplainChargeHandler",
+    "FreezeAllCardsHandler",
+    "FreezeCardHandler",
+    "HandlerRegistry",
     "ListRecentTransactionsHandler",
+    "Provided",
+    "ResponseEncoder",
+    "SearchTransactionsHandler",
     "VerifyClientHandler",
+    "decode_frame",
+    "default_registry",
+    "json_default",
 ]
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, Optional, Protocol
+from typing import AsyncIterable, Dict, Iterable, Iterator, Optional, Protocol
 
 from ..monitoring.observability import ObservabilityContext
 from ..utils.context import ConversationContext
@@ -18,7 +18,7 @@ class ResponseType(str, Enum):
     CASE_ESCALATION = "case_escalation"
 
 
-@dataclass
+@dataclass(slots=True)
 class IntentRequest:
     """Normalized representation of an intent-triggered request."""
 
@@ -27,7 +27,7 @@ class IntentRequest:
     parameters: Dict[str, str] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class IntentResponse:
     """Standard contract for responses produced by intent handlers."""
 
@@ -38,6 +38,64 @@ class IntentResponse:
     terminate_session: bool = False
 
 
+class ChunkKind(str, Enum):
+    """Enumerates the kinds of chunks in a streamed turn."""
+
+    ACK = "ack"
+    TEXT = "text"
+    FINAL = "final"
+
+
+@dataclass(slots=True)
+class ResponseChunk:
+    """One increment of a streamed turn.
+
+    ``ACK`` and ``TEXT`` chunks carry speakable ``text`` in the order it should
+    be voiced. The stream always ends with exactly one ``FINAL`` chunk whose
+    ``response`` holds the complete :class:`IntentResponse`, including the
+    structured ``data`` payload; its message has already been streamed as text.
+    """
+
+    kind: ChunkKind
+    text: Optional[str] = None
+    response: Optional[IntentResponse] = None
+
+
+def acknowledge(text: str) -> ResponseChunk:
+    return ResponseChunk(kind=ChunkKind.ACK, text=text)
+
+
+def stream_response(response: IntentResponse) -> Iterator[ResponseChunk]:
+    """Stream a finished response as its message text followed by the final chunk."""
+
+    yield ResponseChunk(kind=ChunkKind.TEXT, text=response.message)
+    yield ResponseChunk(kind=ChunkKind.FINAL, response=response)
+
+
+def collect_response(chunks: Iterable[ResponseChunk]) -> IntentResponse:
+    """Drain a chunk stream and return its final response."""
+
+    response = None
+    for chunk in chunks:
+        if chunk.kind is ChunkKind.FINAL:
+            response = chunk.response
+    if response is None:
+        raise RuntimeError("Response stream ended without a final chunk.")
+    return response
+
+
+async def collect_response_async(chunks: AsyncIterable[ResponseChunk]) -> IntentResponse:
+    """Asyncio counterpart of :func:`collect_response`."""
+
+    response = None
+    async for chunk in chunks:
+        if chunk.kind is ChunkKind.FINAL:
+            response = chunk.response
+    if response is None:
+        raise RuntimeError("Response stream ended without a final chunk.")
+    return response
+
+
 class IntentHandler(Protocol):
     """Interface implemented by all intent handlers."""
 
@@ -51,3 +109,40 @@ class IntentHandler(Protocol):
         observability: ObservabilityContext,
     ) -> IntentResponse:
         """Process the request and return a response."""
+
+
+class AsyncIntentHandler(Protocol):
+    """Asyncio-native variant of :class:`IntentHandler`.
+
+    ``VAaiAgent.handle_turn_async`` awaits these directly; plain
+    :class:`IntentHandler` implementations are offloaded to an executor.
+    """
+
+    name: str
+    requires_verification: bool
+
+    async def handle(
+        self,
+        request: IntentRequest,
+        context: ConversationContext,
+        observability: ObservabilityContext,
+    ) -> IntentResponse:
+        """Process the request and return a response."""
+
+
+class StreamingIntentHandler(IntentHandler, Protocol):
+    """Handler that can emit chunks before its backend calls complete.
+
+    ``handle_stream`` typically yields an :func:`acknowledge` chunk first so
+    voice channels can start speaking, then finishes with
+    :func:`stream_response`. ``handle`` should return
+    ``collect_response(self.handle_stream(...))``.
+    """
+
+    def handle_stream(
+        self,
+        request: IntentRequest,
+        context: ConversationContext,
+        observability: ObservabilityContext,
+    ) -> Iterator[ResponseChunk]:
+        """Yield response chunks, ending with a ``FINAL`` chunk."""
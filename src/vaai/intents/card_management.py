@@ -1,20 +1,165 @@
 """Card management intents: activation, freeze, replacement."""
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
+from typing import AsyncIterator, Callable, Dict, Iterator, List, Optional
 
-from .base import IntentRequest, IntentResponse, ResponseType
+from .base import (
+    IntentRequest,
+    IntentResponse,
+    ResponseChunk,
+    ResponseType,
+    acknowledge,
+    collect_response,
+    collect_response_async,
+    stream_response,
+)
 from ..monitoring.observability import ObservabilityContext
+from ..utils.audit import CARD_ACTIVATION, CARD_FREEZE, AuditLog
 from ..utils.context import ConversationContext
-from ..integrations.card_api import CardManagementAPI
+from ..integrations.card_api import AsyncCardManagementAPI, CardManagementAPI, CardOperationResult
+from ..integrations.card_bulk import BulkCardOperations
+from ..integrations.resilience import IntegrationUnavailable
+from ..integrations.transaction_cache import CachingTransactionAPI
+from ..workflows.dispatcher import EscalationDispatcher
 from ..workflows.escalation import escalate_to_human
+from ..workflows.prefetch import invalidate_prefetch, prefetched_card_status, prefetched_card_status_async
+
+
+FREEZE_ACK = "Let me freeze that card for you…"
+ACTIVATE_ACK = "Let me activate that card for you…"
+
+
+def _missing_card_response() -> IntentResponse:
+    return IntentResponse(
+        message="I can help with that. Which card would you like me to freeze?",
+        requires_follow_up=True,
+    )
+
+
+def _already_frozen_response(card_id: str) -> IntentResponse:
+    return IntentResponse(
+        message="That card is already frozen, so no further charges can go through on it.",
+        response_type=ResponseType.CARD_SUMMARY,
+        data={"card_id": card_id, "status": "frozen"},
+        requires_follow_up=True,
+    )
+
+
+def _unavailable_result(exc: IntegrationUnavailable) -> CardOperationResult:
+    # A call that timed out or was short-circuited escalates like a declined one.
+    return CardOperationResult(success=False, failure_reason=exc.reason)
+
+
+def _audit_card_action(
+    audit: Optional[AuditLog],
+    action: str,
+    result: CardOperationResult,
+    *,
+    card_id: Optional[str],
+    context: ConversationContext,
+    observability: ObservabilityContext,
+) -> None:
+    if audit is None:
+        return
+    details: Dict[str, object] = {"card_id": card_id, "success": result.success}
+    if result.success:
+        details["reference_id"] = result.reference_id
+    else:
+        details["failure_reason"] = result.failure_reason
+    with observability.span("audit_log.append"):
+        audit.append(action, context=context, details=details, trace_id=observability.trace_id)
+
+
+def _freeze_response(
+    result: CardOperationResult,
+    *,
+    card_id: str,
+    request: IntentRequest,
+    context: ConversationContext,
+    observability: ObservabilityContext,
+    transaction_cache: Optional[CachingTransactionAPI],
+    dispatcher: Optional[EscalationDispatcher],
+    audit: Optional[AuditLog] = None,
+) -> IntentResponse:
+    _audit_card_action(audit, CARD_FREEZE, result, card_id=card_id, context=context, observability=observability)
+    if not result.success:
+        return escalate_to_human(
+            context=context,
+            intent=request.intent_name,
+            reason=result.failure_reason,
+            observability=observability,
+            dispatcher=dispatcher,
+            audit=audit,
+        )
+
+    if transaction_cache is not None:
+        transaction_cache.invalidate_card(card_id)
+    invalidate_prefetch(context, card_id)
+    context.add_note(f"Card {card_id} frozen: {result.reference_id}")
+    return IntentResponse(
+        message="The card is now frozen. I've ordered a replacement and will send updates to your email.",
+        response_type=ResponseType.CARD_SUMMARY,
+        data={"card_id": card_id, "status": "frozen", "replacement_case": result.reference_id},
+        requires_follow_up=True,
+    )
+
+
+def _activation_response(
+    activation: CardOperationResult,
+    *,
+    card_id: Optional[str],
+    request: IntentRequest,
+    context: ConversationContext,
+    observability: ObservabilityContext,
+    dispatcher: Optional[EscalationDispatcher],
+    audit: Optional[AuditLog] = None,
+) -> IntentResponse:
+    _audit_card_action(
+        audit, CARD_ACTIVATION, activation, card_id=card_id, context=context, observability=observability
+    )
+    if activation.success:
+        invalidate_prefetch(context, card_id)
+        return IntentResponse(
+            message="Your card is now active. Is there anything else I can help you with?",
+            response_type=ResponseType.CARD_SUMMARY,
+            data={"card_id": card_id, "status": "active"},
+        )
+
+    return escalate_to_human(
+        context=context,
+        intent=request.intent_name,
+        reason=activation.failure_reason,
+        observability=observability,
+        dispatcher=dispatcher,
+        audit=audit,
+    )
+
+
+async def _respond_async(
+    build: Callable[..., IntentResponse], audit: Optional[AuditLog], **kwargs: object
+) -> IntentResponse:
+    """Build a card response, off the event loop when the audit log has to be written first."""
+
+    if audit is None:
+        return build(**kwargs)
+    return await asyncio.to_thread(build, audit=audit, **kwargs)
 
 
 @dataclass
 class FreezeCardHandler:
-    """Freeze a lost or stolen card."""
+    """Freeze a lost or stolen card.
+
+    When ``transaction_cache`` is set, the frozen card's cached transactions are
+    invalidated so follow-up questions see fresh backend data. With ``audit``
+    set, the freeze outcome and any escalation are durably recorded.
+    """
 
     card_api: CardManagementAPI
+    transaction_cache: Optional[CachingTransactionAPI] = None
+    dispatcher: Optional[EscalationDispatcher] = None
+    audit: Optional[AuditLog] = None
     name: str = "freeze_card"
     requires_verification: bool = True
 
@@ -24,38 +169,54 @@ class FreezeCardHandler:
         context: ConversationContext,
         observability: ObservabilityContext,
     ) -> IntentResponse:
+        return collect_response(self.handle_stream(request, context, observability))
+
+    def handle_stream(
+        self,
+        request: IntentRequest,
+        context: ConversationContext,
+        observability: ObservabilityContext,
+    ) -> Iterator[ResponseChunk]:
         card_id = request.parameters.get("card_id") or context.active_card_id
         if not card_id:
-            return IntentResponse(
-                message="I can help with that. Which card would you like me to freeze?",
-                requires_follow_up=True,
-            )
+            yield from stream_response(_missing_card_response())
+            return
 
-        result = self.card_api.freeze_card(card_id=card_id, reason=request.parameters.get("reason"))
-        if not result.success:
-            return escalate_to_human(
+        status = prefetched_card_status(context, card_id)
+        if status is not None and status.status == "frozen":
+            yield from stream_response(_already_frozen_response(card_id))
+            return
+
+        yield acknowledge(FREEZE_ACK)
+        with observability.span("card_api.freeze_card"):
+            try:
+                result = self.card_api.freeze_card(card_id=card_id, reason=request.parameters.get("reason"))
+            except IntegrationUnavailable as exc:
+                result = _unavailable_result(exc)
+        yield from stream_response(
+            _freeze_response(
+                result,
+                card_id=card_id,
+                request=request,
                 context=context,
-                intent=request.intent_name,
-                reason=result.failure_reason,
                 observability=observability,
+                transaction_cache=self.transaction_cache,
+                dispatcher=self.dispatcher,
+                audit=self.audit,
             )
-
-        context.case_notes.append(f"Card {card_id} frozen: {result.reference_id}")
-        return IntentResponse(
-            message="The card is now frozen. I've ordered a replacement and will send updates to your email.",
-            response_type=ResponseType.CARD_SUMMARY,
-            data={"card_id": card_id, "status": "frozen", "replacement_case": result.reference_id},
-            requires_follow_up=True,
         )
 
 
 @dataclass
 class ActivateCardHandler:
-    """Activate a newly issued card."""
+    """Activate a newly issued card, recording the outcome in ``audit`` when set."""
 
     card_api: CardManagementAPI
+    dispatcher: Optional[EscalationDispatcher] = None
+    audit: Optional[AuditLog] = None
     name: str = "activate_card"
     requires_verification: bool = True
+    fraud_sensitive: bool = True
 
     def handle(
         self,
@@ -63,18 +224,241 @@ class ActivateCardHandler:
         context: ConversationContext,
         observability: ObservabilityContext,
     ) -> IntentResponse:
+        return collect_response(self.handle_stream(request, context, observability))
+
+    def handle_stream(
+        self,
+        request: IntentRequest,
+        context: ConversationContext,
+        observability: ObservabilityContext,
+    ) -> Iterator[ResponseChunk]:
         card_id = request.parameters.get("card_id") or context.active_card_id
-        activation = self.card_api.activate_card(card_id=card_id)
-        if activation.success:
-            return IntentResponse(
-                message="Your card is now active. Is there anything else I can help you with?",
-                response_type=ResponseType.CARD_SUMMARY,
-                data={"card_id": card_id, "status": "active"},
+        yield acknowledge(ACTIVATE_ACK)
+        with observability.span("card_api.activate_card"):
+            try:
+                activation = self.card_api.activate_card(card_id=card_id)
+            except IntegrationUnavailable as exc:
+                activation = _unavailable_result(exc)
+        yield from stream_response(
+            _activation_response(
+                activation,
+                card_id=card_id,
+                request=request,
+                context=context,
+                observability=observability,
+                dispatcher=self.dispatcher,
+                audit=self.audit,
             )
+        )
 
-        return escalate_to_human(
+
+@dataclass
+class AsyncFreezeCardHandler:
+    """Asyncio-native variant of :class:`FreezeCardHandler`.
+
+    Audit records are written in a worker thread so the fsync never blocks
+    the event loop.
+    """
+
+    card_api: AsyncCardManagementAPI
+    transaction_cache: Optional[CachingTransactionAPI] = None
+    dispatcher: Optional[EscalationDispatcher] = None
+    audit: Optional[AuditLog] = None
+    name: str = "freeze_card"
+    requires_verification: bool = True
+
+    async def handle(
+        self,
+        request: IntentRequest,
+        context: ConversationContext,
+        observability: ObservabilityContext,
+    ) -> IntentResponse:
+        return await collect_response_async(self.handle_stream(request, context, observability))
+
+    async def handle_stream(
+        self,
+        request: IntentRequest,
+        context: ConversationContext,
+        observability: ObservabilityContext,
+    ) -> AsyncIterator[ResponseChunk]:
+        card_id = request.parameters.get("card_id") or context.active_card_id
+        if not card_id:
+            for chunk in stream_response(_missing_card_response()):
+                yield chunk
+            return
+
+        status = await prefetched_card_status_async(context, card_id)
+        if status is not None and status.status == "frozen":
+            for chunk in stream_response(_already_frozen_response(card_id)):
+                yield chunk
+            return
+
+        yield acknowledge(FREEZE_ACK)
+        with observability.span("card_api.freeze_card"):
+            try:
+                result = await self.card_api.freeze_card(card_id=card_id, reason=request.parameters.get("reason"))
+            except IntegrationUnavailable as exc:
+                result = _unavailable_result(exc)
+        response = await _respond_async(
+            _freeze_response,
+            self.audit,
+            result=result,
+            card_id=card_id,
+            request=request,
+            context=context,
+            observability=observability,
+            transaction_cache=self.transaction_cache,
+            dispatcher=self.dispatcher,
+        )
+        for chunk in stream_response(response):
+            yield chunk
+
+
+@dataclass
+class AsyncActivateCardHandler:
+    """Asyncio-native variant of :class:`ActivateCardHandler`, auditing like :class:`AsyncFreezeCardHandler`."""
+
+    card_api: AsyncCardManagementAPI
+    dispatcher: Optional[EscalationDispatcher] = None
+    audit: Optional[AuditLog] = None
+    name: str = "activate_card"
+    requires_verification: bool = True
+    fraud_sensitive: bool = True
+
+    async def handle(
+        self,
+        request: IntentRequest,
+        context: ConversationContext,
+        observability: ObservabilityContext,
+    ) -> IntentResponse:
+        return await collect_response_async(self.handle_stream(request, context, observability))
+
+    async def handle_stream(
+        self,
+        request: IntentRequest,
+        context: ConversationContext,
+        observability: ObservabilityContext,
+    ) -> AsyncIterator[ResponseChunk]:
+        card_id = request.parameters.get("card_id") or context.active_card_id
+        yield acknowledge(ACTIVATE_ACK)
+        with observability.span("card_api.activate_card"):
+            try:
+                activation = await self.card_api.activate_card(card_id=card_id)
+            except IntegrationUnavailable as exc:
+                activation = _unavailable_result(exc)
+        response = await _respond_async(
+            _activation_response,
+            self.audit,
+            activation=activation,
+            card_id=card_id,
+            request=request,
             context=context,
-            intent=request.intent_name,
-            reason=activation.failure_reason,
             observability=observability,
+            dispatcher=self.dispatcher,
+        )
+        for chunk in stream_response(response):
+            yield chunk
+
+
+@dataclass
+class FreezeAllCardsHandler:
+    """Freeze every card on the client's profile in one turn.
+
+    Card ids come from the comma-separated ``card_ids`` parameter, falling back
+    to ``ConversationContext.profile_card_ids`` and then the active card.
+    """
+
+    bulk_operations: BulkCardOperations
+    transaction_cache: Optional[CachingTransactionAPI] = None
+    dispatcher: Optional[EscalationDispatcher] = None
+    audit: Optional[AuditLog] = None
+    name: str = "freeze_all_cards"
+    requires_verification: bool = True
+
+    def handle(
+        self,
+        request: IntentRequest,
+        context: ConversationContext,
+        observability: ObservabilityContext,
+    ) -> IntentResponse:
+        return collect_response(self.handle_stream(request, context, observability))
+
+    def handle_stream(
+        self,
+        request: IntentRequest,
+        context: ConversationContext,
+        observability: ObservabilityContext,
+    ) -> Iterator[ResponseChunk]:
+        card_ids = _profile_card_ids(request, context)
+        if not card_ids:
+            yield from stream_response(_missing_card_response())
+            return
+
+        yield acknowledge(f"Let me freeze all {len(card_ids)} cards on your profile. This will take a moment…")
+
+        frozen: List[str] = []
+        statuses = {}
+        run = self.bulk_operations.freeze_cards(card_ids, reason=request.parameters.get("reason"))
+        unavailable: Optional[IntegrationUnavailable] = None
+        with observability.span("card_bulk.freeze_cards"):
+            try:
+                for outcome in run:
+                    _audit_card_action(
+                        self.audit,
+                        CARD_FREEZE,
+                        outcome.result,
+                        card_id=outcome.card_id,
+                        context=context,
+                        observability=observability,
+                    )
+                    if outcome.result.success:
+                        frozen.append(outcome.card_id)
+                        statuses[outcome.card_id] = "frozen"
+                        if self.transaction_cache is not None:
+                            self.transaction_cache.invalidate_card(outcome.card_id)
+                        invalidate_prefetch(context, outcome.card_id)
+                        context.add_note(f"Card {outcome.card_id} frozen: {outcome.result.reference_id}")
+                    else:
+                        statuses[outcome.card_id] = outcome.result.failure_reason or "failed"
+            except IntegrationUnavailable as exc:
+                # Out of turn budget or the card API is failing fast; the remaining cards were not attempted.
+                unavailable = exc
+
+        summary = run.summary
+        if unavailable is not None or summary.failed:
+            if unavailable is not None:
+                reason = f"bulk_freeze_incomplete: {unavailable.reason}"
+            else:
+                reason = f"bulk_freeze_incomplete: {summary.failed} of {summary.total} cards failed"
+            yield from stream_response(
+                escalate_to_human(
+                    context=context,
+                    intent=request.intent_name,
+                    reason=reason,
+                    observability=observability,
+                    dispatcher=self.dispatcher,
+                    audit=self.audit,
+                )
+            )
+            return
+
+        yield from stream_response(
+            IntentResponse(
+                message=(
+                    f"All {len(frozen)} cards on your profile are now frozen. "
+                    "I'll arrange replacements for each of them."
+                ),
+                response_type=ResponseType.CARD_SUMMARY,
+                data={"cards": statuses, "summary": summary.to_json()},
+                requires_follow_up=True,
+            )
         )
+
+
+def _profile_card_ids(request: IntentRequest, context: ConversationContext) -> List[str]:
+    requested = request.parameters.get("card_ids")
+    if requested:
+        return [card_id.strip() for card_id in requested.split(",") if card_id.strip()]
+    if context.profile_card_ids:
+        return list(context.profile_card_ids)
+    return [context.active_card_id] if context.active_card_id else []
@@ -0,0 +1,336 @@
+"""Direct-to-bytes JSON and binary-framed encoding of :class:`IntentResponse`."""
+from __future__ import annotations
+
+import functools
+import json
+import math
+import struct
+from datetime import datetime, timedelta
+from enum import Enum
+from json.encoder import encode_basestring
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Type
+
+from .base import IntentResponse, ResponseType
+from ..integrations.knowledge_base import KnowledgeChunk
+from ..integrations.transaction_api import Money, Transaction, TransactionBatch, TransactionRecords
+from ..workflows.escalation import EscalationTicket
+
+FRAME_MAGIC = b"VA"
+FRAME_VERSION = 1
+_FRAME_HEADER = struct.Struct(">2sBBBII")
+_FLAG_FOLLOW_UP = 0x01
+_FLAG_TERMINATE = 0x02
+_RESPONSE_TYPE_CODES = {response_type: code for code, response_type in enumerate(ResponseType)}
+_RESPONSE_TYPES = list(ResponseType)
+_EPOCH = datetime(1970, 1, 1)
+
+FieldPlan = Sequence[Tuple[str, Callable[[Any], Any]]]
+
+
+@functools.lru_cache(maxsize=65_536)
+def _short_string(value: str) -> bytes:
+    return encode_basestring(value).encode("utf-8")
+
+
+def _string(value: str) -> bytes:
+    # Keys, merchant names, categories and enum values repeat across turns.
+    if len(value) <= 64:
+        return _short_string(value)
+    return encode_basestring(value).encode("utf-8")
+
+
+@functools.lru_cache(maxsize=65_536)
+def _amount(currency: str, cents: int) -> bytes:
+    return f'"{currency} {cents / 100:.2f}"'.encode("utf-8")
+
+
+def _timestamp(moment: datetime) -> bytes:
+    # Aware datetimes for the same instant compare equal across offsets, so the offset is part of the key.
+    return _offset_timestamp(moment, moment.utcoffset())
+
+
+@functools.lru_cache(maxsize=65_536)
+def _offset_timestamp(moment: datetime, offset: Optional[timedelta]) -> bytes:
+    return f'"{moment.isoformat()}"'.encode("ascii")
+
+
+@functools.lru_cache(maxsize=65_536)
+def _timestamp_us(micros: int) -> bytes:
+    return f'"{(_EPOCH + timedelta(microseconds=micros)).isoformat()}"'.encode("ascii")
+
+
+def _float(value: float) -> bytes:
+    if math.isfinite(value):
+        return float.__repr__(value).encode("ascii")
+    return json.dumps(value).encode("ascii")
+
+
+def _transaction_plan() -> FieldPlan:
+    return (
+        ("transactionId", lambda txn: txn.transaction_id),
+        ("postedAt", lambda txn: txn.posted_at),
+        ("merchantName", lambda txn: txn.merchant_name),
+        ("amount", lambda txn: txn.amount),
+        ("category", lambda txn: txn.category),
+    )
+
+
+def _ticket_plan() -> FieldPlan:
+    return (
+        ("clientId", lambda ticket: ticket.client_id),
+        ("caseId", lambda ticket: ticket.case_id),
+        ("issueType", lambda ticket: ticket.issue_type),
+        ("urgencyLevel", lambda ticket: ticket.urgency),
+        ("createdAt", lambda ticket: ticket.created_at),
+        ("metadata", lambda ticket: ticket.metadata),
+    )
+
+
+def _chunk_plan() -> FieldPlan:
+    return (
+        ("chunkId", lambda chunk: chunk.chunk_id),
+        ("docId", lambda chunk: chunk.doc_id),
+        ("title", lambda chunk: chunk.title),
+        ("score", lambda chunk: round(chunk.score, 4)),
+    )
+
+
+class ResponseEncoder:
+    """Serialises responses to UTF-8 JSON bytes without building intermediate dicts.
+
+    Payload types with a registered field plan (``Transaction``,
+    ``EscalationTicket``, ``KnowledgeChunk`` by default; add more with
+    :meth:`register`) are written field by field with precomputed key bytes,
+    producing the same JSON as their ``model_dump``/``to_json`` methods.
+    ``Money`` is written as its ``display_value`` and ``datetime`` as its
+    ``isoformat``; both, along with short strings, are memoised across
+    turns. ``TransactionBatch`` and ``TransactionRecords`` whose rows nobody
+    has read are encoded straight from their columns. Other objects fall back
+    to their ``to_json`` method; :func:`json_default` applies the same rules
+    for :func:`json.dumps`.
+
+    Output matches ``json.dumps(..., separators=(",", ":"), ensure_ascii=False)``
+    of the equivalent dict. :meth:`iter_encode` yields the same bytes in
+    pieces of about ``chunk_size`` so long transaction lists can be written
+    to the channel as they are produced; :meth:`encode_frame` wraps the
+    message and data in a compact binary header.
+    """
+
+    def __init__(self, chunk_size: int = 64 * 1024) -> None:
+        self.chunk_size = chunk_size
+        self._plans: Dict[type, List[Tuple[bytes, Callable[[Any], Any]]]] = {}
+        self._writers: Dict[type, Callable[[Any, List[bytes]], None]] = {
+            str: lambda value, out: out.append(_string(value)),
+            int: lambda value, out: out.append(int.__repr__(value).encode("ascii")),
+            float: lambda value, out: out.append(_float(value)),
+            bool: lambda value, out: out.append(b"true" if value else b"false"),
+            type(None): lambda value, out: out.append(b"null"),
+            dict: self._write_dict,
+            list: self._write_list,
+            tuple: self._write_list,
+            datetime: lambda value, out: out.append(_timestamp(value)),
+            Money: lambda value, out: out.append(_amount(value.currency, value.amount)),
+            TransactionRecords: self._write_records,
+            TransactionBatch: self._write_batch,
+        }
+        self.register(Transaction, _transaction_plan())
+        self.register(EscalationTicket, _ticket_plan())
+        self.register(KnowledgeChunk, _chunk_plan())
+
+    def register(self, kind: Type[Any], plan: FieldPlan) -> None:
+        """Encode ``kind`` as an object with the given ``(json key, getter)`` fields."""
+
+        compiled = [
+            ((b"{" if position == 0 else b",") + _string(key) + b":", getter)
+            for position, (key, getter) in enumerate(plan)
+        ]
+        self._plans[kind] = compiled
+        self._writers[kind] = self._write_planned
+
+    def encode(self, response: IntentResponse) -> bytes:
+        return b"".join(self.iter_encode(response, chunk_size=0))
+
+    def encode_value(self, value: Any) -> bytes:
+        out: List[bytes] = []
+        self._write(value, out)
+        return b"".join(out)
+
+    def iter_encode(self, response: IntentResponse, chunk_size: Optional[int] = None) -> Iterator[bytes]:
+        """Yield the JSON encoding of ``response`` in pieces of roughly ``chunk_size`` bytes.
+
+        A ``chunk_size`` of 0 produces a single piece.
+        """
+
+        limit = self.chunk_size if chunk_size is None else chunk_size
+        out: List[bytes] = [b'{"message":', _string(response.message), b',"responseType":']
+        out.append(_string(response.response_type.value))
+        out.append(b',"data":')
+        data = response.data
+        if data is None:
+            out.append(b"null")
+        elif limit and isinstance(data, dict):
+            # Stream large sequences one element at a time.
+            for position, (key, value) in enumerate(data.items()):
+                out.append((b"{" if position == 0 else b",") + _string(key) + b":")
+                if isinstance(value, (list, tuple, TransactionRecords, TransactionBatch)) and len(value) > 64:
+                    yield from self._iter_sequence(value, out, limit)
+                else:
+                    self._write(value, out)
+            out.append(b"}" if data else b"{}")
+        else:
+            self._write(data, out)
+        out.append(b',"requiresFollowUp":')
+        out.append(b"true" if response.requires_follow_up else b"false")
+        out.append(b',"terminateSession":')
+        out.append(b"true" if response.terminate_session else b"false")
+        out.append(b"}")
+        yield b"".join(out)
+
+    def encode_frame(self, response: IntentResponse) -> bytes:
+        """Binary frame: header, UTF-8 message, then the JSON-encoded ``data``.
+
+        The header is ``FRAME_MAGIC``, ``FRAME_VERSION``, a response-type code,
+        a flags byte (follow-up, terminate) and the message and data lengths as
+        big-endian ``uint32``. See :func:`decode_frame`.
+        """
+
+        message = response.message.encode("utf-8")
+        data = b"" if response.data is None else self.encode_value(response.data)
+        flags = (_FLAG_FOLLOW_UP if response.requires_follow_up else 0) | (
+            _FLAG_TERMINATE if response.terminate_session else 0
+        )
+        header = _FRAME_HEADER.pack(
+            FRAME_MAGIC, FRAME_VERSION, _RESPONSE_TYPE_CODES[response.response_type], flags, len(message), len(data)
+        )
+        return header + message + data
+
+    def _write(self, value: Any, out: List[bytes]) -> None:
+        writer = self._writers.get(type(value))
+        if writer is not None:
+            writer(value, out)
+        elif isinstance(value, Enum):
+            self._write(value.value, out)
+        elif hasattr(value, "to_json"):
+            self._write(value.to_json(), out)
+        else:
+            raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+    def _write_planned(self, value: Any, out: List[bytes]) -> None:
+        for prefix, getter in self._plans[type(value)]:
+            out.append(prefix)
+            self._write(getter(value), out)
+        out.append(b"}")
+
+    def _write_dict(self, value: Dict[str, Any], out: List[bytes]) -> None:
+        if not value:
+            out.append(b"{}")
+            return
+        separator = b"{"
+        for key, item in value.items():
+            out.append(separator + _string(key if isinstance(key, str) else str(key)) + b":")
+            self._write(item, out)
+            separator = b","
+        out.append(b"}")
+
+    def _write_list(self, value: Sequence[Any], out: List[bytes]) -> None:
+        if not value:
+            out.append(b"[]")
+            return
+        separator = b"["
+        for item in value:
+            out.append(separator)
+            self._write(item, out)
+            separator = b","
+        out.append(b"]")
+
+    def _iter_sequence(self, value: Any, out: List[bytes], limit: int) -> Iterator[bytes]:
+        if isinstance(value, TransactionRecords):
+            # Rows someone has read are written as they now stand.
+            value = value.to_json() if value.materialized else value.batch
+        if isinstance(value, TransactionBatch):
+            pieces = self._batch_rows(value)
+        else:
+            pieces = (self.encode_value(item) for item in value)
+        separator = b"["
+        size = sum(len(part) for part in out)
+        for piece in pieces:
+            out.append(separator)
+            out.append(piece)
+            separator = b","
+            size += len(piece) + 1
+            if size >= limit:
+                yield b"".join(out)
+                out.clear()
+                size = 0
+        out.append(b"]" if separator == b"," else b"[]")
+
+    def _write_records(self, records: TransactionRecords, out: List[bytes]) -> None:
+        if records.materialized:
+            self._write_list(records.to_json(), out)
+        else:
+            self._write_batch(records.batch, out)
+
+    def _write_batch(self, batch: TransactionBatch, out: List[bytes]) -> None:
+        rows = list(self._batch_rows(batch))
+        out.append(b"[" + b",".join(rows) + b"]")
+
+    def _batch_rows(self, batch: TransactionBatch) -> Iterator[bytes]:
+        columns = batch.columns()
+        merchants = [_string(name) for name in columns.merchants]
+        categories = [_string(name) for name in columns.categories]
+        currencies = columns.currencies
+        aware = columns.tz is not None
+        for index, transaction_id in enumerate(columns.transaction_ids):
+            posted = (
+                _timestamp(batch.posted_at(index)) if aware else _timestamp_us(columns.posted_us[index])
+            )
+            yield b"".join(
+                (
+                    b'{"transactionId":',
+                    encode_basestring(transaction_id).encode("utf-8"),
+                    b',"postedAt":',
+                    posted,
+                    b',"merchantName":',
+                    merchants[columns.merchant_codes[index]],
+                    b',"amount":',
+                    _amount(currencies[columns.currency_codes[index]], columns.amounts[index]),
+                    b',"category":',
+                    categories[columns.category_codes[index]],
+                    b"}",
+                )
+            )
+
+
+def json_default(value: Any) -> Any:
+    """``default`` hook for :func:`json.dumps` that serialises values as :class:`ResponseEncoder` does."""
+
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Money):
+        return value.display_value
+    if isinstance(value, Enum):
+        return value.value
+    if hasattr(value, "to_json"):
+        return value.to_json()
+    if hasattr(value, "model_dump"):
+        return value.model_dump()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def decode_frame(frame: bytes) -> IntentResponse:
+    """Inverse of :meth:`ResponseEncoder.encode_frame`; ``data`` comes back as plain JSON values."""
+
+    magic, version, type_code, flags, message_length, data_length = _FRAME_HEADER.unpack_from(frame)
+    if magic != FRAME_MAGIC or version != FRAME_VERSION:
+        raise ValueError("Not a VAai response frame.")
+    offset = _FRAME_HEADER.size
+    message = frame[offset : offset + message_length].decode("utf-8")
+    offset += message_length
+    data = json.loads(frame[offset : offset + data_length]) if data_length else None
+    return IntentResponse(
+        message=message,
+        response_type=_RESPONSE_TYPES[type_code],
+        data=data,
+        requires_follow_up=bool(flags & _FLAG_FOLLOW_UP),
+        terminate_session=bool(flags & _FLAG_TERMINATE),
+    )
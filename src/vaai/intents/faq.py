@@ -0,0 +1,78 @@
+"""Policy and FAQ answers grounded in the retrieval index."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterator, List
+
+from .base import (
+    IntentRequest,
+    IntentResponse,
+    ResponseChunk,
+    ResponseType,
+    acknowledge,
+    collect_response,
+    stream_response,
+)
+from ..integrations.knowledge_base import KnowledgeChunk, KnowledgeRetriever
+from ..monitoring.observability import ObservabilityContext
+from ..utils.context import ConversationContext
+
+
+FAQ_ACK = "Let me check our policy on that…"
+
+
+def _answer_response(passages: List[KnowledgeChunk]) -> IntentResponse:
+    best = passages[0]
+    return IntentResponse(
+        message=f"Here's what our {best.title} policy says: {best.text}",
+        response_type=ResponseType.TEXT,
+        data={"sources": [passage.to_json() for passage in passages]},
+        requires_follow_up=True,
+    )
+
+
+def _no_answer_response() -> IntentResponse:
+    return IntentResponse(
+        message="I couldn't find a policy that answers that. Would you like me to connect you with a specialist?",
+        response_type=ResponseType.TEXT,
+        data={"sources": []},
+        requires_follow_up=True,
+    )
+
+
+@dataclass
+class AnswerPolicyQuestionHandler:
+    """Answer policy/FAQ questions from the knowledge base (the ``enable_rag`` path).
+
+    The caller's utterance is the query; passages scoring below ``min_score``
+    are ignored. ``VAaiAgent`` refuses this intent when
+    ``AgentConfig.enable_rag`` is off.
+    """
+
+    retriever: KnowledgeRetriever
+    top_k: int = 3
+    min_score: float = 0.1
+    name: str = "policy_question"
+    requires_verification: bool = False
+    requires_rag: bool = True
+
+    def handle(
+        self,
+        request: IntentRequest,
+        context: ConversationContext,
+        observability: ObservabilityContext,
+    ) -> IntentResponse:
+        return collect_response(self.handle_stream(request, context, observability))
+
+    def handle_stream(
+        self,
+        request: IntentRequest,
+        context: ConversationContext,
+        observability: ObservabilityContext,
+    ) -> Iterator[ResponseChunk]:
+        query = request.parameters.get("question") or request.utterance
+        yield acknowledge(FAQ_ACK)
+        with observability.span("knowledge_base.search"):
+            passages = self.retriever.search(query, top_k=self.top_k)
+        passages = [passage for passage in passages if passage.score >= self.min_score]
+        yield from stream_response(_answer_response(passages) if passages else _no_answer_response())
@@ -0,0 +1,199 @@
+"""Intent handlers declared by name and import path, built on first route."""
+from __future__ import annotations
+
+import importlib
+import threading
+import time
+from dataclasses import dataclass, field
+from importlib.metadata import entry_points
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, MutableMapping, Optional, Union
+
+from .base import AsyncIntentHandler, IntentHandler
+
+if TYPE_CHECKING:
+    from ..utils.biometrics import VoiceBiometricScorer
+
+Handler = Union[IntentHandler, AsyncIntentHandler]
+Target = Union[str, Callable[..., Any]]
+"""A ``"package.module:Attribute"`` path or the callable itself."""
+
+ENTRY_POINT_GROUP = "vaai.intents"
+
+
+def resolve_target(target: Target) -> Callable[..., Any]:
+    """Import ``"package.module:Attribute"`` (dotted attributes allowed); callables pass through."""
+
+    if callable(target):
+        return target
+    module_name, _, attribute = target.partition(":")
+    if not attribute:
+        raise ValueError(f"Expected 'module:attribute', got {target!r}")
+    value: Any = importlib.import_module(module_name)
+    for part in attribute.split("."):
+        value = getattr(value, part)
+    return value
+
+
+@dataclass(frozen=True)
+class Provided:
+    """Option value standing for the shared client registered under ``name``."""
+
+    name: str
+
+
+@dataclass
+class HandlerSpec:
+    """How to build one handler: ``target(**options)``."""
+
+    intent: str
+    target: Target
+    options: Dict[str, Any] = field(default_factory=dict)
+
+
+class HandlerRegistry(MutableMapping[str, Handler]):
+    """Mapping of intent name to handler that imports and builds handlers lazily.
+
+    :meth:`declare` records a handler class (or factory) by import path and
+    its constructor options; nothing is imported until the intent is first
+    routed. Options given as :class:`Provided` refer to shared integration
+    clients registered with :meth:`provide`, which are likewise built once,
+    on first use by any handler. Ready-made handlers can still be assigned
+    directly, so a registry can be passed anywhere a handler dict is.
+
+    Membership tests and iteration cover declared intents without building
+    them. :meth:`warm` builds everything up front, e.g. before a readiness
+    probe passes; ``load_seconds`` records how long each build took.
+    """
+
+    def __init__(self) -> None:
+        self._specs: Dict[str, HandlerSpec] = {}
+        self._handlers: Dict[str, Handler] = {}
+        self._client_specs: Dict[str, HandlerSpec] = {}
+        self._clients: Dict[str, Any] = {}
+        self._lock = threading.RLock()
+        self.load_seconds: Dict[str, float] = {}
+
+    @classmethod
+    def from_entry_points(cls, group: str = ENTRY_POINT_GROUP) -> "HandlerRegistry":
+        """Declare one intent per entry point in ``group``: name is the intent, value the target."""
+
+        registry = cls()
+        for entry_point in entry_points(group=group):
+            registry.declare(entry_point.name, entry_point.value)
+        return registry
+
+    def declare(self, intent: str, target: Target, **options: Any) -> None:
+        with self._lock:
+            self._handlers.pop(intent, None)
+            self._specs[intent] = HandlerSpec(intent, target, options)
+
+    def provide(self, name: str, target: Target, **options: Any) -> Provided:
+        """Register a shared client built as ``target(**options)`` on first use."""
+
+        with self._lock:
+            self._clients.pop(name, None)
+            self._client_specs[name] = HandlerSpec(name, target, options)
+        return Provided(name)
+
+    def client(self, name: str) -> Any:
+        with self._lock:
+            if name not in self._clients:
+                self._clients[name] = self._build(self._client_specs[name], f"client:{name}")
+            return self._clients[name]
+
+    @property
+    def loaded(self) -> List[str]:
+        with self._lock:
+            return list(self._handlers)
+
+    def warm(self, intents: Optional[List[str]] = None) -> None:
+        for intent in intents if intents is not None else list(self):
+            self[intent]
+
+    def __getitem__(self, intent: str) -> Handler:
+        handler = self._handlers.get(intent)
+        if handler is not None:
+            return handler
+        with self._lock:
+            if intent not in self._handlers:
+                self._handlers[intent] = self._build(self._specs[intent], intent)
+            return self._handlers[intent]
+
+    def __setitem__(self, intent: str, handler: Handler) -> None:
+        with self._lock:
+            self._specs.pop(intent, None)
+            self._handlers[intent] = handler
+
+    def __delitem__(self, intent: str) -> None:
+        with self._lock:
+            found = self._specs.pop(intent, None) is not None
+            found = self._handlers.pop(intent, None) is not None or found
+        if not found:
+            raise KeyError(intent)
+
+    def __contains__(self, intent: object) -> bool:
+        return intent in self._handlers or intent in self._specs
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(dict.fromkeys([*self._handlers, *self._specs]))
+
+    def __len__(self) -> int:
+        return len(self._handlers.keys() | self._specs.keys())
+
+    def _build(self, spec: HandlerSpec, label: str) -> Any:
+        started = time.perf_counter()
+        factory = resolve_target(spec.target)
+        options = {
+            key: self.client(value.name) if isinstance(value, Provided) else value
+            for key, value in spec.options.items()
+        }
+        built = factory(**options)
+        self.load_seconds[label] = time.perf_counter() - started
+        return built
+
+
+def default_registry(
+    *, voice_scorer: Optional[VoiceBiometricScorer] = None, enable_voice_biometrics: bool = True
+) -> HandlerRegistry:
+    """The built-in synchronous handlers wired to the default integration clients.
+
+    The ``knowledge_base`` client starts as an empty in-memory index;
+    re-:meth:`~HandlerRegistry.provide` it with a populated one. With a
+    ``voice_scorer``, callers are verified by a
+    :class:`~vaai.utils.biometrics.BiometricVerificationService` that is
+    ``enabled`` per ``enable_voice_biometrics``.
+    """
+
+    registry = HandlerRegistry()
+    card_api = registry.provide("card_api", "vaai.integrations.card_api:CardManagementAPI")
+    transaction_api = registry.provide("transaction_api", "vaai.integrations.transaction_api:TransactionAPI")
+    if voice_scorer is not None:
+        verification = registry.provide(
+            "verification_service",
+            "vaai.utils.biometrics:BiometricVerificationService",
+            scorer=voice_scorer,
+            enabled=enable_voice_biometrics,
+        )
+    else:
+        verification = registry.provide("verification_service", "vaai.utils.security:VerificationService")
+    bulk = registry.provide("bulk_operations", "vaai.integrations.card_bulk:BulkCardOperations", card_api=card_api)
+    knowledge_base = registry.provide("knowledge_base", "vaai.integrations.vector_index:KnowledgeBase")
+    registry.declare(
+        "verify_client", "vaai.intents.verification:VerifyClientHandler", verification_service=verification
+    )
+    registry.declare(
+        "list_recent_transactions",
+        "vaai.intents.transactions:ListRecentTransactionsHandler",
+        transaction_api=transaction_api,
+    )
+    registry.declare(
+        "explain_charge", "vaai.intents.transactions:ExplainChargeHandler", transaction_api=transaction_api
+    )
+    registry.declare(
+        "search_transactions", "vaai.intents.transactions:SearchTransactionsHandler", transaction_api=transaction_api
+    )
+    registry.declare("freeze_card", "vaai.intents.card_management:FreezeCardHandler", card_api=card_api)
+    registry.declare("activate_card", "vaai.intents.card_management:ActivateCardHandler", card_api=card_api)
+    registry.declare("freeze_all_cards", "vaai.intents.card_management:FreezeAllCardsHandler", bulk_operations=bulk)
+    registry.declare("policy_question", "vaai.intents.faq:AnswerPolicyQuestionHandler", retriever=knowledge_base)
+    return registry
@@ -2,11 +2,182 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal, InvalidOperation
+from typing import AsyncIterator, Dict, Iterable, Iterator, Optional, Union
 
-from .base import IntentRequest, IntentResponse, ResponseType
-from ..integrations.transaction_api import TransactionAPI
+from .base import (
+    IntentRequest,
+    IntentResponse,
+    ResponseChunk,
+    ResponseType,
+    acknowledge,
+    collect_response,
+    collect_response_async,
+    stream_response,
+)
+from ..integrations.transaction_api import (
+    AsyncTransactionAPI,
+    Transaction,
+    TransactionAPI,
+    TransactionBatch,
+    TransactionPage,
+    TransactionQuery,
+)
+from ..integrations.resilience import IntegrationUnavailable
 from ..monitoring.observability import ObservabilityContext
 from ..utils.context import ConversationContext
+from ..workflows.prefetch import (
+    prefetched_transaction,
+    prefetched_transaction_async,
+    prefetched_transactions,
+    prefetched_transactions_async,
+)
+
+
+LIST_ACK = "Let me pull up your recent transactions…"
+EXPLAIN_ACK = "Let me look up that charge for you…"
+SEARCH_ACK = "Let me search your transactions…"
+SEARCH_CURSOR_KEY = "transaction_search_cursor"
+
+
+def _transaction_list_response(transactions: Iterable[Transaction]) -> IntentResponse:
+    message = "Here are the last transactions on your card. Let me know if you need more detail on any of them."
+    if isinstance(transactions, TransactionBatch):
+        rows = transactions.records()
+    else:
+        rows = [txn.model_dump() for txn in transactions]
+    return IntentResponse(
+        message=message,
+        response_type=ResponseType.TRANSACTION_LIST,
+        data={"transactions": rows},
+        requires_follow_up=True,
+    )
+
+
+def _cents(parameters: Dict[str, str], name: str) -> Optional[int]:
+    value = parameters.get(name)
+    if not value:
+        return None
+    try:
+        amount = Decimal(value.strip())
+    except InvalidOperation:
+        raise ValueError(f"I didn't catch the amount {value!r}. What amount should I search for?") from None
+    if not amount.is_finite() or amount < 0:
+        raise ValueError(f"I can't search for an amount of {value!r}. What amount should I search for?")
+    return int(amount * 100)
+
+
+def _moment(parameters: Dict[str, str], name: str) -> Optional[datetime]:
+    """Parse an ISO date or datetime; a bare ``end`` date includes that whole day."""
+
+    value = parameters.get(name)
+    if not value:
+        return None
+    try:
+        day = date.fromisoformat(value)
+    except ValueError:
+        pass
+    else:
+        # ``TransactionQuery.end`` is exclusive, so a date-only end means the following midnight.
+        return datetime.combine(day + timedelta(days=1) if name == "end" else day, time())
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        raise ValueError(f"I didn't catch the date {value!r}. Which date do you mean?") from None
+
+
+def _cursor_key(card_id: Optional[str]) -> str:
+    # Cursors are bound to a card, so each card keeps its own place.
+    return f"{SEARCH_CURSOR_KEY}:{card_id}"
+
+
+def _search_prompt_response(message: str) -> IntentResponse:
+    return IntentResponse(message=message, requires_follow_up=True)
+
+
+def _search_arguments(
+    request: IntentRequest, context: ConversationContext
+) -> Union[Dict[str, object], IntentResponse]:
+    """``search`` keyword arguments from the request parameters, or the response to give instead.
+
+    ``cursor`` continues a previous search; ``page=next`` continues the last
+    search made on the card in this session. Unreadable amounts or dates, and
+    ``page=next`` with nothing left to read, are answered without searching.
+    """
+
+    parameters = request.parameters
+    card_id = parameters.get("card_id") or context.active_card_id
+    cursor = parameters.get("cursor")
+    if cursor is None and parameters.get("page") == "next":
+        cursor = context.session_metadata.get(_cursor_key(card_id))
+        if cursor is None:
+            return _search_prompt_response("There are no more results for that search. What else can I look up?")
+    if cursor is not None:
+        return {"card_id": card_id, "cursor": cursor}
+    try:
+        query = TransactionQuery(
+            merchant=parameters.get("merchant") or None,
+            category=parameters.get("category") or None,
+            min_amount=_cents(parameters, "min_amount"),
+            max_amount=_cents(parameters, "max_amount"),
+            start=_moment(parameters, "start"),
+            end=_moment(parameters, "end"),
+        )
+    except ValueError as exc:
+        return _search_prompt_response(str(exc))
+    if query.min_amount is not None and query.max_amount is not None and query.min_amount > query.max_amount:
+        return _search_prompt_response("The lowest amount is above the highest one. What range should I search?")
+    return {"card_id": card_id, "query": query}
+
+
+def _invalid_cursor_response(card_id: Optional[str], context: ConversationContext) -> IntentResponse:
+    context.session_metadata.pop(_cursor_key(card_id), None)
+    return _search_prompt_response("I can't continue that search any more. What would you like me to look for?")
+
+
+def _search_response(page: TransactionPage, card_id: Optional[str], context: ConversationContext) -> IntentResponse:
+    if page.next_cursor is not None:
+        context.session_metadata[_cursor_key(card_id)] = page.next_cursor
+    else:
+        context.session_metadata.pop(_cursor_key(card_id), None)
+    count = len(page.transactions)
+    if not count:
+        message = "I couldn't find any transactions matching that."
+    elif page.next_cursor is not None:
+        message = f"Here are {count} matching transactions, newest first. Ask me for more to hear the next ones."
+    else:
+        message = f"I found {count} matching transaction{'s' if count != 1 else ''}."
+    return IntentResponse(
+        message=message,
+        response_type=ResponseType.TRANSACTION_LIST,
+        data={"transactions": page.transactions.records(), "nextCursor": page.next_cursor},
+        requires_follow_up=True,
+    )
+
+
+def _unavailable_response(exc: IntegrationUnavailable) -> IntentResponse:
+    return IntentResponse(
+        message="I can't reach your transaction history right now. Please try again in a moment.",
+        data={"degraded": exc.reason},
+        requires_follow_up=True,
+    )
+
+
+def _charge_explanation_response(details: Transaction) -> IntentResponse:
+    message = (
+        "This charge was processed by {merchant} on {date} for {amount}. Let me know if you would like to dispute it."
+    ).format(
+        merchant=details.merchant_name,
+        date=details.posted_at.strftime("%d %b %Y"),
+        amount=details.amount.display_value,
+    )
+    return IntentResponse(
+        message=message,
+        response_type=ResponseType.TEXT,
+        data={"transaction": details.model_dump()},
+        requires_follow_up=True,
+    )
 
 
 @dataclass
@@ -14,6 +185,7 @@ class ListRecentTransactionsHandler:
     """Fetch recent transactions for a card."""
 
     transaction_api: TransactionAPI
+    limit: int = 10
     name: str = "list_recent_transactions"
     requires_verification: bool = True
 
@@ -23,15 +195,25 @@ class ListRecentTransactionsHandler:
         context: ConversationContext,
         observability: ObservabilityContext,
     ) -> IntentResponse:
+        return collect_response(self.handle_stream(request, context, observability))
+
+    def handle_stream(
+        self,
+        request: IntentRequest,
+        context: ConversationContext,
+        observability: ObservabilityContext,
+    ) -> Iterator[ResponseChunk]:
         card_id = request.parameters.get("card_id") or context.active_card_id
-        transactions = self.transaction_api.list_recent(card_id=card_id, limit=10)
-        message = "Here are the last transactions on your card. Let me know if you need more detail on any of them."
-        return IntentResponse(
-            message=message,
-            response_type=ResponseType.TRANSACTION_LIST,
-            data={"transactions": [txn.model_dump() for txn in transactions]},
-            requires_follow_up=True,
-        )
+        yield acknowledge(LIST_ACK)
+        transactions = prefetched_transactions(context, card_id, limit=self.limit)
+        if transactions is None:
+            with observability.span("transaction_api.list_recent"):
+                try:
+                    transactions = self.transaction_api.list_recent(card_id=card_id, limit=self.limit)
+                except IntegrationUnavailable as exc:
+                    yield from stream_response(_unavailable_response(exc))
+                    return
+        yield from stream_response(_transaction_list_response(transactions))
 
 
 @dataclass
@@ -48,18 +230,186 @@ class ExplainChargeHandler:
         context: ConversationContext,
         observability: ObservabilityContext,
     ) -> IntentResponse:
+        return collect_response(self.handle_stream(request, context, observability))
+
+    def handle_stream(
+        self,
+        request: IntentRequest,
+        context: ConversationContext,
+        observability: ObservabilityContext,
+    ) -> Iterator[ResponseChunk]:
         transaction_id = request.parameters["transaction_id"]
-        details = self.transaction_api.get_transaction(transaction_id=transaction_id)
-        message = (
-            "This charge was processed by {merchant} on {date} for {amount}. Let me know if you would like to dispute it."
-        ).format(
-            merchant=details.merchant_name,
-            date=details.posted_at.strftime("%d %b %Y"),
-            amount=details.amount.display_value,
-        )
-        return IntentResponse(
-            message=message,
-            response_type=ResponseType.TEXT,
-            data={"transaction": details.model_dump()},
-            requires_follow_up=True,
-        )
+        yield acknowledge(EXPLAIN_ACK)
+        details = prefetched_transaction(context, transaction_id)
+        if details is None:
+            with observability.span("transaction_api.get_transaction"):
+                try:
+                    details = self.transaction_api.get_transaction(transaction_id=transaction_id)
+                except IntegrationUnavailable as exc:
+                    yield from stream_response(_unavailable_response(exc))
+                    return
+        yield from stream_response(_charge_explanation_response(details))
+
+
+@dataclass
+class SearchTransactionsHandler:
+    """Search a card's history by merchant, amount, date and category, one page per turn."""
+
+    transaction_api: TransactionAPI
+    page_size: int = 10
+    name: str = "search_transactions"
+    requires_verification: bool = True
+
+    def handle(
+        self,
+        request: IntentRequest,
+        context: ConversationContext,
+        observability: ObservabilityContext,
+    ) -> IntentResponse:
+        return collect_response(self.handle_stream(request, context, observability))
+
+    def handle_stream(
+        self,
+        request: IntentRequest,
+        context: ConversationContext,
+        observability: ObservabilityContext,
+    ) -> Iterator[ResponseChunk]:
+        arguments = _search_arguments(request, context)
+        if isinstance(arguments, IntentResponse):
+            yield from stream_response(arguments)
+            return
+        yield acknowledge(SEARCH_ACK)
+        with observability.span("transaction_api.search"):
+            try:
+                page = self.transaction_api.search(limit=self.page_size, **arguments)
+            except IntegrationUnavailable as exc:
+                yield from stream_response(_unavailable_response(exc))
+                return
+            except ValueError:
+                if "cursor" not in arguments:
+                    raise
+                # The client rejected the cursor: malformed, or issued for another card.
+                yield from stream_response(_invalid_cursor_response(arguments["card_id"], context))
+                return
+        yield from stream_response(_search_response(page, arguments["card_id"], context))
+
+
+@dataclass
+class AsyncListRecentTransactionsHandler:
+    """Asyncio-native variant of :class:`ListRecentTransactionsHandler`."""
+
+    transaction_api: AsyncTransactionAPI
+    limit: int = 10
+    name: str = "list_recent_transactions"
+    requires_verification: bool = True
+
+    async def handle(
+        self,
+        request: IntentRequest,
+        context: ConversationContext,
+        observability: ObservabilityContext,
+    ) -> IntentResponse:
+        return await collect_response_async(self.handle_stream(request, context, observability))
+
+    async def handle_stream(
+        self,
+        request: IntentRequest,
+        context: ConversationContext,
+        observability: ObservabilityContext,
+    ) -> AsyncIterator[ResponseChunk]:
+        card_id = request.parameters.get("card_id") or context.active_card_id
+        yield acknowledge(LIST_ACK)
+        transactions = await prefetched_transactions_async(context, card_id, limit=self.limit)
+        if transactions is None:
+            with observability.span("transaction_api.list_recent"):
+                try:
+                    transactions = await self.transaction_api.list_recent(card_id=card_id, limit=self.limit)
+                except IntegrationUnavailable as exc:
+                    for chunk in stream_response(_unavailable_response(exc)):
+                        yield chunk
+                    return
+        for chunk in stream_response(_transaction_list_response(transactions)):
+            yield chunk
+
+
+@dataclass
+class AsyncExplainChargeHandler:
+    """Asyncio-native variant of :class:`ExplainChargeHandler`."""
+
+    transaction_api: AsyncTransactionAPI
+    name: str = "explain_charge"
+    requires_verification: bool = True
+
+    async def handle(
+        self,
+        request: IntentRequest,
+        context: ConversationContext,
+        observability: ObservabilityContext,
+    ) -> IntentResponse:
+        return await collect_response_async(self.handle_stream(request, context, observability))
+
+    async def handle_stream(
+        self,
+        request: IntentRequest,
+        context: ConversationContext,
+        observability: ObservabilityContext,
+    ) -> AsyncIterator[ResponseChunk]:
+        transaction_id = request.parameters["transaction_id"]
+        yield acknowledge(EXPLAIN_ACK)
+        details = await prefetched_transaction_async(context, transaction_id)
+        if details is None:
+            with observability.span("transaction_api.get_transaction"):
+                try:
+                    details = await self.transaction_api.get_transaction(transaction_id=transaction_id)
+                except IntegrationUnavailable as exc:
+                    for chunk in stream_response(_unavailable_response(exc)):
+                        yield chunk
+                    return
+        for chunk in stream_response(_charge_explanation_response(details)):
+            yield chunk
+
+
+@dataclass
+class AsyncSearchTransactionsHandler:
+    """Asyncio-native variant of :class:`SearchTransactionsHandler`."""
+
+    transaction_api: AsyncTransactionAPI
+    page_size: int = 10
+    name: str = "search_transactions"
+    requires_verification: bool = True
+
+    async def handle(
+        self,
+        request: IntentRequest,
+        context: ConversationContext,
+        observability: ObservabilityContext,
+    ) -> IntentResponse:
+        return await collect_response_async(self.handle_stream(request, context, observability))
+
+    async def handle_stream(
+        self,
+        request: IntentRequest,
+        context: ConversationContext,
+        observability: ObservabilityContext,
+    ) -> AsyncIterator[ResponseChunk]:
+        arguments = _search_arguments(request, context)
+        if isinstance(arguments, IntentResponse):
+            for chunk in stream_response(arguments):
+                yield chunk
+            return
+        yield acknowledge(SEARCH_ACK)
+        with observability.span("transaction_api.search"):
+            try:
+                page = await self.transaction_api.search(limit=self.page_size, **arguments)
+            except IntegrationUnavailable as exc:
+                for chunk in stream_response(_unavailable_response(exc)):
+                    yield chunk
+                return
+            except ValueError:
+                if "cursor" not in arguments:
+                    raise
+                for chunk in stream_response(_invalid_cursor_response(arguments["card_id"], context)):
+                    yield chunk
+                return
+        for chunk in stream_response(_search_response(page, arguments["card_id"], context)):
+            yield chunk
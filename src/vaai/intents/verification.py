@@ -2,18 +2,25 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Optional
 
 from .base import IntentHandler, IntentRequest, IntentResponse, ResponseType
 from ..monitoring.observability import ObservabilityContext
+from ..utils.audit import VERIFICATION_ATTEMPT, AuditLog
 from ..utils.context import ConversationContext
 from ..utils.security import VerificationService
 
 
 @dataclass
 class VerifyClientHandler:
-    """Handle the client verification workflow."""
+    """Handle the client verification workflow.
+
+    With ``audit`` set, every attempt is durably recorded before the caller
+    hears the result.
+    """
 
     verification_service: VerificationService
+    audit: Optional[AuditLog] = None
     name: str = "verify_client"
     requires_verification: bool = False
 
@@ -23,9 +30,18 @@ class VerifyClientHandler:
         context: ConversationContext,
         observability: ObservabilityContext,
     ) -> IntentResponse:
-        verification_status = self.verification_service.verify(context=context, parameters=request.parameters)
+        with observability.span("verification_service.verify"):
+            verification_status = self.verification_service.verify(context=context, parameters=request.parameters)
         context.is_verified = verification_status.passed
         context.verification_attempts += 1
+        if self.audit is not None:
+            with observability.span("audit_log.append"):
+                self.audit.append(
+                    VERIFICATION_ATTEMPT,
+                    context=context,
+                    details={"passed": verification_status.passed, "attempt": context.verification_attempts},
+                    trace_id=observability.trace_id,
+                )
 
         if verification_status.passed:
             message = "Thank you. I've verified your identity. How can I assist you with your card today?"
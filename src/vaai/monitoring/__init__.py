@@ -1,5 +1,47 @@
 """Monitoring exports."""
-from .analytics import AnalyticsCollector
-from .observability import ObservabilityContext
+from __future__ import annotations
 
-__all__ = ["AnalyticsCollector", "ObservabilityContext"]
+from typing import TYPE_CHECKING
+
+from ..utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .analytics import AnalyticsCollector, AnalyticsEvent
+    from .export import AnalyticsSink, BatchExporter, InMemorySink, NDJSONFileSink, SocketSink
+    from .kpi import KPIAggregator, KPISnapshot
+    from .metrics import LatencyHistogram, LatencyMetrics
+    from .observability import ObservabilityContext, Span
+
+_EXPORTS = {
+    "AnalyticsCollector": ".analytics",
+    "AnalyticsEvent": ".analytics",
+    "AnalyticsSink": ".export",
+    "BatchExporter": ".export",
+    "InMemorySink": ".export",
+    "KPIAggregator": ".kpi",
+    "KPISnapshot": ".kpi",
+    "LatencyHistogram": ".metrics",
+    "LatencyMetrics": ".metrics",
+    "NDJSONFileSink": ".export",
+    "ObservabilityContext": ".observability",
+    "SocketSink": ".export",
+    "Span": ".observability",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+__all__ = [
+    "AnalyticsCollector",
+    "AnalyticsEvent",
+    "AnalyticsSink",
+    "BatchExporter",
+    "InMemorySink",
+    "KPIAggregator",
+    "KPISnapshot",
+    "LatencyHistogram",
+    "LatencyMetrics",
+    "NDJSONFileSink",
+    "ObservabilityContext",
+    "SocketSink",
+    "Span",
+]
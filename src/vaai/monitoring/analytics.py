@@ -1,49 +1,195 @@
 """Analytics and metrics collection."""
 from __future__ import annotations
 
+import threading
+import time
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from typing import Callable, Deque, Dict, List, Optional, Tuple
 
 from ..utils.context import ConversationContext
+from ..utils.security import redact, redact_value
 
+DROP_OLDEST = "drop_oldest"
+DROP_NEWEST = "drop_newest"
 
-def default_events() -> List[Dict[str, object]]:
-    return []
+
+@dataclass(slots=True)
+class AnalyticsEvent:
+    """A single recorded analytics event.
+
+    Events are stored as slotted records on the turn path and only converted to
+    dicts when exported.
+    """
+
+    event: str
+    client_id: str
+    case_id: Optional[str]
+    trace_id: Optional[str]
+    timestamp: float
+    metadata: Optional[Dict[str, object]] = None
+    error: Optional[str] = None
+    channel: Optional[str] = None
+    locale: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, object]:
+        payload: Dict[str, object] = {
+            "event": self.event,
+            "client_id": self.client_id,
+            "case_id": self.case_id,
+            "trace_id": self.trace_id,
+            "timestamp": self.timestamp,
+        }
+        if self.channel is not None:
+            payload["channel"] = self.channel
+        if self.locale is not None:
+            payload["locale"] = self.locale
+        if self.error is not None:
+            payload["error"] = self.error
+        payload["metadata"] = self.metadata or {}
+        return payload
+
+
+def default_events() -> Deque[AnalyticsEvent]:
+    return deque()
+
+
+Subscriber = Callable[[AnalyticsEvent], None]
 
 
 @dataclass
 class AnalyticsCollector:
-    """Captures conversational analytics for dashboards and training."""
+    """Captures conversational analytics for dashboards and training.
+
+    Events go into a ring buffer bounded by ``capacity``. When it is full the
+    ``overflow`` policy either discards the oldest buffered event
+    (``"drop_oldest"``) or the incoming one (``"drop_newest"``); either way
+    ``dropped`` is incremented and recording never blocks. Buffered events are
+    drained by :meth:`flush` or continuously by a
+    :class:`~vaai.monitoring.export.BatchExporter`.
+
+    Each event is stamped with the trace id of its own session (taken from the
+    context's ``trace_id`` metadata unless passed explicitly), so one collector
+    can be shared safely across concurrent sessions. Metadata strings and error
+    messages are PCI-redacted before they are buffered.
+
+    Callbacks registered with :meth:`subscribe` see every recorded event as it
+    is recorded, including events the buffer then drops.
+    """
+
+    capacity: int = 10_000
+    overflow: str = DROP_OLDEST
+    events: Deque[AnalyticsEvent] = field(default_factory=default_events)
+    dropped: int = 0
+    recorded: int = 0
 
-    events: List[Dict[str, object]] = field(default_factory=default_events)
-    trace_id: Optional[str] = None
+    def __post_init__(self) -> None:
+        if self.overflow not in (DROP_OLDEST, DROP_NEWEST):
+            raise ValueError(f"Unknown overflow policy: {self.overflow}")
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+        self._notify_at = self.capacity
+        self._subscribers: Tuple[Subscriber, ...] = ()
 
     def bind_trace(self, trace_id: str) -> None:
-        self.trace_id = trace_id
-
-    def record_event(self, name: str, *, context: ConversationContext, metadata: Optional[Dict[str, object]] = None) -> None:
-        self.events.append(
-            {
-                "event": name,
-                "client_id": context.client_id,
-                "case_id": context.case_id,
-                "metadata": metadata or {},
-            }
+        """Deprecated: events now carry their own session's trace id."""
+
+    def subscribe(self, callback: Subscriber) -> None:
+        """Call ``callback`` with each event on the recording thread; it must be cheap and must not raise."""
+
+        with self._lock:
+            self._subscribers = self._subscribers + (callback,)
+
+    def record_event(
+        self,
+        name: str,
+        *,
+        context: ConversationContext,
+        metadata: Optional[Dict[str, object]] = None,
+        trace_id: Optional[str] = None,
+    ) -> None:
+        self._append(
+            AnalyticsEvent(
+                event=name,
+                client_id=context.client_id,
+                case_id=context.case_id,
+                trace_id=trace_id or context.get_metadata("trace_id"),
+                timestamp=time.time(),
+                metadata=redact_value(metadata) if metadata else metadata,
+                channel=context.channel,
+                locale=context.locale,
+            )
         )
 
-    def record_error(self, error: Exception, *, context: ConversationContext, metadata: Optional[Dict[str, object]] = None) -> None:
-        self.events.append(
-            {
-                "event": "error",
-                "client_id": context.client_id,
-                "case_id": context.case_id,
-                "error": str(error),
-                "metadata": metadata or {},
-            }
+    def record_error(
+        self,
+        error: Exception,
+        *,
+        context: ConversationContext,
+        metadata: Optional[Dict[str, object]] = None,
+        trace_id: Optional[str] = None,
+    ) -> None:
+        self._append(
+            AnalyticsEvent(
+                event="error",
+                client_id=context.client_id,
+                case_id=context.case_id,
+                trace_id=trace_id or context.get_metadata("trace_id"),
+                timestamp=time.time(),
+                metadata=redact_value(metadata) if metadata else metadata,
+                error=redact(str(error)),
+                channel=context.channel,
+                locale=context.locale,
+            )
         )
 
+    def drain(self, max_events: Optional[int] = None) -> List[AnalyticsEvent]:
+        """Remove and return up to ``max_events`` buffered events, oldest first."""
+
+        with self._lock:
+            if max_events is None or max_events >= len(self.events):
+                batch = list(self.events)
+                self.events.clear()
+            else:
+                popleft = self.events.popleft
+                batch = [popleft() for _ in range(max_events)]
+            if len(self.events) < self._notify_at:
+                self._ready.clear()
+        return batch
+
     def flush(self) -> List[Dict[str, object]]:
         """Return recorded events for downstream processing."""
 
-        events, self.events = self.events, []
-        return events
+        return [event.to_dict() for event in self.drain()]
+
+    def wait_for_batch(self, batch_size: int, timeout: float) -> None:
+        """Block an exporter until ``batch_size`` events are buffered or ``timeout`` elapses."""
+
+        self._notify_at = min(batch_size, self.capacity)
+        if len(self.events) < self._notify_at:
+            self._ready.wait(timeout)
+
+    def wake(self) -> None:
+        """Release any exporter blocked in :meth:`wait_for_batch`."""
+
+        self._ready.set()
+
+    @property
+    def pending(self) -> int:
+        """Number of buffered events not yet drained."""
+
+        return len(self.events)
+
+    def _append(self, event: AnalyticsEvent) -> None:
+        for callback in self._subscribers:
+            callback(event)
+        with self._lock:
+            self.recorded += 1
+            if len(self.events) >= self.capacity:
+                self.dropped += 1
+                if self.overflow == DROP_NEWEST:
+                    return
+                self.events.popleft()
+            self.events.append(event)
+            if len(self.events) >= self._notify_at and not self._ready.is_set():
+                self._ready.set()
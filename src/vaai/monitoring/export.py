@@ -0,0 +1,199 @@
+"""Background export of analytics events to pluggable sinks."""
+from __future__ import annotations
+
+import json
+import os
+import socket
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Optional, Protocol, Sequence, Tuple
+
+from .analytics import AnalyticsCollector, AnalyticsEvent
+
+
+class AnalyticsSink(Protocol):
+    """Destination for batches of analytics events."""
+
+    def write_batch(self, events: Sequence[AnalyticsEvent]) -> None:
+        """Persist or forward ``events``; raise to signal a failed batch."""
+
+    def close(self) -> None:
+        """Release any resources held by the sink."""
+
+
+def encode_ndjson(events: Sequence[AnalyticsEvent]) -> bytes:
+    lines = [json.dumps(event.to_dict(), default=str, separators=(",", ":")) for event in events]
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+def default_batches() -> List[List[AnalyticsEvent]]:
+    return []
+
+
+@dataclass
+class InMemorySink:
+    """Keeps exported batches in memory; intended for tests and local runs."""
+
+    batches: List[List[AnalyticsEvent]] = field(default_factory=default_batches)
+
+    def write_batch(self, events: Sequence[AnalyticsEvent]) -> None:
+        self.batches.append(list(events))
+
+    def close(self) -> None:
+        pass
+
+    @property
+    def events(self) -> List[AnalyticsEvent]:
+        return [event for batch in self.batches for event in batch]
+
+
+@dataclass
+class NDJSONFileSink:
+    """Appends events as newline-delimited JSON with size-based rotation.
+
+    When the active file would exceed ``max_bytes`` it is renamed to
+    ``<path>.1`` (shifting older backups up to ``backup_count``) and a fresh
+    file is started.
+    """
+
+    path: Path
+    max_bytes: int = 64 * 1024 * 1024
+    backup_count: int = 5
+
+    def __post_init__(self) -> None:
+        self.path = Path(self.path)
+        self._handle = open(self.path, "ab")
+        self._size = self._handle.tell()
+
+    def write_batch(self, events: Sequence[AnalyticsEvent]) -> None:
+        payload = encode_ndjson(events)
+        if self._size and self._size + len(payload) > self.max_bytes:
+            self._rotate()
+        self._handle.write(payload)
+        self._handle.flush()
+        self._size += len(payload)
+
+    def close(self) -> None:
+        self._handle.close()
+
+    def _rotate(self) -> None:
+        self._handle.close()
+        for index in range(self.backup_count - 1, 0, -1):
+            source = self.path.with_name(f"{self.path.name}.{index}")
+            if source.exists():
+                os.replace(source, self.path.with_name(f"{self.path.name}.{index + 1}"))
+        if self.backup_count > 0:
+            os.replace(self.path, self.path.with_name(f"{self.path.name}.1"))
+        else:
+            self.path.unlink()
+        self._handle = open(self.path, "ab")
+        self._size = 0
+
+
+@dataclass
+class SocketSink:
+    """Streams NDJSON batches to a local collector over TCP.
+
+    Stands in for a telemetry agent listening on ``address``. The connection
+    is opened lazily and re-established after a failed send.
+    """
+
+    address: Tuple[str, int]
+    timeout: float = 2.0
+
+    def __post_init__(self) -> None:
+        self._socket: Optional[socket.socket] = None
+
+    def write_batch(self, events: Sequence[AnalyticsEvent]) -> None:
+        payload = encode_ndjson(events)
+        if self._socket is None:
+            self._socket = socket.create_connection(self.address, timeout=self.timeout)
+        try:
+            self._socket.sendall(payload)
+        except OSError:
+            self.close()
+            raise
+
+    def close(self) -> None:
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+
+
+@dataclass
+class BatchExporter:
+    """Drains an :class:`AnalyticsCollector` on a background thread.
+
+    A batch is sent to ``sink`` once ``batch_size`` events are buffered or
+    ``flush_interval`` seconds have passed, whichever comes first. The turn
+    path only appends to the collector's ring buffer; if the sink falls behind,
+    the collector's overflow policy sheds load. A failing sink does not stop
+    export: the batch is counted in ``failed_batches``/``failed_events`` and
+    discarded.
+    """
+
+    collector: AnalyticsCollector
+    sink: AnalyticsSink
+    batch_size: int = 500
+    flush_interval: float = 1.0
+    exported_events: int = 0
+    exported_batches: int = 0
+    failed_batches: int = 0
+    failed_events: int = 0
+
+    def __post_init__(self) -> None:
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "BatchExporter":
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="vaai-analytics-exporter", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the exporter after sending everything still buffered."""
+
+        self._stop.set()
+        self.collector.wake()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        self.export_pending()
+        self.sink.close()
+
+    def export_pending(self) -> int:
+        """Synchronously export every buffered event; returns the number sent."""
+
+        sent = 0
+        while True:
+            batch = self.collector.drain(self.batch_size)
+            if not batch:
+                return sent
+            self._send(batch)
+            sent += len(batch)
+
+    def __enter__(self) -> "BatchExporter":
+        return self.start()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self.collector.wait_for_batch(self.batch_size, self.flush_interval)
+            batch = self.collector.drain(self.batch_size)
+            if batch:
+                self._send(batch)
+
+    def _send(self, batch: List[AnalyticsEvent]) -> None:
+        try:
+            self.sink.write_batch(batch)
+        except Exception:  # noqa: BLE001
+            self.failed_batches += 1
+            self.failed_events += len(batch)
+            return
+        self.exported_batches += 1
+        self.exported_events += len(batch)
@@ -0,0 +1,264 @@
+"""Incremental per-card fraud anomaly scoring over transaction streams.
+
+Requires NumPy, which the rest of the package does not; import this module
+only where ``AgentConfig.enable_fraud_checks`` is used.
+"""
+from __future__ import annotations
+
+import math
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Union
+
+import numpy as np
+
+from ..integrations.transaction_api import Transaction
+
+CATEGORY_BUCKETS = 16
+_STATE_FIELDS = ("count", "mean", "var", "last_seen", "velocity_hour", "velocity_day", "risk", "category_counts")
+
+
+@dataclass
+class FraudScore:
+    """Risk score in ``[0, 1]`` for one transaction, with the features that drove it."""
+
+    transaction_id: str
+    card_id: str
+    score: float
+    reasons: List[str]
+
+
+def _reasons(transaction: Transaction, score: float) -> List[str]:
+    if score < 0.5:
+        return []
+    return [f"Unusual {transaction.category} spend of {transaction.amount.amount / 100:.2f}"]
+
+
+class FraudScorer:
+    """Array-backed streaming statistics and anomaly scores per card.
+
+    Each card owns one slot in a set of parallel arrays: transaction count,
+    EWMA mean/variance of log amounts, exponentially decayed one-hour and
+    one-day velocity counters, decayed merchant-category frequencies
+    (``CATEGORY_BUCKETS`` hashed buckets, ``float16``) and the latest risk
+    score, about 60 bytes per card. Arrays double when full.
+
+    :meth:`update` scores a batch of transactions against the state as it
+    was before each one and then folds it in, so the batch is vectorised
+    even when a card appears several times. :meth:`card_risk` exposes the
+    decayed risk of a card's recent transactions for ``VAaiAgent``.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 1024,
+        *,
+        amount_alpha: float = 0.1,
+        category_half_life_days: float = 30.0,
+        risk_half_life_hours: float = 24.0,
+        warmup: int = 5,
+        clock=time.time,
+    ) -> None:
+        self.amount_alpha = amount_alpha
+        self.category_decay = math.log(2) / (category_half_life_days * 86_400)
+        self.risk_decay = math.log(2) / (risk_half_life_hours * 3_600)
+        self.warmup = warmup
+        self.clock = clock
+        self._slots: Dict[str, int] = {}
+        self._categories: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._allocate(capacity)
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def update(
+        self,
+        card_ids: Sequence[str],
+        amounts: Sequence[float],
+        categories: Sequence[str],
+        timestamps: Sequence[float],
+    ) -> np.ndarray:
+        """Score then absorb a batch of transactions; returns one score per transaction."""
+
+        with self._lock:
+            slots = self._slots_for(card_ids)
+            amounts_log = np.log1p(np.maximum(np.asarray(amounts, dtype=np.float64), 0.0)).astype(np.float32)
+            buckets = self._buckets_for(categories)
+            times = np.asarray(timestamps, dtype=np.float64)
+            scores = np.zeros(len(slots), dtype=np.float32)
+            # Process in rounds so a card seen several times is updated in timestamp order.
+            order = np.lexsort((times, slots))
+            remaining = order
+            while len(remaining):
+                _, first = np.unique(slots[remaining], return_index=True)
+                batch = remaining[first]
+                scores[batch] = self._score(slots[batch], amounts_log[batch], buckets[batch], times[batch])
+                self._absorb(slots[batch], amounts_log[batch], buckets[batch], times[batch], scores[batch])
+                remaining = np.delete(remaining, first)
+            return scores
+
+    def score(
+        self,
+        card_ids: Sequence[str],
+        amounts: Sequence[float],
+        categories: Sequence[str],
+        timestamps: Sequence[float],
+    ) -> np.ndarray:
+        """Score a batch against current state without updating it."""
+
+        with self._lock:
+            slots = np.fromiter((self._slots.get(card_id, -1) for card_id in card_ids), dtype=np.int64)
+            known = slots >= 0
+            scores = np.zeros(len(slots), dtype=np.float32)
+            if known.any():
+                amounts_log = np.log1p(np.maximum(np.asarray(amounts, dtype=np.float64), 0.0)).astype(np.float32)
+                buckets = self._buckets_for(categories)
+                times = np.asarray(timestamps, dtype=np.float64)
+                scores[known] = self._score(slots[known], amounts_log[known], buckets[known], times[known])
+            return scores
+
+    def observe(self, card_id: str, transactions: Iterable[Transaction]) -> List[FraudScore]:
+        """Score and absorb ``transactions`` for one card."""
+
+        transactions = list(transactions)
+        if not transactions:
+            return []
+        scores = self.update(
+            [card_id] * len(transactions),
+            [transaction.amount.amount / 100 for transaction in transactions],
+            [transaction.category for transaction in transactions],
+            [transaction.posted_at.timestamp() for transaction in transactions],
+        )
+        return [
+            FraudScore(
+                transaction_id=transaction.transaction_id,
+                card_id=card_id,
+                score=float(score),
+                reasons=_reasons(transaction, float(score)),
+            )
+            for transaction, score in zip(transactions, scores)
+        ]
+
+    def card_risk(self, card_id: str, now: Optional[float] = None) -> float:
+        """Risk of the card's recent activity, decayed since its last transaction."""
+
+        moment = now if now is not None else self.clock()
+        with self._lock:
+            slot = self._slots.get(card_id)
+            if slot is None:
+                return 0.0
+            last_seen, risk = float(self._last_seen[slot]), float(self._risk[slot])
+        return risk * math.exp(-self.risk_decay * max(0.0, moment - last_seen))
+
+    def snapshot(self, path: Union[str, Path]) -> None:
+        """Write all card state to a single ``.npz`` file."""
+
+        with self._lock:
+            size = len(self._slots)
+            arrays = {name: getattr(self, f"_{name}")[:size] for name in _STATE_FIELDS}
+            card_ids = sorted(self._slots, key=self._slots.__getitem__)
+            categories = sorted(self._categories, key=self._categories.__getitem__)
+            np.savez(
+                path,
+                card_ids=np.asarray(card_ids, dtype=str),
+                category_names=np.asarray(categories, dtype=str),
+                category_ids=np.asarray([self._categories[name] for name in categories], dtype=np.int64),
+                **arrays,
+            )
+
+    @classmethod
+    def restore(cls, path: Union[str, Path], **options: object) -> "FraudScorer":
+        with np.load(path, allow_pickle=False) as data:
+            card_ids = [str(card_id) for card_id in data["card_ids"]]
+            scorer = cls(capacity=max(1024, len(card_ids)), **options)  # type: ignore[arg-type]
+            scorer._slots = {card_id: slot for slot, card_id in enumerate(card_ids)}
+            scorer._categories = {
+                str(name): int(bucket) for name, bucket in zip(data["category_names"], data["category_ids"])
+            }
+            for name in _STATE_FIELDS:
+                getattr(scorer, f"_{name}")[: len(card_ids)] = data[name]
+        return scorer
+
+    def _allocate(self, capacity: int) -> None:
+        self._count = np.zeros(capacity, dtype=np.uint32)
+        self._mean = np.zeros(capacity, dtype=np.float32)
+        self._var = np.zeros(capacity, dtype=np.float32)
+        self._last_seen = np.zeros(capacity, dtype=np.float64)
+        self._velocity_hour = np.zeros(capacity, dtype=np.float32)
+        self._velocity_day = np.zeros(capacity, dtype=np.float32)
+        self._risk = np.zeros(capacity, dtype=np.float32)
+        self._category_counts = np.zeros((capacity, CATEGORY_BUCKETS), dtype=np.float16)
+
+    def _slots_for(self, card_ids: Sequence[str]) -> np.ndarray:
+        slots = np.empty(len(card_ids), dtype=np.int64)
+        for position, card_id in enumerate(card_ids):
+            slot = self._slots.get(card_id)
+            if slot is None:
+                # Grow before publishing the slot so no reader sees one past the arrays.
+                slot = len(self._slots)
+                if slot >= len(self._count):
+                    self._grow()
+                self._slots[card_id] = slot
+            slots[position] = slot
+        return slots
+
+    def _buckets_for(self, categories: Sequence[str]) -> np.ndarray:
+        buckets = np.empty(len(categories), dtype=np.int64)
+        for position, category in enumerate(categories):
+            bucket = self._categories.get(category)
+            if bucket is None:
+                bucket = self._categories[category] = len(self._categories) % CATEGORY_BUCKETS
+            buckets[position] = bucket
+        return buckets
+
+    def _grow(self) -> None:
+        capacity = 2 * len(self._count)
+        for name in _STATE_FIELDS:
+            old = getattr(self, f"_{name}")
+            new = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[: len(old)] = old
+            setattr(self, f"_{name}", new)
+
+    def _score(self, slots: np.ndarray, amounts: np.ndarray, buckets: np.ndarray, times: np.ndarray) -> np.ndarray:
+        count = self._count[slots].astype(np.float32)
+        elapsed = np.maximum(times - self._last_seen[slots], 0.0)
+        z_amount = (amounts - self._mean[slots]) / np.sqrt(self._var[slots] + 0.05)
+        category_counts = self._category_counts[slots].astype(np.float32)
+        category_share = (category_counts[np.arange(len(slots)), buckets] + 0.5) / (
+            category_counts.sum(axis=1) + 0.5 * CATEGORY_BUCKETS
+        )
+        velocity_hour = self._velocity_hour[slots] * np.exp(-elapsed / 3_600) + 1
+        velocity_day = self._velocity_day[slots] * np.exp(-elapsed / 86_400) + 1
+        burst = velocity_hour / np.maximum(velocity_day / 24, 1.0)
+        logit = (
+            -5.0
+            + 1.5 * np.clip(z_amount - 1.5, 0, 6)
+            + 1.5 * -np.log(category_share)
+            + 0.8 * np.log(burst)
+        )
+        # Cards with little history get damped scores rather than false alarms.
+        confidence = np.minimum(count / self.warmup, 1.0)
+        return (confidence / (1 + np.exp(-logit))).astype(np.float32)
+
+    def _absorb(
+        self, slots: np.ndarray, amounts: np.ndarray, buckets: np.ndarray, times: np.ndarray, scores: np.ndarray
+    ) -> None:
+        first = self._count[slots] == 0
+        elapsed = np.where(first, 0.0, np.maximum(times - self._last_seen[slots], 0.0))
+        alpha = np.where(first, 1.0, self.amount_alpha).astype(np.float32)
+        delta = amounts - self._mean[slots]
+        self._mean[slots] += alpha * delta
+        self._var[slots] = (1 - alpha) * (self._var[slots] + alpha * delta * delta)
+        self._velocity_hour[slots] = self._velocity_hour[slots] * np.exp(-elapsed / 3_600) + 1
+        self._velocity_day[slots] = self._velocity_day[slots] * np.exp(-elapsed / 86_400) + 1
+        decay = np.exp(-self.category_decay * elapsed).astype(np.float32)
+        categories = self._category_counts[slots].astype(np.float32) * decay[:, None]
+        categories[np.arange(len(slots)), buckets] += 1
+        self._category_counts[slots] = np.minimum(categories, 60_000)
+        risk_decay = np.exp(-self.risk_decay * elapsed).astype(np.float32)
+        self._risk[slots] = np.maximum(self._risk[slots] * risk_decay, scores)
+        self._count[slots] += 1
+        self._last_seen[slots] = np.maximum(self._last_seen[slots], times)
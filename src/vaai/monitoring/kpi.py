@@ -0,0 +1,324 @@
+"""Sliding-window KPIs maintained incrementally from analytics events."""
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .analytics import AnalyticsCollector, AnalyticsEvent
+from .metrics import DEFAULT_EXPORT_BOUNDS
+
+DEFAULT_WINDOWS: Tuple[Tuple[str, float], ...] = (("1m", 60.0), ("5m", 300.0), ("1h", 3600.0))
+DIMENSIONS = ("intent", "channel", "locale")
+OTHER = "other"
+"""Series label used once ``max_series`` distinct (intent, channel, locale) keys exist."""
+
+# Counter positions within a window slot; latency bands follow _MAX_US.
+_TURNS = 0
+_COMPLETED = 1
+_ESCALATED = 2
+_ERRORS = 3
+_FOLLOW_UPS = 4
+_HANDLED = 5
+_HANDLE_US = 6
+_MAX_US = 7
+_BANDS = 8
+
+_TERMINAL = {"turn_complete": _COMPLETED, "escalated": _ESCALATED, "verification_failed": _ESCALATED, "error": _ERRORS}
+# ``ResponseType.CASE_ESCALATION``: a handler that escalated itself still completes its turn.
+_ESCALATION_RESPONSE = "case_escalation"
+
+_Key = Tuple[str, str, str]
+
+
+class _Ring:
+    """``len(epochs)`` slots of ``width`` seconds; a slot is reused once its epoch has left the window."""
+
+    __slots__ = ("width", "epochs", "slots")
+
+    def __init__(self, width: float, slots: int, size: int) -> None:
+        self.width = width
+        self.epochs = [-1] * slots
+        self.slots = [[0] * size for _ in range(slots)]
+
+    def slot(self, timestamp: float) -> Optional[List[int]]:
+        epoch = int(timestamp // self.width)
+        index = epoch % len(self.epochs)
+        current = self.epochs[index]
+        if current == epoch:
+            return self.slots[index]
+        if current > epoch:
+            return None
+        self.epochs[index] = epoch
+        counters = self.slots[index]
+        counters[:] = [0] * len(counters)
+        return counters
+
+    def live(self, now: float) -> Iterable[List[int]]:
+        newest = int(now // self.width)
+        oldest = newest - len(self.epochs)
+        return (slot for epoch, slot in zip(self.epochs, self.slots) if oldest < epoch <= newest)
+
+
+@dataclass(slots=True)
+class KPISnapshot:
+    """KPIs over one window for one slice of traffic.
+
+    ``mean_handle_seconds`` is the average handle time of a turn, from
+    ``turn_start`` to its completion, escalation or error.
+    ``first_contact_resolution`` is the share of finished turns completed
+    without escalation or a follow-up; CRM disposition codes remain the
+    source of record for FCR. Percentiles are the upper bound of the
+    latency band holding the quantile.
+    """
+
+    window_seconds: float
+    turns: int = 0
+    completed: int = 0
+    escalated: int = 0
+    errors: int = 0
+    follow_ups: int = 0
+    handled: int = 0
+    handle_seconds: float = 0.0
+    p50_seconds: float = 0.0
+    p95_seconds: float = 0.0
+    p99_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    @property
+    def finished(self) -> int:
+        return self.completed + self.escalated + self.errors
+
+    @property
+    def turns_per_second(self) -> float:
+        return self.turns / self.window_seconds
+
+    @property
+    def escalation_rate(self) -> float:
+        return self.escalated / self.finished if self.finished else 0.0
+
+    @property
+    def error_rate(self) -> float:
+        return self.errors / self.finished if self.finished else 0.0
+
+    @property
+    def first_contact_resolution(self) -> float:
+        return (self.completed - self.follow_ups) / self.finished if self.finished else 0.0
+
+    @property
+    def mean_handle_seconds(self) -> float:
+        return self.handle_seconds / self.handled if self.handled else 0.0
+
+    def to_json(self) -> Dict[str, object]:
+        return {
+            "windowSeconds": self.window_seconds,
+            "turns": self.turns,
+            "completed": self.completed,
+            "escalated": self.escalated,
+            "errors": self.errors,
+            "turnsPerSecond": round(self.turns_per_second, 3),
+            "escalationRate": round(self.escalation_rate, 4),
+            "errorRate": round(self.error_rate, 4),
+            "firstContactResolution": round(self.first_contact_resolution, 4),
+            "meanHandleSeconds": round(self.mean_handle_seconds, 6),
+            "p50": self.p50_seconds,
+            "p95": self.p95_seconds,
+            "p99": self.p99_seconds,
+            "max": self.max_seconds,
+        }
+
+
+class KPIAggregator:
+    """Per-intent, channel and locale KPIs over sliding windows, in fixed memory.
+
+    Subscribe it to a collector with :meth:`attach`; each event then updates
+    counters on the recording thread and the raw events are never kept.
+    Every (intent, channel, locale) series holds one ring of ``slots`` slots
+    per window in ``windows``, so a window slides in steps of
+    ``window / slots`` seconds. Series beyond ``max_series`` are folded into
+    an ``"other"`` series. Handle times come from pairing each session's
+    ``turn_start`` with its next ``turn_complete``, ``escalated``,
+    ``verification_failed`` or ``error``; at most ``max_open_turns`` unpaired
+    starts are remembered. A ``turn_complete`` whose ``response_type`` is
+    ``case_escalation`` counts as an escalation.
+
+    Timestamps are the events' wall-clock times, so ``clock`` defaults to
+    :func:`time.time`.
+    """
+
+    def __init__(
+        self,
+        *,
+        windows: Sequence[Tuple[str, float]] = DEFAULT_WINDOWS,
+        slots: int = 12,
+        bounds: Sequence[float] = DEFAULT_EXPORT_BOUNDS,
+        max_series: int = 1024,
+        max_open_turns: int = 100_000,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.windows = {name: float(seconds) for name, seconds in windows}
+        self.slots = slots
+        self.bounds = tuple(bounds)
+        self.max_series = max_series
+        self.max_open_turns = max_open_turns
+        self.clock = clock
+        self.observed = 0
+        self.late = 0  # window slot updates skipped because the event was older than the window
+        self.orphaned = 0  # turn starts forgotten before their outcome arrived
+        self._bounds_us = [int(bound * 1_000_000) for bound in self.bounds]
+        self._size = _BANDS + len(self.bounds) + 1
+        self._series: Dict[_Key, List[_Ring]] = {}
+        self._open: Dict[Tuple[str, Optional[str]], Tuple[float, str]] = {}
+        self._lock = threading.Lock()
+
+    def attach(self, collector: AnalyticsCollector) -> "KPIAggregator":
+        collector.subscribe(self.observe)
+        return self
+
+    def observe(self, event: AnalyticsEvent) -> None:
+        """Fold one analytics event into the windows."""
+
+        name = event.event
+        outcome = _TERMINAL.get(name)
+        if outcome is None and name != "turn_start":
+            return
+        metadata = event.metadata or {}
+        if outcome == _COMPLETED and metadata.get("response_type") == _ESCALATION_RESPONSE:
+            outcome = _ESCALATED
+        session = (event.client_id, event.trace_id)
+        with self._lock:
+            self.observed += 1
+            if outcome is None:
+                intent = str(metadata.get("intent") or "unknown")
+                self._open.pop(session, None)
+                if len(self._open) >= self.max_open_turns:
+                    del self._open[next(iter(self._open))]
+                    self.orphaned += 1
+                self._open[session] = (event.timestamp, intent)
+                self._count(event, intent, _TURNS, None)
+                return
+            started = self._open.pop(session, None)
+            if started is not None:
+                handle_us = max(0, int((event.timestamp - started[0]) * 1_000_000))
+                intent = started[1]
+            else:
+                handle_us = None
+                intent = str(metadata.get("intent") or "unknown")
+            self._count(event, intent, outcome, handle_us)
+            if outcome == _COMPLETED and metadata.get("requires_follow_up"):
+                self._count(event, intent, _FOLLOW_UPS, None)
+
+    def snapshot(
+        self,
+        window: str = "1m",
+        *,
+        intent: Optional[str] = None,
+        channel: Optional[str] = None,
+        locale: Optional[str] = None,
+    ) -> KPISnapshot:
+        """KPIs over ``window`` for the series matching every given label."""
+
+        wanted = (intent, channel, locale)
+        return self._summarize(
+            window, lambda key: all(label is None or label == value for label, value in zip(wanted, key))
+        )
+
+    def breakdown(self, window: str = "1m", by: str = "intent") -> Dict[str, KPISnapshot]:
+        """One :class:`KPISnapshot` per value of the dimension ``by``."""
+
+        position = DIMENSIONS.index(by)
+        with self._lock:
+            values = sorted({key[position] for key in self._series})
+        return {value: self._summarize(window, lambda key, value=value: key[position] == value) for value in values}
+
+    def to_json(self, by: Sequence[str] = DIMENSIONS) -> Dict[str, object]:
+        return {
+            name: {
+                "all": self.snapshot(name).to_json(),
+                **{
+                    dimension: {value: kpis.to_json() for value, kpis in self.breakdown(name, dimension).items()}
+                    for dimension in by
+                },
+            }
+            for name in self.windows
+        }
+
+    @property
+    def series(self) -> int:
+        return len(self._series)
+
+    def _count(self, event: AnalyticsEvent, intent: str, counter: int, handle_us: Optional[int]) -> None:
+        key = (intent, event.channel or "unknown", event.locale or "unknown")
+        rings = self._series.get(key)
+        if rings is None:
+            if len(self._series) >= self.max_series:
+                key = (OTHER, OTHER, OTHER)
+                rings = self._series.get(key)
+            if rings is None:
+                rings = self._series[key] = [
+                    _Ring(seconds / self.slots, self.slots, self._size) for seconds in self.windows.values()
+                ]
+        timestamp = event.timestamp
+        band = None
+        if handle_us is not None:
+            band = _BANDS + len(self._bounds_us)
+            for offset, bound_us in enumerate(self._bounds_us):
+                if handle_us <= bound_us:
+                    band = _BANDS + offset
+                    break
+        for ring in rings:
+            slot = ring.slot(timestamp)
+            if slot is None:
+                self.late += 1
+                continue
+            slot[counter] += 1
+            if band is not None:
+                slot[_HANDLED] += 1
+                slot[_HANDLE_US] += handle_us
+                slot[band] += 1
+                if handle_us > slot[_MAX_US]:
+                    slot[_MAX_US] = handle_us
+
+    def _summarize(self, window: str, matches: Callable[[_Key], bool]) -> KPISnapshot:
+        position = list(self.windows).index(window)
+        totals = [0] * self._size
+        now = self.clock()
+        with self._lock:
+            for key, rings in self._series.items():
+                if not matches(key):
+                    continue
+                for slot in rings[position].live(now):
+                    for index in range(_MAX_US):
+                        totals[index] += slot[index]
+                    totals[_MAX_US] = max(totals[_MAX_US], slot[_MAX_US])
+                    for index in range(_BANDS, self._size):
+                        totals[index] += slot[index]
+        bands = totals[_BANDS:]
+        max_seconds = totals[_MAX_US] / 1_000_000
+        return KPISnapshot(
+            window_seconds=self.windows[window],
+            turns=totals[_TURNS],
+            completed=totals[_COMPLETED],
+            escalated=totals[_ESCALATED],
+            errors=totals[_ERRORS],
+            follow_ups=totals[_FOLLOW_UPS],
+            handled=totals[_HANDLED],
+            handle_seconds=totals[_HANDLE_US] / 1_000_000,
+            p50_seconds=self._quantile(bands, 0.50, max_seconds),
+            p95_seconds=self._quantile(bands, 0.95, max_seconds),
+            p99_seconds=self._quantile(bands, 0.99, max_seconds),
+            max_seconds=max_seconds,
+        )
+
+    def _quantile(self, bands: List[int], fraction: float, max_seconds: float) -> float:
+        count = sum(bands)
+        if not count:
+            return 0.0
+        target = max(1, int(round(fraction * count)))
+        seen = 0
+        for bound, band in zip(self.bounds, bands):
+            seen += band
+            if seen >= target:
+                return min(bound, max_seconds)
+        return max_seconds
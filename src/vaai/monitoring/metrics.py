@@ -0,0 +1,162 @@
+"""Fixed-memory latency histograms keyed by intent and stage."""
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, List, Sequence, Tuple
+
+SUB_BUCKET_BITS = 5
+_FULL = 1 << SUB_BUCKET_BITS
+_HALF = _FULL >> 1
+MAX_TRACKABLE_US = 1 << 36  # ~19 hours; larger values are clamped.
+_BUCKETS = _FULL + (MAX_TRACKABLE_US.bit_length() - SUB_BUCKET_BITS) * _HALF
+
+DEFAULT_EXPORT_BOUNDS: Tuple[float, ...] = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.4,
+    0.5,
+    1.0,
+    1.5,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+def _bucket_index(value_us: int) -> int:
+    if value_us < _FULL:
+        return max(value_us, 0)
+    value_us = min(value_us, MAX_TRACKABLE_US - 1)
+    shift = value_us.bit_length() - SUB_BUCKET_BITS
+    return _FULL + (shift - 1) * _HALF + (value_us >> shift) - _HALF
+
+
+def _bucket_upper_us(index: int) -> int:
+    """Exclusive upper bound of bucket ``index`` in microseconds."""
+
+    if index < _FULL:
+        return index + 1
+    offset = index - _FULL
+    shift = offset // _HALF + 1
+    mantissa = offset % _HALF + _HALF
+    return (mantissa + 1) << shift
+
+
+class LatencyHistogram:
+    """HDR-style log-linear histogram over microseconds.
+
+    Values below 32us get exact buckets; above that each power of two is split
+    into 16 linear sub-buckets, bounding relative error to about 6%. The bucket
+    array has a fixed size regardless of how many samples are recorded.
+    """
+
+    __slots__ = ("counts", "count", "total_us", "max_us", "_lock")
+
+    def __init__(self) -> None:
+        self.counts: List[int] = [0] * _BUCKETS
+        self.count = 0
+        self.total_us = 0
+        self.max_us = 0
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        value_us = int(seconds * 1_000_000)
+        index = _bucket_index(value_us)
+        with self._lock:
+            self.counts[index] += 1
+            self.count += 1
+            self.total_us += value_us
+            if value_us > self.max_us:
+                self.max_us = value_us
+
+    def percentile(self, fraction: float) -> float:
+        """Approximate ``fraction`` quantile in seconds (upper bucket bound)."""
+
+        if not self.count:
+            return 0.0
+        target = max(1, int(round(fraction * self.count)))
+        seen = 0
+        for index, bucket in enumerate(self.counts):
+            seen += bucket
+            if seen >= target:
+                return min(_bucket_upper_us(index), self.max_us) / 1_000_000
+        return self.max_us / 1_000_000
+
+    def cumulative(self, bounds: Sequence[float]) -> List[int]:
+        """Counts of samples at or below each bound in ``bounds`` (seconds)."""
+
+        result = []
+        index = 0
+        seen = 0
+        for bound in bounds:
+            limit_us = bound * 1_000_000
+            while index < _BUCKETS and _bucket_upper_us(index) <= limit_us:
+                seen += self.counts[index]
+                index += 1
+            result.append(seen)
+        return result
+
+    def to_json(self) -> Dict[str, object]:
+        return {
+            "count": self.count,
+            "sumSeconds": self.total_us / 1_000_000,
+            "p50": self.percentile(0.50),
+            "p95": self.percentile(0.95),
+            "p99": self.percentile(0.99),
+            "max": self.max_us / 1_000_000,
+        }
+
+
+@dataclass
+class LatencyMetrics:
+    """Registry of :class:`LatencyHistogram` objects per (intent, stage)."""
+
+    export_bounds: Tuple[float, ...] = DEFAULT_EXPORT_BOUNDS
+    histograms: Dict[Tuple[str, str], LatencyHistogram] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        self._lock = threading.Lock()
+
+    def histogram(self, intent: str, stage: str) -> LatencyHistogram:
+        key = (intent, stage)
+        histogram = self.histograms.get(key)
+        if histogram is None:
+            with self._lock:
+                histogram = self.histograms.setdefault(key, LatencyHistogram())
+        return histogram
+
+    def record(self, intent: str, stage: str, seconds: float) -> None:
+        self.histogram(intent, stage).record(seconds)
+
+    def to_json(self) -> Dict[str, Dict[str, Dict[str, object]]]:
+        result: Dict[str, Dict[str, Dict[str, object]]] = {}
+        for (intent, stage), histogram in sorted(self.histograms.items()):
+            result.setdefault(intent, {})[stage] = histogram.to_json()
+        return result
+
+    def to_prometheus(self, name: str = "vaai_stage_latency_seconds") -> str:
+        """Render all histograms in the Prometheus text exposition format."""
+
+        lines = [
+            f"# HELP {name} Turn stage latency by intent.",
+            f"# TYPE {name} histogram",
+        ]
+        for (intent, stage), histogram in sorted(self.histograms.items()):
+            labels = f'intent="{_escape(intent)}",stage="{_escape(stage)}"'
+            for bound, cumulative in zip(self.export_bounds, histogram.cumulative(self.export_bounds)):
+                lines.append(f'{name}_bucket{{{labels},le="{bound:g}"}} {cumulative}')
+            lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {histogram.count}')
+            lines.append(f"{name}_sum{{{labels}}} {histogram.total_us / 1_000_000:.6f}")
+            lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
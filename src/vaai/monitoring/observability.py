@@ -1,25 +1,152 @@
 """Observability helpers for tracing and logging."""
 from __future__ import annotations
 
+import contextvars
+import os
+import random
+import time
 import uuid
-from dataclasses import dataclass
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional
 
-from ..intents.base import IntentRequest
 from ..utils.context import ConversationContext
+from .metrics import LatencyMetrics
 
+if TYPE_CHECKING:
+    from ..integrations.resilience import Deadline
+    from ..intents.base import IntentRequest
 
-@dataclass
+_active: contextvars.ContextVar[Optional["ObservabilityContext"]] = contextvars.ContextVar(
+    "vaai_observability", default=None
+)
+
+
+def current_observability() -> Optional["ObservabilityContext"]:
+    """The context whose :meth:`~ObservabilityContext.span` encloses the caller, if it has a deadline."""
+
+    return _active.get()
+
+
+@dataclass(slots=True)
+class Span:
+    """A completed timed stage within a turn."""
+
+    name: str
+    span_id: str
+    parent_id: Optional[str]
+    start_ns: int
+    end_ns: int = 0
+
+    @property
+    def duration(self) -> float:
+        return (self.end_ns - self.start_ns) / 1e9
+
+    def to_json(self) -> Dict[str, object]:
+        return {
+            "name": self.name,
+            "spanId": self.span_id,
+            "parentId": self.parent_id,
+            "startNs": self.start_ns,
+            "durationMs": round(self.duration * 1000, 3),
+        }
+
+
+def default_spans() -> List[Span]:
+    return []
+
+
+@dataclass(slots=True)
 class ObservabilityContext:
-    """Metadata captured for distributed tracing and logging."""
+    """Metadata captured for distributed tracing and logging.
+
+    :meth:`span` times a named stage with a monotonic clock. Every span feeds
+    the per-intent/per-stage histogram in ``metrics`` when one is attached;
+    the individual :class:`Span` records are only retained (in ``spans``) when
+    the turn was ``sampled``, which keeps unsampled turns allocation-light.
+
+    When the turn has a ``deadline``, code running inside one of its spans can
+    reach it through :func:`current_observability` without it being passed
+    down explicitly; guarded integration clients use this to bound each call
+    by the turn's remaining budget.
+    """
 
     trace_id: str
     span_id: str
     client_id: str
     intent: str
+    metrics: Optional[LatencyMetrics] = None
+    sampled: bool = False
+    deadline: Optional[Deadline] = None
+    spans: List[Span] = field(default_factory=default_spans)
+    _stack: List[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._stack: List[str] = [self.span_id]
 
     @classmethod
-    def from_context(cls, context: ConversationContext, request: IntentRequest) -> "ObservabilityContext":
+    def from_context(
+        cls,
+        context: ConversationContext,
+        request: IntentRequest,
+        *,
+        metrics: Optional[LatencyMetrics] = None,
+        sample_rate: float = 0.0,
+        deadline: Optional[Deadline] = None,
+    ) -> "ObservabilityContext":
         trace_id = context.get_metadata("trace_id") or uuid.uuid4().hex
         context.set_metadata("trace_id", trace_id)
         span_id = uuid.uuid4().hex
-        return cls(trace_id=trace_id, span_id=span_id, client_id=context.client_id, intent=request.intent_name)
+        sampled = sample_rate > 0 and (sample_rate >= 1 or random.random() < sample_rate)
+        return cls(
+            trace_id=trace_id,
+            span_id=span_id,
+            client_id=context.client_id,
+            intent=request.intent_name,
+            metrics=metrics,
+            sampled=sampled,
+            deadline=deadline,
+        )
+
+    def record_duration(self, name: str, seconds: float) -> None:
+        """Feed an externally measured duration (e.g. time-to-first-chunk) into ``metrics``."""
+
+        if self.metrics is not None:
+            self.metrics.record(self.intent, name, seconds)
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        """Time the enclosed block as stage ``name``, nested under the current span."""
+
+        if self.deadline is None and self.metrics is None and not self.sampled:
+            yield
+            return
+        if self.deadline is not None:
+            # Restored by value: async generators may resume the span in a copied context.
+            previous = _active.get()
+            _active.set(self)
+            try:
+                yield from self._timed(name)
+            finally:
+                _active.set(previous)
+            return
+        yield from self._timed(name)
+
+    def _timed(self, name: str) -> Iterator[None]:
+        if self.metrics is None and not self.sampled:
+            yield
+            return
+
+        span_id = os.urandom(8).hex() if self.sampled else ""
+        parent_id = self._stack[-1]
+        self._stack.append(span_id)
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            end = time.perf_counter_ns()
+            self._stack.pop()
+            if self.metrics is not None:
+                self.metrics.record(self.intent, name, (end - start) / 1e9)
+            if self.sampled:
+                self.spans.append(Span(name=name, span_id=span_id, parent_id=parent_id, start_ns=start, end_ns=end))
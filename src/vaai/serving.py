@@ -0,0 +1,364 @@
+"""Multi-process serving: one ``VAaiAgent`` per worker process, sessions pinned by client id."""
+from __future__ import annotations
+
+import bisect
+import multiprocessing
+import pickle
+import threading
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from multiprocessing.connection import Connection
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from .agent import VAaiAgent
+from .intents.base import IntentRequest, IntentResponse
+from .utils.context import ConversationContext
+
+AgentFactory = Callable[[], VAaiAgent]
+"""Builds a worker's agent, typically by calling ``create_agent``.
+
+With the ``spawn`` start method it must be importable (a module-level function).
+"""
+
+_PICKLE = pickle.HIGHEST_PROTOCOL
+
+
+class WorkerLost(RuntimeError):
+    """Raised for turns that were in flight on a worker process that exited."""
+
+
+class HashRing:
+    """Consistent-hash ring with ``replicas`` virtual nodes per member.
+
+    Removing a member only moves the keys it owned; every other key keeps its
+    owner.
+    """
+
+    def __init__(self, members: Iterable[int] = (), replicas: int = 128) -> None:
+        self.replicas = replicas
+        self._points: List[int] = []
+        self._owners: List[int] = []
+        for member in members:
+            self.add(member)
+
+    def __len__(self) -> int:
+        return len(set(self._owners))
+
+    def add(self, member: int) -> None:
+        for replica in range(self.replicas):
+            point = zlib.crc32(f"{member}:{replica}".encode())
+            index = bisect.bisect(self._points, point)
+            self._points.insert(index, point)
+            self._owners.insert(index, member)
+
+    def remove(self, member: int) -> None:
+        kept = [(point, owner) for point, owner in zip(self._points, self._owners) if owner != member]
+        self._points = [point for point, _ in kept]
+        self._owners = [owner for _, owner in kept]
+
+    def owner(self, key: str) -> int:
+        if not self._points:
+            raise LookupError("hash ring is empty")
+        index = bisect.bisect(self._points, zlib.crc32(key.encode())) % len(self._points)
+        return self._owners[index]
+
+
+@dataclass
+class PoolStats:
+    """Counters for the serving layer."""
+
+    turns: int = 0
+    failed_turns: int = 0
+    lost_turns: int = 0
+    session_moves: int = 0
+    worker_exits: int = 0
+
+    def __post_init__(self) -> None:
+        self._lock = threading.Lock()
+
+    def add(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + amount)
+
+    def to_json(self) -> Dict[str, object]:
+        return {
+            "turns": self.turns,
+            "failedTurns": self.failed_turns,
+            "lostTurns": self.lost_turns,
+            "sessionMoves": self.session_moves,
+            "workerExits": self.worker_exits,
+        }
+
+
+def _worker_main(factory: AgentFactory, connection: Connection, threads: int, replicate_state: bool) -> None:
+    """Worker process loop: own the agent and the contexts of every session routed here."""
+
+    agent = factory()
+    sessions: Dict[str, ConversationContext] = {}
+    send_lock = threading.Lock()
+    executor = ThreadPoolExecutor(max_workers=threads, thread_name_prefix="vaai-worker")
+
+    def reply(kind: str, sequence: int, result: object, snapshot: Optional[bytes]) -> None:
+        # The result is pickled on its own so one that cannot cross the pipe fails only its turn.
+        try:
+            body = pickle.dumps(result, protocol=_PICKLE)
+        except Exception as exc:  # noqa: BLE001 - returned to the caller
+            error = RuntimeError(repr(result) if kind == "error" else f"unpicklable response: {exc!r}")
+            kind, body = "error", pickle.dumps(error, protocol=_PICKLE)
+        payload = pickle.dumps((kind, sequence, body, snapshot), protocol=_PICKLE)
+        with send_lock:
+            connection.send_bytes(payload)
+
+    def run_turn(sequence: int, context: ConversationContext, request: IntentRequest) -> None:
+        try:
+            response = agent.handle_turn(request, context)
+        except Exception as exc:  # noqa: BLE001 - returned to the caller
+            snapshot = pickle.dumps(context, protocol=_PICKLE) if replicate_state else None
+            reply("error", sequence, exc, snapshot)
+            return
+        snapshot = pickle.dumps(context, protocol=_PICKLE) if replicate_state else None
+        reply("ok", sequence, response, snapshot)
+
+    try:
+        while True:
+            try:
+                message = pickle.loads(connection.recv_bytes())
+            except EOFError:
+                break
+            kind = message[0]
+            if kind == "turn":
+                _, sequence, client_id, request, snapshot = message
+                if snapshot is not None:
+                    sessions[client_id] = pickle.loads(snapshot)
+                context = sessions.get(client_id)
+                if context is None:
+                    reply("error", sequence, KeyError(f"no session for client {client_id!r}"), None)
+                    continue
+                executor.submit(run_turn, sequence, context, request)
+            elif kind == "drop":
+                sessions.pop(message[1], None)
+            elif kind == "stop":
+                break
+    finally:
+        executor.shutdown(wait=True)
+        connection.close()
+
+
+class _Worker:
+    __slots__ = ("worker_id", "process", "connection", "send_lock", "pending", "reader", "alive")
+
+    def __init__(self, worker_id: int, process: multiprocessing.process.BaseProcess, connection: Connection) -> None:
+        self.worker_id = worker_id
+        self.process = process
+        self.connection = connection
+        self.send_lock = threading.Lock()
+        self.pending: Dict[int, Tuple[str, Future]] = {}
+        self.reader: Optional[threading.Thread] = None
+        self.alive = True
+
+
+def default_pool_stats() -> PoolStats:
+    return PoolStats()
+
+
+@dataclass
+class WorkerPool:
+    """Serve turns from ``workers`` processes, each running its own agent.
+
+    A session lives in exactly one worker, chosen by consistent hash of
+    ``ConversationContext.client_id``, so its context never crosses a process
+    boundary between turns. Requests and responses travel as single pickled
+    frames over a duplex pipe per worker. The context passed to
+    :meth:`handle_turn` seeds the session on its first turn only; afterwards
+    the worker's copy is authoritative (see :meth:`session_context`).
+
+    With ``replicate_state`` each reply also carries a pickled snapshot of the
+    session, kept as bytes. When a worker exits its sessions are re-homed on
+    the surviving ring members from their last snapshot; turns that were in
+    flight on it fail with :class:`WorkerLost` rather than being replayed,
+    since they may have had side effects. ``respawn`` starts a replacement
+    worker, which takes back its share of the ring.
+
+    Turns for one session must not overlap, as with :class:`VAaiAgent`.
+    """
+
+    factory: AgentFactory
+    workers: int = 4
+    threads_per_worker: int = 8
+    replicate_state: bool = True
+    respawn: bool = True
+    start_method: Optional[str] = None
+    replicas: int = 128
+    stats: PoolStats = field(default_factory=default_pool_stats)
+
+    def __post_init__(self) -> None:
+        self._context = multiprocessing.get_context(self.start_method)
+        self._lock = threading.Lock()
+        self._workers: Dict[int, _Worker] = {}
+        self._ring = HashRing(replicas=self.replicas)
+        self._homes: Dict[str, int] = {}
+        self._snapshots: Dict[str, bytes] = {}
+        self._sequence = 0
+        self._closed = False
+
+    def start(self) -> "WorkerPool":
+        for worker_id in range(self.workers):
+            self._spawn(worker_id)
+        return self
+
+    def close(self, timeout: float = 5.0) -> None:
+        with self._lock:
+            self._closed = True
+            workers = list(self._workers.values())
+        for worker in workers:
+            try:
+                with worker.send_lock:
+                    worker.connection.send_bytes(pickle.dumps(("stop",), protocol=_PICKLE))
+            except OSError:
+                pass
+        for worker in workers:
+            worker.process.join(timeout)
+            if worker.process.is_alive():
+                worker.process.terminate()
+            if worker.reader is not None:
+                worker.reader.join(timeout)
+
+    def __enter__(self) -> "WorkerPool":
+        return self.start()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def handle_turn(self, request: IntentRequest, context: ConversationContext) -> IntentResponse:
+        return self.submit(request, context).result()
+
+    def submit(self, request: IntentRequest, context: ConversationContext) -> "Future[IntentResponse]":
+        """Route a turn to the worker owning ``context.client_id``."""
+
+        client_id = context.client_id
+        future: "Future[IntentResponse]" = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("worker pool is closed")
+            worker = self._workers[self._ring.owner(client_id)]
+            home = self._homes.get(client_id)
+            snapshot = None
+            if home != worker.worker_id:
+                snapshot = self._snapshots.get(client_id)
+                if home is not None or snapshot is not None:
+                    self.stats.add("session_moves")
+                if home is not None:
+                    self._drop(home, client_id)
+                if snapshot is None:
+                    snapshot = pickle.dumps(context, protocol=_PICKLE)
+                self._homes[client_id] = worker.worker_id
+            self._sequence += 1
+            sequence = self._sequence
+            worker.pending[sequence] = (client_id, future)
+        payload = pickle.dumps(("turn", sequence, client_id, request, snapshot), protocol=_PICKLE)
+        try:
+            with worker.send_lock:
+                worker.connection.send_bytes(payload)
+        except OSError:
+            # The reader thread notices the exit and fails pending turns.
+            pass
+        return future
+
+    def close_session(self, client_id: str) -> None:
+        with self._lock:
+            home = self._homes.pop(client_id, None)
+            self._snapshots.pop(client_id, None)
+            if home is not None:
+                self._drop(home, client_id)
+
+    def session_context(self, client_id: str) -> Optional[ConversationContext]:
+        """Last replicated snapshot of the session, if ``replicate_state`` is on."""
+
+        snapshot = self._snapshots.get(client_id)
+        return pickle.loads(snapshot) if snapshot is not None else None
+
+    def worker_for(self, client_id: str) -> int:
+        with self._lock:
+            return self._ring.owner(client_id)
+
+    def worker_pid(self, worker_id: int) -> Optional[int]:
+        with self._lock:
+            worker = self._workers.get(worker_id)
+            return worker.process.pid if worker is not None else None
+
+    @property
+    def live_workers(self) -> List[int]:
+        with self._lock:
+            return [worker_id for worker_id, worker in self._workers.items() if worker.alive]
+
+    def _spawn(self, worker_id: int) -> None:
+        parent, child = self._context.Pipe(duplex=True)
+        process = self._context.Process(
+            target=_worker_main,
+            args=(self.factory, child, self.threads_per_worker, self.replicate_state),
+            name=f"vaai-worker-{worker_id}",
+            daemon=True,
+        )
+        process.start()
+        child.close()
+        worker = _Worker(worker_id, process, parent)
+        with self._lock:
+            self._workers[worker_id] = worker
+            self._ring.add(worker_id)
+        worker.reader = threading.Thread(
+            target=self._read, args=(worker,), name=f"vaai-pool-reader-{worker_id}", daemon=True
+        )
+        worker.reader.start()
+
+    def _drop(self, worker_id: int, client_id: str) -> None:
+        worker = self._workers.get(worker_id)
+        if worker is None or not worker.alive:
+            return
+        try:
+            with worker.send_lock:
+                worker.connection.send_bytes(pickle.dumps(("drop", client_id), protocol=_PICKLE))
+        except OSError:
+            pass
+
+    def _read(self, worker: _Worker) -> None:
+        while True:
+            try:
+                kind, sequence, body, snapshot = pickle.loads(worker.connection.recv_bytes())
+            except (EOFError, OSError):
+                break
+            with self._lock:
+                client_id, future = worker.pending.pop(sequence)
+                if snapshot is not None and self._homes.get(client_id) == worker.worker_id:
+                    self._snapshots[client_id] = snapshot
+            self.stats.add("turns")
+            try:
+                result = pickle.loads(body)
+            except Exception as exc:  # noqa: BLE001 - fail this turn, keep reading the worker
+                kind, result = "error", RuntimeError(f"unreadable reply from worker {worker.worker_id}: {exc!r}")
+            if kind == "ok":
+                future.set_result(result)
+            else:
+                self.stats.add("failed_turns")
+                future.set_exception(result)
+        self._on_exit(worker)
+
+    def _on_exit(self, worker: _Worker) -> None:
+        with self._lock:
+            worker.alive = False
+            self._ring.remove(worker.worker_id)
+            del self._workers[worker.worker_id]
+            pending = list(worker.pending.values())
+            worker.pending.clear()
+            # Forget the placement so each session is re-seeded from its snapshot on its next turn.
+            for client_id in [client for client, home in self._homes.items() if home == worker.worker_id]:
+                del self._homes[client_id]
+            restart = self.respawn and not self._closed
+        worker.connection.close()
+        if not self._closed:
+            self.stats.add("worker_exits")
+        for _, future in pending:
+            self.stats.add("lost_turns")
+            future.set_exception(WorkerLost(f"worker {worker.worker_id} exited"))
+        if restart:
+            self._spawn(worker.worker_id)
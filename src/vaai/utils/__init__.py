@@ -1,5 +1,49 @@
 """Utility exports for VAai."""
-from .context import ConversationContext
-from .security import VerificationResult, VerificationService
+from __future__ import annotations
 
-__all__ = ["ConversationContext", "VerificationResult", "VerificationService"]
+from typing import TYPE_CHECKING
+
+from .lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .audit import AuditLog, AuditStats, AuditVerification, verify_audit_log
+    from .context import ConversationContext
+    from .journal import JournalStats, SessionJournal, recover_sessions
+    from .security import PCIRedactor, StreamingRedactor, VerificationResult, VerificationService, redact
+    from .sessions import SessionRegistry
+
+_EXPORTS = {
+    "AuditLog": ".audit",
+    "AuditStats": ".audit",
+    "AuditVerification": ".audit",
+    "ConversationContext": ".context",
+    "JournalStats": ".journal",
+    "PCIRedactor": ".security",
+    "SessionJournal": ".journal",
+    "SessionRegistry": ".sessions",
+    "StreamingRedactor": ".security",
+    "VerificationResult": ".security",
+    "VerificationService": ".security",
+    "recover_sessions": ".journal",
+    "redact": ".security",
+    "verify_audit_log": ".audit",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+__all__ = [
+    "AuditLog",
+    "AuditStats",
+    "AuditVerification",
+    "ConversationContext",
+    "JournalStats",
+    "PCIRedactor",
+    "SessionJournal",
+    "SessionRegistry",
+    "StreamingRedactor",
+    "VerificationResult",
+    "VerificationService",
+    "recover_sessions",
+    "redact",
+    "verify_audit_log",
+]
@@ -0,0 +1,270 @@
+"""Hash-chained, append-only audit log of PCI-relevant actions."""
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+from ..monitoring.metrics import LatencyHistogram
+from .context import ConversationContext
+from .security import redact_value
+
+GENESIS = bytes(32)
+"""Chain value before the first record of a log."""
+
+VERIFICATION_ATTEMPT = "verification_attempt"
+CARD_FREEZE = "card_freeze"
+CARD_ACTIVATION = "card_activation"
+ESCALATION = "escalation"
+
+
+def _chain(previous: bytes, body: bytes) -> bytes:
+    return hashlib.sha256(previous + body).digest()
+
+
+def _head(path: Path) -> Tuple[int, bytes, int]:
+    """Sequence and hash of the last complete record, and the byte length of the complete records."""
+
+    size = path.stat().st_size if path.exists() else 0
+    if not size:
+        return 0, GENESIS, 0
+    with open(path, "rb") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        end = data.rfind(b"\n") + 1
+        if not end:
+            return 0, GENESIS, 0
+        start = data.rfind(b"\n", 0, end - 1) + 1
+        line = data[start : end - 1]
+    body, _, digest = line.rpartition(b"\t")
+    return json.loads(body)["seq"], bytes.fromhex(digest.decode("ascii")), end
+
+
+@dataclass(slots=True)
+class AuditVerification:
+    """Outcome of :func:`verify_audit_log`.
+
+    ``failed_at`` is the 1-based line of the first record whose hash does not
+    chain from the one before it. ``torn_tail`` reports a final record cut
+    off mid-write, which was never acknowledged to a caller.
+    """
+
+    valid: bool
+    records: int
+    head: str
+    failed_at: Optional[int] = None
+    reason: Optional[str] = None
+    torn_tail: bool = False
+
+    def to_json(self) -> Dict[str, object]:
+        return {
+            "valid": self.valid,
+            "records": self.records,
+            "head": self.head,
+            "failedAt": self.failed_at,
+            "reason": self.reason,
+            "tornTail": self.torn_tail,
+        }
+
+
+def verify_audit_log(path: Union[str, Path], expected_head: Optional[str] = None) -> AuditVerification:
+    """Re-hash every record of the log at ``path`` through a read-only memory map.
+
+    Pass the :attr:`AuditLog.head` saved elsewhere as ``expected_head`` to
+    also detect records removed from the end.
+    """
+
+    path = Path(path)
+    previous = GENESIS
+    records = 0
+    torn = False
+    size = path.stat().st_size
+    if size:
+        with open(path, "rb") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            find, rfind = data.find, data.rfind
+            sha256 = hashlib.sha256
+            offset = 0
+            while offset < size:
+                end = find(b"\n", offset)
+                if end < 0:
+                    torn = True
+                    break
+                tab = rfind(b"\t", offset, end)
+                if tab < 0:
+                    return AuditVerification(False, records, previous.hex(), records + 1, "malformed record")
+                digest = sha256(previous + data[offset:tab]).digest()
+                if digest.hex().encode("ascii") != data[tab + 1 : end]:
+                    return AuditVerification(False, records, previous.hex(), records + 1, "hash mismatch")
+                previous = digest
+                records += 1
+                offset = end + 1
+    head = previous.hex()
+    if expected_head is not None and head != expected_head:
+        return AuditVerification(False, records, head, reason="head mismatch", torn_tail=torn)
+    return AuditVerification(True, records, head, torn_tail=torn)
+
+
+def default_fsync_histogram() -> LatencyHistogram:
+    return LatencyHistogram()
+
+
+@dataclass
+class AuditStats:
+    """Counters for the audit log's write cost."""
+
+    records: int = 0
+    commits: int = 0
+    log_bytes: int = 0
+    fsync_seconds: LatencyHistogram = field(default_factory=default_fsync_histogram)
+
+    def __post_init__(self) -> None:
+        self._lock = threading.Lock()
+
+    def add(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + amount)
+
+    def to_json(self) -> Dict[str, object]:
+        return {
+            "records": self.records,
+            "commits": self.commits,
+            "recordsPerCommit": round(self.records / self.commits, 2) if self.commits else 0.0,
+            "logBytes": self.log_bytes,
+            "fsyncSeconds": self.fsync_seconds.to_json(),
+        }
+
+
+class AuditLog:
+    """Durable, tamper-evident record of verification attempts, card actions and escalations.
+
+    Each line is a compact JSON record followed by a tab and the hex SHA-256
+    of the previous record's hash concatenated with the JSON bytes, so
+    editing, reordering or deleting any record breaks every hash after it;
+    :func:`verify_audit_log` checks the chain. Keep :attr:`head` outside the
+    log (e.g. in the case system) to detect truncation as well.
+
+    :meth:`append` returns once the record is written and, with ``fsync``, on
+    disk. Concurrent appends are group-committed as in
+    :class:`~vaai.utils.journal.SessionJournal`: the first waiting caller
+    writes everything queued with one write and one fsync. Details are
+    PCI-redacted before they are hashed. Reopening a log continues its chain
+    after dropping a torn final line. If a write or fsync fails, the file is
+    cut back to the last committed record and the batch is queued again for
+    the next append; if even that fails, the log refuses further appends.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        *,
+        fsync: bool = True,
+        clock: Callable[[], float] = time.time,
+        stats: Optional[AuditStats] = None,
+    ) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.fsync = fsync
+        self.clock = clock
+        self.stats = stats if stats is not None else AuditStats()
+        self._sequence, self._previous, complete = _head(self.path)
+        self._written_sequence = self._sequence
+        self._pending: List[bytes] = []
+        self._writing = False
+        self._failure: Optional[BaseException] = None
+        self._lock = threading.Lock()
+        self._written = threading.Condition(self._lock)
+        # Unbuffered, so a failed write leaves nothing behind to be flushed later.
+        self._handle = open(self.path, "ab", buffering=0)
+        if self._handle.tell() != complete:
+            self._handle.truncate(complete)
+            self._handle.seek(complete)
+        self._size = complete
+
+    @property
+    def head(self) -> str:
+        """Hex hash of the latest appended record."""
+
+        with self._lock:
+            return self._previous.hex()
+
+    def append(
+        self,
+        action: str,
+        *,
+        context: ConversationContext,
+        details: Optional[Dict[str, object]] = None,
+        trace_id: Optional[str] = None,
+    ) -> int:
+        """Durably record ``action`` for the session in ``context``; returns the record's sequence number."""
+
+        record = {
+            "ts": self.clock(),
+            "action": action,
+            "client_id": context.client_id,
+            "case_id": context.case_id,
+            "trace_id": trace_id or context.get_metadata("trace_id"),
+            "details": redact_value(details) if details else {},
+        }
+        encoded = json.dumps(record, separators=(",", ":"), default=str)
+        with self._lock:
+            self._sequence += 1
+            body = f'{{"seq":{self._sequence},{encoded[1:]}'.encode("utf-8")
+            self._previous = _chain(self._previous, body)
+            self._pending.append(body + b"\t" + self._previous.hex().encode("ascii") + b"\n")
+            self.stats.add("records")
+            sequence = self._sequence
+            self._commit(sequence)
+        return sequence
+
+    def close(self) -> None:
+        try:
+            with self._lock:
+                self._commit(self._sequence)
+        finally:
+            self._handle.close()
+
+    def _commit(self, sequence: int) -> None:
+        """Return once ``sequence`` is written, writing the queued batch if no one else is. Caller holds the lock."""
+
+        while self._written_sequence < sequence:
+            if self._failure is not None:
+                raise OSError("audit log is unusable after a failed write") from self._failure
+            if self._writing:
+                self._written.wait()
+                continue
+            batch, high = self._pending, self._sequence
+            self._pending = []
+            self._writing = True
+            self._lock.release()
+            try:
+                data = b"".join(batch)
+                view = memoryview(data)
+                while view:
+                    view = view[self._handle.write(view) :]
+                if self.fsync:
+                    started = time.perf_counter()
+                    os.fsync(self._handle.fileno())
+                    self.stats.fsync_seconds.record(time.perf_counter() - started)
+            except BaseException as exc:
+                self._lock.acquire()
+                self._writing = False
+                try:
+                    # Drop whatever part of the batch reached the file so a retry does not duplicate it.
+                    self._handle.truncate(self._size)
+                    self._handle.seek(self._size)
+                except OSError:
+                    self._failure = exc
+                self._pending[:0] = batch
+                self._written.notify_all()
+                raise
+            self._lock.acquire()
+            self._writing = False
+            self.stats.add("commits")
+            self.stats.add("log_bytes", len(data))
+            self._size += len(data)
+            self._written_sequence = high
+            self._written.notify_all()
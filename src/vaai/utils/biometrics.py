@@ -0,0 +1,193 @@
+"""Voice-biometric verification against memory-mapped voiceprint templates.
+
+Requires NumPy, which the rest of the package does not; import this module
+only where voice biometrics are enabled.
+"""
+from __future__ import annotations
+
+import base64
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple, Union
+
+import numpy as np
+
+from .context import ConversationContext
+from .security import VerificationResult, VerificationService
+
+VOICEPRINT_PARAMETER = "voiceprint"
+METHOD = "voice_biometrics"
+
+
+def _normalise(vectors: np.ndarray) -> np.ndarray:
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    np.maximum(norms, np.finfo(np.float32).tiny, out=norms)
+    return vectors / norms
+
+
+def encode_voiceprint(embedding: Sequence[float]) -> str:
+    """Encode an embedding for the ``voiceprint`` request parameter."""
+
+    return base64.b64encode(np.asarray(embedding, dtype="<f4").tobytes()).decode("ascii")
+
+
+def decode_voiceprint(value: str) -> np.ndarray:
+    return np.frombuffer(base64.b64decode(value), dtype="<f4")
+
+
+class VoiceprintStore:
+    """Enrolled voiceprint templates in a memory-mapped ``.npy`` matrix.
+
+    Templates are stored L2-normalised (``float16`` by default, 2 bytes per
+    dimension) so scoring is a plain dot product. The matrix lives at
+    ``<path>.npy`` and client ids, one per row, at ``<path>.ids``; every
+    process that opens the store maps the same file, so the operating system
+    keeps a single copy in the page cache however many workers score against it.
+    """
+
+    def __init__(self, matrix: np.ndarray, client_ids: List[str], path: Path) -> None:
+        self.matrix = matrix
+        self.path = path
+        self._client_ids = client_ids
+        self._rows: Dict[str, int] = {client_id: row for row, client_id in enumerate(client_ids)}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def create(
+        cls, path: Union[str, Path], *, dim: int, capacity: int, dtype: Union[str, np.dtype] = np.float16
+    ) -> "VoiceprintStore":
+        """Create an empty writable store with room for ``capacity`` templates."""
+
+        path = Path(path)
+        matrix = np.lib.format.open_memmap(
+            path.with_suffix(".npy"), mode="w+", dtype=np.dtype(dtype), shape=(capacity, dim)
+        )
+        path.with_suffix(".ids").write_text("")
+        return cls(matrix, [], path)
+
+    @classmethod
+    def open(cls, path: Union[str, Path], *, writable: bool = False) -> "VoiceprintStore":
+        """Map an existing store; read-only unless ``writable``."""
+
+        path = Path(path)
+        matrix = np.load(path.with_suffix(".npy"), mmap_mode="r+" if writable else "r")
+        client_ids = path.with_suffix(".ids").read_text().splitlines()
+        return cls(matrix, client_ids, path)
+
+    def __len__(self) -> int:
+        return len(self._client_ids)
+
+    def __contains__(self, client_id: object) -> bool:
+        return client_id in self._rows
+
+    @property
+    def dim(self) -> int:
+        return self.matrix.shape[1]
+
+    def rows(self, client_ids: Sequence[str]) -> np.ndarray:
+        """Row index for each client id, ``-1`` where the client is not enrolled."""
+
+        return np.fromiter((self._rows.get(client_id, -1) for client_id in client_ids), dtype=np.int64)
+
+    def enroll(self, client_id: str, embedding: Sequence[float]) -> None:
+        self.enroll_many([client_id], np.asarray(embedding)[None, :])
+
+    def enroll_many(self, client_ids: Sequence[str], embeddings: np.ndarray) -> None:
+        """Add or replace templates for ``client_ids`` (one embedding per row)."""
+
+        embeddings = _normalise(embeddings)
+        if embeddings.shape != (len(client_ids), self.dim):
+            raise ValueError(f"expected embeddings of shape ({len(client_ids)}, {self.dim})")
+        with self._lock:
+            new_ids = [client_id for client_id in dict.fromkeys(client_ids) if client_id not in self._rows]
+            if len(self._client_ids) + len(new_ids) > self.matrix.shape[0]:
+                raise ValueError("voiceprint store is full")
+            for client_id in new_ids:
+                self._rows[client_id] = len(self._client_ids)
+                self._client_ids.append(client_id)
+            self.matrix[self.rows(client_ids)] = embeddings.astype(self.matrix.dtype)
+            with self.path.with_suffix(".ids").open("a") as handle:
+                handle.writelines(f"{client_id}\n" for client_id in new_ids)
+
+    def flush(self) -> None:
+        if isinstance(self.matrix, np.memmap):
+            self.matrix.flush()
+
+
+@dataclass
+class VoiceBiometricScorer:
+    """Batched cosine scoring of caller voiceprints against enrolled templates.
+
+    Only the template rows of the callers being verified are read, so the
+    cost of a batch depends on its size rather than on how many clients are
+    enrolled.
+    """
+
+    store: VoiceprintStore
+    threshold: float = 0.75
+
+    def score(self, client_ids: Sequence[str], embeddings: np.ndarray) -> np.ndarray:
+        """Cosine similarity per (client, embedding) pair; ``nan`` if not enrolled."""
+
+        probes = _normalise(np.atleast_2d(embeddings))
+        if probes.shape != (len(client_ids), self.store.dim):
+            raise ValueError(f"expected embeddings of shape ({len(client_ids)}, {self.store.dim})")
+        rows = self.store.rows(client_ids)
+        enrolled = rows >= 0
+        scores = np.full(len(client_ids), np.nan, dtype=np.float32)
+        if enrolled.any():
+            templates = self.store.matrix[rows[enrolled]].astype(np.float32)
+            scores[enrolled] = np.einsum("ij,ij->i", templates, probes[enrolled])
+        return scores
+
+    def verify_batch(self, pending: Sequence[Tuple[str, Sequence[float]]]) -> List[VerificationResult]:
+        """Score many pending ``(client_id, embedding)`` verifications in one call."""
+
+        if not pending:
+            return []
+        client_ids = [client_id for client_id, _ in pending]
+        scores = self.score(client_ids, np.stack([np.asarray(embedding, dtype=np.float32) for _, embedding in pending]))
+        return [self._result(float(score)) for score in scores]
+
+    def _result(self, score: float) -> VerificationResult:
+        if np.isnan(score):
+            return VerificationResult(passed=False, method=METHOD, failure_reason="Voiceprint not enrolled")
+        if score < self.threshold:
+            return VerificationResult(
+                passed=False, method=METHOD, failure_reason="Voiceprint did not match", score=score
+            )
+        return VerificationResult(passed=True, method=METHOD, score=score)
+
+
+class BiometricVerificationService(VerificationService):
+    """Verifies callers by voiceprint, falling back to OTP/last4 without one.
+
+    The channel adapter passes the caller's embedding as the ``voiceprint``
+    parameter (see :func:`encode_voiceprint`). When ``enabled`` is false, as
+    with ``AgentConfig.enable_voice_biometrics=False``, voiceprints are ignored.
+    """
+
+    def __init__(self, scorer: VoiceBiometricScorer, *, enabled: bool = True) -> None:
+        self.scorer = scorer
+        self.enabled = enabled
+
+    def verify(self, context: ConversationContext, parameters: Dict[str, str]) -> VerificationResult:
+        voiceprint = parameters.get(VOICEPRINT_PARAMETER)
+        if not self.enabled or not voiceprint:
+            return super().verify(context, parameters)
+        try:
+            embedding = decode_voiceprint(voiceprint)
+            return self.scorer.verify_batch([(context.client_id, embedding)])[0]
+        except ValueError:
+            # Bad base64, a truncated buffer, or an embedding of the wrong dimension.
+            return VerificationResult(passed=False, method=METHOD, failure_reason="Voiceprint unreadable")
+
+    def verify_many(
+        self, pending: Sequence[Tuple[ConversationContext, Sequence[float]]]
+    ) -> List[VerificationResult]:
+        """Batch counterpart of :meth:`verify` for adapters that queue callers."""
+
+        return self.scorer.verify_batch([(context.client_id, embedding) for context, embedding in pending])
+
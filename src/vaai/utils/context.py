@@ -3,13 +3,22 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+from .security import redact
+
+if TYPE_CHECKING:
+    from ..workflows.prefetch import PrefetchBuffer
 
 
 def default_case_notes() -> List[str]:
     return []
 
 
+def default_card_ids() -> List[str]:
+    return []
+
+
 def default_metadata() -> Dict[str, str]:
     return {}
 
@@ -25,14 +34,24 @@ class ConversationContext:
     is_verified: bool = False
     verification_attempts: int = 0
     active_card_id: Optional[str] = None
+    profile_card_ids: List[str] = field(default_factory=default_card_ids)
     case_id: Optional[str] = None
     case_notes: List[str] = field(default_factory=default_case_notes)
     session_metadata: Dict[str, str] = field(default_factory=default_metadata)
     started_at: datetime = field(default_factory=datetime.utcnow)
+    prefetch_buffer: Optional[PrefetchBuffer] = field(default=None, repr=False, compare=False)
+
+    def __getstate__(self) -> Dict[str, object]:
+        # In-flight prefetches are process-local; they are not carried across pickling.
+        state = dict(self.__dict__)
+        state["prefetch_buffer"] = None
+        return state
 
     def add_note(self, note: str) -> None:
+        """Append a timestamped case note with card data redacted."""
+
         timestamp = datetime.utcnow().isoformat()
-        self.case_notes.append(f"[{timestamp}] {note}")
+        self.case_notes.append(f"[{timestamp}] {redact(note)}")
 
     def set_metadata(self, key: str, value: str) -> None:
         self.session_metadata[key] = value
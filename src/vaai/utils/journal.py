@@ -0,0 +1,467 @@
+"""Append-only journal of conversation context changes, for rebuilding sessions after a crash."""
+from __future__ import annotations
+
+import json
+import os
+import struct
+import threading
+import time
+import zlib
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+from ..monitoring.metrics import LatencyHistogram
+from .context import ConversationContext
+
+_HEADER = struct.Struct("<II")
+_SEGMENT = "journal-{:016d}.log"
+_SNAPSHOT = "snapshot-{:016d}.snap"
+
+_SCALARS = (
+    "client_id",
+    "channel",
+    "locale",
+    "loyalty_tier",
+    "is_verified",
+    "verification_attempts",
+    "active_card_id",
+    "case_id",
+)
+
+State = Dict[str, object]
+"""A session's journaled fields: the scalars plus ``profile_card_ids``,
+``case_notes``, ``session_metadata`` and ``started_at``."""
+
+
+def _state(context: ConversationContext) -> State:
+    state: State = {name: getattr(context, name) for name in _SCALARS}
+    state["profile_card_ids"] = list(context.profile_card_ids)
+    state["case_notes"] = list(context.case_notes)
+    state["session_metadata"] = dict(context.session_metadata)
+    state["started_at"] = context.started_at.isoformat()
+    return state
+
+
+def _delta(previous: Optional[State], current: State) -> Dict[str, object]:
+    """Changes from ``previous`` to ``current``; the full state for a new session.
+
+    Case notes are append-only, so only new notes are recorded; metadata is
+    recorded key by key.
+    """
+
+    if previous is None:
+        return {"set": current}
+    changed = {
+        name: value
+        for name, value in current.items()
+        if name not in ("case_notes", "session_metadata") and value != previous[name]
+    }
+    delta: Dict[str, object] = {"set": changed} if changed else {}
+    notes, old_notes = current["case_notes"], previous["case_notes"]
+    if notes != old_notes:
+        if len(notes) > len(old_notes) and notes[: len(old_notes)] == old_notes:
+            delta["notes"] = notes[len(old_notes) :]
+        else:
+            changed["case_notes"] = notes
+            delta["set"] = changed
+    metadata, old_metadata = current["session_metadata"], previous["session_metadata"]
+    if metadata != old_metadata:
+        updated = {key: value for key, value in metadata.items() if old_metadata.get(key) != value}
+        removed = [key for key in old_metadata if key not in metadata]
+        if updated:
+            delta["meta"] = updated
+        if removed:
+            delta["unmeta"] = removed
+    return delta
+
+
+def _apply(state: Optional[State], delta: Dict[str, object]) -> State:
+    state = dict(state) if state is not None else {}
+    state.update(delta.get("set", {}))
+    if "notes" in delta:
+        state["case_notes"] = state["case_notes"] + delta["notes"]
+    if "meta" in delta or "unmeta" in delta:
+        metadata = dict(state["session_metadata"])
+        metadata.update(delta.get("meta", {}))
+        for key in delta.get("unmeta", ()):
+            metadata.pop(key, None)
+        state["session_metadata"] = metadata
+    return state
+
+
+def _context_from_state(state: State) -> ConversationContext:
+    fields = dict(state)
+    fields["started_at"] = datetime.fromisoformat(fields["started_at"])
+    return ConversationContext(**fields)
+
+
+def _frame(payload: bytes) -> bytes:
+    return _HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+
+
+def _records(path: Path) -> Iterator[Dict[str, object]]:
+    """Decoded records of one file, stopping at a torn or corrupt tail."""
+
+    data = path.read_bytes()
+    offset, size = 0, len(data)
+    while offset + _HEADER.size <= size:
+        length, checksum = _HEADER.unpack_from(data, offset)
+        start = offset + _HEADER.size
+        payload = data[start : start + length]
+        if len(payload) < length or zlib.crc32(payload) != checksum:
+            return
+        yield json.loads(payload)
+        offset = start + length
+
+
+def _open_segment(path: Path) -> BinaryIO:
+    # Unbuffered, so a failed write leaves nothing behind to be flushed later.
+    return open(path, "wb", buffering=0)
+
+
+def _write_all(handle: BinaryIO, data: bytes) -> None:
+    view = memoryview(data)
+    while view:
+        view = view[handle.write(view) :]
+
+
+def _sequence_of(path: Path) -> int:
+    return int(path.stem.split("-")[1])
+
+
+def _fsync_directory(directory: Path) -> None:
+    if os.name == "posix":
+        descriptor = os.open(directory, os.O_RDONLY)
+        try:
+            os.fsync(descriptor)
+        finally:
+            os.close(descriptor)
+
+
+def replay(directory: Union[str, Path]) -> Tuple[Dict[str, State], int]:
+    """Rebuild every live session's state: latest snapshot plus the log after it.
+
+    Returns the states and the last sequence number applied.
+    """
+
+    directory = Path(directory)
+    states: Dict[str, State] = {}
+    last = 0
+    snapshots = sorted(directory.glob("snapshot-*.snap"), key=_sequence_of)
+    if snapshots:
+        for record in _records(snapshots[-1]):
+            if "snapshot" in record:
+                last = record["snapshot"]
+            else:
+                states[record["s"]] = record["state"]
+    for segment in sorted(directory.glob("journal-*.log"), key=_sequence_of):
+        for record in _records(segment):
+            sequence = record["q"]
+            if sequence <= last:
+                continue
+            last = sequence
+            if record.get("end"):
+                states.pop(record["s"], None)
+            else:
+                states[record["s"]] = _apply(states.get(record["s"]), record["d"])
+    return states, last
+
+
+def recover_sessions(
+    directory: Union[str, Path], session_ids: Optional[Iterable[str]] = None
+) -> Dict[str, ConversationContext]:
+    """Contexts of the sessions journaled in ``directory`` (all of them, or just ``session_ids``)."""
+
+    states, _ = replay(directory)
+    wanted = set(session_ids) if session_ids is not None else None
+    return {
+        session_id: _context_from_state(state)
+        for session_id, state in states.items()
+        if wanted is None or session_id in wanted
+    }
+
+
+def default_fsync_histogram() -> LatencyHistogram:
+    return LatencyHistogram()
+
+
+@dataclass
+class JournalStats:
+    """Counters for the journal's write cost."""
+
+    records: int = 0
+    unchanged: int = 0
+    delta_bytes: int = 0
+    log_bytes: int = 0
+    snapshot_bytes: int = 0
+    commits: int = 0
+    snapshots: int = 0
+    fsync_seconds: LatencyHistogram = field(default_factory=default_fsync_histogram)
+
+    def __post_init__(self) -> None:
+        self._lock = threading.Lock()
+
+    def add(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + amount)
+
+    @property
+    def write_amplification(self) -> float:
+        """Bytes written to disk (framed log plus snapshots) per byte of change recorded."""
+
+        return (self.log_bytes + self.snapshot_bytes) / self.delta_bytes if self.delta_bytes else 0.0
+
+    def to_json(self) -> Dict[str, object]:
+        return {
+            "records": self.records,
+            "unchanged": self.unchanged,
+            "deltaBytes": self.delta_bytes,
+            "logBytes": self.log_bytes,
+            "snapshotBytes": self.snapshot_bytes,
+            "commits": self.commits,
+            "recordsPerCommit": round(self.records / self.commits, 2) if self.commits else 0.0,
+            "snapshots": self.snapshots,
+            "writeAmplification": round(self.write_amplification, 3),
+            "fsyncSeconds": self.fsync_seconds.to_json(),
+        }
+
+
+class SessionJournal:
+    """Event-sourced, append-only log of :class:`ConversationContext` changes.
+
+    :meth:`record` compares a context with the state last journaled for the
+    session and appends only what changed (new case notes, changed fields,
+    changed metadata keys); a session's first record carries its full state.
+    It returns once the record is written and, with ``fsync``, on disk.
+    Records from concurrent sessions are group-committed: the first waiting
+    caller writes everything queued so far with one write and one fsync,
+    while the others wait for it.
+
+    Once the current segment exceeds ``segment_bytes`` the log rolls to a new
+    segment and a compact snapshot of every live session is written in the
+    background; older segments and snapshots are then deleted. Another
+    process can rebuild sessions with :func:`recover_sessions` from the
+    latest snapshot plus the log after it. Reopening an existing directory
+    resumes from its contents.
+
+    A record only enters the journal's view of a session once its batch is
+    written; if the write or fsync fails, whatever part of the batch reached
+    the segment is cut off and every caller in it gets the error, so neither
+    the log nor later deltas assume the record exists.
+
+    Call :meth:`end` when a session finishes so it is left out of recovery;
+    the agent does so when a response terminates the session, and
+    :meth:`on_evicted` can be registered as a
+    :class:`~vaai.utils.sessions.SessionRegistry` eviction hook.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        *,
+        fsync: bool = True,
+        segment_bytes: int = 64 * 1024 * 1024,
+        stats: Optional[JournalStats] = None,
+    ) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.fsync = fsync
+        self.segment_bytes = segment_bytes
+        self.stats = stats if stats is not None else JournalStats()
+        self._states, self._sequence = replay(self.directory)
+        self._written_sequence = self._sequence
+        # Queued records as ``(frame, session_id, state)``; ``state`` is None for an end record.
+        self._pending: List[Tuple[bytes, str, Optional[State]]] = []
+        # Latest queued but unwritten state per session, the base for its next delta.
+        self._staged: Dict[str, Optional[State]] = {}
+        self._failures: Dict[int, BaseException] = {}
+        self._writing = False
+        self._lock = threading.Lock()
+        self._written = threading.Condition(self._lock)
+        self._snapshot_thread: Optional[threading.Thread] = None
+        self._segment_path = self.directory / _SEGMENT.format(self._sequence + 1)
+        # A segment already named for the next sequence can only hold a torn tail.
+        self._segment = _open_segment(self._segment_path)
+        self._segment_size = 0
+
+    def record(self, context: ConversationContext, session_id: Optional[str] = None) -> bool:
+        """Journal the changes to ``context`` since its last record; returns whether anything changed.
+
+        ``session_id`` defaults to the context's ``client_id``, which is how
+        the agent and :class:`~vaai.serving.WorkerPool` key sessions.
+        """
+
+        session_id = session_id if session_id is not None else context.client_id
+        current = _state(context)
+        with self._lock:
+            delta = _delta(self._base(session_id), current)
+            if not delta:
+                self.stats.add("unchanged")
+                return False
+            sequence = self._enqueue(session_id, current, json.dumps(delta, separators=(",", ":")))
+            self._commit(sequence)
+        return True
+
+    def end(self, session_id: str) -> None:
+        """Record that ``session_id`` finished; it will not be recovered."""
+
+        with self._lock:
+            if self._base(session_id) is None:
+                return
+            self._commit(self._enqueue(session_id, None, None))
+
+    def on_evicted(self, session_id: str, context: ConversationContext, reason: str) -> None:
+        """:data:`~vaai.utils.sessions.EvictionHook` ending the evicted session, keyed like :meth:`record`."""
+
+        self.end(context.client_id)
+
+    def sessions(self) -> Set[str]:
+        with self._lock:
+            return set(self._states)
+
+    def snapshot(self) -> None:
+        """Roll the log and write a snapshot now, waiting for it to finish."""
+
+        with self._lock:
+            self._rotate()
+            thread = self._snapshot_thread
+        if thread is not None:
+            thread.join()
+
+    def close(self) -> None:
+        with self._lock:
+            self._commit(self._sequence)
+            thread = self._snapshot_thread
+        if thread is not None:
+            thread.join()
+        self._segment.close()
+
+    def _base(self, session_id: str) -> Optional[State]:
+        """The state the session's next delta builds on. Caller holds the lock."""
+
+        if session_id in self._staged:
+            return self._staged[session_id]
+        return self._states.get(session_id)
+
+    def _enqueue(self, session_id: str, state: Optional[State], delta: Optional[str]) -> int:
+        # Caller holds the lock, so sequence order matches file order.
+        self._sequence += 1
+        session = json.dumps(session_id)
+        if delta is None:
+            payload = f'{{"q":{self._sequence},"s":{session},"end":true}}'
+        else:
+            payload = f'{{"q":{self._sequence},"s":{session},"d":{delta}}}'
+            self.stats.add("delta_bytes", len(delta))
+        self._pending.append((_frame(payload.encode("utf-8")), session_id, state))
+        self._staged[session_id] = state
+        self.stats.add("records")
+        return self._sequence
+
+    def _commit(self, sequence: int) -> None:
+        """Return once ``sequence`` is written, writing the queued batch if no one else is. Caller holds the lock."""
+
+        while self._written_sequence < sequence:
+            if self._writing:
+                self._written.wait()
+                continue
+            batch, low, high, segment = self._pending, self._written_sequence + 1, self._sequence, self._segment
+            self._pending = []
+            self._writing = True
+            self._lock.release()
+            try:
+                data = b"".join(frame for frame, _, _ in batch)
+                _write_all(segment, data)
+                if self.fsync:
+                    started = time.perf_counter()
+                    os.fsync(segment.fileno())
+                    self.stats.fsync_seconds.record(time.perf_counter() - started)
+            except BaseException as exc:
+                self._lock.acquire()
+                self._writing = False
+                self._discard(batch, segment)
+                self._failures.update(dict.fromkeys(range(low, high + 1), exc))
+                self._written_sequence = high
+                self._written.notify_all()
+                break
+            self._lock.acquire()
+            self._writing = False
+            for _, session_id, state in batch:
+                if state is None:
+                    self._states.pop(session_id, None)
+                else:
+                    self._states[session_id] = state
+                if self._staged.get(session_id, batch) is state:
+                    del self._staged[session_id]
+            self.stats.add("commits")
+            self.stats.add("log_bytes", len(data))
+            self._segment_size += len(data)
+            self._written_sequence = high
+            self._written.notify_all()
+            if self._segment_size >= self.segment_bytes:
+                self._rotate()
+        failure = self._failures.pop(sequence, None)
+        if failure is not None:
+            raise OSError(f"Journal write failed: {failure}") from failure
+
+    def _discard(self, batch: List[Tuple[bytes, str, Optional[State]]], segment: BinaryIO) -> None:
+        """Forget a batch whose write failed. Caller holds the lock."""
+
+        for _, session_id, state in batch:
+            if self._staged.get(session_id, batch) is state:
+                del self._staged[session_id]
+        try:
+            segment.truncate(self._segment_size)
+            segment.seek(self._segment_size)
+        except OSError:
+            # The segment is unusable; a torn tail is skipped on replay anyway.
+            pass
+
+    def _rotate(self) -> None:
+        """Start a new segment and snapshot every session in the background. Caller holds the lock."""
+
+        while self._writing:
+            self._written.wait()
+        if self._snapshot_thread is not None and self._snapshot_thread.is_alive():
+            return
+        # The snapshot covers what is written; records still queued land in
+        # the new segment and are replayed on top of it.
+        sequence = self._written_sequence
+        states = dict(self._states)
+        previous = self._segment
+        self._segment_path = self.directory / _SEGMENT.format(sequence + 1)
+        self._segment = _open_segment(self._segment_path)
+        self._segment_size = 0
+        self._snapshot_thread = threading.Thread(
+            target=self._write_snapshot, args=(states, sequence, previous), name="vaai-journal-snapshot", daemon=True
+        )
+        self._snapshot_thread.start()
+
+    def _write_snapshot(self, states: Dict[str, State], sequence: int, previous: BinaryIO) -> None:
+        previous.close()
+        path = self.directory / _SNAPSHOT.format(sequence)
+        temporary = path.with_suffix(".tmp")
+        size = 0
+        with open(temporary, "wb") as handle:
+            chunk = [_frame(json.dumps({"snapshot": sequence}).encode("utf-8"))]
+            for session_id, state in states.items():
+                chunk.append(_frame(json.dumps({"s": session_id, "state": state}, separators=(",", ":")).encode()))
+                if len(chunk) >= 1024:
+                    size += handle.write(b"".join(chunk))
+                    chunk = []
+            size += handle.write(b"".join(chunk))
+            handle.flush()
+            if self.fsync:
+                os.fsync(handle.fileno())
+        os.replace(temporary, path)
+        if self.fsync:
+            _fsync_directory(self.directory)
+        for old in self.directory.glob("snapshot-*.snap"):
+            if _sequence_of(old) < sequence:
+                old.unlink()
+        for old in self.directory.glob("journal-*.log"):
+            if _sequence_of(old) <= sequence:
+                old.unlink()
+        self.stats.add("snapshots")
+        self.stats.add("snapshot_bytes", size)
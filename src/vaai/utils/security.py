@@ -1,10 +1,14 @@
 """Security utilities for verification and compliance."""
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
-from typing import Dict
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, TypeVar
 
-from .context import ConversationContext
+if TYPE_CHECKING:
+    from .context import ConversationContext
+
+T = TypeVar("T")
 
 
 @dataclass
@@ -14,6 +18,7 @@ class VerificationResult:
     passed: bool
     method: str
     failure_reason: str | None = None
+    score: float | None = None
 
 
 class VerificationService:
@@ -31,3 +36,215 @@ class VerificationService:
         if otp == "000000" or last4 == "0000":
             return VerificationResult(passed=True, method="demo")
         return VerificationResult(passed=False, method="demo", failure_reason="Invalid credentials provided")
+
+
+# Filler allowed between a keyword and its digits ("CVV is 123", "account no. 12345678").
+# ``\x00`` never matches so joined batches cannot leak context across records.
+_GAP = r"[^\w\x00]{0,3}(?:(?:is|was|number|num|no|code|of)[^\w\x00]{1,3}){0,2}"
+_KEYWORD_BEFORE = re.compile(
+    r"\b(?:(?P<cvv>cvv2?|cvc2?|cid|security\s+code)"
+    r"|(?P<otp>otp|one[- ]time\s+(?:pass)?code|passcode|verification\s+code|pin)"
+    r"|(?P<account>account|acct|a/c))" + _GAP + r"$",
+    re.IGNORECASE,
+)
+# Maximal runs of digits, optionally grouped by single spaces or dashes.
+_DIGIT_RUN = re.compile(r"\d(?:[ \-]?\d)*")
+_DIGIT = re.compile(r"\d")
+_SEPARATORS = re.compile(r"[ \-]")
+_KEYWORD_CONTEXT = 48
+_BATCH_SEPARATOR = "\x00"
+# kind -> (minimum digits, maximum digits, separators allowed)
+_KEYWORD_RULES = {
+    "cvv": (3, 4, False),
+    "otp": (4, 8, False),
+    "account": (6, 17, True),
+}
+
+
+def luhn_valid(digits: str) -> bool:
+    """Return ``True`` if the digit string passes the Luhn checksum."""
+
+    total = 0
+    for index, char in enumerate(reversed(digits)):
+        value = ord(char) - 48
+        if index % 2:
+            value *= 2
+            if value > 9:
+                value -= 9
+        total += value
+    return total % 10 == 0
+
+
+class PCIRedactor:
+    """Single-pass redaction of card numbers, CVVs, OTPs and account numbers.
+
+    Every secret contains digits, so the scanner makes one pass over the text
+    looking only for digit runs (digits optionally grouped by spaces or
+    dashes) and classifies each run where it stands: a run preceded by a
+    CVV/OTP/PIN/account keyword within a few words is redacted by that rule;
+    otherwise 13-19 digit runs, or groups within longer runs, that pass the
+    Luhn check are redacted as card numbers. Text without digits is returned
+    untouched. Keywords are kept so notes stay readable ("CVV [CVV]").
+    """
+
+    def __init__(self, *, keep_pan_last4: bool = True) -> None:
+        self.keep_pan_last4 = keep_pan_last4
+
+    def redact(self, text: str) -> str:
+        if not _DIGIT.search(text):
+            return text
+        return self._redact_range(text, 0, len(text))
+
+    def redact_many(self, texts: Iterable[str]) -> List[str]:
+        """Redact a batch of records with one scan over their concatenation."""
+
+        texts = list(texts)
+        if not texts:
+            return []
+        if any(_BATCH_SEPARATOR in text for text in texts):
+            return [self.redact(text) for text in texts]
+        return self.redact(_BATCH_SEPARATOR.join(texts)).split(_BATCH_SEPARATOR)
+
+    def redact_value(self, value: T) -> T:
+        """Redact strings nested anywhere in dicts, lists and tuples."""
+
+        if isinstance(value, str):
+            return self.redact(value)  # type: ignore[return-value]
+        if isinstance(value, dict):
+            return {key: self.redact_value(item) for key, item in value.items()}  # type: ignore[return-value]
+        if isinstance(value, (list, tuple)):
+            return type(value)(self.redact_value(item) for item in value)  # type: ignore[return-value]
+        return value
+
+    def stream(self) -> "StreamingRedactor":
+        return StreamingRedactor(self)
+
+    def _redact_range(self, text: str, begin: int, end: int) -> str:
+        """Redact ``text[begin:end]``; keywords may be found before ``begin``."""
+
+        parts: List[str] = []
+        last = begin
+        for run in _DIGIT_RUN.finditer(text, begin, end):
+            start, value = run.span()[0], run.group()
+            replacement = None
+            if start and text[start - 1].isalpha() and not value.isdigit():
+                # The first group belongs to a word such as "cvc2"; try the rest on its own.
+                head = _SEPARATORS.search(value).end()
+                tail = self._classify(text, start + head, value[head:])
+                if tail is not None:
+                    replacement = value[:head] + tail
+            if replacement is None:
+                replacement = self._classify(text, start, value)
+            if replacement is not None:
+                parts.append(text[last : run.start()])
+                parts.append(replacement)
+                last = run.end()
+        if not parts:
+            return text[begin:end]
+        parts.append(text[last:end])
+        return "".join(parts)
+
+    def _classify(self, text: str, start: int, value: str) -> Optional[str]:
+        digits = _SEPARATORS.sub("", value) if len(value) > 3 else value
+        count = len(digits)
+        if count < 3:
+            return None
+        keyword = _KEYWORD_BEFORE.search(text, max(0, start - _KEYWORD_CONTEXT), start)
+        if keyword is not None:
+            kind = keyword.lastgroup
+            low, high, grouped = _KEYWORD_RULES[kind]
+            if low <= count <= high and (grouped or count == len(value)):
+                return f"[{kind.upper()}]"
+        if count < 13:
+            return None
+        if count <= 19 and luhn_valid(digits):
+            return self._pan(digits)
+        if count == len(value):
+            return None
+        return self._pan_within(value)
+
+    def _pan(self, digits: str) -> str:
+        return f"[PAN ****{digits[-4:]}]" if self.keep_pan_last4 else "[PAN]"
+
+    def _pan_within(self, value: str) -> Optional[str]:
+        """Redact card numbers among the digit groups of an over-long run.
+
+        Every group that belongs to some Luhn-valid 13-19 digit window is
+        redacted, preferring over-redaction to leaking part of a number.
+        """
+
+        groups = _SEPARATORS.split(value)
+        separators = _SEPARATORS.findall(value) + [""]
+        covered = [False] * len(groups)
+        for start in range(len(groups)):
+            total = 0
+            for stop in range(start, len(groups)):
+                total += len(groups[stop])
+                if total > 19:
+                    break
+                if total >= 13 and luhn_valid("".join(groups[start : stop + 1])):
+                    covered[start : stop + 1] = [True] * (stop + 1 - start)
+        if not any(covered):
+            return None
+        parts: List[str] = []
+        index = 0
+        while index < len(groups):
+            if not covered[index]:
+                parts.append(groups[index] + separators[index])
+                index += 1
+                continue
+            stop = index
+            while stop + 1 < len(groups) and covered[stop + 1]:
+                stop += 1
+            parts.append(self._pan("".join(groups[index : stop + 1])) + separators[stop])
+            index = stop + 1
+        return "".join(parts)
+
+
+class StreamingRedactor:
+    """Incremental redaction of a transcript arriving in chunks.
+
+    :meth:`feed` returns the redacted text up to any trailing digit run, which
+    is held back because it may continue into the next chunk. The last few
+    emitted characters are kept as context so a keyword such as "CVV is" in
+    one chunk still applies to digits arriving in the next. Call :meth:`flush`
+    when the transcript ends.
+    """
+
+    def __init__(self, redactor: PCIRedactor) -> None:
+        self.redactor = redactor
+        self._context = ""
+        self._pending = ""
+
+    def feed(self, chunk: str) -> str:
+        text = self._context + self._pending + chunk
+        begin = len(self._context)
+        hold_from = len(text)
+        while hold_from > begin:
+            char = text[hold_from - 1]
+            if not (char.isdigit() or (char in " -" and text[hold_from - 2 : hold_from - 1].isdigit())):
+                break
+            hold_from -= 1
+        output = self.redactor._redact_range(text, begin, hold_from)
+        self._context = text[max(0, hold_from - _KEYWORD_CONTEXT) : hold_from]
+        self._pending = text[hold_from:]
+        return output
+
+    def flush(self) -> str:
+        text = self._context + self._pending
+        output = self.redactor._redact_range(text, len(self._context), len(text))
+        self._context = self._pending = ""
+        return output
+
+
+DEFAULT_REDACTOR = PCIRedactor()
+
+
+def redact(text: str) -> str:
+    """Redact ``text`` with the default :class:`PCIRedactor`."""
+
+    return DEFAULT_REDACTOR.redact(text)
+
+
+def redact_value(value: T) -> T:
+    return DEFAULT_REDACTOR.redact_value(value)
@@ -0,0 +1,240 @@
+"""Sharded in-memory registry that owns live conversation contexts."""
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Iterator, List, Optional, Tuple
+
+from .context import ConversationContext
+
+EvictionHook = Callable[[str, ConversationContext, str], None]
+"""Called as ``hook(session_id, context, reason)`` after a session is evicted.
+
+``reason`` is one of ``"idle"``, ``"capacity"`` or ``"expired"``.
+"""
+
+
+def default_hooks() -> List[EvictionHook]:
+    return []
+
+
+class _Shard:
+    """One lock plus an activity-ordered map; least recently active first."""
+
+    __slots__ = ("lock", "entries")
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        # Values are ``[context, last_active]`` lists so activity updates in place.
+        self.entries: "OrderedDict[str, List]" = OrderedDict()
+
+
+@dataclass
+class SessionRegistry:
+    """Owns live :class:`ConversationContext` objects keyed by session id.
+
+    Sessions are spread over ``shards`` independently locked maps so turns for
+    different calls do not contend. Each shard keeps entries ordered by last
+    activity, which makes get/put O(1) and lets idle and capacity eviction pop
+    from the cold end without scanning. ``max_sessions`` bounds the total
+    across shards: once a new session takes the registry over the bound, the
+    least recently active session of the same shard is evicted (or of another
+    shard, if that one holds only the new session), so uneven hashing never
+    evicts early.
+
+    Idle eviction happens lazily on access and in :meth:`evict_idle`, which the
+    channel adapter should call periodically. ``max_session_age`` additionally
+    expires sessions by ``ConversationContext.started_at`` when they are next
+    accessed. Hooks run after the shard lock is released, so they may safely
+    call back into the registry.
+    """
+
+    max_sessions: int = 50_000
+    idle_timeout: float = 900.0
+    max_session_age: Optional[float] = None
+    shards: int = 64
+    clock: Callable[[], float] = time.monotonic
+    hooks: List[EvictionHook] = field(default_factory=default_hooks)
+
+    def __post_init__(self) -> None:
+        if self.shards < 1 or self.max_sessions < 1:
+            raise ValueError("shards and max_sessions must be positive")
+        self._shards = [_Shard() for _ in range(self.shards)]
+        self._size = 0
+        self._size_lock = threading.Lock()
+        self._next_victim = 0
+
+    def add_eviction_hook(self, hook: EvictionHook) -> None:
+        self.hooks.append(hook)
+
+    def get(self, session_id: str) -> Optional[ConversationContext]:
+        """Return the live context for ``session_id`` and mark it active."""
+
+        shard = self._shard_for(session_id)
+        now = self.clock()
+        with shard.lock:
+            entry = shard.entries.get(session_id)
+            if entry is None:
+                return None
+            if now - entry[1] <= self.idle_timeout and self.max_session_age is None:
+                reason = None
+            else:
+                reason = self._expiry_reason(entry, now)
+            if reason is None:
+                entry[1] = now
+                shard.entries.move_to_end(session_id)
+                return entry[0]
+            del shard.entries[session_id]
+        self._resize(-1)
+        self._fire([(session_id, entry[0], reason)])
+        return None
+
+    def put(self, session_id: str, context: ConversationContext) -> None:
+        """Register or replace the context for ``session_id``."""
+
+        shard = self._shard_for(session_id)
+        now = self.clock()
+        evicted: List[Tuple[str, ConversationContext, str]] = []
+        with shard.lock:
+            entry = shard.entries.get(session_id)
+            if entry is None:
+                shard.entries[session_id] = [context, now]
+            else:
+                entry[0], entry[1] = context, now
+                shard.entries.move_to_end(session_id)
+            self._trim(shard, now, evicted)
+        if entry is None:
+            self._resize(1)
+            self._make_room(shard, evicted)
+        self._fire(evicted)
+
+    def get_or_create(self, session_id: str, factory: Callable[[], ConversationContext]) -> ConversationContext:
+        """Return the live context, creating it with ``factory`` if absent."""
+
+        context = self.get(session_id)
+        if context is not None:
+            return context
+        shard = self._shard_for(session_id)
+        now = self.clock()
+        evicted: List[Tuple[str, ConversationContext, str]] = []
+        with shard.lock:
+            entry = shard.entries.get(session_id)
+            if entry is None:
+                context = factory()
+                shard.entries[session_id] = [context, now]
+            else:
+                context, entry[1] = entry[0], now
+                shard.entries.move_to_end(session_id)
+            self._trim(shard, now, evicted)
+        if entry is None:
+            self._resize(1)
+            self._make_room(shard, evicted)
+        self._fire(evicted)
+        return context
+
+    def touch(self, session_id: str) -> bool:
+        """Record activity on ``session_id`` without returning it."""
+
+        return self.get(session_id) is not None
+
+    def remove(self, session_id: str) -> Optional[ConversationContext]:
+        """Drop a session that ended normally. Eviction hooks are not fired."""
+
+        shard = self._shard_for(session_id)
+        with shard.lock:
+            entry = shard.entries.pop(session_id, None)
+        if entry is None:
+            return None
+        self._resize(-1)
+        return entry[0]
+
+    def evict_idle(self) -> int:
+        """Evict every session idle for longer than ``idle_timeout``."""
+
+        now = self.clock()
+        count = 0
+        for shard in self._shards:
+            evicted: List[Tuple[str, ConversationContext, str]] = []
+            with shard.lock:
+                self._trim(shard, now, evicted)
+            count += len(evicted)
+            self._fire(evicted)
+        return count
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, session_id: object) -> bool:
+        return isinstance(session_id, str) and session_id in self._shard_for(session_id).entries
+
+    def __iter__(self) -> Iterator[str]:
+        for shard in self._shards:
+            with shard.lock:
+                keys = list(shard.entries)
+            yield from keys
+
+    def _shard_for(self, session_id: str) -> _Shard:
+        return self._shards[hash(session_id) % self.shards]
+
+    def _expiry_reason(self, entry: List, now: float) -> Optional[str]:
+        if now - entry[1] > self.idle_timeout:
+            return "idle"
+        if self.max_session_age is not None:
+            age = (datetime.utcnow() - entry[0].started_at).total_seconds()
+            if age > self.max_session_age:
+                return "expired"
+        return None
+
+    def _resize(self, delta: int) -> None:
+        with self._size_lock:
+            self._size += delta
+
+    def _trim(self, shard: _Shard, now: float, evicted: List[Tuple[str, ConversationContext, str]]) -> None:
+        """Evict the shard's idle sessions. Caller holds the shard lock."""
+
+        entries = shard.entries
+        removed = 0
+        while entries:
+            session_id, (context, last_active) = next(iter(entries.items()))
+            if now - last_active <= self.idle_timeout:
+                break
+            del entries[session_id]
+            evicted.append((session_id, context, "idle"))
+            removed += 1
+        if removed:
+            self._resize(-removed)
+
+    def _make_room(self, shard: _Shard, evicted: List[Tuple[str, ConversationContext, str]]) -> None:
+        """Evict least recently active sessions while the registry is over ``max_sessions``."""
+
+        while self._size > self.max_sessions:
+            # The shard that just grew keeps its newest session; others may be emptied.
+            if self._evict_oldest(shard, keep=1, evicted=evicted):
+                continue
+            for _ in range(self.shards):
+                self._next_victim = (self._next_victim + 1) % self.shards
+                if self._evict_oldest(self._shards[self._next_victim], keep=0, evicted=evicted):
+                    break
+            else:
+                return
+
+    def _evict_oldest(self, shard: _Shard, keep: int, evicted: List[Tuple[str, ConversationContext, str]]) -> bool:
+        with shard.lock:
+            if len(shard.entries) <= keep:
+                return False
+            with self._size_lock:
+                if self._size <= self.max_sessions:
+                    # Another thread already made room.
+                    return True
+                self._size -= 1
+            session_id, (context, _) = shard.entries.popitem(last=False)
+        evicted.append((session_id, context, "capacity"))
+        return True
+
+    def _fire(self, evicted: List[Tuple[str, ConversationContext, str]]) -> None:
+        for session_id, context, reason in evicted:
+            for hook in self.hooks:
+                hook(session_id, context, reason)
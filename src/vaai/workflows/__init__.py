@@ -1,5 +1,52 @@
 """Workflow utilities for VAai."""
-from .escalation import EscalationTicket, escalate_to_human
-from .router import WorkflowRouter
+from __future__ import annotations
 
-__all__ = ["EscalationTicket", "WorkflowRouter", "escalate_to_human"]
+from typing import TYPE_CHECKING
+
+from ..utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .dispatcher import DispatchStats, EscalationDispatcher, InMemoryTicketSink, TicketSink
+    from .escalation import CaseIdGenerator, EscalationRequired, EscalationTicket, escalate_to_human
+    from .prefetch import PrefetchBuffer, Prefetcher, PrefetchStats
+    from .router import IntentFallback, IntentPrediction, RoutingStats, UtteranceClassifier, WorkflowRouter
+
+_EXPORTS = {
+    "CaseIdGenerator": ".escalation",
+    "DispatchStats": ".dispatcher",
+    "EscalationDispatcher": ".dispatcher",
+    "EscalationRequired": ".escalation",
+    "EscalationTicket": ".escalation",
+    "InMemoryTicketSink": ".dispatcher",
+    "IntentFallback": ".router",
+    "IntentPrediction": ".router",
+    "PrefetchBuffer": ".prefetch",
+    "PrefetchStats": ".prefetch",
+    "Prefetcher": ".prefetch",
+    "RoutingStats": ".router",
+    "TicketSink": ".dispatcher",
+    "UtteranceClassifier": ".router",
+    "WorkflowRouter": ".router",
+    "escalate_to_human": ".escalation",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+__all__ = [
+    "CaseIdGenerator",
+    "DispatchStats",
+    "EscalationDispatcher",
+    "EscalationRequired",
+    "EscalationTicket",
+    "InMemoryTicketSink",
+    "IntentFallback",
+    "IntentPrediction",
+    "PrefetchBuffer",
+    "PrefetchStats",
+    "Prefetcher",
+    "RoutingStats",
+    "TicketSink",
+    "UtteranceClassifier",
+    "WorkflowRouter",
+    "escalate_to_human",
+]
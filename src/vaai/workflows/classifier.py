@@ -0,0 +1,138 @@
+"""Hashed n-gram nearest-centroid utterance classifier.
+
+Requires NumPy, which the rest of the package does not; import this module
+only where local intent classification is enabled.
+"""
+from __future__ import annotations
+
+import re
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple, Union
+
+import numpy as np
+
+from .router import IntentPrediction
+
+DEFAULT_DIMS = 1 << 16
+_TOKEN = re.compile(r"[a-z0-9']+")
+
+
+def _hashed_features(utterance: str, dims: int) -> Dict[int, float]:
+    """Word unigrams, word bigrams and in-word character trigrams, hashed into ``dims`` buckets."""
+
+    tokens = _TOKEN.findall(utterance.lower())
+    counts: Dict[int, float] = {}
+    mask = dims - 1
+    crc32 = zlib.crc32
+    previous = "^"
+    for token in tokens:
+        for feature in (f"w:{token}", f"b:{previous} {token}"):
+            bucket = crc32(feature.encode()) & mask
+            counts[bucket] = counts.get(bucket, 0.0) + 1.0
+        padded = f"<{token}>"
+        for start in range(len(padded) - 2):
+            bucket = crc32(padded[start : start + 3].encode()) & mask
+            counts[bucket] = counts.get(bucket, 0.0) + 0.5
+        previous = token
+    return counts
+
+
+def _vectorize(utterances: Sequence[str], dims: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """L2-normalised sparse rows as ``(indices, values, row_lengths)``."""
+
+    indices: List[int] = []
+    values: List[float] = []
+    lengths = np.zeros(len(utterances), dtype=np.int64)
+    for row, utterance in enumerate(utterances):
+        counts = _hashed_features(utterance, dims)
+        norm = sum(value * value for value in counts.values()) ** 0.5 or 1.0
+        indices.extend(counts)
+        values.extend(value / norm for value in counts.values())
+        lengths[row] = len(counts)
+    return np.asarray(indices, dtype=np.int64), np.asarray(values, dtype=np.float32), lengths
+
+
+def _softmax(scores: np.ndarray) -> np.ndarray:
+    scores = scores - scores.max(axis=1, keepdims=True)
+    np.exp(scores, out=scores)
+    scores /= scores.sum(axis=1, keepdims=True)
+    return scores
+
+
+@dataclass
+class NearestCentroidClassifier:
+    """Cosine nearest-centroid model over hashed n-gram features.
+
+    ``weights`` has one row per hash bucket and one column per intent, so
+    scoring a batch gathers only the rows its features touch. Confidence is
+    the softmax probability of the best intent with scores scaled by
+    ``temperature``. Models are saved as a single uncompressed ``.npz`` of
+    ``float16`` weights (128 KiB per intent at the default 65,536 buckets).
+    """
+
+    labels: List[str]
+    weights: np.ndarray
+    temperature: float = 20.0
+
+    @property
+    def dims(self) -> int:
+        return self.weights.shape[0]
+
+    @classmethod
+    def train(
+        cls,
+        utterances: Sequence[str],
+        intents: Sequence[str],
+        *,
+        dims: int = DEFAULT_DIMS,
+        temperature: float = 20.0,
+    ) -> "NearestCentroidClassifier":
+        if dims & (dims - 1):
+            raise ValueError("dims must be a power of two")
+        if len(utterances) != len(intents) or not utterances:
+            raise ValueError("need one intent label per utterance")
+        labels = sorted(set(intents))
+        column = {label: index for index, label in enumerate(labels)}
+        indices, values, lengths = _vectorize(utterances, dims)
+        columns = np.repeat(np.fromiter((column[intent] for intent in intents), dtype=np.int64), lengths)
+        weights = np.zeros((dims, len(labels)), dtype=np.float32)
+        np.add.at(weights, (indices, columns), values)
+        weights /= np.maximum(np.linalg.norm(weights, axis=0, keepdims=True), 1e-12)
+        return cls(labels=labels, weights=weights.astype(np.float16), temperature=temperature)
+
+    def predict(self, utterances: Sequence[str]) -> List[IntentPrediction]:
+        probabilities = self.predict_proba(utterances)
+        best = probabilities.argmax(axis=1)
+        return [
+            IntentPrediction(intent=self.labels[column], confidence=float(probabilities[row, column]))
+            for row, column in enumerate(best)
+        ]
+
+    def predict_proba(self, utterances: Sequence[str]) -> np.ndarray:
+        """Probability per (utterance, intent); rows follow ``labels`` order."""
+
+        indices, values, lengths = _vectorize(utterances, self.dims)
+        contributions = self.weights[indices].astype(np.float32) * values[:, None]
+        rows = np.repeat(np.arange(len(utterances)), lengths)
+        scores = np.zeros((len(utterances), len(self.labels)), dtype=np.float32)
+        np.add.at(scores, rows, contributions)
+        return _softmax(scores * self.temperature)
+
+    def save(self, path: Union[str, Path]) -> None:
+        np.savez(
+            path,
+            weights=self.weights,
+            labels=np.asarray(self.labels),
+            temperature=np.asarray(self.temperature),
+        )
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "NearestCentroidClassifier":
+        with np.load(path, allow_pickle=False) as data:
+            return cls(
+                labels=[str(label) for label in data["labels"]],
+                weights=data["weights"],
+                temperature=float(data["temperature"]),
+            )
@@ -0,0 +1,337 @@
+"""Skill-based priority queues and batched hand-off of escalation tickets."""
+from __future__ import annotations
+
+import heapq
+import itertools
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional, Protocol, Sequence, Tuple
+
+from ..monitoring.metrics import LatencyHistogram
+from .escalation import EscalationTicket
+
+URGENCY_LEVELS = ("critical", "high", "medium", "low")
+DEFAULT_SKILL = "general"
+DEFAULT_SKILLS: Dict[str, str] = {
+    "freeze_card": "card_security",
+    "freeze_all_cards": "card_security",
+    "activate_card": "card_services",
+    "verify_client": "identity",
+}
+
+
+class TicketSink(Protocol):
+    """Ticketing system that receives escalations for human agents."""
+
+    def submit_batch(self, tickets: Sequence[EscalationTicket]) -> None:
+        """Create ``tickets`` downstream; raise to signal a failed batch."""
+
+    def close(self) -> None:
+        """Release any resources held by the sink."""
+
+
+def default_ticket_batches() -> List[List[EscalationTicket]]:
+    return []
+
+
+@dataclass
+class InMemoryTicketSink:
+    """Keeps handed-off batches in memory; stands in for the ticketing system locally."""
+
+    batches: List[List[EscalationTicket]] = field(default_factory=default_ticket_batches)
+
+    def submit_batch(self, tickets: Sequence[EscalationTicket]) -> None:
+        self.batches.append(list(tickets))
+
+    def close(self) -> None:
+        pass
+
+    @property
+    def tickets(self) -> List[EscalationTicket]:
+        return [ticket for batch in self.batches for ticket in batch]
+
+
+def default_wait_histograms() -> Dict[str, LatencyHistogram]:
+    return {urgency: LatencyHistogram() for urgency in URGENCY_LEVELS}
+
+
+@dataclass
+class DispatchStats:
+    """Counters and per-urgency queue wait times for the dispatcher."""
+
+    submitted: int = 0
+    deduplicated: int = 0
+    reprioritised: int = 0
+    handed_off: int = 0
+    claimed: int = 0
+    cancelled: int = 0
+    failed_batches: int = 0
+    waits: Dict[str, LatencyHistogram] = field(default_factory=default_wait_histograms)
+
+    def __post_init__(self) -> None:
+        self._lock = threading.Lock()
+
+    def add(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + amount)
+
+    def record_wait(self, urgency: str, seconds: float) -> None:
+        histogram = self.waits.get(urgency)
+        if histogram is None:
+            with self._lock:
+                histogram = self.waits.setdefault(urgency, LatencyHistogram())
+        histogram.record(seconds)
+
+    def to_json(self) -> Dict[str, object]:
+        return {
+            "submitted": self.submitted,
+            "deduplicated": self.deduplicated,
+            "reprioritised": self.reprioritised,
+            "handedOff": self.handed_off,
+            "claimed": self.claimed,
+            "cancelled": self.cancelled,
+            "failedBatches": self.failed_batches,
+            "waitSeconds": {urgency: histogram.to_json() for urgency, histogram in self.waits.items()},
+        }
+
+
+class _Entry:
+    __slots__ = ("ticket", "skill", "rank", "sequence", "enqueued_at", "live")
+
+    def __init__(self, ticket: EscalationTicket, skill: str, rank: int, sequence: int, enqueued_at: float) -> None:
+        self.ticket = ticket
+        self.skill = skill
+        self.rank = rank
+        self.sequence = sequence
+        self.enqueued_at = enqueued_at
+        self.live = True
+
+
+def _urgency_rank(urgency: str) -> int:
+    try:
+        return URGENCY_LEVELS.index(urgency)
+    except ValueError:
+        return len(URGENCY_LEVELS)
+
+
+def skill_for_issue(ticket: EscalationTicket) -> str:
+    return DEFAULT_SKILLS.get(ticket.issue_type, DEFAULT_SKILL)
+
+
+class EscalationDispatcher:
+    """Queues escalation tickets by skill and urgency and hands them off in batches.
+
+    Each skill has a binary heap ordered by urgency (``URGENCY_LEVELS``) and
+    then arrival, so submit and pop are O(log n). A case has at most one
+    queued ticket: resubmitting it is dropped as a duplicate unless the new
+    ticket is more urgent, in which case it replaces the queued one and keeps
+    the original arrival time. Superseded and cancelled entries are left in the
+    heap and skipped when popped.
+
+    :meth:`hand_off` sends up to ``batch_size`` tickets per skill per batch to
+    ``sink``; a failed batch is requeued. :meth:`start` runs hand-offs on a
+    background thread every ``flush_interval`` seconds, or sooner once
+    ``batch_size`` tickets are waiting. Human desks can instead pull single
+    tickets with :meth:`claim`.
+    """
+
+    def __init__(
+        self,
+        sink: TicketSink,
+        *,
+        batch_size: int = 100,
+        flush_interval: float = 0.5,
+        skill_for: Callable[[EscalationTicket], str] = skill_for_issue,
+        stats: Optional[DispatchStats] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.sink = sink
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.skill_for = skill_for
+        self.stats = stats if stats is not None else DispatchStats()
+        self.clock = clock
+        self._queues: Dict[str, List[Tuple[int, int, _Entry]]] = {}
+        self._active: Dict[str, _Entry] = {}
+        self._depth: Dict[Tuple[str, int], int] = {}
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def __len__(self) -> int:
+        return len(self._active)
+
+    def submit(self, ticket: EscalationTicket) -> bool:
+        """Queue ``ticket``; returns ``False`` if its case was already queued at equal or higher urgency."""
+
+        skill = self.skill_for(ticket)
+        rank = _urgency_rank(ticket.urgency)
+        with self._lock:
+            queued = self._enqueue(ticket, skill, rank)
+        self.stats.add("submitted")
+        return queued
+
+    def submit_many(self, tickets: Iterable[EscalationTicket]) -> int:
+        """Queue several tickets under one lock acquisition; returns how many were queued."""
+
+        prepared = [(ticket, self.skill_for(ticket), _urgency_rank(ticket.urgency)) for ticket in tickets]
+        with self._lock:
+            queued = sum(self._enqueue(ticket, skill, rank) for ticket, skill, rank in prepared)
+        self.stats.add("submitted", len(prepared))
+        return queued
+
+    def cancel(self, case_id: str) -> bool:
+        with self._lock:
+            entry = self._active.pop(case_id, None)
+            if entry is None:
+                return False
+            self._retire(entry)
+        self.stats.add("cancelled")
+        return True
+
+    def claim(self, skill: str) -> Optional[EscalationTicket]:
+        """Pop the most urgent ticket waiting for ``skill``, if any."""
+
+        with self._lock:
+            entries = self._pop(skill, 1)
+        if not entries:
+            return None
+        self._record_waits(entries)
+        self.stats.add("claimed")
+        return entries[0].ticket
+
+    def hand_off(self, limit: Optional[int] = None) -> int:
+        """Send queued tickets to ``sink`` in per-skill batches; returns how many were accepted."""
+
+        sent = 0
+        while limit is None or sent < limit:
+            progressed = False
+            for skill in list(self._queues):
+                size = self.batch_size if limit is None else min(self.batch_size, limit - sent)
+                if size <= 0:
+                    break
+                with self._lock:
+                    entries = self._pop(skill, size)
+                if not entries:
+                    continue
+                progressed = True
+                try:
+                    self.sink.submit_batch([entry.ticket for entry in entries])
+                except Exception:  # noqa: BLE001
+                    self.stats.add("failed_batches")
+                    with self._lock:
+                        self._requeue(entries)
+                    return sent
+                self._record_waits(entries)
+                self.stats.add("handed_off", len(entries))
+                sent += len(entries)
+            if not progressed:
+                break
+        return sent
+
+    def depth(self) -> Dict[str, Dict[str, int]]:
+        """Queued tickets per skill and urgency."""
+
+        with self._lock:
+            report: Dict[str, Dict[str, int]] = {}
+            for (skill, rank), count in self._depth.items():
+                if count:
+                    urgency = URGENCY_LEVELS[rank] if rank < len(URGENCY_LEVELS) else "unknown"
+                    report.setdefault(skill, {})[urgency] = count
+            return report
+
+    def oldest_wait(self) -> Dict[str, float]:
+        """Seconds the longest-waiting ticket per skill has been queued."""
+
+        now = self.clock()
+        with self._lock:
+            oldest: Dict[str, float] = {}
+            for entry in self._active.values():
+                oldest[entry.skill] = max(oldest.get(entry.skill, 0.0), now - entry.enqueued_at)
+            return oldest
+
+    def to_json(self) -> Dict[str, object]:
+        return {"depth": self.depth(), "oldestWaitSeconds": self.oldest_wait(), "stats": self.stats.to_json()}
+
+    def start(self) -> "EscalationDispatcher":
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="vaai-escalation-dispatcher", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the background thread after handing off everything still queued."""
+
+        self._stop.set()
+        self._ready.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        self.hand_off()
+        self.sink.close()
+
+    def __enter__(self) -> "EscalationDispatcher":
+        return self.start()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._ready.wait(self.flush_interval)
+            self._ready.clear()
+            self.hand_off()
+
+    def _enqueue(self, ticket: EscalationTicket, skill: str, rank: int) -> bool:
+        existing = self._active.get(ticket.case_id)
+        enqueued_at = self.clock()
+        if existing is not None:
+            if rank >= existing.rank:
+                self.stats.add("deduplicated")
+                return False
+            self._retire(existing)
+            enqueued_at = existing.enqueued_at
+            self.stats.add("reprioritised")
+        entry = _Entry(ticket, skill, rank, next(self._sequence), enqueued_at)
+        self._push(entry)
+        if len(self._active) >= self.batch_size:
+            self._ready.set()
+        return True
+
+    def _push(self, entry: _Entry) -> None:
+        self._active[entry.ticket.case_id] = entry
+        heapq.heappush(self._queues.setdefault(entry.skill, []), (entry.rank, entry.sequence, entry))
+        key = (entry.skill, entry.rank)
+        self._depth[key] = self._depth.get(key, 0) + 1
+
+    def _retire(self, entry: _Entry) -> None:
+        entry.live = False
+        self._depth[(entry.skill, entry.rank)] -= 1
+
+    def _pop(self, skill: str, count: int) -> List[_Entry]:
+        queue = self._queues.get(skill)
+        entries: List[_Entry] = []
+        while queue and len(entries) < count:
+            _, _, entry = heapq.heappop(queue)
+            if not entry.live:
+                continue
+            self._retire(entry)
+            del self._active[entry.ticket.case_id]
+            entries.append(entry)
+        return entries
+
+    def _requeue(self, entries: List[_Entry]) -> None:
+        for entry in entries:
+            if entry.ticket.case_id in self._active:
+                continue  # A newer ticket for the case arrived meanwhile.
+            entry.live = True
+            self._push(entry)
+
+    def _record_waits(self, entries: List[_Entry]) -> None:
+        now = self.clock()
+        for entry in entries:
+            self.stats.record_wait(entry.ticket.urgency, now - entry.enqueued_at)
@@ -1,18 +1,52 @@
 """Utilities for escalating cases to human agents."""
 from __future__ import annotations
 
+import itertools
+import secrets
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict
+from typing import TYPE_CHECKING, Dict, Optional
 
 from ..intents.base import IntentResponse, ResponseType
 from ..monitoring.observability import ObservabilityContext
 from ..utils.context import ConversationContext
+from ..utils.security import redact_value
+
+if TYPE_CHECKING:
+    from ..utils.audit import AuditLog
+    from .dispatcher import EscalationDispatcher
+
+
+class CaseIdGenerator:
+    """Collision-free case ids: ``CASE-<start time>-<random node>-<sequence>``.
+
+    The prefix is fixed per generator (one per process by default), so ids only
+    need a counter increment and stay unique at any issuance rate.
+    """
+
+    def __init__(self, node: Optional[str] = None) -> None:
+        node = node or secrets.token_hex(3).upper()
+        self.prefix = f"CASE-{datetime.utcnow().strftime('%Y%m%d%H%M%S')}-{node}"
+        self._sequence = itertools.count(1)
+
+    def __call__(self) -> str:
+        # ``next`` on itertools.count is atomic under the GIL.
+        return f"{self.prefix}-{next(self._sequence):06d}"
+
+
+new_case_id = CaseIdGenerator()
+
+
+class EscalationRequired(Exception):
+    """Raised when a request must be escalated to a human agent."""
 
 
 @dataclass
 class EscalationTicket:
-    """Structured payload for handing off to human agents."""
+    """Structured payload for handing off to human agents.
+
+    ``metadata`` values are PCI-redacted on construction.
+    """
 
     client_id: str
     case_id: str
@@ -21,6 +55,9 @@ class EscalationTicket:
     created_at: datetime
     metadata: Dict[str, str]
 
+    def __post_init__(self) -> None:
+        self.metadata = redact_value(self.metadata)
+
     def to_json(self) -> Dict[str, object]:
         return {
             "clientId": self.client_id,
@@ -39,20 +76,39 @@ def escalate_to_human(
     reason: str | None,
     observability: ObservabilityContext,
     urgency: str = "high",
+    dispatcher: Optional[EscalationDispatcher] = None,
+    audit: Optional[AuditLog] = None,
 ) -> IntentResponse:
-    """Build an escalation response and ticket payload."""
-
-    context.case_id = context.case_id or f"CASE-{datetime.utcnow().strftime('%Y%m%d%H%M%S')}"
-    context.add_note(f"Escalated intent {intent}: {reason}")
-
-    ticket = EscalationTicket(
-        client_id=context.client_id,
-        case_id=context.case_id,
-        issue_type=intent,
-        urgency=urgency,
-        created_at=datetime.utcnow(),
-        metadata={"reason": reason or "unspecified", "trace_id": observability.trace_id},
-    )
+    """Build an escalation response and ticket payload.
+
+    When ``dispatcher`` is given the ticket is also queued for hand-off; with
+    ``audit`` the escalation is durably recorded first.
+    """
+
+    with observability.span("escalation"):
+        context.case_id = context.case_id or new_case_id()
+        context.add_note(f"Escalated intent {intent}: {reason}")
+
+        ticket = EscalationTicket(
+            client_id=context.client_id,
+            case_id=context.case_id,
+            issue_type=intent,
+            urgency=urgency,
+            created_at=datetime.utcnow(),
+            metadata={"reason": reason or "unspecified", "trace_id": observability.trace_id},
+        )
+        if audit is not None:
+            from ..utils.audit import ESCALATION
+
+            with observability.span("audit_log.append"):
+                audit.append(
+                    ESCALATION,
+                    context=context,
+                    details={"intent": intent, "reason": reason, "urgency": urgency},
+                    trace_id=observability.trace_id,
+                )
+        if dispatcher is not None:
+            dispatcher.submit(ticket)
 
     return IntentResponse(
         message="I'll bring a specialist to assist you further. Please stay on the line while I connect you.",
@@ -0,0 +1,335 @@
+"""Speculative, verification-gated prefetch of card and transaction data."""
+from __future__ import annotations
+
+import asyncio
+import inspect
+import threading
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, Optional, Sequence, Set, Tuple, Union
+
+from ..integrations.card_api import AsyncCardManagementAPI, CardManagementAPI, CardStatus
+from ..integrations.transaction_api import AsyncTransactionAPI, Transaction, TransactionAPI, TransactionBatch
+from ..utils.context import ConversationContext
+
+PENDING = "pending"
+RELEASED = "released"
+DISCARDED = "discarded"
+
+
+@dataclass
+class PrefetchStats:
+    """Counters for judging whether prefetching pays for itself.
+
+    ``hits`` counts prefetched results a handler used at least once, so it
+    never exceeds ``issued``; ``misses`` counts lookups that fell through to
+    the backend, and ``wasted`` prefetches that were never used.
+    """
+
+    issued: int = 0
+    hits: int = 0
+    misses: int = 0
+    wasted: int = 0
+    discarded_sessions: int = 0
+
+    def __post_init__(self) -> None:
+        self._lock = threading.Lock()
+
+    def add(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + amount)
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of issued prefetches that a handler used."""
+
+        return self.hits / self.issued if self.issued else 0.0
+
+    def to_json(self) -> Dict[str, object]:
+        return {
+            "issued": self.issued,
+            "hits": self.hits,
+            "misses": self.misses,
+            "wasted": self.wasted,
+            "discardedSessions": self.discarded_sessions,
+            "hitRate": round(self.hit_rate, 4),
+        }
+
+
+class PrefetchBuffer:
+    """Per-turn holder for in-flight and completed prefetches.
+
+    Results are invisible until :meth:`release` is called after the caller
+    passes verification. :meth:`discard` drops everything (cancelling fetches
+    that have not started) when verification fails, and :meth:`invalidate`
+    drops one card's results after an action changed it.
+    """
+
+    def __init__(self, stats: PrefetchStats, wait_timeout: float, transaction_limit: int) -> None:
+        self.state = PENDING
+        self.stats = stats
+        self.wait_timeout = wait_timeout
+        self.transaction_limit = transaction_limit
+        self._entries: Dict[Hashable, Future] = {}
+        self._consumed: Set[Hashable] = set()
+        self.carried = False
+
+    def add(self, key: Hashable, future: Future) -> None:
+        self._entries[key] = future
+
+    def release(self) -> None:
+        if self.state == PENDING:
+            self.state = RELEASED
+
+    def discard(self) -> None:
+        if self.state == DISCARDED:
+            return
+        self.state = DISCARDED
+        for future in self._entries.values():
+            future.cancel()
+        self.stats.add("wasted", len(self._entries))
+        self.stats.add("discarded_sessions")
+        self._entries.clear()
+
+    def invalidate(self, card_id: Optional[str]) -> None:
+        """Drop the results for ``card_id`` so later lookups go to the backend."""
+
+        for key in [key for key in self._entries if key[1] == card_id]:
+            if key not in self._consumed:
+                self._entries[key].cancel()
+                self.stats.add("wasted")
+            del self._entries[key]
+
+    def close(self) -> None:
+        """Account for prefetches the session never used."""
+
+        if self.state != DISCARDED:
+            for key, future in self._entries.items():
+                if key not in self._consumed:
+                    future.cancel()
+                    self.stats.add("wasted")
+            self.state = DISCARDED
+            self._entries.clear()
+
+    def get(self, key: Hashable, select: Optional[Callable[[Any], Any]] = None) -> Optional[Any]:
+        """Return the prefetched value for ``key``, waiting for it if still in flight.
+
+        ``select`` narrows the value (e.g. one transaction out of a list); a
+        ``None`` selection, a failed fetch, or a timeout all count as misses.
+        """
+
+        future = self._usable(key)
+        if future is None:
+            return None
+        try:
+            value = future.result(timeout=self.wait_timeout)
+        except Exception:  # noqa: BLE001
+            return self._miss()
+        return self._hit(key, value, select)
+
+    async def get_async(self, key: Hashable, select: Optional[Callable[[Any], Any]] = None) -> Optional[Any]:
+        """Asyncio counterpart of :meth:`get` that does not block the loop."""
+
+        future = self._usable(key)
+        if future is None:
+            return None
+        try:
+            value = await asyncio.wait_for(asyncio.wrap_future(future), self.wait_timeout)
+        except Exception:  # noqa: BLE001
+            return self._miss()
+        return self._hit(key, value, select)
+
+    def _usable(self, key: Hashable) -> Optional[Future]:
+        if self.state != RELEASED:
+            return None
+        future = self._entries.get(key)
+        if future is None:
+            self._miss()
+        return future
+
+    def _hit(self, key: Hashable, value: Any, select: Optional[Callable[[Any], Any]]) -> Optional[Any]:
+        if select is not None:
+            value = select(value)
+        if value is None:
+            return self._miss()
+        if key not in self._consumed:
+            self._consumed.add(key)
+            self.stats.add("hits")
+        return value
+
+    def _miss(self) -> None:
+        self.stats.add("misses")
+        return None
+
+
+def _submit(executor: Executor, func: Callable[..., Any], **kwargs: Any) -> Future:
+    if inspect.iscoroutinefunction(func):
+        # Async clients run on the caller's event loop rather than a worker thread.
+        return asyncio.run_coroutine_threadsafe(func(**kwargs), asyncio.get_running_loop())
+    return executor.submit(func, **kwargs)
+
+
+def _default_executor() -> Executor:
+    return ThreadPoolExecutor(max_workers=64, thread_name_prefix="vaai-prefetch")
+
+
+@dataclass
+class Prefetcher:
+    """Starts background fetches for a session as soon as its card is known.
+
+    ``VAaiAgent`` calls :meth:`start` at the beginning of each turn; while the
+    caller is unverified and the context has an ``active_card_id``, the recent
+    transactions and card status are requested as verification proceeds: on ``executor``
+    for synchronous clients, or on the running event loop for asyncio ones.
+    The agent calls :meth:`settle` to release or discard the buffer and
+    :meth:`finish_turn` when the turn ends. Handlers read through
+    :func:`prefetched_transactions`, :func:`prefetched_transaction` and
+    :func:`prefetched_card_status`.
+
+    A buffer serves a single turn: the one in which it is released, or the
+    next one when verification completes at the end of a turn. It is closed
+    after that turn, so later turns never read data from earlier in the call.
+    """
+
+    transaction_api: Union[TransactionAPI, AsyncTransactionAPI]
+    card_api: Optional[Union[CardManagementAPI, AsyncCardManagementAPI]] = None
+    transaction_limit: int = 10
+    wait_timeout: float = 1.0
+    executor: Executor = field(default_factory=_default_executor)
+    stats: PrefetchStats = field(default_factory=PrefetchStats)
+
+    def start(self, context: ConversationContext) -> Optional[PrefetchBuffer]:
+        buffer = context.prefetch_buffer
+        if buffer is not None:
+            if buffer.state == PENDING or buffer.carried:
+                buffer.carried = False
+                if context.is_verified:
+                    buffer.release()
+                return buffer
+            # Discarded, or left released by a turn that ended in an escalation or error.
+            self.close_session(context)
+        if not context.active_card_id or context.is_verified:
+            # Once verified there is no verification latency left to hide.
+            return None
+
+        card_id = context.active_card_id
+        buffer = PrefetchBuffer(self.stats, self.wait_timeout, self.transaction_limit)
+        buffer.add(
+            ("transactions", card_id),
+            _submit(self.executor, self.transaction_api.list_recent, card_id=card_id, limit=self.transaction_limit),
+        )
+        self.stats.add("issued")
+        if self.card_api is not None:
+            buffer.add(("card_status", card_id), _submit(self.executor, self.card_api.get_card_status, card_id=card_id))
+            self.stats.add("issued")
+        context.prefetch_buffer = buffer
+        return buffer
+
+    def settle(self, context: ConversationContext, *, verification_attempted: bool) -> None:
+        """Release the buffer once verified; discard it after a failed attempt."""
+
+        buffer = context.prefetch_buffer
+        if buffer is None or buffer.state != PENDING:
+            return
+        if context.is_verified:
+            buffer.release()
+        elif verification_attempted:
+            buffer.discard()
+
+    def finish_turn(self, context: ConversationContext, *, verification_attempted: bool) -> None:
+        """Settle the turn's buffer, keeping it only if the next turn is the first to see it."""
+
+        buffer = context.prefetch_buffer
+        if buffer is None:
+            return
+        was_pending = buffer.state == PENDING
+        self.settle(context, verification_attempted=verification_attempted)
+        if buffer.state == PENDING or (was_pending and buffer.state == RELEASED):
+            buffer.carried = buffer.state == RELEASED
+            return
+        self.close_session(context)
+
+    def close_session(self, context: ConversationContext) -> None:
+        if context.prefetch_buffer is not None:
+            context.prefetch_buffer.close()
+            context.prefetch_buffer = None
+
+
+def invalidate_prefetch(context: ConversationContext, card_id: Optional[str]) -> None:
+    """Forget prefetched data for ``card_id`` after the turn changed the card."""
+
+    if context.prefetch_buffer is not None:
+        context.prefetch_buffer.invalidate(card_id)
+
+
+def _recent(limit: int) -> Callable[[Sequence[Transaction]], Sequence[Transaction]]:
+    def select(transactions: Sequence[Transaction]) -> Sequence[Transaction]:
+        return transactions[:limit]
+
+    return select
+
+
+def _matching(transaction_id: str) -> Callable[[Sequence[Transaction]], Optional[Transaction]]:
+    def select(transactions: Sequence[Transaction]) -> Optional[Transaction]:
+        if isinstance(transactions, TransactionBatch):
+            index = transactions.index_of(transaction_id)
+            return transactions[index] if index is not None else None
+        for transaction in transactions:
+            if transaction.transaction_id == transaction_id:
+                return transaction
+        return None
+
+    return select
+
+
+def _transactions_key(context: ConversationContext, card_id: Optional[str], limit: int) -> Optional[Tuple[str, Optional[str]]]:
+    buffer = context.prefetch_buffer
+    if buffer is None or limit > buffer.transaction_limit:
+        return None
+    return ("transactions", card_id)
+
+
+def prefetched_transactions(
+    context: ConversationContext, card_id: Optional[str], limit: int
+) -> Optional[Sequence[Transaction]]:
+    """Recent transactions for ``card_id`` from the session's released prefetch, if any."""
+
+    key = _transactions_key(context, card_id, limit)
+    return None if key is None else context.prefetch_buffer.get(key, _recent(limit))
+
+
+async def prefetched_transactions_async(
+    context: ConversationContext, card_id: Optional[str], limit: int
+) -> Optional[Sequence[Transaction]]:
+    key = _transactions_key(context, card_id, limit)
+    return None if key is None else await context.prefetch_buffer.get_async(key, _recent(limit))
+
+
+def prefetched_transaction(context: ConversationContext, transaction_id: str) -> Optional[Transaction]:
+    """Look ``transaction_id`` up among the prefetched recent transactions of the active card."""
+
+    buffer = context.prefetch_buffer
+    if buffer is None:
+        return None
+    return buffer.get(("transactions", context.active_card_id), _matching(transaction_id))
+
+
+async def prefetched_transaction_async(context: ConversationContext, transaction_id: str) -> Optional[Transaction]:
+    buffer = context.prefetch_buffer
+    if buffer is None:
+        return None
+    return await buffer.get_async(("transactions", context.active_card_id), _matching(transaction_id))
+
+
+def prefetched_card_status(context: ConversationContext, card_id: Optional[str]) -> Optional[CardStatus]:
+    buffer = context.prefetch_buffer
+    if buffer is None:
+        return None
+    return buffer.get(("card_status", card_id))
+
+
+async def prefetched_card_status_async(context: ConversationContext, card_id: Optional[str]) -> Optional[CardStatus]:
+    buffer = context.prefetch_buffer
+    if buffer is None:
+        return None
+    return await buffer.get_async(("card_status", card_id))
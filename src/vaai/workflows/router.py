@@ -1,18 +1,77 @@
 """Workflow routing utilities."""
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict
+import threading
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, MutableMapping, Optional, Protocol, Sequence
 
-from ..agent import EscalationRequired
-from ..intents.base import IntentHandler
+from ..intents.base import IntentHandler, IntentRequest
+from .escalation import EscalationRequired
+
+
+@dataclass
+class IntentPrediction:
+    """An intent guessed from an utterance, with the model's confidence in ``[0, 1]``."""
+
+    intent: str
+    confidence: float
+
+
+class UtteranceClassifier(Protocol):
+    """Local first-pass model mapping utterances to intent names."""
+
+    def predict(self, utterances: Sequence[str]) -> List[IntentPrediction]:
+        """Return one prediction per utterance, in order."""
+
+
+IntentFallback = Callable[[IntentRequest], str]
+"""Expensive resolver (e.g. an NLU or LLM call) returning the intent name for a request."""
+
+
+@dataclass
+class RoutingStats:
+    """How utterances without an intent name were resolved."""
+
+    classified: int = 0
+    fallbacks: int = 0
+
+    def __post_init__(self) -> None:
+        self._lock = threading.Lock()
+
+    def add(self, name: str) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    @property
+    def fallback_rate(self) -> float:
+        total = self.classified + self.fallbacks
+        return self.fallbacks / total if total else 0.0
+
+    def to_json(self) -> Dict[str, object]:
+        return {
+            "classified": self.classified,
+            "fallbacks": self.fallbacks,
+            "fallbackRate": round(self.fallback_rate, 4),
+        }
 
 
 @dataclass
 class WorkflowRouter:
-    """Maps intents to their handlers with validation."""
+    """Maps intents to their handlers with validation.
 
-    handlers: Dict[str, IntentHandler]
+    Requests that arrive without an ``intent_name`` are resolved from their
+    utterance by :meth:`resolve_intent`: predictions from the local
+    ``classifier`` at or above ``confidence_threshold`` are used directly, and
+    only the rest go to the ``fallback`` resolver. ``handlers`` may be a
+    :class:`~vaai.intents.registry.HandlerRegistry`, in which case each
+    handler is imported and built the first time its intent is routed.
+    """
+
+    handlers: MutableMapping[str, IntentHandler]
+    classifier: Optional[UtteranceClassifier] = None
+    confidence_threshold: float = 0.7
+    fallback: Optional[IntentFallback] = None
+    stats: RoutingStats = field(default_factory=RoutingStats)
 
     def route(self, intent_name: str) -> IntentHandler:
         try:
@@ -20,5 +79,47 @@ class WorkflowRouter:
         except KeyError as exc:  # noqa: B902
             raise EscalationRequired(f"No handler registered for intent: {intent_name}") from exc
 
+    def route_utterance(self, request: IntentRequest) -> IntentHandler:
+        """Route ``request`` by its intent name, resolving it from the utterance if unset."""
+
+        return self.route(self.resolve_intent(request))
+
+    def resolve_intent(self, request: IntentRequest) -> str:
+        """Fill in ``request.intent_name`` from the utterance when it is empty."""
+
+        if not request.intent_name:
+            prediction = self.classifier.predict([request.utterance])[0] if self.classifier is not None else None
+            request.intent_name = self._accept(prediction) or self._fall_back(request)
+        return request.intent_name
+
+    def resolve_intents(self, requests: Sequence[IntentRequest]) -> List[str]:
+        """Batch counterpart of :meth:`resolve_intent` using one classifier call."""
+
+        pending = [request for request in requests if not request.intent_name]
+        if pending and self.classifier is not None:
+            predictions = self.classifier.predict([request.utterance for request in pending])
+            for request, prediction in zip(pending, predictions):
+                request.intent_name = self._accept(prediction) or ""
+        for request in pending:
+            if not request.intent_name:
+                request.intent_name = self._fall_back(request)
+        return [request.intent_name for request in requests]
+
     def register(self, handler: IntentHandler) -> None:
         self.handlers[handler.name] = handler
+
+    def _accept(self, prediction: Optional[IntentPrediction]) -> Optional[str]:
+        if (
+            prediction is None
+            or prediction.confidence < self.confidence_threshold
+            or prediction.intent not in self.handlers
+        ):
+            return None
+        self.stats.add("classified")
+        return prediction.intent
+
+    def _fall_back(self, request: IntentRequest) -> str:
+        self.stats.add("fallbacks")
+        if self.fallback is None:
+            raise EscalationRequired("Unable to determine the caller's intent.")
+        return self.fallback(request)